@@ -12,10 +12,6 @@ from flask import Flask, request, jsonify
 from flask_cors import CORS
 import cv2
 import numpy as np
-import mediapipe as mp
-import tensorflow as tf
-from tensorflow import keras
-import json
 import base64
 from io import BytesIO
 from PIL import Image
@@ -24,6 +20,13 @@ import logging
 from datetime import datetime
 from functools import wraps
 import traceback
+import sys
+
+# 与 FastAPI 后端共用推理核心（backend/app/core），模型加载、特征构建和各项推理优化只有一份实现
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'backend'))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+from app.core import create_engine
 
 # ============================================================================
 # 配置部分
@@ -57,146 +60,11 @@ CORS(app, resources={
     }
 })
 
-# ============================================================================
-# 手语识别核心类
-# ============================================================================
-
-class SignLanguageRecognizer:
-    """手语识别器 - 封装模型和预处理逻辑"""
-    
-    def __init__(self, model_path, label_path):
-        """
-        初始化识别器
-        
-        Args:
-            model_path: 模型文件路径 (.h5)
-            label_path: 标签文件路径 (.json)
-        """
-        logger.info(f"加载模型: {model_path}")
-        self.model = keras.models.load_model(model_path)
-        
-        logger.info(f"加载标签: {label_path}")
-        with open(label_path, 'r', encoding='utf-8') as f:
-            label_mapping = json.load(f)
-        self.labels = label_mapping['classes']
-        
-        # 初始化 MediaPipe 手部检测
-        self.mp_hands = mp.solutions.hands
-        self.hands = self.mp_hands.Hands(
-            static_image_mode=False,
-            max_num_hands=2,
-            min_detection_confidence=0.5,
-            min_tracking_confidence=0.5
-        )
-        self.mp_drawing = mp.solutions.drawing_utils
-        
-        logger.info(f"模型加载成功，支持 {len(self.labels)} 个类别: {self.labels}")
-    
-    def extract_features(self, image):
-        """
-        提取手部关键点特征
-        
-        Args:
-            image: OpenCV 格式的图像 (BGR)
-            
-        Returns:
-            features: 126维特征向量，如果未检测到手部则返回 None
-            hand_landmarks: MediaPipe 手部关键点对象
-        """
-        # 转换为 RGB (MediaPipe 需要)
-        image_rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-        
-        # 手部检测
-        results = self.hands.process(image_rgb)
-        
-        if not results.multi_hand_landmarks:
-            return None, None
-        
-        # 提取特征向量
-        features = []
-        for hand_landmarks in results.multi_hand_landmarks:
-            hand_features = []
-            for landmark in hand_landmarks.landmark:
-                hand_features.extend([landmark.x, landmark.y, landmark.z])
-            features.extend(hand_features)
-        
-        # 填充到固定长度 (单手63维，双手126维)
-        if len(results.multi_hand_landmarks) == 1:
-            features.extend([0] * 63)
-        
-        return np.array(features[:126]), results.multi_hand_landmarks
-    
-    def predict(self, image, return_all_probs=False):
-        """
-        预测手语含义
-        
-        Args:
-            image: OpenCV 格式的图像 (BGR)
-            return_all_probs: 是否返回所有类别的概率
-            
-        Returns:
-            dict: 包含预测结果的字典
-        """
-        # 提取特征
-        features, hand_landmarks = self.extract_features(image)
-        
-        if features is None:
-            return {
-                'detected': False,
-                'message': '未检测到手部'
-            }
-        
-        # 模型预测
-        features = features.reshape(1, -1)
-        predictions = self.model.predict(features, verbose=0)[0]
-        
-        # 获取预测结果
-        predicted_class = int(np.argmax(predictions))
-        confidence = float(predictions[predicted_class])
-        predicted_label = self.labels[predicted_class]
-        
-        result = {
-            'detected': True,
-            'word': predicted_label,
-            'confidence': confidence,
-            'hand_landmarks': hand_landmarks
-        }
-        
-        # 如果需要返回所有类别的概率
-        if return_all_probs:
-            result['all_predictions'] = {
-                self.labels[i]: float(predictions[i])
-                for i in range(len(self.labels))
-            }
-        
-        return result
-    
-    def draw_landmarks(self, image, hand_landmarks):
-        """
-        在图像上绘制手部关键点
-        
-        Args:
-            image: OpenCV 格式的图像 (BGR)
-            hand_landmarks: MediaPipe 手部关键点对象
-            
-        Returns:
-            image: 绘制了关键点的图像
-        """
-        for landmarks in hand_landmarks:
-            self.mp_drawing.draw_landmarks(
-                image,
-                landmarks,
-                self.mp_hands.HAND_CONNECTIONS,
-                self.mp_drawing.DrawingSpec(color=(0, 255, 0), thickness=2, circle_radius=2),
-                self.mp_drawing.DrawingSpec(color=(255, 0, 0), thickness=2)
-            )
-        return image
-
 # ============================================================================
 # 全局变量
 # ============================================================================
 
-recognizer = None  # 全局识别器实例
+recognizer = None  # 全局识别器实例（共享推理核心创建的识别器池）
 request_count = 0  # 请求计数
 start_time = datetime.now()  # 服务启动时间
 
@@ -286,12 +154,15 @@ def get_info():
             'message': '模型未加载'
         }), 503
     
+    inference = recognizer.get_model_info().get('inference') or {}
     return jsonify({
         'success': True,
         'model_info': {
             'num_classes': len(recognizer.labels),
             'classes': recognizer.labels,
             'input_shape': [126],  # 126维特征向量
+            'inference_backend': inference.get('backend'),
+            'inference_latency_ms': inference.get('latency_ms'),
             'description': '基于 MediaPipe 和 TensorFlow 的手语识别模型'
         }
     })
@@ -355,31 +226,34 @@ def predict():
             image_np = cv2.cvtColor(image_np, cv2.COLOR_RGB2BGR)
         
         # 调用识别器
-        result = recognizer.predict(image_np, return_all_probs=return_all_probs)
+        word, confidence, hand_landmarks, probabilities = recognizer.predict(image_np, return_probs=True)
         
         # 如果未检测到手部
-        if not result['detected']:
+        if word is None:
             return jsonify({
                 'success': True,
                 'detected': False,
-                'message': result['message']
+                'message': '未检测到手部'
             })
         
         # 构建响应
         response = {
             'success': True,
             'detected': True,
-            'word': result['word'],
-            'confidence': result['confidence']
+            'word': word,
+            'confidence': confidence
         }
         
         # 添加所有类别概率
         if return_all_probs:
-            response['all_predictions'] = result['all_predictions']
+            response['all_predictions'] = {
+                label: float(probability)
+                for label, probability in zip(recognizer.labels, probabilities)
+            }
         
         # 绘制关键点
-        if draw_landmarks and result['hand_landmarks']:
-            image_np = recognizer.draw_landmarks(image_np, result['hand_landmarks'])
+        if draw_landmarks and hand_landmarks:
+            image_np = recognizer.draw_landmarks(image_np, hand_landmarks)
             
             # 转换回 base64
             _, buffer = cv2.imencode('.jpg', image_np, [cv2.IMWRITE_JPEG_QUALITY, 85])
@@ -438,7 +312,14 @@ def initialize_service():
         return False
     
     try:
-        recognizer = SignLanguageRecognizer(model_path, label_path)
+        # 同机与 FastAPI 后端共同部署时，设置相同的 SIGNLANG_MODEL_PATH 即可共享权重文件
+        recognizer = create_engine(
+            os.environ.get('SIGNLANG_MODEL_PATH', model_path),
+            os.environ.get('SIGNLANG_LABELS_PATH', label_path)
+        )
+        if recognizer is None:
+            logger.error("❌ 服务初始化失败: 识别器加载失败")
+            return False
         logger.info("✅ 服务初始化成功")
         return True
     except Exception as e:
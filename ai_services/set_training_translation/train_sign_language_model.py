@@ -16,10 +16,17 @@ import tensorflow as tf
 from tensorflow import keras
 from tensorflow.keras import layers
 import os
+import sys
 import json
 from sklearn.model_selection import train_test_split
 from sklearn.preprocessing import LabelEncoder
 
+# 与后端共用特征构建代码（backend/app/core/landmarks.py），保证训练和推理的特征完全一致
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'backend'))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+from app.core.landmarks import build_features
+
 class SignLanguageModel:
     def __init__(self, num_classes):
         self.num_classes = num_classes
@@ -57,26 +64,23 @@ class SignLanguageModel:
         if not results.multi_hand_landmarks:
             return None
         
-        # 提取特征：每只手21个关键点，每个点3个坐标(x, y, z)
-        features = []
-        
-        for hand_landmarks in results.multi_hand_landmarks:
-            hand_features = []
-            for landmark in hand_landmarks.landmark:
-                hand_features.extend([landmark.x, landmark.y, landmark.z])
-            features.extend(hand_features)
-        
-        # 如果只有一只手，填充零向量
-        if len(results.multi_hand_landmarks) == 1:
-            features.extend([0] * 63)  # 21 * 3 = 63
-        
-        return np.array(features[:126])  # 最多2只手，共126个特征
+        # 提取特征：每只手21个关键点，每个点3个坐标(x, y, z)，单手时补零，共126维
+        # 与线上识别使用同一个函数
+        return build_features(results.multi_hand_landmarks)
     
-    def load_dataset(self, dataset_dir):
+    def load_dataset(self, dataset_dir, cache_path=None):
         """
         从数据集目录加载训练数据
         目录结构: dataset_dir/word_label/image_files.jpg
+        
+        cache_path 指向已缓存的特征文件 (.npz) 时直接读取，跳过逐张图像的手部检测
         """
+        if cache_path and os.path.exists(cache_path):
+            X, y = self.load_features(cache_path)
+            if len(X) > 0:
+                print(f"使用缓存特征: {cache_path}")
+                return X, self.label_encoder.fit_transform(y)
+        
         X = []
         y = []
         
@@ -106,14 +110,30 @@ class SignLanguageModel:
             print("警告：没有加载到任何有效数据")
             return np.array([]), np.array([])
         
-        X = np.array(X)
+        X = np.array(X, dtype=np.float32)
         y = np.array(y)
         
+        if cache_path:
+            self.save_features(cache_path, X, y)
+        
         # 标签编码
         y_encoded = self.label_encoder.fit_transform(y)
         
         return X, y_encoded
     
+    def save_features(self, cache_path, X, y):
+        """
+        缓存提取好的特征和原始标签
+        量化校准 (backend/scripts/quantize_model.py) 也读取这个文件
+        """
+        np.savez_compressed(cache_path, features=X.astype(np.float32), labels=np.asarray(y))
+        print(f"特征已缓存到: {cache_path}")
+    
+    def load_features(self, cache_path):
+        """读取缓存的特征和原始标签"""
+        data = np.load(cache_path, allow_pickle=False)
+        return data['features'], data['labels']
+    
     def build_model(self, input_shape):
         """
         构建深度学习模型
@@ -255,9 +275,12 @@ def main():
     # 创建模型实例（类别数会在加载数据后更新）
     model = SignLanguageModel(num_classes=10)
     
-    # 加载数据集
+    # 加载数据集（特征会缓存，供重新训练和量化校准使用）
     print("\n[1/5] 加载数据集...")
-    X, y = model.load_dataset(dataset_dir)
+    X, y = model.load_dataset(
+        dataset_dir,
+        cache_path='c:/Users/86135/Desktop/my/sign_language_features.npz'
+    )
     
     if len(X) == 0:
         print("错误：没有找到训练数据！")
@@ -306,6 +329,7 @@ def main():
     print("\n模型文件:")
     print("  - sign_language_model.h5")
     print("  - sign_language_labels.json")
+    print("  - sign_language_features.npz (特征缓存)")
     print("\n可以使用实时翻译页面进行测试！")
 
 
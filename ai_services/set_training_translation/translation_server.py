@@ -7,14 +7,17 @@ from flask import Flask, request, jsonify, send_from_directory
 from flask_cors import CORS
 import cv2
 import numpy as np
-import mediapipe as mp
-import tensorflow as tf
-from tensorflow import keras
-import json
 import base64
 from io import BytesIO
 from PIL import Image
 import os
+import sys
+
+# 与 FastAPI 后端共用推理核心（backend/app/core），模型加载、特征构建和各项推理优化只有一份实现
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'backend'))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+from app.core import create_engine
 
 # 获取当前文件所在目录
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -22,74 +25,11 @@ BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 app = Flask(__name__, static_folder=BASE_DIR, static_url_path='')
 CORS(app)
 
-class SignLanguageTranslator:
-    def __init__(self, model_path, label_path):
-        # 加载模型
-        self.model = keras.models.load_model(model_path)
-        
-        # 加载标签
-        with open(label_path, 'r', encoding='utf-8') as f:
-            label_mapping = json.load(f)
-        self.labels = label_mapping['classes']
-        
-        # 初始化 MediaPipe
-        self.mp_hands = mp.solutions.hands
-        self.hands = self.mp_hands.Hands(
-            static_image_mode=False,
-            max_num_hands=2,
-            min_detection_confidence=0.5,
-            min_tracking_confidence=0.5
-        )
-        self.mp_drawing = mp.solutions.drawing_utils
-        
-    def extract_features(self, image):
-        """提取手部关键点特征"""
-        image_rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-        results = self.hands.process(image_rgb)
-        
-        if not results.multi_hand_landmarks:
-            return None, None
-        
-        features = []
-        for hand_landmarks in results.multi_hand_landmarks:
-            hand_features = []
-            for landmark in hand_landmarks.landmark:
-                hand_features.extend([landmark.x, landmark.y, landmark.z])
-            features.extend(hand_features)
-        
-        # 填充到固定长度
-        if len(results.multi_hand_landmarks) == 1:
-            features.extend([0] * 63)
-        
-        return np.array(features[:126]), results.multi_hand_landmarks
-    
-    def predict(self, image):
-        """预测手语含义"""
-        features, hand_landmarks = self.extract_features(image)
-        
-        if features is None:
-            return None, 0.0, None
-        
-        features = features.reshape(1, -1)
-        predictions = self.model.predict(features, verbose=0)
-        
-        predicted_class = np.argmax(predictions[0])
-        confidence = float(predictions[0][predicted_class])
-        predicted_label = self.labels[predicted_class]
-        
-        return predicted_label, confidence, hand_landmarks
-    
-    def draw_landmarks(self, image, hand_landmarks):
-        """在图像上绘制手部关键点"""
-        for landmarks in hand_landmarks:
-            self.mp_drawing.draw_landmarks(
-                image,
-                landmarks,
-                self.mp_hands.HAND_CONNECTIONS,
-                self.mp_drawing.DrawingSpec(color=(0, 255, 0), thickness=2, circle_radius=2),
-                self.mp_drawing.DrawingSpec(color=(255, 0, 0), thickness=2)
-            )
-        return image
+def create_translator():
+    """通过共享推理核心加载本目录下的模型，SIGNLANG_MODEL_PATH / SIGNLANG_LABELS_PATH 可覆盖路径"""
+    model_path = os.environ.get('SIGNLANG_MODEL_PATH', os.path.join(BASE_DIR, 'sign_language_model.h5'))
+    label_path = os.environ.get('SIGNLANG_LABELS_PATH', os.path.join(BASE_DIR, 'sign_language_labels.json'))
+    return create_engine(model_path, label_path)
 
 # 全局翻译器实例
 translator = None
@@ -98,17 +38,10 @@ def init_translator():
     """启动时自动初始化翻译器"""
     global translator
     try:
-        model_path = os.path.join(BASE_DIR, 'sign_language_model.h5')
-        label_path = os.path.join(BASE_DIR, 'sign_language_labels.json')
-        
-        if not os.path.exists(model_path):
-            print(f"⚠️ 模型文件不存在: {model_path}")
+        translator = create_translator()
+        if translator is None:
+            print("⚠️ 模型加载失败，详见日志")
             return False
-        if not os.path.exists(label_path):
-            print(f"⚠️ 标签文件不存在: {label_path}")
-            return False
-            
-        translator = SignLanguageTranslator(model_path, label_path)
         print(f"✅ 模型加载成功！")
         print(f"   - 类别数: {len(translator.labels)}")
         print(f"   - 类别: {translator.labels}")
@@ -140,10 +73,12 @@ def init_model():
         })
     
     try:
-        model_path = os.path.join(BASE_DIR, 'sign_language_model.h5')
-        label_path = os.path.join(BASE_DIR, 'sign_language_labels.json')
-        
-        translator = SignLanguageTranslator(model_path, label_path)
+        translator = create_translator()
+        if translator is None:
+            return jsonify({
+                'success': False,
+                'message': '模型加载失败'
+            })
         
         return jsonify({
             'success': True,
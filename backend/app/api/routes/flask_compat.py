@@ -8,18 +8,22 @@ import base64
 import os
 import threading
 from io import BytesIO
-from typing import Optional, TYPE_CHECKING
+from typing import Optional, Union, TYPE_CHECKING
 
 import cv2
 import numpy as np
 from PIL import Image
 from fastapi import APIRouter, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import JSONResponse
 
 if TYPE_CHECKING:
-    from ...core.recognizer import SignLanguageRecognizer
+    from ...core.hot_swap import HotSwapRecognizer
+    from ...core.recognizer_pool import RecognizerPool
+    from ...core.worker_pool import ProcessRecognizerPool
 
 from ...core.config import config
+from ...utils.common_utils import service_manager, parse_session_id
 from ...utils.error_handler import ErrorResponse, ServiceError, RecognitionError, ImageProcessingError
 
 # 配置日志
@@ -30,48 +34,48 @@ logger = get_module_logger(__name__)
 router = APIRouter()
 
 # 全局翻译器实例（与ai_services保持一致）
-translator: Optional["SignLanguageRecognizer"] = None
-# 线程锁，保护全局变量
+# 默认为进程内的识别器池，INFERENCE_WORKER_PROCESSES > 0 时为多进程识别器池，
+# 配置了 MODEL_REGISTRY_DIR 时外层包装为可热切换版本的识别器
+translator: Optional[Union["RecognizerPool", "ProcessRecognizerPool", "HotSwapRecognizer"]] = None
+# 线程锁，只保护全局变量的读写，不在推理期间持有
 translator_lock = threading.Lock()
 
-def init_translator() -> bool:
+def init_translator(timings: Optional[dict] = None) -> bool:
     """
     启动时自动初始化翻译器（与ai_services保持一致）
+    识别器预热完成后才写入全局变量，在此之前识别接口返回未就绪。
+    模型加载不持有 translator_lock，识别接口读取全局变量时不会被加载过程阻塞
+
+    Args:
+        timings: 可选的字典，写入模型加载各阶段耗时（毫秒）
     """
     global translator
-    # 延迟导入以避免在应用启动早期初始化TensorFlow
-    from ...core.recognizer import SignLanguageRecognizer
-    
-    with translator_lock:  # 使用线程锁保护
-        try:
-            model_path = config.get_model_path()
-            labels_path = config.get_labels_path()
-
-            logger.info(f"正在加载模型: {model_path}")
-            logger.info(f"标签文件: {labels_path}")
-
-            if not os.path.exists(model_path):
-                logger.error(f"⚠️ 模型文件不存在: {model_path}")
-                return False
-            if not os.path.exists(labels_path):
-                logger.error(f"⚠️ 标签文件不存在: {labels_path}")
-                return False
+    from ...core.engine import create_engine
 
-            translator = SignLanguageRecognizer(model_path, labels_path)
+    try:
+        pool = create_engine(timings=timings)
+    except Exception as e:
+        logger.error(f"❌ 模型加载失败: {str(e)}")
+        return False
 
-            if not translator.is_ready():
-                logger.error("❌ 翻译器初始化失败")
-                return False
+    if pool is None:
+        logger.error("❌ 翻译器初始化失败")
+        return False
 
-            logger.info(f"✅ 模型加载成功！")
-            logger.info(f"   - 类别数: {len(translator.labels)}")
-            logger.info(f"   - 类别: {translator.labels}")
+    with translator_lock:  # 只在写入全局变量时持有锁
+        existing = translator
+        if existing is None:
+            translator = pool
 
-            return True
+    if existing is not None:
+        # 并发的初始化已经先完成，丢弃本次加载的实例
+        pool.close()
+        return True
 
-        except Exception as e:
-            logger.error(f"❌ 模型加载失败: {str(e)}")
-            return False
+    logger.info(f"✅ 模型加载成功！")
+    logger.info(f"   - 类别数: {len(pool.labels)}")
+    logger.info(f"   - 类别: {pool.labels}")
+    return True
 
 @router.post("/api/init")
 async def init_model():
@@ -81,6 +85,10 @@ async def init_model():
     """
     global translator
 
+    # 启动时的后台加载尚未完成，避免重复加载并阻塞事件循环
+    if service_manager.is_loading():
+        return ErrorResponse.service_unavailable(service_manager.not_ready_message())
+
     with translator_lock:  # 使用线程锁保护
         if translator is not None:
             return {
@@ -91,7 +99,8 @@ async def init_model():
             }
 
     try:
-        if init_translator():
+        # 在线程池中加载模型，避免阻塞事件循环
+        if await run_in_threadpool(init_translator):
             with translator_lock:  # 再次获取锁以确保线程安全
                 return {
                     "success": True,
@@ -106,6 +115,53 @@ async def init_model():
         logger.error(f"模型初始化异常: {str(e)}")
         return ErrorResponse.internal_error(f"模型加载失败: {str(e)}")
 
+def _decode_image(image_data: str) -> np.ndarray:
+    """解码base64图像为BGR数组（与ai_services一致）"""
+    image_bytes = base64.b64decode(image_data)
+    image = Image.open(BytesIO(image_bytes))
+    image_np = np.array(image)
+
+    # 转换颜色空间
+    if image_np.shape[2] == 4:  # RGBA
+        image_np = cv2.cvtColor(image_np, cv2.COLOR_RGBA2BGR)
+    else:  # RGB
+        image_np = cv2.cvtColor(image_np, cv2.COLOR_RGB2BGR)
+    return image_np
+
+def _predict_frame(recognizer: Union["RecognizerPool", "ProcessRecognizerPool", "HotSwapRecognizer"], image_data: str, session_id: Optional[str] = None) -> dict:
+    """
+    在线程池中执行解码、识别和绘制
+    识别时从池中签出一个独占的识别器，分类调用可以与其他请求合并成批
+    """
+    image_np = _decode_image(image_data)
+
+    # 预测（使用我们移植的recognizer）
+    predicted_label, confidence, hand_landmarks = recognizer.predict(image_np, session_id=session_id)
+
+    if predicted_label is None:
+        return {
+            "success": True,
+            "detected": False,
+            "message": "未检测到手势"
+        }
+
+    # 绘制关键点（与ai_services一致）
+    if hand_landmarks:
+        image_np = recognizer.draw_landmarks(image_np, hand_landmarks)
+
+    # 转换回base64（与ai_services一致）
+    _, buffer = cv2.imencode('.jpg', image_np)
+    annotated_image = base64.b64encode(buffer).decode('utf-8')
+
+    # 返回与ai_services完全一致的格式
+    return {
+        "success": True,
+        "detected": True,
+        "word": predicted_label,  # ai_services使用'word'字段
+        "confidence": float(confidence),
+        "annotated_image": f"data:image/jpeg;base64,{annotated_image}"
+    }
+
 @router.post("/api/predict")
 async def predict(request: dict):
     """
@@ -114,9 +170,12 @@ async def predict(request: dict):
     """
     global translator
 
-    with translator_lock:  # 使用线程锁保护
-        if translator is None:
-            return ErrorResponse.service_unavailable("模型未初始化")
+    with translator_lock:  # 使用线程锁保护，只读取当前实例
+        recognizer = translator
+    if recognizer is None:
+        return ErrorResponse.service_unavailable(
+            service_manager.not_ready_message() if service_manager.is_loading() else "模型未初始化"
+        )
 
     try:
         # 获取base64图像数据（与ai_services一致）
@@ -125,46 +184,14 @@ async def predict(request: dict):
             raise ValueError("缺少image字段")
 
         image_data = data['image'].split(',')[1]
+        # 可选：同一路视频流的连续帧携带相同的session_id，可保持手部跟踪状态
+        try:
+            session_id = parse_session_id(data.get('session_id'))
+        except ValueError as e:
+            return ErrorResponse.bad_request(str(e))
 
-        # 解码图像
-        image_bytes = base64.b64decode(image_data)
-        image = Image.open(BytesIO(image_bytes))
-        image_np = np.array(image)
-
-        # 转换颜色空间
-        if image_np.shape[2] == 4:  # RGBA
-            image_np = cv2.cvtColor(image_np, cv2.COLOR_RGBA2BGR)
-        else:  # RGB
-            image_np = cv2.cvtColor(image_np, cv2.COLOR_RGB2BGR)
-
-        # 预测（使用我们移植的recognizer）
-        with translator_lock:  # 线程安全地访问翻译器
-            predicted_label, confidence, hand_landmarks = translator.predict(image_np)
-
-        if predicted_label is None:
-            return {
-                "success": True,
-                "detected": False,
-                "message": "未检测到手势"
-            }
-
-        # 绘制关键点（与ai_services一致）
-        if hand_landmarks:
-            with translator_lock:  # 线程安全地访问翻译器
-                image_np = translator.draw_landmarks(image_np, hand_landmarks)
-
-        # 转换回base64（与ai_services一致）
-        _, buffer = cv2.imencode('.jpg', image_np)
-        annotated_image = base64.b64encode(buffer).decode('utf-8')
-
-        # 返回与ai_services完全一致的格式
-        return {
-            "success": True,
-            "detected": True,
-            "word": predicted_label,  # ai_services使用'word'字段
-            "confidence": float(confidence),
-            "annotated_image": f"data:image/jpeg;base64,{annotated_image}"
-        }
+        # 在线程池中处理，避免阻塞事件循环，并发请求才能进入同一个推理批次
+        return await run_in_threadpool(_predict_frame, recognizer, image_data, session_id)
 
     except ValueError as e:
         logger.warning(f"图像解析错误: {str(e)}")
@@ -0,0 +1,148 @@
+"""
+模型版本管理路由
+配置 MODEL_REGISTRY_DIR 后可用：查看仓库中的版本、热切换启用版本、以影子模式评估候选版本
+"""
+
+import hmac
+import math
+from typing import Any, Optional
+
+from fastapi import APIRouter, Body, Depends, Header, HTTPException, status
+
+from ...core.config import config
+from ...core.model_registry import ModelRegistry
+from ...utils.error_handler import ErrorResponse
+from . import flask_compat
+
+# 配置日志
+from ...utils.logger_config import get_module_logger
+logger = get_module_logger(__name__)
+
+router = APIRouter(prefix="/api/models", tags=["模型版本"])
+
+
+def _get_registry() -> Optional[ModelRegistry]:
+    return ModelRegistry(config.MODEL_REGISTRY_DIR) if config.MODEL_REGISTRY_DIR else None
+
+
+def require_model_admin(x_admin_token: Optional[str] = Header(None)):
+    """
+    模型管理接口的鉴权：请求头 X-Admin-Token 需与 MODEL_ADMIN_TOKEN 一致，未配置令牌时接口禁用
+    """
+    if not config.MODEL_ADMIN_TOKEN:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="未配置 MODEL_ADMIN_TOKEN，模型管理接口已禁用")
+    expected = config.MODEL_ADMIN_TOKEN.encode("utf-8")
+    if not x_admin_token or not hmac.compare_digest(x_admin_token.encode("utf-8"), expected):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="管理令牌无效")
+
+
+def _parse_version(value: Any) -> str:
+    """版本号必须是非空字符串，不能留空后落到当前启用的版本"""
+    if not isinstance(value, str) or not value.strip():
+        raise ValueError("version 需要是非空字符串")
+    return value.strip()
+
+
+def _parse_fraction(value: Any) -> float:
+    """影子模式的流量比例，限制在 [0, 1]"""
+    if isinstance(value, bool):
+        raise ValueError("fraction 需要是数字")
+    try:
+        fraction = float(value)
+    except (TypeError, ValueError):
+        raise ValueError("fraction 需要是数字")
+    if math.isnan(fraction):
+        raise ValueError("fraction 需要是数字")
+    return min(max(fraction, 0.0), 1.0)
+
+
+def _get_hot_swap():
+    """当前的识别器支持热切换时返回它，否则返回 None"""
+    from ...core.hot_swap import HotSwapRecognizer
+
+    with flask_compat.translator_lock:
+        recognizer = flask_compat.translator
+    return recognizer if isinstance(recognizer, HotSwapRecognizer) else None
+
+
+@router.get("", summary="模型版本列表")
+async def list_models():
+    """列出模型仓库中的版本，以及当前服务中的版本状态"""
+    registry = _get_registry()
+    if registry is None:
+        return ErrorResponse.bad_request("未配置模型仓库 (MODEL_REGISTRY_DIR)")
+
+    recognizer = _get_hot_swap()
+    return {
+        "success": True,
+        "active": registry.active_version(),
+        "versions": registry.list_versions(),
+        "serving": recognizer.get_stats() if recognizer else None
+    }
+
+
+@router.post("/activate", summary="热切换模型版本", dependencies=[Depends(require_model_admin)])
+async def activate_model(payload: dict = Body(...)):
+    """
+    在后台加载并预热指定版本，完成后原子切换并写入 manifest；
+    切换前后的请求都不会中断，通过 GET /api/models 查看进度
+    """
+    try:
+        version = _parse_version(payload.get("version"))
+    except ValueError as e:
+        return ErrorResponse.bad_request(str(e))
+
+    registry = _get_registry()
+    if registry is None:
+        return ErrorResponse.service_unavailable("模型仓库未启用或识别器未就绪")
+
+    # 版本需要有当前推理后端可以加载的模型文件（如 onnx 后端需要 .onnx）
+    try:
+        registry.resolve(version, backend=config.INFERENCE_BACKEND)
+    except (KeyError, FileNotFoundError) as e:
+        return ErrorResponse.bad_request(str(e.args[0]))
+
+    recognizer = _get_hot_swap()
+    if recognizer is None:
+        return ErrorResponse.service_unavailable("模型仓库未启用或识别器未就绪")
+
+    if not recognizer.load_version(version, on_swapped=registry.set_active):
+        return ErrorResponse.bad_request("已有模型版本正在加载，请稍后重试")
+
+    logger.info(f"开始加载模型版本: {version}")
+    return {"success": True, "message": f"正在加载模型版本 {version}", "version": version}
+
+
+@router.post("/shadow", summary="影子模式", dependencies=[Depends(require_model_admin)])
+async def shadow_model(payload: dict = Body(...)):
+    """
+    按比例用候选版本识别同一帧，只记录延迟和一致率，不影响响应；
+    fraction 为 0 时停止影子模式（此时可不传 version）
+    """
+    try:
+        fraction = _parse_fraction(payload.get("fraction", config.MODEL_SHADOW_FRACTION))
+        version = _parse_version(payload.get("version")) if fraction > 0 else None
+    except ValueError as e:
+        return ErrorResponse.bad_request(str(e))
+
+    registry = _get_registry()
+    if registry is None:
+        return ErrorResponse.service_unavailable("模型仓库未启用或识别器未就绪")
+
+    if version is not None:
+        try:
+            registry.resolve(version, backend=config.INFERENCE_BACKEND)
+        except (KeyError, FileNotFoundError) as e:
+            return ErrorResponse.bad_request(str(e.args[0]))
+
+    recognizer = _get_hot_swap()
+    if recognizer is None:
+        return ErrorResponse.service_unavailable("模型仓库未启用或识别器未就绪")
+
+    if version is None:
+        recognizer.stop_shadow()
+        return {"success": True, "message": "影子模式已停止", "shadow": recognizer.get_stats()["shadow"]}
+
+    if not recognizer.start_shadow(version, fraction):
+        return ErrorResponse.bad_request("已有模型版本正在加载，请稍后重试")
+    return {"success": True, "message": f"正在加载影子版本 {version}", "version": version, "fraction": fraction}
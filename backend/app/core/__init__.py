@@ -0,0 +1,36 @@
+"""
+SignLink 推理核心
+FastAPI 后端与 ai_services 的 Flask 服务共用的识别引擎：
+
+    from app.core import create_engine
+    engine = create_engine()
+    label, confidence, hand_landmarks = engine.predict(image_bgr)
+
+导出的名称在首次访问时才导入对应模块，导入 app.core.config 等轻量模块时
+不会加载 TensorFlow / MediaPipe
+"""
+
+import importlib
+
+_EXPORTS = {
+    "create_engine": ".engine",
+    "SignLanguageRecognizer": ".recognizer",
+    "draw_hand_landmarks": ".recognizer",
+    "RecognizerPool": ".recognizer_pool",
+    "ProcessRecognizerPool": ".worker_pool",
+    "HotSwapRecognizer": ".hot_swap",
+    "ModelRegistry": ".model_registry",
+    "InferenceBatcher": ".batcher",
+    "HandTrackerRegistry": ".session",
+    "load_classifier": ".classifier",
+    "build_features": ".landmarks",
+    "FEATURE_DIM": ".landmarks",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,215 @@
+"""
+推理微批处理调度模块
+将多个并发会话提交的特征向量合并成一个批次，只调用一次分类器
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# 配置日志
+from ..utils.logger_config import get_module_logger
+logger = get_module_logger(__name__)
+
+# 停止信号
+_STOP = object()
+
+
+class InferenceBatcher:
+    """
+    动态微批处理调度器
+    后台线程收集排队的特征向量，在达到最大批大小或最长等待时间后统一推理，
+    再把每一行结果交还给对应的调用方
+    """
+
+    def __init__(
+        self,
+        predict_fn: Callable[[np.ndarray], Sequence[Any]],
+        max_batch_size: int = 32,
+        max_wait_ms: float = 5.0,
+        name: str = "inference-batcher"
+    ):
+        """
+        初始化调度器
+
+        Args:
+            predict_fn: 批量推理函数，输入 shape=(N, D) 的数组，返回长度为 N 的结果序列
+            max_batch_size: 单个批次的最大样本数
+            max_wait_ms: 第一个样本入队后最多等待的毫秒数
+            name: 后台线程名称
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size 必须大于 0")
+
+        self.predict_fn = predict_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max(0.0, float(max_wait_ms))
+        self.name = name
+
+        self._queue: "queue.Queue" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._stats_lock = threading.Lock()
+        self._closed = False
+
+        # 统计信息
+        self._batch_count = 0
+        self._item_count = 0
+        self._max_observed_batch = 0
+        self._total_infer_ms = 0.0
+
+    def start(self) -> "InferenceBatcher":
+        """启动后台调度线程"""
+        if self._thread is None or not self._thread.is_alive():
+            self._closed = False
+            self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+            self._thread.start()
+            logger.info(
+                f"微批调度器已启动: max_batch_size={self.max_batch_size}, "
+                f"max_wait_ms={self.max_wait_ms}"
+            )
+        return self
+
+    def submit(self, features: np.ndarray) -> Future:
+        """
+        提交单个特征向量
+
+        Args:
+            features: shape=(D,) 的特征向量
+
+        Returns:
+            Future，结果为 predict_fn 对应行的输出
+        """
+        if self._closed or self._thread is None:
+            raise RuntimeError("微批调度器未启动或已关闭")
+
+        future: Future = Future()
+        self._queue.put((np.asarray(features, dtype=np.float32), future, time.monotonic()))
+        return future
+
+    def predict(self, features: np.ndarray, timeout: Optional[float] = None) -> Any:
+        """
+        提交特征向量并阻塞等待结果
+
+        Args:
+            features: shape=(D,) 的特征向量
+            timeout: 最长等待秒数
+
+        Returns:
+            predict_fn 对应行的输出
+        """
+        return self.submit(features).result(timeout=timeout)
+
+    def _run(self):
+        """后台调度循环"""
+        max_wait = self.max_wait_ms / 1000.0
+
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                break
+
+            batch = [item]
+            # 以第一个样本的入队时间为准计算截止时间，避免排队时间被重复计入
+            deadline = item[2] + max_wait
+            should_stop = False
+
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                try:
+                    if remaining > 0:
+                        next_item = self._queue.get(timeout=remaining)
+                    else:
+                        # 已到截止时间，只收集已经排队的样本
+                        next_item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+
+                if next_item is _STOP:
+                    should_stop = True
+                    break
+                batch.append(next_item)
+
+            self._run_batch(batch)
+
+            if should_stop:
+                break
+
+        # 关闭时拒绝剩余请求
+        self._drain(RuntimeError("微批调度器已关闭"))
+
+    def _run_batch(self, batch: List[Tuple[np.ndarray, Future, float]]):
+        """执行一个批次并分发结果"""
+        futures = [entry[1] for entry in batch]
+
+        try:
+            inputs = np.stack([entry[0] for entry in batch])
+            start = time.perf_counter()
+            outputs = self.predict_fn(inputs)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+
+            if len(outputs) != len(batch):
+                raise RuntimeError(f"批量推理结果数量不匹配: {len(outputs)} != {len(batch)}")
+
+        except Exception as e:
+            logger.error(f"批量推理失败: {str(e)}")
+            for future in futures:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        with self._stats_lock:
+            self._batch_count += 1
+            self._item_count += len(batch)
+            self._max_observed_batch = max(self._max_observed_batch, len(batch))
+            self._total_infer_ms += elapsed_ms
+
+        for future, output in zip(futures, outputs):
+            if not future.done():
+                future.set_result(output)
+
+    def _drain(self, error: Exception):
+        """清空队列，通知仍在等待的调用方"""
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not _STOP and not item[1].done():
+                item[1].set_exception(error)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        获取调度统计信息
+
+        Returns:
+            包含批次数、样本数、平均批大小等信息的字典
+        """
+        with self._stats_lock:
+            batch_count = self._batch_count
+            item_count = self._item_count
+            return {
+                "max_batch_size": self.max_batch_size,
+                "max_wait_ms": self.max_wait_ms,
+                "batch_count": batch_count,
+                "item_count": item_count,
+                "average_batch_size": item_count / batch_count if batch_count else 0.0,
+                "max_observed_batch_size": self._max_observed_batch,
+                "average_infer_ms": self._total_infer_ms / batch_count if batch_count else 0.0,
+                "queue_depth": self._queue.qsize()
+            }
+
+    def close(self, timeout: float = 2.0):
+        """停止后台线程"""
+        if self._closed:
+            return
+        self._closed = True
+
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join(timeout=timeout)
+            logger.info("微批调度器已停止")
+        self._thread = None
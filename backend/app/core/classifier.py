@@ -0,0 +1,355 @@
+"""
+分类器封装模块
+统一不同推理路径的调用方式，识别器只依赖 predict(batch) 接口
+"""
+
+import hashlib
+import os
+import tempfile
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+import numpy as np
+
+# 配置日志
+from ..utils.logger_config import get_module_logger
+logger = get_module_logger(__name__)
+
+
+class KerasClassifier:
+    """
+    Keras模型分类器
+    默认使用固定输入签名的 tf.function 推理，绕过 model.predict 每次调用时
+    构建数据适配器和回调的开销；fast_path=False 时退回 model.predict
+    """
+
+    def __init__(self, model_path: str, fast_path: bool = True, benchmark_iterations: int = 20):
+        """
+        加载模型并预热
+
+        Args:
+            model_path: 模型文件路径 (.h5格式)
+            fast_path: 是否使用编译后的推理函数
+            benchmark_iterations: 加载后对比两种推理路径的调用次数，0 表示不测量
+        """
+        # 延迟导入，只有使用Keras推理时才加载TensorFlow
+        import tensorflow as tf
+        from tensorflow import keras
+
+        self._tf = tf
+        self.model_path = model_path
+        self.model = keras.models.load_model(model_path)
+        self.fast_path = fast_path
+        self.latency_report: Optional[Dict[str, float]] = None
+
+        self._fast_predict = None
+        if fast_path:
+            self._fast_predict = self._build_fast_predict()
+            self.warmup()
+
+        if benchmark_iterations > 0:
+            self.latency_report = self.benchmark(benchmark_iterations)
+
+    @property
+    def input_shape(self):
+        return self.model.input_shape
+
+    @property
+    def output_shape(self):
+        return self.model.output_shape
+
+    @property
+    def input_dim(self) -> int:
+        return int(self.model.input_shape[-1])
+
+    def _build_fast_predict(self):
+        """构建固定输入签名的推理函数，只追踪一次计算图"""
+        tf = self._tf
+        model = self.model
+
+        @tf.function(
+            input_signature=[tf.TensorSpec(shape=[None, self.input_dim], dtype=tf.float32)],
+            reduce_retracing=True
+        )
+        def fast_predict(features):
+            return model(features, training=False)
+
+        return fast_predict
+
+    def warmup(self, batch_sizes=(1, 8)):
+        """用零向量触发图追踪，避免第一帧真实请求承担编译开销"""
+        for batch_size in batch_sizes:
+            self.predict(np.zeros((batch_size, self.input_dim), dtype=np.float32))
+
+    def predict(self, features_batch: np.ndarray) -> np.ndarray:
+        """
+        批量推理
+
+        Args:
+            features_batch: shape=(N, 126) 的特征矩阵
+
+        Returns:
+            shape=(N, 类别数) 的softmax概率矩阵
+        """
+        features_batch = np.asarray(features_batch, dtype=np.float32)
+        if self._fast_predict is not None:
+            return self._fast_predict(self._tf.constant(features_batch)).numpy()
+        return np.asarray(self.model.predict(features_batch, verbose=0))
+
+    def benchmark(self, iterations: int = 20) -> Dict[str, float]:
+        """
+        测量单样本推理延迟，对比 model.predict 与编译推理函数
+
+        Args:
+            iterations: 每种路径的调用次数
+
+        Returns:
+            各推理路径的平均单次调用耗时（毫秒）
+        """
+        sample = np.zeros((1, self.input_dim), dtype=np.float32)
+        report: Dict[str, float] = {}
+
+        # 先调用一次，排除首次调用的初始化开销
+        self.model.predict(sample, verbose=0)
+        start = time.perf_counter()
+        for _ in range(iterations):
+            self.model.predict(sample, verbose=0)
+        report["keras_predict_ms"] = (time.perf_counter() - start) * 1000 / iterations
+
+        if self._fast_predict is not None:
+            start = time.perf_counter()
+            for _ in range(iterations):
+                self.predict(sample)
+            report["fast_path_ms"] = (time.perf_counter() - start) * 1000 / iterations
+
+        logger.info(
+            "推理延迟: "
+            + ", ".join(f"{name}={value:.3f}" for name, value in report.items())
+        )
+        return report
+
+    def get_info(self) -> Dict:
+        """获取分类器信息"""
+        return {
+            "backend": "keras",
+            "fast_path": self._fast_predict is not None,
+            "latency_ms": self.latency_report
+        }
+
+
+def measure_latency(predict_fn: Callable[[np.ndarray], np.ndarray], input_dim: int,
+                    iterations: int = 20) -> float:
+    """
+    测量单样本推理的平均耗时
+
+    Args:
+        predict_fn: 批量推理函数
+        input_dim: 输入特征维度
+        iterations: 调用次数
+
+    Returns:
+        平均单次调用耗时（毫秒）
+    """
+    sample = np.zeros((1, input_dim), dtype=np.float32)
+    predict_fn(sample)  # 排除首次调用的初始化开销
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        predict_fn(sample)
+    return (time.perf_counter() - start) * 1000 / iterations
+
+
+class OnnxClassifier:
+    """
+    ONNX Runtime分类器
+    模型由 scripts/export_model.py 导出，输入名为 features
+    """
+
+    def __init__(self, model_path: str, num_threads: int = 0):
+        """
+        创建推理会话
+
+        Args:
+            model_path: .onnx 模型文件路径
+            num_threads: 算子内线程数，0 表示由ONNX Runtime决定
+        """
+        import onnxruntime as ort
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if num_threads > 0:
+            options.intra_op_num_threads = num_threads
+
+        self.model_path = model_path
+        self.session = ort.InferenceSession(
+            model_path,
+            sess_options=options,
+            providers=["CPUExecutionProvider"]
+        )
+        model_input = self.session.get_inputs()[0]
+        self._input_name = model_input.name
+        self.input_dim = int(model_input.shape[-1])
+        self.output_dim = int(self.session.get_outputs()[0].shape[-1])
+        self.latency_report: Optional[Dict[str, float]] = None
+
+    @property
+    def input_shape(self):
+        return (None, self.input_dim)
+
+    @property
+    def output_shape(self):
+        return (None, self.output_dim)
+
+    def predict(self, features_batch: np.ndarray) -> np.ndarray:
+        """批量推理，返回softmax概率矩阵"""
+        features_batch = np.asarray(features_batch, dtype=np.float32)
+        return self.session.run(None, {self._input_name: features_batch})[0]
+
+    def get_info(self) -> Dict:
+        """获取分类器信息"""
+        return {"backend": "onnx", "latency_ms": self.latency_report}
+
+
+def _import_tflite_interpreter():
+    """按体积从小到大查找可用的TFLite解释器"""
+    try:
+        from tflite_runtime.interpreter import Interpreter
+        return Interpreter
+    except ImportError:
+        pass
+    try:
+        from ai_edge_litert.interpreter import Interpreter
+        return Interpreter
+    except ImportError:
+        pass
+    import tensorflow as tf
+    return tf.lite.Interpreter
+
+
+class TFLiteClassifier:
+    """
+    TFLite分类器
+    优先使用 tflite-runtime，只有在未安装时才回退到完整的TensorFlow
+    """
+
+    def __init__(self, model_path: str, num_threads: int = 0):
+        """
+        加载解释器
+
+        Args:
+            model_path: .tflite 模型文件路径
+            num_threads: 解释器线程数，0 表示使用默认值
+        """
+        interpreter_class = _import_tflite_interpreter()
+
+        self.model_path = model_path
+        self.interpreter = interpreter_class(
+            model_path=model_path,
+            num_threads=num_threads if num_threads > 0 else None
+        )
+        self.interpreter.allocate_tensors()
+        # 解释器不是线程安全的，且批大小变化时需要重新分配张量
+        self._lock = threading.Lock()
+        self._refresh_details()
+        self.input_dim = int(self._input_details["shape"][-1])
+        self.output_dim = int(self._output_details["shape"][-1])
+        self.latency_report: Optional[Dict[str, float]] = None
+
+    @property
+    def input_shape(self):
+        return (None, self.input_dim)
+
+    @property
+    def output_shape(self):
+        return (None, self.output_dim)
+
+    def _refresh_details(self):
+        self._input_details = self.interpreter.get_input_details()[0]
+        self._output_details = self.interpreter.get_output_details()[0]
+        self._batch_size = int(self._input_details["shape"][0])
+
+    def predict(self, features_batch: np.ndarray) -> np.ndarray:
+        """批量推理，返回softmax概率矩阵"""
+        features_batch = np.asarray(features_batch, dtype=np.float32)
+        batch_size = features_batch.shape[0]
+
+        with self._lock:
+            if batch_size != self._batch_size:
+                self.interpreter.resize_tensor_input(
+                    self._input_details["index"], [batch_size, self.input_dim]
+                )
+                self.interpreter.allocate_tensors()
+                self._refresh_details()
+
+            self.interpreter.set_tensor(self._input_details["index"], features_batch)
+            self.interpreter.invoke()
+            return self.interpreter.get_tensor(self._output_details["index"]).copy()
+
+    def get_info(self) -> Dict:
+        """获取分类器信息"""
+        return {"backend": "tflite", "latency_ms": self.latency_report}
+
+
+# 支持的推理后端
+SUPPORTED_BACKENDS = ("keras", "numpy", "onnx", "tflite")
+
+
+def folded_weights_path(model_path: str, cache_dir: str = "") -> str:
+    """
+    NumPy后端共享权重文件的路径，如 <缓存目录>/sign_language_model-1a2b3c4d5e6f.folded.npy
+
+    文件写在缓存目录而不是模型目录，模型目录可以只读挂载；文件名带模型绝对路径的哈希，
+    不同目录下同名的模型（如模型仓库中的各个版本）不会互相覆盖
+
+    Args:
+        model_path: 模型文件路径
+        cache_dir: 缓存目录，为空时使用系统临时目录下的 signlink-weights
+    """
+    cache_dir = cache_dir or os.path.join(tempfile.gettempdir(), "signlink-weights")
+    stem = os.path.splitext(os.path.basename(model_path))[0]
+    digest = hashlib.sha1(os.path.abspath(model_path).encode("utf-8")).hexdigest()[:12]
+    return os.path.join(cache_dir, f"{stem}-{digest}.folded.npy")
+
+
+def load_classifier(model_path: str, backend: str = "keras", fast_path: bool = True,
+                    benchmark_iterations: int = 0, num_threads: int = 0,
+                    shared_weights: bool = False, weights_cache_dir: str = ""):
+    """
+    按后端名称加载分类器
+
+    Args:
+        model_path: 模型文件路径（需与后端匹配：.h5 / .onnx / .tflite）
+        backend: 推理后端，可选 keras、numpy、onnx、tflite
+        fast_path: Keras后端是否使用编译后的推理函数
+        benchmark_iterations: 加载后测量推理延迟的调用次数，0 表示不测量
+        num_threads: onnx/tflite 后端的推理线程数，0 表示使用默认值
+        shared_weights: numpy 后端是否以内存映射方式加载折叠后的权重，多进程共享一份
+        weights_cache_dir: 共享权重文件的目录，为空时使用系统临时目录
+
+    Returns:
+        提供 predict(batch) 接口的分类器
+    """
+    backend = (backend or "keras").lower()
+
+    if backend == "keras":
+        return KerasClassifier(model_path, fast_path=fast_path, benchmark_iterations=benchmark_iterations)
+
+    if backend == "numpy":
+        from .numpy_engine import NumpyMLPClassifier
+        classifier = NumpyMLPClassifier(
+            model_path,
+            shared_weights_path=folded_weights_path(model_path, weights_cache_dir) if shared_weights else None
+        )
+    elif backend == "onnx":
+        classifier = OnnxClassifier(model_path, num_threads=num_threads)
+    elif backend == "tflite":
+        classifier = TFLiteClassifier(model_path, num_threads=num_threads)
+    else:
+        raise ValueError(f"不支持的推理后端: {backend}，可选: {', '.join(SUPPORTED_BACKENDS)}")
+
+    if benchmark_iterations > 0:
+        latency = measure_latency(classifier.predict, classifier.input_dim, benchmark_iterations)
+        classifier.latency_report = {"predict_ms": latency}
+        logger.info(f"推理延迟: {backend}={latency:.3f}ms")
+    return classifier
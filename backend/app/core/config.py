@@ -5,15 +5,67 @@
 
 import os
 from functools import lru_cache
-from typing import List
+from typing import List, Optional, Tuple
 
 from dotenv import load_dotenv
 
+# 配置日志
+from ..utils.logger_config import get_module_logger
+logger = get_module_logger(__name__)
+
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 ENV_PATH = os.path.join(BASE_DIR, ".env")
 load_dotenv(ENV_PATH)
 
 
+# 各推理后端对应的模型文件扩展名
+MODEL_EXTENSIONS = {
+    "keras": ".h5",
+    "numpy": ".h5",
+    "onnx": ".onnx",
+    "tflite": ".tflite",
+}
+
+
+# MediaPipe手部检测的部署档位：model_complexity=0 的轻量模型单帧耗时更低，但检测率略低；
+# 选择档位前可用 scripts/profile_mediapipe.py 在录制的帧上比较各组合的耗时和检测率
+MEDIAPIPE_PROFILES = {
+    "fast": {
+        "model_complexity": 0,
+        "max_num_hands": 2,
+        "min_detection_confidence": 0.5,
+        "min_tracking_confidence": 0.5,
+    },
+    "balanced": {
+        "model_complexity": 1,
+        "max_num_hands": 2,
+        "min_detection_confidence": 0.5,
+        "min_tracking_confidence": 0.5,
+    },
+    "accurate": {
+        "model_complexity": 1,
+        "max_num_hands": 2,
+        "min_detection_confidence": 0.6,
+        "min_tracking_confidence": 0.7,
+    },
+}
+
+
+def _mediapipe_profile(value: str) -> str:
+    """解析 MEDIAPIPE_PROFILE，无法识别的档位记录警告并使用 balanced"""
+    profile = value.strip().lower()
+    if profile not in MEDIAPIPE_PROFILES:
+        logger.warning(
+            f"无效的 MEDIAPIPE_PROFILE={value!r}，可选值: {', '.join(MEDIAPIPE_PROFILES)}，已使用 balanced"
+        )
+        return "balanced"
+    return profile
+
+
+_MEDIAPIPE_PROFILE = _mediapipe_profile(os.environ.get("MEDIAPIPE_PROFILE", "balanced"))
+_PROFILE_OPTIONS = MEDIAPIPE_PROFILES[_MEDIAPIPE_PROFILE]
+
+
 def _str_to_bool(value: str, default: bool = False) -> bool:
     if value is None:
         return default
@@ -82,10 +134,140 @@ class Config:
         "sign_language_labels.json"
     )
 
-    # MediaPipe配置
-    MAX_NUM_HANDS: int = 2
-    MIN_DETECTION_CONFIDENCE: float = 0.5
-    MIN_TRACKING_CONFIDENCE: float = 0.5
+    # MediaPipe配置：MEDIAPIPE_PROFILE 选择档位（fast / balanced / accurate），单项环境变量可覆盖档位中的值
+    MEDIAPIPE_PROFILE: str = _MEDIAPIPE_PROFILE
+    MEDIAPIPE_MODEL_COMPLEXITY: int = int(
+        os.environ.get("MEDIAPIPE_MODEL_COMPLEXITY", _PROFILE_OPTIONS["model_complexity"])
+    )
+    MAX_NUM_HANDS: int = int(os.environ.get("MAX_NUM_HANDS", _PROFILE_OPTIONS["max_num_hands"]))
+    MIN_DETECTION_CONFIDENCE: float = float(
+        os.environ.get("MIN_DETECTION_CONFIDENCE", _PROFILE_OPTIONS["min_detection_confidence"])
+    )
+    MIN_TRACKING_CONFIDENCE: float = float(
+        os.environ.get("MIN_TRACKING_CONFIDENCE", _PROFILE_OPTIONS["min_tracking_confidence"])
+    )
+
+    # 推理后端：keras、numpy、onnx 或 tflite
+    # numpy 后端不导入TensorFlow；onnx/tflite 需先运行 scripts/export_model.py 导出模型
+    INFERENCE_BACKEND: str = os.environ.get("INFERENCE_BACKEND", "keras").lower()
+
+    # 量化模型版本（仅 tflite 后端）：如 int8、float16，对应 sign_language_model.int8.tflite
+    # 由 scripts/quantize_model.py 生成，留空表示使用 float32 模型
+    INFERENCE_MODEL_VARIANT: str = os.environ.get("INFERENCE_MODEL_VARIANT", "").strip().lower()
+
+    # 推理路径配置：使用编译后的推理函数代替 model.predict
+    INFERENCE_FAST_PATH: bool = _str_to_bool(os.environ.get("INFERENCE_FAST_PATH", "true"), True)
+    # 加载模型后测量推理延迟的调用次数，0 表示不测量
+    INFERENCE_BENCHMARK_ITERATIONS: int = int(os.environ.get("INFERENCE_BENCHMARK_ITERATIONS", "10"))
+    # 启动时送入每个MediaPipe检测图的合成帧数量，预热完成前识别接口返回未就绪；0 表示不预热
+    INFERENCE_WARMUP_FRAMES: int = int(os.environ.get("INFERENCE_WARMUP_FRAMES", "3"))
+    # 为 true 时等待识别器加载和预热完成后才开始接收请求，默认后台加载
+    STARTUP_WAIT_FOR_MODEL: bool = _str_to_bool(os.environ.get("STARTUP_WAIT_FOR_MODEL", "false"), False)
+
+    # 推理微批配置
+    INFERENCE_BATCHING_ENABLED: bool = _str_to_bool(os.environ.get("INFERENCE_BATCHING_ENABLED", "true"), True)
+    INFERENCE_MAX_BATCH_SIZE: int = int(os.environ.get("INFERENCE_MAX_BATCH_SIZE", "32"))
+    INFERENCE_MAX_WAIT_MS: float = float(os.environ.get("INFERENCE_MAX_WAIT_MS", "5"))
+    # 等待批次结果的超时（毫秒），超时的请求返回识别失败而不是一直阻塞；0 表示不限时
+    INFERENCE_BATCH_TIMEOUT_MS: float = float(os.environ.get("INFERENCE_BATCH_TIMEOUT_MS", "1000"))
+
+    # 识别器池大小：每个实例拥有独立的MediaPipe图，决定可并发处理的帧数
+    RECOGNIZER_POOL_SIZE: int = int(os.environ.get("RECOGNIZER_POOL_SIZE", str(min(4, os.cpu_count() or 1))))
+
+    # 会话级手部跟踪：每个WebSocket连接或 session_id 独占一个MediaPipe图，空闲超时后回收
+    SESSION_TRACKING_ENABLED: bool = _str_to_bool(os.environ.get("SESSION_TRACKING_ENABLED", "true"), True)
+    SESSION_IDLE_TIMEOUT_S: float = float(os.environ.get("SESSION_IDLE_TIMEOUT_S", "60"))
+    SESSION_MAX_COUNT: int = int(os.environ.get("SESSION_MAX_COUNT", "64"))
+    # 预测缓存：关键点特征按 PREDICTION_MEMO_GRID（归一化坐标）量化后作为键，手势几乎不变时复用之前的分类结果
+    PREDICTION_MEMO_ENABLED: bool = _str_to_bool(os.environ.get("PREDICTION_MEMO_ENABLED", "true"), True)
+    PREDICTION_MEMO_GRID: float = float(os.environ.get("PREDICTION_MEMO_GRID", "0.01"))
+    PREDICTION_MEMO_MAX_ENTRIES: int = int(os.environ.get("PREDICTION_MEMO_MAX_ENTRIES", "4096"))
+    # 无手帧预过滤：缩小后的帧中肤色像素占比低于阈值时跳过MediaPipe；阈值需按实际摄像头环境
+    # 用 scripts/calibrate_prefilter.py 在漏检预算内校准，每丢弃 HAND_PREFILTER_AUDIT_INTERVAL 帧抽检一次
+    HAND_PREFILTER_ENABLED: bool = _str_to_bool(os.environ.get("HAND_PREFILTER_ENABLED", "false"), False)
+    HAND_PREFILTER_MIN_SKIN_FRACTION: float = float(os.environ.get("HAND_PREFILTER_MIN_SKIN_FRACTION", "0.002"))
+    HAND_PREFILTER_AUDIT_INTERVAL: int = int(os.environ.get("HAND_PREFILTER_AUDIT_INTERVAL", "50"))
+    # 自适应检测分辨率：每个会话从 DETECTION_RESOLUTIONS 中最高的一档（长边像素）开始，检测耗时超过
+    # DETECTION_LATENCY_TARGET_MS 或同时处理的帧数达到 DETECTION_QUEUE_HIGH 时降一档，空闲时升回。
+    # 默认关闭：低分辨率下远处的小手检测率会下降，启用前先对比 /api/metrics 中各档的检测率
+    ADAPTIVE_RESOLUTION_ENABLED: bool = _str_to_bool(os.environ.get("ADAPTIVE_RESOLUTION_ENABLED", "false"), False)
+    DETECTION_RESOLUTIONS: List[int] = [
+        int(level) for level in os.environ.get("DETECTION_RESOLUTIONS", "640,480,320").split(",") if level.strip()
+    ]
+    DETECTION_LATENCY_TARGET_MS: float = float(os.environ.get("DETECTION_LATENCY_TARGET_MS", "40"))
+    DETECTION_QUEUE_HIGH: int = int(os.environ.get("DETECTION_QUEUE_HIGH", str(min(4, os.cpu_count() or 1) * 2)))
+
+    # 多进程推理：大于0时由工作进程执行关键点提取和分类，主进程通过共享内存传递帧
+    INFERENCE_WORKER_PROCESSES: int = int(os.environ.get("INFERENCE_WORKER_PROCESSES", "0"))
+    # 共享内存槽位数量（0 表示每个工作进程4个）和单个槽位的字节数（默认容纳 1080p BGR 帧）
+    INFERENCE_SHM_SLOTS: int = int(os.environ.get("INFERENCE_SHM_SLOTS", "0"))
+    INFERENCE_SHM_SLOT_BYTES: int = int(os.environ.get("INFERENCE_SHM_SLOT_BYTES", str(1920 * 1080 * 3)))
+
+    # 线程预算：每个进程中 TensorFlow 算子内线程、OpenCV 和 ONNX Runtime / TFLite 的线程数，0 表示各库默认（按整机核数）；
+    # 同机运行多个服务进程或工作进程时按 核数 / 进程数 设置，避免线程数超过核数
+    INFERENCE_THREADS: int = int(os.environ.get("INFERENCE_THREADS", "0"))
+    INFERENCE_INTER_OP_THREADS: int = int(os.environ.get("INFERENCE_INTER_OP_THREADS", "1"))
+    # CPU亲和性（仅Linux）：留空不绑定；"0-3,8" 把进程绑定到这些核，工作进程再平分它们；
+    # "auto" 只把当前可用的核平分给各工作进程
+    CPU_AFFINITY: str = os.environ.get("CPU_AFFINITY", "").strip().lower()
+
+    # numpy 后端以内存映射方式加载折叠后的权重（*.folded.npy），同机运行的多个服务进程共享同一份权重；
+    # 文件写入 INFERENCE_WEIGHTS_CACHE_DIR（为空时为系统临时目录下的 signlink-weights），不写模型目录
+    INFERENCE_SHARED_WEIGHTS: bool = _str_to_bool(os.environ.get("INFERENCE_SHARED_WEIGHTS", "false"), False)
+    INFERENCE_WEIGHTS_CACHE_DIR: str = os.environ.get("INFERENCE_WEIGHTS_CACHE_DIR", "").strip()
+
+    # 帧间变化检测：带会话ID的帧与上一次完整识别时的灰度缩略图相比，变化像素占比低于
+    # MOTION_CHANGED_FRACTION 时复用上一次的结果；连续复用 MOTION_MAX_REUSE 帧后强制识别一次
+    MOTION_GATE_ENABLED: bool = _str_to_bool(os.environ.get("MOTION_GATE_ENABLED", "true"), True)
+    MOTION_THUMBNAIL_WIDTH: int = int(os.environ.get("MOTION_THUMBNAIL_WIDTH", "64"))
+    MOTION_PIXEL_THRESHOLD: int = int(os.environ.get("MOTION_PIXEL_THRESHOLD", "12"))
+    MOTION_CHANGED_FRACTION: float = float(os.environ.get("MOTION_CHANGED_FRACTION", "0.005"))
+    MOTION_MAX_REUSE: int = int(os.environ.get("MOTION_MAX_REUSE", "20"))
+
+    # 帧内容缓存：以图像数据的哈希为键缓存识别结果，重复上传的相同图像直接返回（跨会话共享）
+    FRAME_CACHE_ENABLED: bool = _str_to_bool(os.environ.get("FRAME_CACHE_ENABLED", "true"), True)
+    FRAME_CACHE_MAX_ENTRIES: int = int(os.environ.get("FRAME_CACHE_MAX_ENTRIES", "1024"))
+    FRAME_CACHE_MAX_MB: float = float(os.environ.get("FRAME_CACHE_MAX_MB", "32"))
+    FRAME_CACHE_TTL_S: float = float(os.environ.get("FRAME_CACHE_TTL_S", "30"))
+
+    # 时间平滑：带会话ID的帧（WebSocket 连接、携带 session_id 的实时识别）按会话平滑最近
+    # SMOOTHING_WINDOW 帧的概率，返回稳定词汇和 changed 标记；方式为 ema（指数滑动平均）或 vote（多数投票）
+    SMOOTHING_ENABLED: bool = _str_to_bool(os.environ.get("SMOOTHING_ENABLED", "true"), True)
+    SMOOTHING_METHOD: str = os.environ.get("SMOOTHING_METHOD", "ema").strip().lower()
+    SMOOTHING_WINDOW: int = int(os.environ.get("SMOOTHING_WINDOW", "8"))
+    SMOOTHING_EMA_ALPHA: float = float(os.environ.get("SMOOTHING_EMA_ALPHA", "0.3"))
+    # 迟滞阈值：新词汇的得分连续 SMOOTHING_MIN_FRAMES 帧达到进入阈值才切换，当前词汇低于退出阈值才允许切换
+    SMOOTHING_ENTER_THRESHOLD: float = float(os.environ.get("SMOOTHING_ENTER_THRESHOLD", "0.6"))
+    SMOOTHING_EXIT_THRESHOLD: float = float(os.environ.get("SMOOTHING_EXIT_THRESHOLD", "0.4"))
+    SMOOTHING_MIN_FRAMES: int = int(os.environ.get("SMOOTHING_MIN_FRAMES", "3"))
+    # 保留平滑状态的最大会话数，每个会话约 SMOOTHING_WINDOW x 类别数 x 4 字节
+    SMOOTHING_MAX_SESSIONS: int = int(os.environ.get("SMOOTHING_MAX_SESSIONS", "1024"))
+
+    # 语句组装：WebSocket 连接按会话把逐帧结果组装成词汇和句子，以 /ws?mode=sentence 连接时只推送这些事件。
+    # 同一词汇连续 SENTENCE_MIN_CONSECUTIVE 帧且置信度不低于 SENTENCE_MIN_CONFIDENCE 时确认，
+    # 连续 SENTENCE_PAUSE_S 秒未检测到手时断句，同一词汇 SENTENCE_DEDUPE_S 秒内不重复添加
+    SENTENCE_ENABLED: bool = _str_to_bool(os.environ.get("SENTENCE_ENABLED", "true"), True)
+    SENTENCE_MIN_CONSECUTIVE: int = int(os.environ.get("SENTENCE_MIN_CONSECUTIVE", "3"))
+    SENTENCE_MIN_CONFIDENCE: float = float(os.environ.get("SENTENCE_MIN_CONFIDENCE", "0.8"))
+    SENTENCE_PAUSE_S: float = float(os.environ.get("SENTENCE_PAUSE_S", "1.5"))
+    SENTENCE_DEDUPE_S: float = float(os.environ.get("SENTENCE_DEDUPE_S", "2.0"))
+    SENTENCE_MAX_WORDS: int = int(os.environ.get("SENTENCE_MAX_WORDS", "32"))
+
+    # 流式时序模型（scripts/train_sequence_model.py 训练的因果TCN）：设置后带会话ID的帧逐帧更新
+    # 该会话的时序状态，结果中附带 sequence_word。相对路径按分类模型所在目录解析（见 get_sequence_paths），
+    # 标签文件留空时为时序模型同目录的 sign_language_sequence_labels.json
+    SEQUENCE_MODEL_PATH: str = os.environ.get("SEQUENCE_MODEL_PATH", "").strip()
+    SEQUENCE_LABELS_PATH: str = os.environ.get("SEQUENCE_LABELS_PATH", "").strip()
+    # 保留时序状态的最大会话数，每个会话约 感受野帧数 x 通道数 x 层数 x 4 字节
+    SEQUENCE_MAX_SESSIONS: int = int(os.environ.get("SEQUENCE_MAX_SESSIONS", "1024"))
+
+    # 模型仓库目录（含 manifest.json 和按版本存放的模型），设置后加载启用的版本并支持热切换；
+    # 留空时使用 SIGNLANG_MODEL_PATH / SIGNLANG_LABELS_PATH 指定的固定模型
+    MODEL_REGISTRY_DIR: str = os.environ.get("MODEL_REGISTRY_DIR", "").strip()
+    # 影子模式未指定比例时，参与候选版本识别的帧比例
+    MODEL_SHADOW_FRACTION: float = float(os.environ.get("MODEL_SHADOW_FRACTION", "0.1"))
+    # 模型管理接口（热切换、影子模式）的管理令牌，请求头 X-Admin-Token 需与之一致；留空时这些接口禁用
+    MODEL_ADMIN_TOKEN: str = os.environ.get("MODEL_ADMIN_TOKEN", "").strip()
 
     # API限流配置
     API_RATE_LIMIT: int = 100
@@ -96,9 +278,48 @@ class Config:
 
     @classmethod
     @lru_cache()
-    def get_model_path(cls) -> str:
-        """获取模型文件路径，支持环境变量覆盖"""
-        return os.environ.get("SIGNLANG_MODEL_PATH", cls.MODEL_PATH)
+    def get_model_path(cls, backend: Optional[str] = None) -> str:
+        """
+        获取模型文件路径，支持环境变量覆盖
+        指定推理后端时返回对应格式的同名文件，如 sign_language_model.onnx；
+        tflite 后端配置了量化版本时返回 sign_language_model.int8.tflite
+        """
+        model_path = os.environ.get("SIGNLANG_MODEL_PATH", cls.MODEL_PATH)
+        return cls.model_path_for_backend(model_path, backend)
+
+    @classmethod
+    def model_path_for_backend(cls, model_path: str, backend: Optional[str] = None) -> str:
+        """把 .h5 模型路径换成指定推理后端对应格式的同名文件"""
+        backend = (backend or "keras").lower()
+        extension = MODEL_EXTENSIONS.get(backend)
+        if extension and not model_path.endswith(extension):
+            variant = f".{cls.INFERENCE_MODEL_VARIANT}" if backend == "tflite" and cls.INFERENCE_MODEL_VARIANT else ""
+            model_path = os.path.splitext(model_path)[0] + variant + extension
+        return model_path
+
+    @classmethod
+    def hands_options(cls) -> dict:
+        """MediaPipe Hands 的构造参数（视频流模式）"""
+        return {
+            "static_image_mode": False,
+            "model_complexity": cls.MEDIAPIPE_MODEL_COMPLEXITY,
+            "max_num_hands": cls.MAX_NUM_HANDS,
+            "min_detection_confidence": cls.MIN_DETECTION_CONFIDENCE,
+            "min_tracking_confidence": cls.MIN_TRACKING_CONFIDENCE
+        }
+
+    @classmethod
+    def get_sequence_paths(cls) -> Tuple[str, str]:
+        """
+        获取时序模型和标签文件的路径
+        相对路径按分类模型所在目录（默认 app/assets/models）解析，与训练脚本的默认输出位置一致
+        """
+        models_dir = os.path.dirname(os.path.abspath(cls.get_model_path()))
+        model_path = os.path.join(models_dir, cls.SEQUENCE_MODEL_PATH)
+        labels_path = cls.SEQUENCE_LABELS_PATH or os.path.join(
+            os.path.dirname(model_path), "sign_language_sequence_labels.json"
+        )
+        return model_path, os.path.join(models_dir, labels_path)
 
     @classmethod
     @lru_cache()
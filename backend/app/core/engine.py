@@ -0,0 +1,221 @@
+"""
+推理引擎入口
+FastAPI 后端和 ai_services 的两个 Flask 服务都通过 create_engine 创建识别器，
+微批、会话跟踪、多进程、共享权重、版本热切换等优化只在这里实现一次
+"""
+
+import os
+import time
+from typing import Dict, Optional, Union, TYPE_CHECKING
+
+from .config import config
+
+if TYPE_CHECKING:
+    from .hot_swap import HotSwapRecognizer
+    from .recognizer_pool import RecognizerPool
+    from .worker_pool import ProcessRecognizerPool
+
+# 配置日志
+from ..utils.logger_config import get_module_logger
+logger = get_module_logger(__name__)
+
+
+def _create_thread_pool(model_path: str, labels_path: str, backend: str, timings: Dict[str, float]):
+    """在当前进程中加载模型，创建共享模型的识别器池"""
+    start = time.perf_counter()
+    from .recognizer import SignLanguageRecognizer
+    from .recognizer_pool import RecognizerPool
+    timings["import_ms"] = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    recognizer = SignLanguageRecognizer(
+        model_path,
+        labels_path,
+        backend=backend,
+        fast_path=config.INFERENCE_FAST_PATH,
+        benchmark_iterations=config.INFERENCE_BENCHMARK_ITERATIONS,
+        shared_weights=config.INFERENCE_SHARED_WEIGHTS,
+        weights_cache_dir=config.INFERENCE_WEIGHTS_CACHE_DIR,
+        hands_options=config.hands_options(),
+        num_threads=config.INFERENCE_THREADS
+    )
+
+    timings["model_load_ms"] = (time.perf_counter() - start) * 1000
+
+    if not recognizer.is_ready():
+        recognizer.close()
+        return None
+
+    start = time.perf_counter()
+    pool = RecognizerPool(recognizer, size=config.RECOGNIZER_POOL_SIZE)
+    timings["pool_ms"] = (time.perf_counter() - start) * 1000
+
+    if config.INFERENCE_BATCHING_ENABLED:
+        pool.enable_batching(
+            max_batch_size=config.INFERENCE_MAX_BATCH_SIZE,
+            max_wait_ms=config.INFERENCE_MAX_WAIT_MS,
+            timeout_ms=config.INFERENCE_BATCH_TIMEOUT_MS
+        )
+
+    if config.SESSION_TRACKING_ENABLED:
+        pool.enable_sessions(
+            idle_timeout_s=config.SESSION_IDLE_TIMEOUT_S,
+            max_sessions=config.SESSION_MAX_COUNT
+        )
+
+    if config.PREDICTION_MEMO_ENABLED:
+        pool.enable_prediction_memo(
+            grid_size=config.PREDICTION_MEMO_GRID,
+            max_entries=config.PREDICTION_MEMO_MAX_ENTRIES
+        )
+
+    if config.HAND_PREFILTER_ENABLED:
+        pool.enable_prefilter(
+            min_skin_fraction=config.HAND_PREFILTER_MIN_SKIN_FRACTION,
+            audit_interval=config.HAND_PREFILTER_AUDIT_INTERVAL
+        )
+
+    if config.ADAPTIVE_RESOLUTION_ENABLED:
+        pool.enable_adaptive_resolution(
+            levels=config.DETECTION_RESOLUTIONS,
+            target_ms=config.DETECTION_LATENCY_TARGET_MS,
+            queue_high=config.DETECTION_QUEUE_HIGH
+        )
+
+    if config.INFERENCE_WARMUP_FRAMES > 0:
+        timings["warmup_ms"] = pool.warm_up(config.INFERENCE_WARMUP_FRAMES)
+
+    logger.info(f"   - 识别器池大小: {pool.size}")
+    return pool
+
+
+def _create_process_pool(model_path: str, labels_path: str, backend: str, timings: Dict[str, float]):
+    """启动工作进程，每个进程持有自己的识别器，帧通过共享内存传递"""
+    from .worker_pool import ProcessRecognizerPool
+
+    pool = ProcessRecognizerPool(
+        model_path,
+        labels_path,
+        num_workers=config.INFERENCE_WORKER_PROCESSES,
+        num_slots=config.INFERENCE_SHM_SLOTS,
+        slot_bytes=config.INFERENCE_SHM_SLOT_BYTES,
+        backend=backend,
+        fast_path=config.INFERENCE_FAST_PATH,
+        shared_weights=config.INFERENCE_SHARED_WEIGHTS,
+        weights_cache_dir=config.INFERENCE_WEIGHTS_CACHE_DIR,
+        hands_options=config.hands_options(),
+        threads=config.INFERENCE_THREADS,
+        inter_op_threads=config.INFERENCE_INTER_OP_THREADS,
+        cpu_affinity=config.CPU_AFFINITY,
+        session_tracking=config.SESSION_TRACKING_ENABLED,
+        session_idle_timeout_s=config.SESSION_IDLE_TIMEOUT_S,
+        session_max_count=config.SESSION_MAX_COUNT,
+        prediction_memo_grid=config.PREDICTION_MEMO_GRID if config.PREDICTION_MEMO_ENABLED else 0.0,
+        prediction_memo_size=config.PREDICTION_MEMO_MAX_ENTRIES,
+        prefilter_min_skin_fraction=config.HAND_PREFILTER_MIN_SKIN_FRACTION if config.HAND_PREFILTER_ENABLED else 0.0,
+        prefilter_audit_interval=config.HAND_PREFILTER_AUDIT_INTERVAL,
+        resolution_levels=config.DETECTION_RESOLUTIONS if config.ADAPTIVE_RESOLUTION_ENABLED else None,
+        resolution_target_ms=config.DETECTION_LATENCY_TARGET_MS,
+        resolution_queue_high=config.DETECTION_QUEUE_HIGH,
+        warmup_frames=config.INFERENCE_WARMUP_FRAMES
+    )
+
+    # 工作进程并行加载模型并各自预热，全部就绪后才返回
+    start = time.perf_counter()
+    ready = pool.start()
+    timings["workers_ms"] = (time.perf_counter() - start) * 1000
+    if not ready:
+        pool.close()
+        return None
+
+    logger.info(f"   - 工作进程数: {pool.num_workers}")
+    return pool
+
+
+def _create_engine(model_path: str, labels_path: str, backend: str, timings: Dict[str, float]):
+    """加载一对模型和标签文件，返回预热后的识别器"""
+    model_path = config.model_path_for_backend(model_path, backend)
+
+    logger.info(f"正在加载模型: {model_path} (推理后端: {backend})")
+    logger.info(f"标签文件: {labels_path}")
+
+    if not os.path.exists(model_path):
+        logger.error(f"⚠️ 模型文件不存在: {model_path}")
+        return None
+    if not os.path.exists(labels_path):
+        logger.error(f"⚠️ 标签文件不存在: {labels_path}")
+        return None
+
+    # 延迟导入识别器，避免在不需要时初始化TensorFlow / MediaPipe
+    if config.INFERENCE_WORKER_PROCESSES > 0:
+        engine = _create_process_pool(model_path, labels_path, backend, timings)
+    else:
+        engine = _create_thread_pool(model_path, labels_path, backend, timings)
+
+    if engine is not None:
+        logger.info("   - 加载耗时: " + ", ".join(f"{phase}={ms:.0f}ms" for phase, ms in timings.items()))
+    return engine
+
+
+def _create_registry_engine(backend: str, timings: Dict[str, float]):
+    """从模型仓库加载启用的版本，包装为可热切换的识别器"""
+    from .hot_swap import HotSwapRecognizer
+    from .model_registry import ModelRegistry
+
+    registry = ModelRegistry(config.MODEL_REGISTRY_DIR)
+    try:
+        version, model_path, labels_path = registry.resolve(backend=backend)
+    except KeyError:
+        # 仓库中还没有版本时使用默认模型，之后仍可切换到注册的版本
+        logger.warning(f"模型仓库 {registry.root_dir} 中没有启用的版本，使用默认模型")
+        version, model_path, labels_path = None, config.get_model_path(), config.get_labels_path()
+    except FileNotFoundError as e:
+        logger.error(f"⚠️ {str(e)}")
+        return None
+
+    engine = _create_engine(model_path, labels_path, backend, timings)
+    if engine is None:
+        return None
+
+    def load_version(new_version: str):
+        _, new_model_path, new_labels_path = registry.resolve(new_version, backend=backend)
+        return _create_engine(new_model_path, new_labels_path, backend, {})
+
+    logger.info(f"   - 模型版本: {version or '默认'}")
+    return HotSwapRecognizer(engine, version, load_version)
+
+
+def create_engine(model_path: Optional[str] = None, labels_path: Optional[str] = None,
+                  backend: Optional[str] = None,
+                  timings: Optional[Dict[str, float]] = None) -> Optional[Union["RecognizerPool", "ProcessRecognizerPool", "HotSwapRecognizer"]]:
+    """
+    按配置创建识别器（进程内识别器池或多进程识别器池），返回前完成预热
+    未指定模型路径且配置了 MODEL_REGISTRY_DIR 时，加载模型仓库中启用的版本并支持热切换
+
+    Args:
+        model_path: .h5 模型路径，默认使用 config.get_model_path()；
+            会按推理后端换成对应格式的同名文件
+        labels_path: 标签文件路径，默认使用 config.get_labels_path()
+        backend: 推理后端，默认使用 INFERENCE_BACKEND
+        timings: 可选的字典，写入各阶段耗时（毫秒），用于启动耗时分析
+
+    Returns:
+        提供 predict / draw_landmarks / get_model_info / close 接口的识别器，加载失败时返回 None
+    """
+    timings = timings if timings is not None else {}
+    backend = (backend or config.INFERENCE_BACKEND).lower()
+
+    # 线程预算需要在加载模型（初始化TensorFlow运行时）之前设置
+    from .threads import apply_thread_budget, parse_cpu_list
+    apply_thread_budget(
+        threads=config.INFERENCE_THREADS,
+        inter_op_threads=config.INFERENCE_INTER_OP_THREADS,
+        cpu_affinity=parse_cpu_list(config.CPU_AFFINITY) if config.CPU_AFFINITY not in ("", "auto") else None
+    )
+
+    if model_path is None and config.MODEL_REGISTRY_DIR:
+        return _create_registry_engine(backend, timings)
+
+    model_path = model_path or config.get_model_path()
+    labels_path = labels_path or config.get_labels_path()
+    return _create_engine(model_path, labels_path, backend, timings)
@@ -0,0 +1,143 @@
+"""
+帧内容缓存模块
+客户端经常重复发送同一张JPEG（请求重试、视频暂停、前端工具构造的批量请求）。
+以图像数据的哈希为键缓存识别结果（含关键点和预测），重复的帧不再做Base64解码、
+MediaPipe检测和分类。缓存按最近使用顺序淘汰，同时受条目数、内存上限和过期时间约束
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Union
+
+# 配置日志
+from ..utils.logger_config import get_module_logger
+logger = get_module_logger(__name__)
+
+
+class _CacheEntry:
+    __slots__ = ("value", "size", "expires_at")
+
+    def __init__(self, value: Any, size: int, expires_at: float):
+        self.value = value
+        self.size = size
+        self.expires_at = expires_at
+
+
+class FrameCache:
+    """带容量、内存上限和过期时间的LRU缓存"""
+
+    def __init__(self, max_entries: int = 1024, max_bytes: int = 32 * 1024 * 1024, ttl_s: float = 30.0):
+        """
+        Args:
+            max_entries: 最大条目数
+            max_bytes: 缓存值估算占用的内存上限（字节）
+            ttl_s: 条目的有效时间（秒）
+        """
+        self.max_entries = max(1, int(max_entries))
+        self.max_bytes = max(1, int(max_bytes))
+        self.ttl_s = float(ttl_s)
+
+        self._entries: "OrderedDict[bytes, _CacheEntry]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+        # 统计信息
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expired = 0
+
+    @staticmethod
+    def make_key(data: Union[str, bytes], namespace: str = "") -> bytes:
+        """
+        计算图像数据的内容哈希
+
+        Args:
+            data: Base64字符串或图像字节；Base64字符串直接参与哈希，不需要先解码
+            namespace: 区分不同模型版本等的前缀，版本切换后旧结果不会被命中
+
+        Returns:
+            16字节的哈希值
+        """
+        if isinstance(data, str):
+            data = data.encode("ascii", errors="ignore")
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(namespace.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(data)
+        return digest.digest()
+
+    def get(self, key: bytes) -> Optional[Any]:
+        """
+        查找缓存
+
+        Returns:
+            缓存的值，未命中或已过期时返回 None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            if entry.expires_at <= time.monotonic():
+                self._remove(key)
+                self._expired += 1
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry.value
+
+    def put(self, key: bytes, value: Any, size: int):
+        """
+        写入缓存，超出条目数或内存上限时淘汰最久未使用的条目
+
+        Args:
+            key: make_key 计算的键
+            value: 缓存的值
+            size: 值的估算内存占用（字节），超过上限的值不缓存
+        """
+        size = int(size)
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = _CacheEntry(value, size, time.monotonic() + self.ttl_s)
+            self._bytes += size
+
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self._evictions += 1
+
+    def _remove(self, key: bytes):
+        """删除条目（调用方持有 self._lock）"""
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+    def clear(self):
+        """清空缓存"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """获取缓存统计"""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "ttl_s": self.ttl_s,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": round(self._hits / lookups, 4) if lookups else 0.0,
+                "evictions": self._evictions,
+                "expired": self._expired
+            }
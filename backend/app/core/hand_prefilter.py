@@ -0,0 +1,175 @@
+"""
+无手帧预过滤模块
+没有手的帧同样要跑一遍MediaPipe手掌检测才能返回 (None, 0.0, None)。
+预过滤把帧缩小到64像素宽，统计YCrCb空间中肤色像素的占比，占比低于阈值的帧
+直接判定为无手，单帧耗时约0.05ms。
+
+阈值用带标注的回放集校准（见 scripts/calibrate_prefilter.py）：在允许的漏检率
+（有手却被丢弃的帧占有手帧的比例）内选择最大的阈值。运行时每隔若干个被丢弃的帧
+仍交给MediaPipe检测一次（抽检），用于估计线上的实际漏检率
+"""
+
+import threading
+import time
+from typing import Any, Dict, Sequence
+
+import cv2
+import numpy as np
+
+# 配置日志
+from ..utils.logger_config import get_module_logger
+logger = get_module_logger(__name__)
+
+# YCrCb 空间的肤色范围（对光照亮度不敏感，覆盖常见肤色）
+SKIN_YCRCB_LOWER = (0, 133, 77)
+SKIN_YCRCB_UPPER = (255, 173, 127)
+
+# check 的返回值
+PREFILTER_PASS = "pass"      # 可能有手，正常检测
+PREFILTER_REJECT = "reject"  # 判定为无手，跳过检测
+PREFILTER_AUDIT = "audit"    # 判定为无手，但作为抽检样本仍然检测
+
+
+def skin_fraction(image_bgr: np.ndarray, width: int = 64) -> float:
+    """
+    计算缩小后的图像中肤色像素的占比
+
+    Args:
+        image_bgr: OpenCV格式的图像 (BGR)
+        width: 缩小后的宽度
+
+    Returns:
+        0-1之间的肤色像素占比
+    """
+    height, full_width = image_bgr.shape[:2]
+    small_height = max(1, int(round(height * width / full_width)))
+    small = cv2.resize(image_bgr, (width, small_height), interpolation=cv2.INTER_LINEAR)
+    if small.dtype != np.uint8:
+        # 归一化到 0-1 的浮点图像先还原为 0-255
+        small = cv2.convertScaleAbs(small, alpha=255.0 if small.max() <= 1.0 else 1.0)
+    mask = cv2.inRange(cv2.cvtColor(small, cv2.COLOR_BGR2YCrCb), SKIN_YCRCB_LOWER, SKIN_YCRCB_UPPER)
+    return cv2.countNonZero(mask) / mask.size
+
+
+def calibrate_threshold(fractions: Sequence[float], has_hand: Sequence[bool], fn_budget: float) -> float:
+    """
+    在漏检预算内选择最大的肤色占比阈值
+
+    Args:
+        fractions: 回放集每帧的肤色像素占比
+        has_hand: 每帧是否有手（标注或MediaPipe检测结果）
+        fn_budget: 允许的漏检率，如 0.01 表示最多丢弃1%的有手帧
+
+    Returns:
+        阈值，肤色占比低于该值的帧被判定为无手
+    """
+    hand_fractions = np.sort(np.asarray(fractions, dtype=np.float64)[np.asarray(has_hand, dtype=bool)])
+    if len(hand_fractions) == 0:
+        raise ValueError("回放集中没有有手的帧，无法校准")
+    # 低于阈值的有手帧不超过 floor(预算 * 有手帧数) 个
+    allowed_misses = int(np.floor(max(0.0, fn_budget) * len(hand_fractions)))
+    return float(hand_fractions[min(allowed_misses, len(hand_fractions) - 1)])
+
+
+def evaluate_threshold(fractions: Sequence[float], has_hand: Sequence[bool], threshold: float) -> Dict[str, Any]:
+    """
+    在回放集上评估阈值：节省的检测次数和误丢弃的有手帧
+
+    Returns:
+        包含帧数、节省帧数、误丢弃帧数和比例的字典
+    """
+    fractions = np.asarray(fractions, dtype=np.float64)
+    has_hand = np.asarray(has_hand, dtype=bool)
+    rejected = fractions < threshold
+    hand_frames = int(has_hand.sum())
+    empty_frames = int(len(has_hand) - hand_frames)
+    saved = int((rejected & ~has_hand).sum())
+    false_negatives = int((rejected & has_hand).sum())
+    return {
+        "threshold": float(threshold),
+        "frames": int(len(has_hand)),
+        "hand_frames": hand_frames,
+        "empty_frames": empty_frames,
+        "saved": saved,
+        "saved_ratio": round(saved / empty_frames, 4) if empty_frames else 0.0,
+        "false_negatives": false_negatives,
+        "false_negative_rate": round(false_negatives / hand_frames, 4) if hand_frames else 0.0
+    }
+
+
+class HandPrefilter:
+    """按肤色占比丢弃明显无手的帧，可被多个线程共享"""
+
+    def __init__(self, min_skin_fraction: float = 0.002, width: int = 64, audit_interval: int = 50):
+        """
+        Args:
+            min_skin_fraction: 肤色像素占比低于该值的帧判定为无手
+            width: 计算肤色占比前缩小到的宽度
+            audit_interval: 每丢弃多少帧抽检一次（仍交给MediaPipe），0 表示不抽检
+        """
+        self.min_skin_fraction = float(min_skin_fraction)
+        self.width = int(width)
+        self.audit_interval = int(audit_interval)
+        self._lock = threading.Lock()
+
+        # 统计信息
+        self._frames = 0
+        self._rejected = 0
+        self._audited = 0
+        self._audit_misses = 0
+        self._check_seconds = 0.0
+
+    def check(self, image_bgr: np.ndarray) -> str:
+        """
+        判断一帧是否需要做手部检测
+
+        Returns:
+            PREFILTER_PASS、PREFILTER_REJECT 或 PREFILTER_AUDIT；
+            PREFILTER_AUDIT 的帧检测后需要调用 record_audit 报告结果
+        """
+        start = time.perf_counter()
+        candidate = skin_fraction(image_bgr, self.width) >= self.min_skin_fraction
+        elapsed = time.perf_counter() - start
+
+        with self._lock:
+            self._frames += 1
+            self._check_seconds += elapsed
+            if candidate:
+                return PREFILTER_PASS
+            self._rejected += 1
+            if self.audit_interval and self._rejected % self.audit_interval == 0:
+                return PREFILTER_AUDIT
+            return PREFILTER_REJECT
+
+    def record_audit(self, found_hand: bool):
+        """
+        记录抽检结果
+
+        Args:
+            found_hand: MediaPipe是否在被判定为无手的帧中找到了手
+        """
+        with self._lock:
+            self._audited += 1
+            self._audit_misses += int(found_hand)
+        if found_hand:
+            logger.debug("预过滤抽检：被丢弃的帧中检测到了手")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        获取预过滤统计：saved 为跳过MediaPipe的帧数；
+        被丢弃的帧中实际有手的比例由抽检估计，据此估算误丢弃的帧数
+        """
+        with self._lock:
+            miss_ratio = self._audit_misses / self._audited if self._audited else None
+            return {
+                "min_skin_fraction": self.min_skin_fraction,
+                "frames": self._frames,
+                "rejected": self._rejected,
+                "saved": self._rejected - self._audited,
+                "saved_ratio": round((self._rejected - self._audited) / self._frames, 4) if self._frames else 0.0,
+                "audited": self._audited,
+                "audit_misses": self._audit_misses,
+                "audit_miss_ratio": round(miss_ratio, 4) if miss_ratio is not None else None,
+                "estimated_wrongly_dropped": int(round(miss_ratio * self._rejected)) if miss_ratio is not None else None,
+                "avg_check_ms": round(self._check_seconds * 1000 / self._frames, 4) if self._frames else 0.0
+            }
@@ -0,0 +1,406 @@
+"""
+模型热切换模块
+HotSwapRecognizer 包装当前使用的识别器（识别器池或多进程识别器池），对外接口与之相同：
+- 新版本在后台线程中加载并预热，完成后原子替换，期间请求继续由旧版本处理
+- 已经开始处理的帧在旧版本上完成，最后一帧归还后才关闭旧版本
+- 影子模式：按比例把流量同时交给候选版本识别，只记录延迟和与当前版本的一致率，不影响响应
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+# 配置日志
+from ..utils.logger_config import get_module_logger
+logger = get_module_logger(__name__)
+
+# 影子识别最多积压的帧数，超过时跳过采样，避免拖慢主流程或占用过多内存
+SHADOW_MAX_PENDING = 4
+# 每隔多少个影子样本输出一次对比日志
+SHADOW_LOG_EVERY = 100
+
+
+class _Generation:
+    """一个已加载的模型版本及其使用状态"""
+
+    __slots__ = ("engine", "version", "users", "retired")
+
+    def __init__(self, engine: Any, version: Optional[str]):
+        self.engine = engine
+        self.version = version
+        # 正在使用该版本处理帧的调用方数量，大于0时不能关闭
+        self.users = 0
+        # 已被新版本替换，最后一个调用方归还时关闭
+        self.retired = False
+
+
+class _ShadowStats:
+    """影子模式的对比统计"""
+
+    def __init__(self, version: Optional[str], fraction: float):
+        self.version = version
+        self.fraction = fraction
+        self.frames = 0
+        self.agreements = 0
+        self.skipped = 0
+        self.errors = 0
+        self.primary_ms = 0.0
+        self.shadow_ms = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        frames = max(self.frames, 1)
+        return {
+            "version": self.version,
+            "fraction": self.fraction,
+            "frames": self.frames,
+            "skipped": self.skipped,
+            "errors": self.errors,
+            "agreement": round(self.agreements / frames, 4) if self.frames else None,
+            "primary_latency_ms": round(self.primary_ms / frames, 2) if self.frames else None,
+            "shadow_latency_ms": round(self.shadow_ms / frames, 2) if self.frames else None
+        }
+
+
+class HotSwapRecognizer:
+    """
+    可热切换模型版本的识别器
+    对外提供与 RecognizerPool 相同的调用接口
+    """
+
+    def __init__(self, engine: Any, version: Optional[str], loader: Callable[[str], Optional[Any]]):
+        """
+        Args:
+            engine: 已加载并预热的识别器
+            version: 该识别器对应的模型版本号
+            loader: 按版本号创建并预热识别器的函数，失败时返回 None
+        """
+        self._loader = loader
+        self._current = _Generation(engine, version)
+        self._lock = threading.Lock()
+
+        # 后台加载状态
+        self._loading_version: Optional[str] = None
+        self._last_error: Optional[str] = None
+        self._swaps = 0
+
+        # 影子模式
+        self._shadow: Optional[_Generation] = None
+        self._shadow_stats: Optional[_ShadowStats] = None
+        self._shadow_credit = 0.0
+        self._shadow_pending = 0
+        self._shadow_executor: Optional[ThreadPoolExecutor] = None
+
+    # ========== 版本引用计数 ==========
+
+    @contextmanager
+    def _use(self, shadow: bool = False) -> Iterator[Optional[_Generation]]:
+        """取得当前版本（或影子版本）的引用，退出时归还"""
+        with self._lock:
+            generation = self._shadow if shadow else self._current
+            if generation is not None:
+                generation.users += 1
+        try:
+            yield generation
+        finally:
+            if generation is not None:
+                self._release(generation)
+
+    def _release(self, generation: _Generation):
+        with self._lock:
+            generation.users -= 1
+            close_now = generation.retired and generation.users == 0
+        if close_now:
+            self._close_generation(generation)
+
+    def _retire(self, generation: Optional[_Generation]):
+        """标记版本已被替换，没有调用方使用时立即关闭（调用方不持有 self._lock）"""
+        if generation is None:
+            return
+        with self._lock:
+            generation.retired = True
+            close_now = generation.users == 0
+        if close_now:
+            self._close_generation(generation)
+
+    @staticmethod
+    def _close_generation(generation: _Generation):
+        try:
+            generation.engine.close()
+            logger.info(f"模型版本 {generation.version} 已关闭")
+        except Exception as e:
+            logger.warning(f"关闭模型版本 {generation.version} 失败: {str(e)}")
+
+    # ========== 与 RecognizerPool 相同的接口 ==========
+
+    @property
+    def version(self) -> Optional[str]:
+        return self._current.version
+
+    @property
+    def labels(self) -> List[str]:
+        return self._current.engine.labels
+
+    @property
+    def model(self):
+        return getattr(self._current.engine, "model", None)
+
+    @property
+    def model_path(self) -> str:
+        return self._current.engine.model_path
+
+    @property
+    def labels_path(self) -> str:
+        return self._current.engine.labels_path
+
+    def predict(self, image: np.ndarray, session_id: Optional[str] = None, return_probs: bool = False,
+                use_memo: bool = True, return_features: bool = False) -> Tuple:
+        """预测图像中的手语，参数和返回值与 SignLanguageRecognizer.predict 相同"""
+        sample = self._should_shadow()
+        if sample:
+            # 调用方可能在预测后直接在原图上绘制关键点，影子识别使用副本
+            shadow_image = image.copy()
+
+        start = time.perf_counter()
+        with self._use() as generation:
+            # 只在关闭预测缓存或需要特征时传递对应参数，兼容不支持这些参数的引擎
+            options = {} if use_memo else {"use_memo": False}
+            if return_features:
+                options["return_features"] = True
+            result = generation.engine.predict(image, session_id=session_id, return_probs=return_probs, **options)
+        primary_ms = (time.perf_counter() - start) * 1000
+
+        if sample:
+            self._submit_shadow(shadow_image, result[0], primary_ms)
+        return result
+
+    def predict_features(self, features: np.ndarray, return_probs: bool = False, use_memo: bool = True) -> Tuple:
+        """对特征向量分类，参数和返回值与 SignLanguageRecognizer.predict_features 相同（不参与影子模式）"""
+        with self._use() as generation:
+            options = {} if use_memo else {"use_memo": False}
+            return generation.engine.predict_features(features, return_probs=return_probs, **options)
+
+    def draw_landmarks(self, image: np.ndarray, hand_landmarks_list: List) -> np.ndarray:
+        return self._current.engine.draw_landmarks(image, hand_landmarks_list)
+
+    def release_session(self, session_id: str):
+        """释放会话；切换版本后旧版本的会话随旧版本一起关闭"""
+        with self._use() as generation:
+            generation.engine.release_session(session_id)
+
+    def is_ready(self) -> bool:
+        return self._current.engine.is_ready()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """获取版本切换和影子模式的状态"""
+        with self._lock:
+            shadow = self._shadow_stats.to_dict() if self._shadow_stats else None
+            return {
+                "serving": self._current.version,
+                "loading": self._loading_version,
+                "last_error": self._last_error,
+                "swaps": self._swaps,
+                "shadow": shadow
+            }
+
+    def get_model_info(self) -> dict:
+        """获取模型信息，附带版本状态"""
+        with self._use() as generation:
+            info = generation.engine.get_model_info()
+        info["version"] = self.get_stats()
+        return info
+
+    def close(self):
+        """关闭当前版本和影子版本"""
+        self.stop_shadow()
+        with self._lock:
+            current = self._current
+        self._retire(current)
+        logger.info("热切换识别器已关闭")
+
+    # ========== 版本切换 ==========
+
+    def swap(self, engine: Any, version: Optional[str]):
+        """
+        原子替换当前版本，旧版本在最后一帧处理完后关闭
+
+        Args:
+            engine: 已加载并预热的识别器
+            version: 新版本号
+        """
+        with self._lock:
+            previous = self._current
+            self._current = _Generation(engine, version)
+            self._swaps += 1
+        logger.info(f"✅ 模型版本已切换: {previous.version} -> {version}")
+        self._retire(previous)
+
+    def load_version(self, version: str, on_swapped: Optional[Callable[[str], None]] = None) -> bool:
+        """
+        在后台线程中加载并预热指定版本，完成后切换
+
+        Args:
+            version: 模型版本号
+            on_swapped: 切换成功后的回调（如更新 manifest 的启用版本）
+
+        Returns:
+            是否已开始加载；已有版本正在加载时返回 False
+        """
+        with self._lock:
+            if self._loading_version is not None:
+                return False
+            self._loading_version = version
+            self._last_error = None
+
+        def run():
+            try:
+                engine = self._loader(version)
+                if engine is None:
+                    raise RuntimeError(f"模型版本 {version} 加载失败")
+                self.swap(engine, version)
+                if on_swapped is not None:
+                    on_swapped(version)
+            except Exception as e:
+                logger.error(f"❌ 模型版本切换失败: {str(e)}")
+                with self._lock:
+                    self._last_error = str(e)
+            finally:
+                with self._lock:
+                    self._loading_version = None
+
+        threading.Thread(target=run, name=f"model-loader-{version}", daemon=True).start()
+        return True
+
+    # ========== 影子模式 ==========
+
+    def start_shadow(self, version: str, fraction: float) -> bool:
+        """
+        在后台加载候选版本，加载完成后按比例对流量做影子识别
+
+        Args:
+            version: 候选版本号
+            fraction: 参与影子识别的帧比例 (0, 1]
+
+        Returns:
+            是否已开始加载；已有版本正在加载时返回 False
+        """
+        fraction = min(max(float(fraction), 0.0), 1.0)
+        if fraction <= 0.0:
+            self.stop_shadow()
+            return True
+
+        with self._lock:
+            if self._loading_version is not None:
+                return False
+            self._loading_version = version
+            self._last_error = None
+
+        def run():
+            try:
+                engine = self._loader(version)
+                if engine is None:
+                    raise RuntimeError(f"模型版本 {version} 加载失败")
+                with self._lock:
+                    previous = self._shadow
+                    self._shadow = _Generation(engine, version)
+                    self._shadow_stats = _ShadowStats(version, fraction)
+                    self._shadow_credit = 0.0
+                    if self._shadow_executor is None:
+                        self._shadow_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="shadow")
+                self._retire(previous)
+                logger.info(f"影子模式已启动: 版本 {version}, 比例 {fraction:.2%}")
+            except Exception as e:
+                logger.error(f"❌ 影子版本加载失败: {str(e)}")
+                with self._lock:
+                    self._last_error = str(e)
+            finally:
+                with self._lock:
+                    self._loading_version = None
+
+        threading.Thread(target=run, name=f"shadow-loader-{version}", daemon=True).start()
+        return True
+
+    def stop_shadow(self):
+        """停止影子模式并关闭候选版本"""
+        with self._lock:
+            shadow = self._shadow
+            executor = self._shadow_executor
+            stats = self._shadow_stats
+            self._shadow = None
+            self._shadow_executor = None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        if shadow is not None:
+            if stats is not None:
+                logger.info(f"影子模式已停止: {stats.to_dict()}")
+            self._retire(shadow)
+
+    def _should_shadow(self) -> bool:
+        """按比例采样：每帧累加比例，累计满1时采样一帧"""
+        if self._shadow is None:
+            return False
+        with self._lock:
+            if self._shadow is None:
+                return False
+            self._shadow_credit += self._shadow_stats.fraction
+            if self._shadow_credit < 1.0:
+                return False
+            self._shadow_credit -= 1.0
+            if self._shadow_pending >= SHADOW_MAX_PENDING:
+                self._shadow_stats.skipped += 1
+                return False
+            self._shadow_pending += 1
+            return True
+
+    def _submit_shadow(self, image: np.ndarray, primary_label: Optional[str], primary_ms: float):
+        with self._lock:
+            executor = self._shadow_executor
+        if executor is None:
+            with self._lock:
+                self._shadow_pending -= 1
+            return
+        try:
+            executor.submit(self._run_shadow, image, primary_label, primary_ms)
+        except RuntimeError:
+            # 影子模式恰好被停止
+            with self._lock:
+                self._shadow_pending -= 1
+
+    def _run_shadow(self, image: np.ndarray, primary_label: Optional[str], primary_ms: float):
+        """在影子线程中用候选版本识别同一帧并记录对比结果"""
+        try:
+            with self._use(shadow=True) as generation:
+                if generation is None:
+                    return
+                start = time.perf_counter()
+                try:
+                    shadow_label = generation.engine.predict(image)[0]
+                    error = False
+                except Exception as e:
+                    logger.warning(f"影子识别失败: {str(e)}")
+                    shadow_label, error = None, True
+                shadow_ms = (time.perf_counter() - start) * 1000
+
+            with self._lock:
+                stats = self._shadow_stats
+                if stats is None or stats.version != generation.version:
+                    return
+                if error:
+                    stats.errors += 1
+                    return
+                stats.frames += 1
+                stats.agreements += int(shadow_label == primary_label)
+                stats.primary_ms += primary_ms
+                stats.shadow_ms += shadow_ms
+                summary = stats.to_dict() if stats.frames % SHADOW_LOG_EVERY == 0 else None
+            if summary is not None:
+                logger.info(
+                    f"影子模式 {summary['version']}: {summary['frames']} 帧, 一致率 {summary['agreement']:.2%}, "
+                    f"延迟 {summary['primary_latency_ms']}ms (当前) / {summary['shadow_latency_ms']}ms (候选)"
+                )
+        finally:
+            with self._lock:
+                self._shadow_pending -= 1
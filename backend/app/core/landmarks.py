@@ -0,0 +1,169 @@
+"""
+手部关键点数据转换模块
+- build_features: 训练与推理共用的 126 维特征构建，所有识别路径都调用它，保证特征完全一致
+- landmarks_to_array / array_to_landmarks: 关键点列表与 shape=(手数, 21, 3) 数组互相转换，
+  用于跨进程传递关键点
+- parse_landmark_array: 校验客户端上传的关键点（客户端自行运行手部跟踪，只上传坐标）
+"""
+
+from typing import Any, List, Optional
+
+import numpy as np
+
+# 每只手的关键点数量和每个关键点的坐标数
+NUM_LANDMARKS = 21
+NUM_COORDS = 3
+# 最多使用的手数，以及单手 / 双手的特征维度
+MAX_HANDS = 2
+HAND_FEATURE_DIM = NUM_LANDMARKS * NUM_COORDS
+FEATURE_DIM = MAX_HANDS * HAND_FEATURE_DIM
+
+# NormalizedLandmarkList 序列化后，每个关键点是一个只含 x/y/z 三个 fixed32 字段的子消息：
+# 0x0A 长度15 | 0x0D x | 0x15 y | 0x1D z，共17字节，坐标可以直接按步长读成 (21, 3) 的float32视图
+_PACKED_STRIDE = 17
+_PACKED_COORD_OFFSET = 3
+_PACKED_COORD_STRIDE = 5
+_PACKED_SIZE = NUM_LANDMARKS * _PACKED_STRIDE
+_PACKED_MARKERS = tuple(
+    (offset, bytes([value]) * NUM_LANDMARKS)
+    for offset, value in ((0, 0x0A), (1, 15), (2, 0x0D), (7, 0x15), (12, 0x1D))
+)
+
+
+def _fill_hand(out: np.ndarray, hand_landmarks) -> None:
+    """
+    把一只手的关键点写入 shape=(21, 3) 的数组
+
+    MediaPipe 的关键点是 protobuf 对象，逐个读取属性的开销远大于计算本身；
+    布局符合预期时直接解析序列化字节，否则（如含 visibility 字段或非protobuf对象）逐点读取。
+    已经是 shape=(21, 3) 数组的关键点（客户端上传）直接复制
+    """
+    if isinstance(hand_landmarks, np.ndarray):
+        out[...] = hand_landmarks
+        return
+
+    serialize = getattr(hand_landmarks, "SerializeToString", None)
+    if serialize is not None:
+        buffer = serialize()
+        if len(buffer) == _PACKED_SIZE and all(
+            buffer[offset::_PACKED_STRIDE] == marker for offset, marker in _PACKED_MARKERS
+        ):
+            out[...] = np.ndarray(
+                (NUM_LANDMARKS, NUM_COORDS), dtype="<f4", buffer=buffer,
+                offset=_PACKED_COORD_OFFSET, strides=(_PACKED_STRIDE, _PACKED_COORD_STRIDE)
+            )
+            return
+
+    out[...] = [(landmark.x, landmark.y, landmark.z) for landmark in hand_landmarks.landmark]
+
+
+def build_features(hand_landmarks_list, out: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
+    """
+    由手部关键点构建分类模型的输入特征
+
+    规则（训练和推理一致）：
+    - 按MediaPipe返回的顺序依次写入每只手的 21 个关键点的 (x, y, z)
+    - 只检测到一只手时，第二只手的 63 维补零
+    - 超过两只手时只使用前两只
+
+    Args:
+        hand_landmarks_list: MediaPipe手部关键点列表（results.multi_hand_landmarks），
+            或 parse_landmark_array 返回的 shape=(手数, 21, 3) 数组
+        out: 可选的 shape=(126,) float32 数组，提供时直接写入并返回它
+
+    Returns:
+        shape=(126,) 的 float32 特征向量，未检测到手时返回 None
+    """
+    if hand_landmarks_list is None or len(hand_landmarks_list) == 0:
+        return None
+
+    if out is None:
+        out = np.zeros(FEATURE_DIM, dtype=np.float32)
+    else:
+        out[...] = 0.0
+
+    hands = out.reshape(MAX_HANDS, NUM_LANDMARKS, NUM_COORDS)
+    for hand_index, hand_landmarks in zip(range(MAX_HANDS), hand_landmarks_list):
+        _fill_hand(hands[hand_index], hand_landmarks)
+    return out
+
+
+def landmarks_to_array(hand_landmarks_list: Optional[List]) -> Optional[np.ndarray]:
+    """
+    将MediaPipe手部关键点列表转换为数组
+
+    Args:
+        hand_landmarks_list: MediaPipe手部关键点对象列表
+
+    Returns:
+        shape=(手数, 21, 3) 的数组，未检测到手时返回 None
+    """
+    if not hand_landmarks_list:
+        return None
+
+    array = np.empty((len(hand_landmarks_list), NUM_LANDMARKS, NUM_COORDS), dtype=np.float32)
+    for hand_index, hand_landmarks in enumerate(hand_landmarks_list):
+        _fill_hand(array[hand_index], hand_landmarks)
+    return array
+
+
+def array_to_landmarks(array: Optional[np.ndarray]) -> Optional[List]:
+    """
+    将关键点数组还原为MediaPipe的 NormalizedLandmarkList 列表，
+    以便继续使用 draw_landmarks 和 TranslationService 的结果构建逻辑
+
+    Args:
+        array: shape=(手数, 21, 3) 的数组
+
+    Returns:
+        NormalizedLandmarkList 列表，输入为空时返回 None
+    """
+    if array is None or len(array) == 0:
+        return None
+
+    from mediapipe.framework.formats import landmark_pb2
+
+    hand_landmarks_list = []
+    for hand in np.asarray(array, dtype=np.float32):
+        hand_landmarks = landmark_pb2.NormalizedLandmarkList()
+        for x, y, z in hand.tolist():
+            hand_landmarks.landmark.add(x=x, y=y, z=z)
+        hand_landmarks_list.append(hand_landmarks)
+    return hand_landmarks_list
+
+
+def parse_landmark_array(data: Any) -> np.ndarray:
+    """
+    校验并转换客户端上传的关键点
+
+    接受以下形式（坐标与MediaPipe一致：x/y 为归一化坐标，z 为相对深度）：
+    - shape=(手数, 21, 3) 的嵌套列表，手数为 0-2
+    - shape=(21, 3) 的单手
+    - 长度为 63 或 126 的扁平列表（与特征向量的布局一致）
+
+    Args:
+        data: JSON解析得到的列表或numpy数组
+
+    Returns:
+        shape=(手数, 21, 3) 的 float32 数组，手数为 0 表示未检测到手
+
+    Raises:
+        ValueError: 形状不符或含非有限值
+    """
+    try:
+        array = np.asarray(data, dtype=np.float32)
+    except (TypeError, ValueError):
+        raise ValueError(f"关键点需要是 ({MAX_HANDS}, {NUM_LANDMARKS}, {NUM_COORDS}) 的数值数组")
+
+    if array.ndim == 1 and array.size in (0, HAND_FEATURE_DIM, FEATURE_DIM):
+        array = array.reshape(-1, NUM_LANDMARKS, NUM_COORDS)
+    elif array.ndim == 2 and array.shape == (NUM_LANDMARKS, NUM_COORDS):
+        array = array[None]
+
+    if array.ndim != 3 or array.shape[1:] != (NUM_LANDMARKS, NUM_COORDS) or len(array) > MAX_HANDS:
+        raise ValueError(
+            f"关键点形状错误: {array.shape}，需要 (手数, {NUM_LANDMARKS}, {NUM_COORDS})，手数不超过 {MAX_HANDS}"
+        )
+    if not np.all(np.isfinite(array)):
+        raise ValueError("关键点包含非有限值")
+    return array
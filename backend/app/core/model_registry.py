@@ -0,0 +1,201 @@
+"""
+模型版本仓库
+目录结构：
+    <MODEL_REGISTRY_DIR>/
+        manifest.json               # {"active": "v2", "versions": {"v1": {...}, "v2": {...}}}
+        v1/sign_language_model.h5
+        v1/sign_language_model.onnx          # 可选，注册时 .h5 同目录下的其他推理后端格式
+        v1/sign_language_model.int8.tflite   # 可选
+        v1/sign_language_labels.json
+        v2/...
+
+每个版本是一对模型和标签文件，以及注册时找到的 ONNX / TFLite 导出文件；manifest 记录当前启用的版本；
+manifest 通过临时文件 + os.replace 原子写入，读取方不会看到写了一半的内容
+"""
+
+import json
+import os
+import shutil
+import threading
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from .config import config
+
+# 配置日志
+from ..utils.logger_config import get_module_logger
+logger = get_module_logger(__name__)
+
+MANIFEST_NAME = "manifest.json"
+MODEL_FILE_NAME = "sign_language_model.h5"
+LABELS_FILE_NAME = "sign_language_labels.json"
+# 与 .h5 一同复制进仓库的其他推理后端格式（ONNX、TFLite 及其量化版本）
+BACKEND_ARTIFACT_EXTENSIONS = (".onnx", ".tflite")
+
+
+def _backend_artifacts(model_path: str) -> List[Tuple[str, str]]:
+    """
+    查找 .h5 同目录下同名的其他推理后端文件
+
+    Returns:
+        [(源文件路径, 仓库中的文件名)]，如 (".../model.int8.tflite", "sign_language_model.int8.tflite")
+    """
+    directory = os.path.dirname(os.path.abspath(model_path))
+    stem = os.path.splitext(os.path.basename(model_path))[0]
+    target_stem = os.path.splitext(MODEL_FILE_NAME)[0]
+    artifacts = []
+    for name in sorted(os.listdir(directory)):
+        if name.startswith(stem + ".") and name.endswith(BACKEND_ARTIFACT_EXTENSIONS):
+            artifacts.append((os.path.join(directory, name), target_stem + name[len(stem):]))
+    return artifacts
+
+
+class ModelRegistry:
+    """按版本号管理模型和标签文件"""
+
+    def __init__(self, root_dir: str):
+        """
+        Args:
+            root_dir: 仓库根目录，不存在时在第一次注册版本时创建
+        """
+        self.root_dir = os.path.abspath(root_dir)
+        self.manifest_path = os.path.join(self.root_dir, MANIFEST_NAME)
+        self._lock = threading.Lock()
+
+    def _read_manifest(self) -> Dict[str, Any]:
+        if not os.path.exists(self.manifest_path):
+            return {"active": None, "versions": {}}
+        with open(self.manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        manifest.setdefault("active", None)
+        manifest.setdefault("versions", {})
+        return manifest
+
+    def _write_manifest(self, manifest: Dict[str, Any]):
+        os.makedirs(self.root_dir, exist_ok=True)
+        tmp_path = f"{self.manifest_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.manifest_path)
+
+    def list_versions(self) -> List[Dict[str, Any]]:
+        """
+        列出所有版本
+
+        Returns:
+            按注册时间排序的版本信息列表，包含 version、active 和 manifest 中记录的字段
+        """
+        manifest = self._read_manifest()
+        versions = [
+            dict(entry, version=version, active=version == manifest["active"])
+            for version, entry in manifest["versions"].items()
+        ]
+        return sorted(versions, key=lambda entry: entry.get("registered_at", ""))
+
+    def active_version(self) -> Optional[str]:
+        """当前启用的版本号，仓库为空时返回 None"""
+        return self._read_manifest()["active"]
+
+    def resolve(self, version: Optional[str] = None, backend: Optional[str] = None) -> Tuple[str, str, str]:
+        """
+        获取某个版本的模型和标签路径
+
+        Args:
+            version: 版本号，为 None 时使用当前启用的版本
+            backend: 推理后端，提供时返回该后端格式的模型文件（如 .onnx），为 None 时返回 .h5
+
+        Returns:
+            (版本号, 模型路径, 标签路径)
+
+        Raises:
+            KeyError: 版本不存在或仓库中没有启用的版本
+            FileNotFoundError: 该版本没有指定推理后端所需的模型文件
+        """
+        manifest = self._read_manifest()
+        version = version or manifest["active"]
+        if version is None or version not in manifest["versions"]:
+            raise KeyError(f"模型版本不存在: {version}")
+
+        entry = manifest["versions"][version]
+        version_dir = os.path.join(self.root_dir, version)
+        model_path = os.path.join(version_dir, entry.get("model", MODEL_FILE_NAME))
+        if backend is not None:
+            model_path = config.model_path_for_backend(model_path, backend)
+            if not os.path.exists(model_path):
+                raise FileNotFoundError(
+                    f"模型版本 {version} 缺少 {backend} 推理后端所需的 {os.path.basename(model_path)}，"
+                    f"请把导出的文件放在 .h5 同目录下重新注册"
+                )
+        return version, model_path, os.path.join(version_dir, entry.get("labels", LABELS_FILE_NAME))
+
+    def register(self, version: str, model_path: str, labels_path: str,
+                 notes: str = "", activate: bool = False) -> Dict[str, Any]:
+        """
+        把一对模型和标签文件复制进仓库，.h5 同目录下同名的 ONNX / TFLite 文件一并复制，
+        以便其他推理后端也能加载和热切换该版本
+
+        Args:
+            version: 版本号，只能包含字母、数字、点、横线和下划线
+            model_path: .h5 模型文件
+            labels_path: 标签文件
+            notes: 版本说明
+            activate: 是否同时设为启用版本（只修改manifest，运行中的服务需调用热切换接口）
+
+        Returns:
+            该版本在 manifest 中的记录
+        """
+        if not version or not all(c.isalnum() or c in ".-_" for c in version) or version.startswith("."):
+            raise ValueError(f"非法的版本号: {version!r}")
+
+        with self._lock:
+            manifest = self._read_manifest()
+            if version in manifest["versions"]:
+                raise ValueError(f"模型版本已存在: {version}")
+
+            # 先复制到临时目录再改名，manifest 中只会出现完整的版本
+            version_dir = os.path.join(self.root_dir, version)
+            staging_dir = f"{version_dir}.{os.getpid()}.staging"
+            artifacts = _backend_artifacts(model_path)
+            os.makedirs(staging_dir)
+            try:
+                shutil.copy2(model_path, os.path.join(staging_dir, MODEL_FILE_NAME))
+                shutil.copy2(labels_path, os.path.join(staging_dir, LABELS_FILE_NAME))
+                for source, name in artifacts:
+                    shutil.copy2(source, os.path.join(staging_dir, name))
+                os.replace(staging_dir, version_dir)
+            except Exception:
+                shutil.rmtree(staging_dir, ignore_errors=True)
+                raise
+
+            with open(labels_path, 'r', encoding='utf-8') as f:
+                classes = json.load(f).get('classes', [])
+            entry = {
+                "model": MODEL_FILE_NAME,
+                "labels": LABELS_FILE_NAME,
+                "artifacts": [name for _, name in artifacts],
+                "num_classes": len(classes),
+                "notes": notes,
+                "registered_at": datetime.now().isoformat()
+            }
+            manifest["versions"][version] = entry
+            if activate or manifest["active"] is None:
+                manifest["active"] = version
+            self._write_manifest(manifest)
+
+        logger.info(f"模型版本已注册: {version} -> {version_dir}")
+        return entry
+
+    def set_active(self, version: str):
+        """
+        修改 manifest 中的启用版本，服务重启后也会加载该版本
+
+        Args:
+            version: 已注册的版本号
+        """
+        with self._lock:
+            manifest = self._read_manifest()
+            if version not in manifest["versions"]:
+                raise KeyError(f"模型版本不存在: {version}")
+            manifest["active"] = version
+            self._write_manifest(manifest)
+        logger.info(f"启用模型版本: {version}")
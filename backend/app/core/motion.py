@@ -0,0 +1,137 @@
+"""
+帧间变化检测模块
+前端按固定间隔发送帧，画面静止时（如用户在阅读题目）每帧都跑完整的识别流程是浪费的。
+每个会话保存上一次完整识别时的灰度缩略图和识别结果：新帧的缩略图与之相比
+变化的像素比例低于阈值时直接复用上一次的结果，跳过解码、关键点提取和分类
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+# 配置日志
+from ..utils.logger_config import get_module_logger
+logger = get_module_logger(__name__)
+
+
+class _GateState:
+    """单个会话的参考缩略图和可复用的结果"""
+
+    __slots__ = ("reference", "result", "reused", "last_used")
+
+    def __init__(self, reference: np.ndarray):
+        self.reference = reference
+        self.result: Any = None
+        self.reused = 0
+        self.last_used = time.monotonic()
+
+
+class MotionGate:
+    """按会话判断画面是否变化，画面不变时复用上一次的识别结果"""
+
+    def __init__(self, thumbnail_width: int = 64, pixel_threshold: int = 12, changed_fraction: float = 0.005,
+                 max_reuse: int = 20, max_sessions: int = 256, idle_timeout_s: float = 60.0):
+        """
+        Args:
+            thumbnail_width: 比较用灰度缩略图的宽度
+            pixel_threshold: 缩略图单个像素灰度差超过该值才算变化，过滤摄像头噪声和压缩噪声
+            changed_fraction: 变化像素占比达到该值时认为画面有变化
+            max_reuse: 连续复用的最大帧数，达到后强制完整识别一次
+            max_sessions: 同时保留的最大会话数
+            idle_timeout_s: 会话空闲多久后回收（秒）
+        """
+        self.thumbnail_width = int(thumbnail_width)
+        self.pixel_threshold = int(pixel_threshold)
+        self.changed_fraction = float(changed_fraction)
+        self.max_reuse = int(max_reuse)
+        self.max_sessions = max(1, int(max_sessions))
+        self.idle_timeout_s = float(idle_timeout_s)
+
+        self._states: "OrderedDict[str, _GateState]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        # 统计信息
+        self._frames = 0
+        self._skipped = 0
+
+    def is_static(self, reference: np.ndarray, thumbnail: np.ndarray) -> bool:
+        """两张缩略图之间变化的像素比例是否低于阈值"""
+        if reference.shape != thumbnail.shape:
+            return False
+        diff = np.abs(reference.astype(np.int16) - thumbnail.astype(np.int16))
+        return np.count_nonzero(diff > self.pixel_threshold) < self.changed_fraction * diff.size
+
+    def check(self, session_id: str, thumbnail: np.ndarray) -> Optional[Any]:
+        """
+        判断新帧是否可以复用上一次的结果
+
+        Args:
+            session_id: 会话ID
+            thumbnail: 新帧的灰度缩略图
+
+        Returns:
+            可复用的识别结果；需要完整识别时返回 None，并以该帧作为新的参考帧
+        """
+        session_id = str(session_id)
+        with self._lock:
+            self._frames += 1
+            now = time.monotonic()
+            state = self._states.get(session_id)
+
+            if (
+                state is not None
+                and state.result is not None
+                and state.reused < self.max_reuse
+                and now - state.last_used < self.idle_timeout_s
+                and self.is_static(state.reference, thumbnail)
+            ):
+                state.reused += 1
+                state.last_used = now
+                self._states.move_to_end(session_id)
+                self._skipped += 1
+                return state.result
+
+            # 与上一次完整识别的帧比较，而不是与上一帧比较，缓慢移动也会在累计后触发识别
+            if state is None:
+                state = _GateState(thumbnail)
+                self._states[session_id] = state
+                while len(self._states) > self.max_sessions:
+                    self._states.popitem(last=False)
+            else:
+                state.reference = thumbnail
+                state.result = None
+                state.reused = 0
+                state.last_used = now
+                self._states.move_to_end(session_id)
+            return None
+
+    def update(self, session_id: str, result: Any):
+        """
+        保存完整识别的结果，供之后画面不变的帧复用
+
+        Args:
+            session_id: 会话ID
+            result: 识别结果
+        """
+        with self._lock:
+            state = self._states.get(str(session_id))
+            if state is not None:
+                state.result = result
+
+    def release(self, session_id: str):
+        """释放会话（如WebSocket断开时）"""
+        with self._lock:
+            self._states.pop(str(session_id), None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """获取跳过帧的统计"""
+        with self._lock:
+            return {
+                "frames": self._frames,
+                "skipped": self._skipped,
+                "skip_ratio": round(self._skipped / self._frames, 4) if self._frames else 0.0,
+                "sessions": len(self._states)
+            }
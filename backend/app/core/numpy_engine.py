@@ -0,0 +1,329 @@
+"""
+NumPy推理引擎
+直接读取 .h5 权重，把 BatchNormalization 折叠进相邻的 Dense 层，
+用几次矩阵乘法完成推理，运行时不需要导入TensorFlow
+
+折叠后的权重可以保存为 .npy 文件并以只读内存映射方式加载，
+同一台机器上的多个服务进程映射同一个文件，内存中只保留一份权重
+"""
+
+import json
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+# 配置日志
+from ..utils.logger_config import get_module_logger
+logger = get_module_logger(__name__)
+
+# 与Keras模型输出的最大绝对误差（float32下实测约1e-7量级）
+NUMPY_ENGINE_TOLERANCE = 1e-5
+
+
+def _relu(x: np.ndarray) -> np.ndarray:
+    return np.maximum(x, 0.0, out=x)
+
+
+def _softmax(x: np.ndarray) -> np.ndarray:
+    x = x - x.max(axis=-1, keepdims=True)
+    np.exp(x, out=x)
+    x /= x.sum(axis=-1, keepdims=True)
+    return x
+
+
+def _sigmoid(x: np.ndarray) -> np.ndarray:
+    return 1.0 / (1.0 + np.exp(-x))
+
+
+_ACTIVATIONS = {
+    "linear": None,
+    "relu": _relu,
+    "softmax": _softmax,
+    "sigmoid": _sigmoid,
+    "tanh": np.tanh,
+}
+
+
+def _read_layer_weights(weights_group, layer_name: str) -> Dict[str, np.ndarray]:
+    """按权重名称后缀读取某一层的所有权重，如 kernel、bias、gamma"""
+    if layer_name not in weights_group:
+        return {}
+
+    layer_group = weights_group[layer_name]
+    weight_names = [
+        name.decode("utf-8") if isinstance(name, bytes) else str(name)
+        for name in layer_group.attrs.get("weight_names", [])
+    ]
+
+    weights = {}
+    for name in weight_names:
+        key = name.split("/")[-1].split(":")[0]
+        weights[key] = np.asarray(layer_group[name], dtype=np.float32)
+    return weights
+
+
+class NumpyMLPClassifier:
+    """
+    只由 Dense / BatchNormalization / Dropout 组成的分类器的NumPy实现
+
+    折叠规则：
+    - BN 紧跟在线性 Dense 之后时，直接缩放该层的权重和偏置
+    - BN 跟在激活函数之后时（本项目的模型结构），折叠进下一层 Dense 的输入端
+    - Dropout 在推理阶段不起作用，直接跳过
+    """
+
+    def __init__(self, model_path: str, shared_weights_path: Optional[str] = None):
+        """
+        读取 .h5 文件并完成BN折叠
+
+        Args:
+            model_path: Keras保存的 .h5 模型文件
+            shared_weights_path: 折叠后权重的 .npy 缓存路径，提供时以内存映射方式加载，
+                缓存不存在或与模型文件不匹配时重新生成
+        """
+        self.model_path = model_path
+        # 每一项为 (权重, 偏置, 激活函数名)，权重为None时表示逐元素仿射 x * bias[0] + bias[1]
+        self.layers: List[Tuple[Optional[np.ndarray], Any, str]] = []
+        self.input_dim = 0
+        self.output_dim = 0
+        self.latency_report: Optional[Dict[str, float]] = None
+        # 权重来源：h5（进程内副本）或 mmap（共享的内存映射文件）
+        self.weights_source = "h5"
+
+        if shared_weights_path and self._map_folded(shared_weights_path):
+            return
+
+        self._load(model_path)
+        if shared_weights_path:
+            try:
+                self.save_folded(shared_weights_path)
+                self._map_folded(shared_weights_path)
+            except OSError as e:
+                logger.warning(f"无法写入共享权重文件，使用进程内权重: {str(e)}")
+
+    @property
+    def input_shape(self):
+        return (None, self.input_dim)
+
+    @property
+    def output_shape(self):
+        return (None, self.output_dim)
+
+    def _load(self, model_path: str):
+        """解析模型结构并加载、折叠权重"""
+        import h5py
+
+        with h5py.File(model_path, "r") as f:
+            model_config = f.attrs.get("model_config")
+            if model_config is None:
+                raise ValueError(f"模型文件缺少 model_config: {model_path}")
+            if isinstance(model_config, bytes):
+                model_config = model_config.decode("utf-8")
+            layer_configs = json.loads(model_config)["config"]["layers"]
+
+            weights_group = f["model_weights"] if "model_weights" in f else f
+            # 待折叠进下一层 Dense 的逐元素仿射 (scale, shift)
+            pending: Optional[Tuple[np.ndarray, np.ndarray]] = None
+
+            for layer in layer_configs:
+                class_name = layer["class_name"]
+                layer_config = layer["config"]
+                name = layer_config.get("name")
+
+                if class_name == "InputLayer":
+                    shape = layer_config.get("batch_input_shape") or layer_config.get("batch_shape")
+                    self.input_dim = int(shape[-1])
+
+                elif class_name == "Dense":
+                    weights = _read_layer_weights(weights_group, name)
+                    kernel = weights["kernel"]
+                    bias = weights.get("bias", np.zeros(kernel.shape[1], dtype=np.float32))
+                    activation = layer_config.get("activation", "linear")
+                    if activation not in _ACTIVATIONS:
+                        raise ValueError(f"不支持的激活函数: {activation}")
+
+                    if pending is not None:
+                        # (x * s + t) @ W + b = x @ (s[:, None] * W) + (t @ W + b)
+                        scale, shift = pending
+                        bias = bias + shift @ kernel
+                        kernel = scale[:, None] * kernel
+                        pending = None
+
+                    if not self.input_dim:
+                        self.input_dim = int(kernel.shape[0])
+                    self.layers.append((
+                        np.ascontiguousarray(kernel, dtype=np.float32),
+                        bias.astype(np.float32),
+                        activation
+                    ))
+
+                elif class_name == "BatchNormalization":
+                    weights = _read_layer_weights(weights_group, name)
+                    epsilon = float(layer_config.get("epsilon", 1e-3))
+                    mean = weights["moving_mean"]
+                    variance = weights["moving_variance"]
+                    gamma = weights.get("gamma", np.ones_like(mean))
+                    beta = weights.get("beta", np.zeros_like(mean))
+
+                    scale = gamma / np.sqrt(variance + epsilon)
+                    shift = beta - mean * scale
+
+                    if pending is not None:
+                        prev_scale, prev_shift = pending
+                        pending = (prev_scale * scale, prev_shift * scale + shift)
+                    elif self.layers and self.layers[-1][0] is not None and self.layers[-1][2] == "linear":
+                        # 线性 Dense 后直接接 BN：缩放该层输出
+                        kernel, bias, activation = self.layers[-1]
+                        self.layers[-1] = (kernel * scale, bias * scale + shift, activation)
+                    else:
+                        pending = (scale, shift)
+
+                elif class_name == "Dropout":
+                    continue
+
+                else:
+                    raise ValueError(f"NumPy推理引擎不支持的层类型: {class_name}")
+
+            if pending is not None:
+                # 最后一层之后仍有BN，保留为独立的逐元素仿射
+                self.layers.append((None, pending, "linear"))
+
+        if not self.layers:
+            raise ValueError(f"模型中没有可用的层: {model_path}")
+
+        last_kernel, last_bias, _ = self.layers[-1]
+        self.output_dim = int(last_kernel.shape[1] if last_kernel is not None else last_bias[0].shape[0])
+
+        logger.info(
+            f"NumPy推理引擎加载完成: {len(self.layers)} 个计算层, "
+            f"输入维度={self.input_dim}, 输出维度={self.output_dim}"
+        )
+
+    def _source_signature(self) -> Dict[str, Any]:
+        """模型文件的标识，用于判断权重缓存是否过期"""
+        stat = os.stat(self.model_path)
+        return {
+            "source": os.path.abspath(self.model_path),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns
+        }
+
+    def save_folded(self, path: str):
+        """
+        把折叠后的权重保存为一个扁平的 float32 .npy 文件，布局写入同名 .json
+
+        Args:
+            path: .npy 文件路径
+        """
+        chunks = []
+        offset = 0
+        layout = []
+
+        def add(array: np.ndarray) -> List:
+            nonlocal offset
+            array = np.ascontiguousarray(array, dtype=np.float32)
+            chunks.append(array.ravel())
+            entry = [offset, list(array.shape)]
+            offset += array.size
+            return entry
+
+        for kernel, bias, activation in self.layers:
+            if kernel is None:
+                layout.append({"scale": add(bias[0]), "shift": add(bias[1]), "activation": activation})
+            else:
+                layout.append({"kernel": add(kernel), "bias": add(bias), "activation": activation})
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        # 先写入临时文件再替换，其他进程不会读到写了一半的文件；布局文件最后写入，作为完成标记
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as f:
+            np.save(f, np.concatenate(chunks))
+        os.replace(temp_path, path)
+
+        meta = {
+            **self._source_signature(),
+            "input_dim": self.input_dim,
+            "output_dim": self.output_dim,
+            "layers": layout
+        }
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+        os.replace(temp_path, path + ".json")
+        logger.info(f"折叠后的权重已保存: {path} ({offset * 4 / 1024:.1f} KB)")
+
+    def _map_folded(self, path: str) -> bool:
+        """
+        以只读内存映射方式加载折叠后的权重
+
+        Returns:
+            缓存存在且与模型文件匹配时返回 True
+        """
+        meta_path = path + ".json"
+        if not (os.path.exists(path) and os.path.exists(meta_path)):
+            return False
+
+        with open(meta_path, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        signature = self._source_signature()
+        if any(meta.get(key) != value for key, value in signature.items()):
+            logger.info(f"共享权重文件已过期，重新生成: {path}")
+            return False
+
+        flat = np.load(path, mmap_mode="r")
+
+        def view(entry: List) -> np.ndarray:
+            offset, shape = entry
+            size = int(np.prod(shape))
+            return np.asarray(flat[offset:offset + size]).reshape(shape)
+
+        layers = []
+        for layer in meta["layers"]:
+            if "kernel" in layer:
+                layers.append((view(layer["kernel"]), view(layer["bias"]), layer["activation"]))
+            else:
+                layers.append((None, (view(layer["scale"]), view(layer["shift"])), layer["activation"]))
+
+        self.layers = layers
+        self.input_dim = int(meta["input_dim"])
+        self.output_dim = int(meta["output_dim"])
+        self.weights_source = "mmap"
+        logger.info(f"NumPy推理引擎使用共享权重: {path}")
+        return True
+
+    def predict(self, features_batch: np.ndarray) -> np.ndarray:
+        """
+        批量推理
+
+        Args:
+            features_batch: shape=(N, 126) 的特征矩阵
+
+        Returns:
+            shape=(N, 类别数) 的softmax概率矩阵
+        """
+        x = np.asarray(features_batch, dtype=np.float32)
+        if x.ndim == 1:
+            x = x.reshape(1, -1)
+
+        for kernel, bias, activation in self.layers:
+            if kernel is None:
+                scale, shift = bias
+                x = x * scale + shift
+            else:
+                x = x @ kernel
+                x += bias
+
+            activation_fn = _ACTIVATIONS[activation]
+            if activation_fn is not None:
+                x = activation_fn(x)
+        return x
+
+    def get_info(self) -> Dict[str, Any]:
+        """获取推理引擎信息"""
+        return {
+            "backend": "numpy",
+            "layers": len(self.layers),
+            "tolerance": NUMPY_ENGINE_TOLERANCE,
+            "weights_source": self.weights_source,
+            "latency_ms": self.latency_report
+        }
@@ -0,0 +1,104 @@
+"""
+量化特征的预测缓存模块
+保持同一个手势时，相邻帧的像素虽然不同，126维关键点特征只在很小的范围内抖动。
+把特征按固定网格量化后作为键，落在同一网格中的手势直接复用之前的softmax输出，
+不再调用分类模型。缓存按最近使用顺序淘汰
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+# 配置日志
+from ..utils.logger_config import get_module_logger
+logger = get_module_logger(__name__)
+
+
+class PredictionMemo:
+    """以量化后的特征向量为键的分类结果LRU缓存，可被多个线程共享"""
+
+    def __init__(self, grid_size: float = 0.01, max_entries: int = 4096):
+        """
+        Args:
+            grid_size: 量化网格的边长（归一化坐标），0.01 约相当于640像素宽画面中的6个像素
+            max_entries: 最大条目数，超出时淘汰最久未使用的条目
+        """
+        if grid_size <= 0:
+            raise ValueError(f"grid_size 必须大于0: {grid_size}")
+        self.grid_size = float(grid_size)
+        self.max_entries = max(1, int(max_entries))
+
+        self._entries: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        # 统计信息
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def make_key(self, features: np.ndarray) -> bytes:
+        """
+        把特征向量量化到网格上
+
+        Args:
+            features: shape=(126,) 的特征向量
+
+        Returns:
+            量化后坐标的字节串
+        """
+        return np.rint(np.asarray(features, dtype=np.float32) / self.grid_size).astype(np.int32).tobytes()
+
+    def get(self, key: bytes) -> Optional[np.ndarray]:
+        """
+        查找缓存的softmax输出
+
+        Returns:
+            只读的概率数组，未命中时返回 None
+        """
+        with self._lock:
+            probabilities = self._entries.get(key)
+            if probabilities is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return probabilities
+
+    def put(self, key: bytes, probabilities: np.ndarray):
+        """
+        保存分类结果
+
+        Args:
+            key: make_key 计算的键
+            probabilities: shape=(类别数,) 的softmax输出
+        """
+        # 保存只读副本，调用方修改返回的数组不会影响缓存
+        probabilities = np.array(probabilities, dtype=np.float32)
+        probabilities.setflags(write=False)
+        with self._lock:
+            self._entries[key] = probabilities
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self):
+        """清空缓存（如更换分类模型后）"""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """获取缓存统计"""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "grid_size": self.grid_size,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": round(self._hits / lookups, 4) if lookups else 0.0,
+                "evictions": self._evictions
+            }
@@ -3,56 +3,175 @@
 负责加载模型、提取特征和进行预测
 """
 
+import copy
 import cv2
 import numpy as np
 import mediapipe as mp
-import tensorflow as tf
-from tensorflow import keras
 import json
 import os
-from typing import List, Tuple, Optional
+import threading
+import time
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Callable, List, Tuple, Optional
 from datetime import datetime
 
+from .batcher import InferenceBatcher
+from .hand_prefilter import PREFILTER_AUDIT, PREFILTER_REJECT, HandPrefilter
+from .classifier import load_classifier
+from .landmarks import FEATURE_DIM, build_features
+from .prediction_memo import PredictionMemo
+from .resolution import ResolutionController, fit_to_side
+from .session import HandTrackerRegistry
+
 # 配置日志
+from ..utils.error_handler import RecognitionError
 from ..utils.logger_config import get_module_logger
 logger = get_module_logger(__name__)
 
+def draw_hand_landmarks(image: np.ndarray, hand_landmarks_list: List) -> np.ndarray:
+    """
+    在图像上绘制手部关键点（不依赖识别器实例，多进程模式下在主进程中使用）
+
+    Args:
+        image: OpenCV格式的图像 (BGR)
+        hand_landmarks_list: MediaPipe手部关键点列表
+
+    Returns:
+        绘制关键点后的图像
+    """
+    mp_drawing = mp.solutions.drawing_utils
+    try:
+        for hand_landmarks in hand_landmarks_list:
+            mp_drawing.draw_landmarks(
+                image,
+                hand_landmarks,
+                mp.solutions.hands.HAND_CONNECTIONS,
+                # 关键点样式：绿色小圆点
+                mp_drawing.DrawingSpec(
+                    color=(0, 255, 0), thickness=2, circle_radius=2
+                ),
+                # 连接线样式：红色线条
+                mp_drawing.DrawingSpec(
+                    color=(255, 0, 0), thickness=2
+                )
+            )
+        return image
+
+    except Exception as e:
+        logger.error(f"绘制关键点失败: {str(e)}")
+        return image
+
+def pack_prediction(label, confidence, hand_landmarks, probabilities, features,
+                    return_probs: bool, return_features: bool) -> Tuple:
+    """按 predict 的 return_probs / return_features 参数组装返回的元组"""
+    result = (label, confidence, hand_landmarks)
+    if return_probs:
+        result += (probabilities,)
+    if return_features:
+        result += (features,)
+    return result
+
+
 class SignLanguageRecognizer:
     """
     手语识别器
     核心功能：使用MediaPipe检测手部关键点，使用深度学习模型进行分类
     """
 
-    def __init__(self, model_path: str, labels_path: str):
+    # MediaPipe手部检测图的默认参数，可通过构造参数 hands_options 覆盖，get_model_info 也从这里读取
+    hands_options = {
+        "static_image_mode": False,  # 视频流模式
+        "model_complexity": 1,  # 手部关键点模型复杂度，0 为轻量模型
+        "max_num_hands": 2,  # 最大检测2只手
+        "min_detection_confidence": 0.5,  # 最小检测置信度
+        "min_tracking_confidence": 0.5  # 最小跟踪置信度
+    }
+
+    def __init__(self, model_path: str, labels_path: str, backend: str = "keras",
+                 fast_path: bool = True, benchmark_iterations: int = 0,
+                 shared_weights: bool = False, hands_options: Optional[dict] = None,
+                 num_threads: int = 0, weights_cache_dir: str = ""):
         """
         初始化识别器
 
         Args:
             model_path: 模型文件路径 (.h5格式)
             labels_path: 标签文件路径 (.json格式)
+            backend: 推理后端，可选 keras、numpy、onnx、tflite
+            fast_path: 是否使用编译后的推理函数代替 model.predict
+            benchmark_iterations: 加载后测量推理延迟的调用次数，0 表示不测量
+            shared_weights: numpy 后端是否以内存映射方式加载权重，同机多个服务进程共享一份
+            hands_options: 覆盖默认的MediaPipe参数，如 config.hands_options()
+            num_threads: onnx/tflite 后端的推理线程数，0 表示使用默认值
+            weights_cache_dir: 共享权重文件的目录，为空时使用系统临时目录
         """
         self.model = None
         self.labels = []
         self.model_path = model_path
         self.labels_path = labels_path
+        self.backend = backend
+        self.fast_path = fast_path
+        self.benchmark_iterations = benchmark_iterations
+        self.shared_weights = shared_weights
+        self.weights_cache_dir = weights_cache_dir
+        self.num_threads = num_threads
+        if hands_options:
+            self.hands_options = {**SignLanguageRecognizer.hands_options, **hands_options}
+        # 微批调度器（可选），启用后分类调用会与其他会话合并
+        self.batcher: Optional[InferenceBatcher] = None
+        # 等待微批结果的超时（秒），None 表示不限时
+        self.batch_timeout_s: Optional[float] = None
+        # 会话级检测图（可选），启用后同一路视频流的帧始终送入同一个检测图
+        self.sessions: Optional[HandTrackerRegistry] = None
+        # 会话数已满时处理该会话帧的检测函数（识别器池设置为签出一个成员），为None时使用本实例的静态图片模式检测图
+        self.session_overflow: Optional[Callable[[np.ndarray], object]] = None
+        # 量化特征的预测缓存（可选），手势几乎不变时复用之前的分类结果
+        self.prediction_memo: Optional[PredictionMemo] = None
+        # 无手帧预过滤（可选），肤色占比过低的帧跳过MediaPipe
+        self.prefilter: Optional[HandPrefilter] = None
+        # 自适应检测分辨率（可选），按延迟目标和负载为每个会话选择送入MediaPipe的分辨率
+        self.resolution: Optional[ResolutionController] = None
+        # 模型、标签和调度器的所有者负责关闭调度器，clone出的实例只共享引用
+        self._owns_model = True
 
         # MediaPipe配置
         self.mp_hands = mp.solutions.hands
-        self.hands = self.mp_hands.Hands(
-            static_image_mode=False,  # 视频流模式
-            max_num_hands=2,  # 最大检测2只手
-            min_detection_confidence=0.5,  # 最小检测置信度
-            min_tracking_confidence=0.5  # 最小跟踪置信度
-        )
+        self.hands = self._create_hands()
         self.mp_drawing = mp.solutions.drawing_utils
+        # MediaPipe图不是线程安全的，只在调用process时加锁，分类阶段可以并发
+        self._hands_lock = threading.Lock()
+        # 静态图片模式的检测图，不保留跟踪状态，首次需要时创建
+        self.static_hands = None
+        self._static_hands_lock = threading.Lock()
 
         # 加载模型和标签
         self._load_model()
         self._load_labels()
 
+    def _create_hands(self, **overrides):
+        """创建一个独立的MediaPipe手部检测图，overrides 覆盖部分构造参数（如 static_image_mode）"""
+        return self.mp_hands.Hands(**{**self.hands_options, **overrides})
+
+    def clone(self) -> "SignLanguageRecognizer":
+        """
+        创建共享模型、标签和微批调度器，但拥有独立MediaPipe图的识别器
+        用于识别器池，每个实例同一时间只被一个线程使用
+
+        Returns:
+            新的识别器实例
+        """
+        twin = copy.copy(self)
+        twin.hands = self._create_hands()
+        twin._hands_lock = threading.Lock()
+        twin.static_hands = None
+        twin._static_hands_lock = threading.Lock()
+        twin.session_overflow = None
+        twin._owns_model = False
+        return twin
+
     def _load_model(self) -> bool:
         """
-        加载TensorFlow模型
+        按配置的推理后端加载分类模型
 
         Returns:
             是否加载成功
@@ -62,8 +181,16 @@ class SignLanguageRecognizer:
                 logger.error(f"模型文件不存在: {self.model_path}")
                 return False
 
-            self.model = keras.models.load_model(self.model_path)
-            logger.info(f"✅ 模型加载成功: {self.model_path}")
+            self.model = load_classifier(
+                self.model_path,
+                backend=self.backend,
+                fast_path=self.fast_path,
+                benchmark_iterations=self.benchmark_iterations,
+                num_threads=self.num_threads,
+                shared_weights=self.shared_weights,
+                weights_cache_dir=self.weights_cache_dir
+            )
+            logger.info(f"✅ 模型加载成功: {self.model_path} (推理后端: {self.backend})")
             logger.info(f"   模型输入形状: {self.model.input_shape}")
             logger.info(f"   模型输出形状: {self.model.output_shape}")
 
@@ -99,12 +226,70 @@ class SignLanguageRecognizer:
             logger.error(f"❌ 标签加载失败: {str(e)}")
             return False
 
-    def extract_features(self, image: np.ndarray) -> Tuple[Optional[np.ndarray], Optional[List]]:
+    def enable_sessions(self, idle_timeout_s: float = 60.0, max_sessions: int = 64) -> HandTrackerRegistry:
+        """
+        启用会话级手部跟踪，带 session_id 的帧使用该会话独占的检测图
+
+        Args:
+            idle_timeout_s: 会话空闲多久后回收（秒）
+            max_sessions: 同时保留的最大会话数
+
+        Returns:
+            会话注册表
+        """
+        if self.sessions is None:
+            self.sessions = HandTrackerRegistry(
+                self._create_hands,
+                idle_timeout_s=idle_timeout_s,
+                max_sessions=max_sessions
+            )
+        return self.sessions
+
+    def release_session(self, session_id: str):
+        """释放会话的检测图（如WebSocket断开时）"""
+        if self.sessions is not None and session_id is not None:
+            self.sessions.release(session_id)
+        if self.resolution is not None and session_id is not None:
+            self.resolution.forget(session_id)
+
+    def _process_hands(self, image_rgb: np.ndarray, session_id: Optional[str] = None):
+        """
+        运行MediaPipe检测，有会话时使用会话独占的检测图；
+        会话数已满时该帧不能混入其他视频流的跟踪状态，改用不保留跟踪状态的静态图片模式检测
+        """
+        if session_id is not None and self.sessions is not None:
+            with self.sessions.acquire(session_id) as hands:
+                if hands is not None:
+                    return hands.process(image_rgb)
+            if self.session_overflow is not None:
+                return self.session_overflow(image_rgb)
+            return self.detect_static(image_rgb)
+
+        with self._hands_lock:
+            return self.hands.process(image_rgb)
+
+    def detect_static(self, image_rgb: np.ndarray):
+        """
+        用静态图片模式的检测图处理单帧，每帧都做手掌检测，不依赖也不改变任何视频流的跟踪状态
+
+        Args:
+            image_rgb: RGB格式的图像
+
+        Returns:
+            MediaPipe的检测结果
+        """
+        with self._static_hands_lock:
+            if self.static_hands is None:
+                self.static_hands = self._create_hands(static_image_mode=True)
+            return self.static_hands.process(image_rgb)
+
+    def extract_features(self, image: np.ndarray, session_id: Optional[str] = None) -> Tuple[Optional[np.ndarray], Optional[List]]:
         """
         从图像中提取手部关键点特征
 
         Args:
             image: OpenCV格式的图像 (BGR)
+            session_id: 视频流的会话ID，为None时使用识别器自身的检测图
 
         Returns:
             Tuple[特征向量, 手部关键点列表]
@@ -113,92 +298,252 @@ class SignLanguageRecognizer:
             - 如果未检测到手，返回 (None, None)
         """
         try:
-            # 将BGR转换为RGB
-            image_rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+            # 明显无手的帧不做检测
+            decision = self.prefilter.check(image) if self.prefilter is not None else None
+            if decision == PREFILTER_REJECT:
+                return None, None
 
-            # 使用MediaPipe检测手部
-            results = self.hands.process(image_rgb)
+            # 按该会话当前的检测分辨率缩小图像，关键点是归一化坐标，不受缩放影响
+            max_side = self.resolution.acquire(session_id) if self.resolution is not None else None
+            start = time.perf_counter()
+            detected = False
+            try:
+                if max_side is not None:
+                    image = fit_to_side(image, max_side)
+
+                # 将BGR转换为RGB
+                image_rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+
+                # 使用MediaPipe检测手部
+                results = self._process_hands(image_rgb, session_id)
+                detected = bool(results.multi_hand_landmarks)
+            finally:
+                if max_side is not None:
+                    self.resolution.release(session_id, max_side, (time.perf_counter() - start) * 1000, detected)
+            if decision == PREFILTER_AUDIT:
+                self.prefilter.record_audit(detected)
 
             # 如果没有检测到手部关键点
             if not results.multi_hand_landmarks:
                 return None, None
 
-            # 提取特征
-            features = []
-            hand_landmarks_list = []
-
-            for hand_landmarks in results.multi_hand_landmarks:
-                # 存储手部关键点
-                hand_landmarks_list.append(hand_landmarks)
-
-                # 提取该手的特征
-                hand_features = []
-                for landmark in hand_landmarks.landmark:
-                    # 每个关键点有x, y, z三个坐标
-                    hand_features.extend([landmark.x, landmark.y, landmark.z])
-
-                # 将该手的特征添加到总特征中
-                features.extend(hand_features)
-
-            # 如果只检测到一只手，用零填充第二只手的特征
-            if len(results.multi_hand_landmarks) == 1:
-                features.extend([0.0] * 63)  # 21个关键点 * 3个坐标 = 63维
-
-            # 确保特征向量长度不超过126维（2只手 * 21关键点 * 3坐标）
-            features = features[:126]
+            # 提取特征：与训练脚本共用同一个特征构建函数
+            hand_landmarks_list = list(results.multi_hand_landmarks)
+            features = build_features(hand_landmarks_list)
 
             logger.debug(f"特征提取完成: 维度={len(features)}, 手部数={len(hand_landmarks_list)}")
 
-            return np.array(features, dtype=np.float32), hand_landmarks_list
+            return features, hand_landmarks_list
 
         except Exception as e:
             logger.error(f"特征提取失败: {str(e)}")
             return None, None
 
-    def predict(self, image: np.ndarray) -> Tuple[Optional[str], Optional[float], Optional[List]]:
+    def predict(self, image: np.ndarray, session_id: Optional[str] = None, return_probs: bool = False,
+                use_memo: bool = True, return_features: bool = False) -> Tuple:
         """
         预测图像中的手语
 
         Args:
             image: OpenCV格式的图像 (BGR)
+            session_id: 视频流的会话ID，同一会话的帧共享跟踪状态
+            return_probs: 是否额外返回所有类别的概率
+            use_memo: 是否使用预测缓存（已启用时），为False时本次总是调用分类模型
+            return_features: 是否额外返回构建好的特征向量（如供时序模型使用，不必再由关键点构建）
 
         Returns:
-            Tuple[预测类别, 置信度, 手部关键点列表]
+            Tuple[预测类别, 置信度, 手部关键点列表]，return_probs=True 时追加概率数组，
+            return_features=True 时再追加特征向量
             - 预测类别: 手语标签字符串，如果未检测到手则为None
             - 置信度: 0-1之间的浮点数
             - 手部关键点列表: 用于可视化的关键点数据
+            - 概率数组: shape=(类别数,)，未检测到手时为None
+            - 特征向量: shape=(126,)，未检测到手时为None
         """
         try:
             # 检查模型是否加载
             if self.model is None or len(self.labels) == 0:
                 logger.error("模型或标签未加载，无法进行预测")
-                return None, None, None
+                return pack_prediction(None, None, None, None, None, return_probs, return_features)
 
             # 提取特征
-            features, hand_landmarks = self.extract_features(image)
+            features, hand_landmarks = self.extract_features(image, session_id)
 
             # 如果没有检测到手部
             if features is None:
-                return None, 0.0, None
+                return pack_prediction(None, 0.0, None, None, None, return_probs, return_features)
 
-            # 准备模型输入：添加batch维度
-            features_input = features.reshape(1, -1)
-
-            # 进行预测
-            predictions = self.model.predict(features_input, verbose=0)
+            probabilities = self._classify(features, use_memo and self.prediction_memo is not None)
 
             # 获取最高概率的类别
-            predicted_index = np.argmax(predictions[0])
-            confidence = float(predictions[0][predicted_index])
+            predicted_index = int(np.argmax(probabilities))
+            confidence = float(probabilities[predicted_index])
             predicted_label = self.labels[predicted_index]
 
             logger.debug(f"预测结果: {predicted_label} (置信度: {confidence:.4f})")
 
-            return predicted_label, confidence, hand_landmarks
+            return pack_prediction(predicted_label, confidence, hand_landmarks, np.asarray(probabilities),
+                                   features, return_probs, return_features)
 
+        except RecognitionError:
+            raise
         except Exception as e:
             logger.error(f"预测失败: {str(e)}")
-            return None, None, None
+            return pack_prediction(None, None, None, None, None, return_probs, return_features)
+
+    def predict_features(self, features: np.ndarray, return_probs: bool = False, use_memo: bool = True) -> Tuple:
+        """
+        对已构建好的特征向量分类，不经过MediaPipe检测（客户端上传关键点时使用）
+
+        Args:
+            features: build_features 得到的 shape=(126,) 特征向量
+            return_probs: 是否额外返回所有类别的概率
+            use_memo: 是否使用预测缓存（已启用时）
+
+        Returns:
+            Tuple[预测类别, 置信度]，return_probs=True 时末尾追加概率数组；模型未加载时类别和置信度为None
+        """
+        if self.model is None or len(self.labels) == 0:
+            logger.error("模型或标签未加载，无法进行预测")
+            return (None, None, None) if return_probs else (None, None)
+
+        probabilities = self._classify(
+            np.asarray(features, dtype=np.float32), use_memo and self.prediction_memo is not None
+        )
+        predicted_index = int(np.argmax(probabilities))
+        predicted_label, confidence = self.labels[predicted_index], float(probabilities[predicted_index])
+        if return_probs:
+            return predicted_label, confidence, np.asarray(probabilities)
+        return predicted_label, confidence
+
+    def _classify(self, features: np.ndarray, use_memo: bool) -> np.ndarray:
+        """
+        对单个特征向量分类，先查预测缓存，启用微批时与其他会话合并成一个批次
+
+        Raises:
+            RecognitionError: 等待微批结果超过 batch_timeout_s
+        """
+        if use_memo:
+            key = self.prediction_memo.make_key(features)
+            probabilities = self.prediction_memo.get(key)
+            if probabilities is not None:
+                return probabilities
+
+        if self.batcher is not None:
+            try:
+                probabilities = self.batcher.predict(features, timeout=self.batch_timeout_s)
+            except FutureTimeoutError:
+                logger.warning(f"等待微批推理结果超时 ({self.batch_timeout_s:.3f}s)")
+                raise RecognitionError("推理超时，请稍后重试", {"timeout_s": self.batch_timeout_s})
+        else:
+            probabilities = self.predict_proba(features.reshape(1, -1))[0]
+
+        if use_memo:
+            self.prediction_memo.put(key, probabilities)
+        return probabilities
+
+    def predict_proba(self, features_batch: np.ndarray) -> np.ndarray:
+        """
+        对一批特征向量进行分类
+
+        Args:
+            features_batch: shape=(N, 126) 的特征矩阵
+
+        Returns:
+            shape=(N, 类别数) 的softmax概率矩阵
+        """
+        return self.model.predict(features_batch)
+
+    def warm_up(self, frames: int = 3) -> float:
+        """
+        用合成帧预热MediaPipe检测图和分类模型，
+        图初始化、推理函数追踪等一次性开销在启动时完成，不落在第一个真实请求上
+
+        Args:
+            frames: 送入检测图的合成帧数量
+
+        Returns:
+            预热耗时（毫秒）
+        """
+        start = time.perf_counter()
+        rng = np.random.default_rng(0)
+        for _ in range(max(0, int(frames))):
+            frame = rng.integers(0, 256, size=(480, 640, 3), dtype=np.uint8)
+            self._process_hands(frame)
+
+        # 合成帧检测不到手，分类模型单独预热
+        if self.model is not None:
+            self.predict_proba(np.zeros((1, FEATURE_DIM), dtype=np.float32))
+        return (time.perf_counter() - start) * 1000
+
+    def enable_batching(self, max_batch_size: int = 32, max_wait_ms: float = 5.0,
+                        timeout_ms: float = 1000.0) -> InferenceBatcher:
+        """
+        启用微批调度，将并发请求的分类调用合并
+
+        Args:
+            max_batch_size: 单个批次的最大样本数
+            max_wait_ms: 凑批的最长等待时间（毫秒）
+            timeout_ms: 调用方等待批次结果的超时（毫秒），超时抛出 RecognitionError；0 表示不限时
+
+        Returns:
+            已启动的微批调度器
+        """
+        if self.batcher is None:
+            self.batcher = InferenceBatcher(
+                self.predict_proba,
+                max_batch_size=max_batch_size,
+                max_wait_ms=max_wait_ms
+            ).start()
+        self.batch_timeout_s = timeout_ms / 1000 if timeout_ms > 0 else None
+        return self.batcher
+
+    def enable_prediction_memo(self, grid_size: float = 0.01, max_entries: int = 4096) -> PredictionMemo:
+        """
+        启用量化特征的预测缓存，落在同一量化网格中的手势复用之前的分类结果
+
+        Args:
+            grid_size: 量化网格的边长（归一化坐标）
+            max_entries: 最大条目数
+
+        Returns:
+            预测缓存
+        """
+        if self.prediction_memo is None:
+            self.prediction_memo = PredictionMemo(grid_size=grid_size, max_entries=max_entries)
+        return self.prediction_memo
+
+    def enable_prefilter(self, min_skin_fraction: float = 0.002, audit_interval: int = 50) -> HandPrefilter:
+        """
+        启用无手帧预过滤
+
+        Args:
+            min_skin_fraction: 肤色像素占比低于该值的帧判定为无手，用 scripts/calibrate_prefilter.py 校准
+            audit_interval: 每丢弃多少帧抽检一次，用于估计漏检率
+
+        Returns:
+            预过滤器
+        """
+        if self.prefilter is None:
+            self.prefilter = HandPrefilter(min_skin_fraction=min_skin_fraction, audit_interval=audit_interval)
+        return self.prefilter
+
+    def enable_adaptive_resolution(self, levels=(640, 480, 320), target_ms: float = 40.0,
+                                   queue_high: int = 4) -> ResolutionController:
+        """
+        启用自适应检测分辨率
+
+        Args:
+            levels: 可选的分辨率（长边像素）
+            target_ms: 单帧检测耗时的目标（毫秒）
+            queue_high: 同时处理的帧数达到该值时降低分辨率
+
+        Returns:
+            分辨率控制器
+        """
+        if self.resolution is None:
+            self.resolution = ResolutionController(levels=levels, target_ms=target_ms, queue_high=queue_high)
+        return self.resolution
 
     def draw_landmarks(self, image: np.ndarray, hand_landmarks_list: List) -> np.ndarray:
         """
@@ -211,26 +556,7 @@ class SignLanguageRecognizer:
         Returns:
             绘制关键点后的图像
         """
-        try:
-            for hand_landmarks in hand_landmarks_list:
-                self.mp_drawing.draw_landmarks(
-                    image,
-                    hand_landmarks,
-                    self.mp_hands.HAND_CONNECTIONS,
-                    # 关键点样式：绿色小圆点
-                    self.mp_drawing.DrawingSpec(
-                        color=(0, 255, 0), thickness=2, circle_radius=2
-                    ),
-                    # 连接线样式：红色线条
-                    self.mp_drawing.DrawingSpec(
-                        color=(255, 0, 0), thickness=2
-                    )
-                )
-            return image
-
-        except Exception as e:
-            logger.error(f"绘制关键点失败: {str(e)}")
-            return image
+        return draw_hand_landmarks(image, hand_landmarks_list)
 
     def get_model_info(self) -> dict:
         """
@@ -248,9 +574,16 @@ class SignLanguageRecognizer:
             "classes": self.labels,
             "input_shape": str(self.model.input_shape) if self.model else None,
             "output_shape": str(self.model.output_shape) if self.model else None,
-            "max_num_hands": self.hands.max_num_hands,
-            "detection_confidence": self.hands.min_detection_confidence,
-            "tracking_confidence": self.hands.min_tracking_confidence,
+            "model_complexity": self.hands_options["model_complexity"],
+            "max_num_hands": self.hands_options["max_num_hands"],
+            "detection_confidence": self.hands_options["min_detection_confidence"],
+            "tracking_confidence": self.hands_options["min_tracking_confidence"],
+            "inference": self.model.get_info() if self.model else None,
+            "batching": self.batcher.get_stats() if self.batcher else None,
+            "sessions": self.sessions.get_stats() if self.sessions else None,
+            "prediction_memo": self.prediction_memo.get_stats() if self.prediction_memo else None,
+            "prefilter": self.prefilter.get_stats() if self.prefilter else None,
+            "resolution": self.resolution.get_stats() if self.resolution else None,
             "timestamp": datetime.now().isoformat()
         }
 
@@ -266,8 +599,20 @@ class SignLanguageRecognizer:
     def close(self):
         """显式清理资源"""
         try:
-            if hasattr(self, 'hands') and self.hands:
+            if getattr(self, 'batcher', None) is not None:
+                if getattr(self, '_owns_model', True):
+                    self.batcher.close()
+                self.batcher = None
+            if getattr(self, 'sessions', None) is not None:
+                if getattr(self, '_owns_model', True):
+                    self.sessions.close()
+                self.sessions = None
+            if getattr(self, 'static_hands', None):
+                self.static_hands.close()
+                self.static_hands = None
+            if getattr(self, 'hands', None):
                 self.hands.close()
+                self.hands = None
                 logger.info("MediaPipe手部检测器已关闭")
         except Exception as e:
             logger.warning(f"关闭MediaPipe资源时出错: {str(e)}")
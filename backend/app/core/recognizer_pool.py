@@ -0,0 +1,235 @@
+"""
+识别器池模块
+MediaPipe的手部检测图不是线程安全的，单个识别器只能串行处理帧。
+识别器池持有多个共享模型、各自拥有独立MediaPipe图的识别器，
+每个请求签出一个实例独占使用，吞吐随CPU核数扩展
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from .recognizer import SignLanguageRecognizer, pack_prediction
+
+# 配置日志
+from ..utils.logger_config import get_module_logger
+logger = get_module_logger(__name__)
+
+
+class RecognizerPool:
+    """
+    识别器池
+    对外提供与 SignLanguageRecognizer 相同的调用接口，可以直接替换单个识别器使用
+    """
+
+    def __init__(self, primary: SignLanguageRecognizer, size: int = 4, checkout_timeout: float = 10.0):
+        """
+        基于已加载的识别器创建池
+
+        Args:
+            primary: 已加载模型和标签的识别器，其余成员由它 clone 得到
+            size: 池中识别器数量（即最多可并发处理的帧数）
+            checkout_timeout: 签出识别器的最长等待时间（秒）
+        """
+        self.primary = primary
+        self.size = max(1, int(size))
+        self.checkout_timeout = checkout_timeout
+
+        self._members: List[SignLanguageRecognizer] = [primary]
+        for _ in range(self.size - 1):
+            self._members.append(primary.clone())
+
+        self._idle: "queue.Queue[SignLanguageRecognizer]" = queue.Queue()
+        for member in self._members:
+            self._idle.put(member)
+
+        self._stats_lock = threading.Lock()
+        self._checkouts = 0
+        self._waits = 0
+
+        logger.info(f"识别器池已创建: {self.size} 个实例")
+
+    # 共享的模型状态直接转发给主识别器
+    @property
+    def labels(self) -> List[str]:
+        return self.primary.labels
+
+    @property
+    def model(self):
+        return self.primary.model
+
+    @property
+    def batcher(self):
+        return self.primary.batcher
+
+    @property
+    def sessions(self):
+        return self.primary.sessions
+
+    @property
+    def model_path(self) -> str:
+        return self.primary.model_path
+
+    @property
+    def labels_path(self) -> str:
+        return self.primary.labels_path
+
+    @contextmanager
+    def checkout(self) -> Iterator[SignLanguageRecognizer]:
+        """
+        签出一个空闲的识别器，退出上下文时归还
+
+        Yields:
+            当前线程独占的识别器
+        """
+        try:
+            member = self._idle.get_nowait()
+            waited = False
+        except queue.Empty:
+            waited = True
+            try:
+                member = self._idle.get(timeout=self.checkout_timeout)
+            except queue.Empty:
+                raise TimeoutError(f"等待空闲识别器超时 ({self.checkout_timeout}s)")
+
+        with self._stats_lock:
+            self._checkouts += 1
+            if waited:
+                self._waits += 1
+
+        try:
+            yield member
+        finally:
+            self._idle.put(member)
+
+    def predict(self, image: np.ndarray, session_id: Optional[str] = None, return_probs: bool = False,
+                use_memo: bool = True, return_features: bool = False) -> Tuple:
+        """
+        预测图像中的手语，参数和返回值与 SignLanguageRecognizer.predict 相同
+        带会话ID时使用会话独占的检测图，不占用池中的实例（会话数已满时检测阶段签出一个实例）；否则签出一个识别器
+        """
+        if session_id is not None and self.primary.sessions is not None:
+            return self.primary.predict(image, session_id=session_id, return_probs=return_probs, use_memo=use_memo,
+                                        return_features=return_features)
+
+        try:
+            with self.checkout() as recognizer:
+                return recognizer.predict(image, return_probs=return_probs, use_memo=use_memo,
+                                          return_features=return_features)
+        except TimeoutError as e:
+            logger.error(f"预测失败: {str(e)}")
+            return pack_prediction(None, None, None, None, None, return_probs, return_features)
+
+    def extract_features(self, image: np.ndarray):
+        """签出一个识别器提取特征"""
+        with self.checkout() as recognizer:
+            return recognizer.extract_features(image)
+
+    def enable_sessions(self, idle_timeout_s: float = 60.0, max_sessions: int = 64):
+        """
+        启用会话级手部跟踪，所有成员共享同一个会话注册表；
+        会话数已满时，超出的会话每帧签出一个成员做静态图片模式检测，不串行在同一个检测图上
+        """
+        sessions = self.primary.enable_sessions(idle_timeout_s=idle_timeout_s, max_sessions=max_sessions)
+        for member in self._members:
+            member.sessions = sessions
+            member.session_overflow = self._detect_overflow
+        return sessions
+
+    def _detect_overflow(self, image_rgb: np.ndarray):
+        """会话数已满时签出一个成员，用它的静态图片模式检测图处理该帧"""
+        with self.checkout() as recognizer:
+            return recognizer.detect_static(image_rgb)
+
+    def release_session(self, session_id: str):
+        """释放会话的检测图"""
+        self.primary.release_session(session_id)
+
+    def predict_features(self, features: np.ndarray, return_probs: bool = False, use_memo: bool = True) -> Tuple:
+        """对特征向量分类，参数和返回值与 SignLanguageRecognizer.predict_features 相同；不需要检测图，不签出"""
+        return self.primary.predict_features(features, return_probs=return_probs, use_memo=use_memo)
+
+    def predict_proba(self, features_batch: np.ndarray) -> np.ndarray:
+        """分类模型是共享的，不需要签出"""
+        return self.primary.predict_proba(features_batch)
+
+    def warm_up(self, frames: int = 3) -> float:
+        """
+        并行预热所有成员（每个成员的MediaPipe图都需要单独初始化）
+
+        Args:
+            frames: 每个成员送入的合成帧数量
+
+        Returns:
+            预热耗时（毫秒）
+        """
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.size, thread_name_prefix="recognizer-warmup") as executor:
+            list(executor.map(lambda member: member.warm_up(frames), self._members))
+        return (time.perf_counter() - start) * 1000
+
+    def enable_batching(self, max_batch_size: int = 32, max_wait_ms: float = 5.0, timeout_ms: float = 1000.0):
+        """启用微批调度，所有成员共享同一个调度器"""
+        batcher = self.primary.enable_batching(
+            max_batch_size=max_batch_size, max_wait_ms=max_wait_ms, timeout_ms=timeout_ms
+        )
+        for member in self._members:
+            member.batcher = batcher
+            member.batch_timeout_s = self.primary.batch_timeout_s
+        return batcher
+
+    def enable_prediction_memo(self, grid_size: float = 0.01, max_entries: int = 4096):
+        """启用预测缓存，所有成员共享同一个缓存"""
+        memo = self.primary.enable_prediction_memo(grid_size=grid_size, max_entries=max_entries)
+        for member in self._members:
+            member.prediction_memo = memo
+        return memo
+
+    def enable_prefilter(self, min_skin_fraction: float = 0.002, audit_interval: int = 50):
+        """启用无手帧预过滤，所有成员共享同一个预过滤器和统计"""
+        prefilter = self.primary.enable_prefilter(min_skin_fraction=min_skin_fraction, audit_interval=audit_interval)
+        for member in self._members:
+            member.prefilter = prefilter
+        return prefilter
+
+    def enable_adaptive_resolution(self, levels=(640, 480, 320), target_ms: float = 40.0, queue_high: int = 4):
+        """启用自适应检测分辨率，所有成员共享同一个控制器，正在处理的帧数按整个池统计"""
+        resolution = self.primary.enable_adaptive_resolution(levels=levels, target_ms=target_ms, queue_high=queue_high)
+        for member in self._members:
+            member.resolution = resolution
+        return resolution
+
+    def draw_landmarks(self, image: np.ndarray, hand_landmarks_list: List) -> np.ndarray:
+        """绘制只使用静态的绘图工具，不需要签出"""
+        return self.primary.draw_landmarks(image, hand_landmarks_list)
+
+    def get_stats(self) -> dict:
+        """获取池的使用统计"""
+        with self._stats_lock:
+            return {
+                "size": self.size,
+                "idle": self._idle.qsize(),
+                "checkouts": self._checkouts,
+                "waits": self._waits
+            }
+
+    def get_model_info(self) -> dict:
+        """获取模型信息，附带池的使用统计"""
+        info = self.primary.get_model_info()
+        info["pool"] = self.get_stats()
+        return info
+
+    def is_ready(self) -> bool:
+        return self.primary.is_ready()
+
+    def close(self):
+        """关闭所有成员，主识别器最后关闭以释放共享的调度器"""
+        for member in self._members[1:]:
+            member.close()
+        self.primary.close()
+        logger.info("识别器池已关闭")
@@ -0,0 +1,189 @@
+"""
+自适应检测分辨率模块
+关键点提取的耗时随输入分辨率增长，负载高时先降低分辨率比排队更划算。
+控制器为每个会话在若干档分辨率（长边像素）之间选择：检测耗时的滑动平均超过
+延迟目标或正在处理的帧数超过水位时降一档，空闲且耗时远低于目标时升一档。
+MediaPipe 输出的是归一化坐标，分辨率变化不影响特征向量的坐标系。
+每档分辨率的检测率和平均耗时单独统计，用于观察降分辨率对检测效果的影响
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Sequence
+
+import cv2
+import numpy as np
+
+# 配置日志
+from ..utils.logger_config import get_module_logger
+logger = get_module_logger(__name__)
+
+# 不带会话ID的请求共用的状态键
+_SHARED_KEY = "__shared__"
+
+
+def fit_to_side(image: np.ndarray, max_side: int) -> np.ndarray:
+    """
+    等比缩小图像，使长边不超过 max_side（不放大）
+
+    Args:
+        image: OpenCV格式的图像
+        max_side: 长边的最大像素数
+
+    Returns:
+        缩小后的图像，不需要缩小时返回原图
+    """
+    height, width = image.shape[:2]
+    long_side = max(height, width)
+    if long_side <= max_side:
+        return image
+    scale = max_side / long_side
+    size = (max(1, int(round(width * scale))), max(1, int(round(height * scale))))
+    return cv2.resize(image, size, interpolation=cv2.INTER_AREA)
+
+
+class _LevelStats:
+    __slots__ = ("frames", "detected", "total_ms")
+
+    def __init__(self):
+        self.frames = 0
+        self.detected = 0
+        self.total_ms = 0.0
+
+
+class _SessionState:
+    __slots__ = ("level", "ewma_ms", "frames_since_change")
+
+    def __init__(self, level: int):
+        self.level = level
+        self.ewma_ms: Optional[float] = None
+        self.frames_since_change = 0
+
+
+class ResolutionController:
+    """按延迟目标和当前负载为每个会话选择检测分辨率，可被多个线程共享"""
+
+    def __init__(self, levels: Sequence[int] = (640, 480, 320), target_ms: float = 40.0, queue_high: int = 4,
+                 step_interval: int = 10, ewma_alpha: float = 0.2, max_sessions: int = 256):
+        """
+        Args:
+            levels: 可选的分辨率（长边像素），从高到低排列
+            target_ms: 单帧检测耗时的目标（毫秒）
+            queue_high: 同时处理的帧数达到该值时认为负载高
+            step_interval: 两次调整之间至少间隔的帧数，避免来回抖动
+            ewma_alpha: 耗时滑动平均的平滑系数
+            max_sessions: 同时保留的最大会话数
+        """
+        if not levels:
+            raise ValueError("至少需要一档分辨率")
+        self.levels = sorted({int(level) for level in levels}, reverse=True)
+        self.target_ms = float(target_ms)
+        self.queue_high = max(1, int(queue_high))
+        self.step_interval = max(1, int(step_interval))
+        self.ewma_alpha = float(ewma_alpha)
+        self.max_sessions = max(1, int(max_sessions))
+
+        self._sessions: "OrderedDict[str, _SessionState]" = OrderedDict()
+        self._levels_stats = {level: _LevelStats() for level in self.levels}
+        self._in_flight = 0
+        self._max_in_flight = 0
+        self._steps_down = 0
+        self._steps_up = 0
+        self._lock = threading.Lock()
+
+    def _state(self, session_id: Optional[str]) -> _SessionState:
+        """获取会话状态（调用方持有 self._lock），新会话从最高分辨率开始"""
+        key = _SHARED_KEY if session_id is None else str(session_id)
+        state = self._sessions.get(key)
+        if state is None:
+            state = _SessionState(0)
+            self._sessions[key] = state
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+        else:
+            self._sessions.move_to_end(key)
+        return state
+
+    def acquire(self, session_id: Optional[str] = None) -> int:
+        """
+        开始处理一帧，返回该会话当前的分辨率
+
+        Returns:
+            长边像素数，处理完成后需要调用 release
+        """
+        with self._lock:
+            self._in_flight += 1
+            self._max_in_flight = max(self._max_in_flight, self._in_flight)
+            return self.levels[self._state(session_id).level]
+
+    def release(self, session_id: Optional[str], max_side: int, latency_ms: float, detected: bool):
+        """
+        结束处理一帧，记录耗时和检测结果，并按需调整该会话的分辨率
+
+        Args:
+            session_id: 会话ID
+            max_side: acquire 返回的分辨率
+            latency_ms: 检测耗时（毫秒）
+            detected: 是否检测到手
+        """
+        with self._lock:
+            queue_depth = self._in_flight
+            self._in_flight = max(0, self._in_flight - 1)
+
+            stats = self._levels_stats.get(max_side)
+            if stats is not None:
+                stats.frames += 1
+                stats.detected += int(detected)
+                stats.total_ms += latency_ms
+
+            state = self._state(session_id)
+            if state.ewma_ms is None:
+                state.ewma_ms = latency_ms
+            else:
+                state.ewma_ms += self.ewma_alpha * (latency_ms - state.ewma_ms)
+            state.frames_since_change += 1
+            if state.frames_since_change < self.step_interval:
+                return
+
+            overloaded = state.ewma_ms > self.target_ms or queue_depth >= self.queue_high
+            idle = state.ewma_ms < self.target_ms * 0.5 and queue_depth <= 1
+            if overloaded and state.level < len(self.levels) - 1:
+                state.level += 1
+                self._steps_down += 1
+            elif idle and state.level > 0:
+                state.level -= 1
+                self._steps_up += 1
+            else:
+                return
+            state.frames_since_change = 0
+            # 切换分辨率后耗时的参考值重新累计
+            state.ewma_ms = None
+            logger.debug(f"会话 {session_id} 检测分辨率调整为 {self.levels[state.level]} (负载 {queue_depth})")
+
+    def forget(self, session_id: str):
+        """释放会话状态"""
+        with self._lock:
+            self._sessions.pop(str(session_id), None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """获取各档分辨率的使用情况、检测率和平均耗时"""
+        with self._lock:
+            current: Dict[int, int] = {level: 0 for level in self.levels}
+            for state in self._sessions.values():
+                current[self.levels[state.level]] += 1
+            return {
+                "target_ms": self.target_ms,
+                "in_flight": self._in_flight,
+                "max_in_flight": self._max_in_flight,
+                "steps_down": self._steps_down,
+                "steps_up": self._steps_up,
+                "sessions_by_level": {str(level): count for level, count in current.items()},
+                "levels": {
+                    str(level): {
+                        "frames": stats.frames,
+                        "detection_rate": round(stats.detected / stats.frames, 4) if stats.frames else None,
+                        "avg_ms": round(stats.total_ms / stats.frames, 2) if stats.frames else None
+                    }
+                    for level, stats in self._levels_stats.items()
+                }
+            }
@@ -0,0 +1,230 @@
+"""
+语句组装模块
+把前端的语句判断逻辑（见 Signlink前端语句判断逻辑.md）移到服务端，按会话增量组装：
+
+- 同一词汇连续识别 min_consecutive 帧且置信度不低于 min_confidence 时确认该词汇
+- 未检测到手的帧使连续计数递减，词汇变化时重新计数
+- 与上一个确认的词汇相同且间隔不足 dedupe_s 秒时不重复添加
+- 连续 pause_s 秒没有检测到手、或句子达到 max_words 个词时断句；客户端停止发送帧时由 expire 按时间断句
+- 启用时间平滑时使用平滑后的稳定词汇（add_stable），连续帧计数和迟滞只由平滑器负责
+
+每帧只返回新产生的事件（确认的词汇、完成的句子），大多数帧没有事件，客户端不再需要逐帧结果
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+# 配置日志
+from ..utils.logger_config import get_module_logger
+logger = get_module_logger(__name__)
+
+EVENT_WORD = "word"
+EVENT_SENTENCE = "sentence"
+
+
+class _SentenceState:
+    """单个会话正在组装的句子"""
+
+    __slots__ = ("words", "current", "consecutive", "committed", "last_word", "last_commit_at", "last_hand_at")
+
+    def __init__(self, now: float):
+        self.words: List[str] = []
+        self.current: Optional[str] = None
+        self.consecutive = 0
+        # 当前连续段的词汇是否已经确认，同一段只确认一次
+        self.committed = False
+        self.last_word: Optional[str] = None
+        self.last_commit_at = 0.0
+        self.last_hand_at = now
+
+
+class SentenceAssembler:
+    """按会话把逐帧识别结果组装成词汇和句子事件，可被多个线程共享"""
+
+    def __init__(self, min_consecutive: int = 3, min_confidence: float = 0.8, pause_s: float = 1.5,
+                 dedupe_s: float = 2.0, max_words: int = 32, max_sessions: int = 1024):
+        """
+        Args:
+            min_consecutive: 确认词汇所需的连续帧数
+            min_confidence: 参与计数的最低置信度
+            pause_s: 连续未检测到手超过该时长（秒）时断句
+            dedupe_s: 同一词汇在该时长（秒）内不重复添加
+            max_words: 单句最多的词数，达到后断句
+            max_sessions: 同时保留的最大会话数
+        """
+        self.min_consecutive = max(1, int(min_consecutive))
+        self.min_confidence = float(min_confidence)
+        self.pause_s = float(pause_s)
+        self.dedupe_s = float(dedupe_s)
+        self.max_words = max(1, int(max_words))
+        self.max_sessions = max(1, int(max_sessions))
+
+        self._states: "OrderedDict[str, _SentenceState]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        # 统计信息
+        self._frames = 0
+        self._word_events = 0
+        self._sentence_events = 0
+
+    def _state(self, session_id: str, now: float) -> _SentenceState:
+        """获取会话状态（调用方持有 self._lock）"""
+        state = self._states.get(session_id)
+        if state is None:
+            state = _SentenceState(now)
+            self._states[session_id] = state
+            while len(self._states) > self.max_sessions:
+                self._states.popitem(last=False)
+        else:
+            self._states.move_to_end(session_id)
+        return state
+
+    def _end_sentence(self, state: _SentenceState, reason: str) -> List[Dict[str, Any]]:
+        """结束当前句子（调用方持有 self._lock），没有词汇时不产生事件"""
+        if not state.words:
+            return []
+        words, state.words = state.words, []
+        self._sentence_events += 1
+        return [{"type": EVENT_SENTENCE, "text": " ".join(words), "words": words, "reason": reason}]
+
+    def add(self, session_id: str, word: Optional[str], confidence: Optional[float],
+            now: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        处理一帧的识别结果
+
+        Args:
+            session_id: 会话ID
+            word: 该帧识别的词汇，未检测到手或识别失败时为 None
+            confidence: 置信度
+            now: 帧的时间（秒，单调时钟），默认取当前时间
+
+        Returns:
+            这一帧产生的事件列表，大多数帧为空：
+            - {"type": "word", "word", "confidence", "sentence"}：确认了一个词汇，sentence 为当前句子
+            - {"type": "sentence", "text", "words", "reason"}：完成了一个句子（reason 为 pause / max_words / flush / timeout）
+        """
+        now = time.monotonic() if now is None else now
+        session_id = str(session_id)
+        events: List[Dict[str, Any]] = []
+
+        with self._lock:
+            self._frames += 1
+            state = self._state(session_id, now)
+
+            if word is None:
+                if state.consecutive > 0:
+                    state.consecutive -= 1
+                    if state.consecutive == 0:
+                        state.current, state.committed = None, False
+                if now - state.last_hand_at >= self.pause_s:
+                    events.extend(self._end_sentence(state, "pause"))
+                return events
+
+            state.last_hand_at = now
+            if confidence is None or confidence < self.min_confidence:
+                # 低置信度的帧打断连续计数
+                state.consecutive, state.committed = 0, False
+                return events
+
+            if word != state.current:
+                state.current, state.consecutive, state.committed = word, 1, False
+            else:
+                state.consecutive += 1
+
+            if state.committed or state.consecutive < self.min_consecutive:
+                return events
+            state.committed = True
+            events.extend(self._commit(state, word, confidence, now))
+        return events
+
+    def add_stable(self, session_id: str, word: Optional[str], confidence: Optional[float], changed: bool,
+                   has_hand: bool, now: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        处理一帧时间平滑后的结果：稳定词汇已经过平滑器的迟滞判断，不再重复计数连续帧，
+        稳定词汇切换到新词汇的那一帧直接确认
+
+        Args:
+            session_id: 会话ID
+            word: 平滑后的稳定词汇，还没有稳定词汇时为 None
+            confidence: 稳定词汇的平滑得分
+            changed: 稳定词汇是否在这一帧变化
+            has_hand: 这一帧是否检测到手，用于判断停顿
+            now: 帧的时间（秒，单调时钟），默认取当前时间
+
+        Returns:
+            与 add 相同
+        """
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            self._frames += 1
+            state = self._state(str(session_id), now)
+            if not has_hand:
+                if now - state.last_hand_at >= self.pause_s:
+                    return self._end_sentence(state, "pause")
+                return []
+
+            state.last_hand_at = now
+            if not changed or word is None:
+                return []
+            return self._commit(state, word, confidence, now)
+
+    def _commit(self, state: _SentenceState, word: str, confidence: Optional[float],
+                now: float) -> List[Dict[str, Any]]:
+        """确认一个词汇（调用方持有 self._lock），与上一个词汇相同且间隔过短时不重复添加"""
+        if word == state.last_word and now - state.last_commit_at < self.dedupe_s:
+            state.last_commit_at = now
+            return []
+
+        state.words.append(word)
+        state.last_word, state.last_commit_at = word, now
+        self._word_events += 1
+        events = [{
+            "type": EVENT_WORD,
+            "word": word,
+            "confidence": round(float(confidence or 0.0), 4),
+            "sentence": " ".join(state.words)
+        }]
+        if len(state.words) >= self.max_words:
+            events.extend(self._end_sentence(state, "max_words"))
+        return events
+
+    def expire(self, session_id: str, now: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        客户端停止发送帧时按时间断句：距该会话最后一次检测到手已超过 pause_s 秒时结束当前句子
+
+        Returns:
+            句子事件（reason 为 timeout），没有需要结束的句子时为空列表
+        """
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            state = self._states.get(str(session_id))
+            if state is None or now - state.last_hand_at < self.pause_s:
+                return []
+            return self._end_sentence(state, "timeout")
+
+    def flush(self, session_id: str) -> List[Dict[str, Any]]:
+        """立即结束会话当前的句子（如客户端停止翻译）"""
+        with self._lock:
+            state = self._states.get(str(session_id))
+            if state is None:
+                return []
+            return self._end_sentence(state, "flush")
+
+    def forget(self, session_id: str):
+        """释放会话状态"""
+        with self._lock:
+            self._states.pop(str(session_id), None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """获取处理的帧数、产生的事件数以及消息数的压缩比例"""
+        with self._lock:
+            events = self._word_events + self._sentence_events
+            return {
+                "sessions": len(self._states),
+                "frames": self._frames,
+                "word_events": self._word_events,
+                "sentence_events": self._sentence_events,
+                "message_reduction": round(self._frames / events, 1) if events else None
+            }
@@ -0,0 +1,304 @@
+"""
+流式时序模型模块
+逐帧分类器只看单帧的126维特征，无法处理连续手语。时序模型是一个小型因果时间卷积网络（TCN）：
+若干层膨胀因果卷积叠加在关键点特征序列上，每个时间步输出所有类别的概率。
+
+训练时对整段序列做卷积（scripts/train_sequence_model.py）；服务时每层只保存最近
+(kernel_size - 1) x dilation 帧的输入（环形缓冲区），每来一帧只计算这一帧的输出，
+单帧耗时与已处理的帧数无关，结果与对整段序列做因果卷积时最后一个时间步的输出一致。
+运行时只需要 NumPy 和 h5py，不导入TensorFlow
+"""
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from .landmarks import FEATURE_DIM
+from .numpy_engine import _read_layer_weights, _softmax
+
+# 配置日志
+from ..utils.logger_config import get_module_logger
+logger = get_module_logger(__name__)
+
+# 层命名约定：卷积层 tcn_conv_{i}，带残差连接的层另有 tcn_add_{i}，输出层 output
+CONV_PREFIX = "tcn_conv_"
+ADD_PREFIX = "tcn_add_"
+OUTPUT_LAYER = "output"
+
+
+def build_sequence_model(num_classes: int, input_dim: int = FEATURE_DIM, channels: int = 64,
+                         kernel_size: int = 3, dilations: Sequence[int] = (1, 2, 4, 8), dropout: float = 0.2):
+    """
+    构建因果TCN（需要TensorFlow，仅用于训练）
+
+    Args:
+        num_classes: 类别数
+        input_dim: 每帧特征维度
+        channels: 卷积通道数
+        kernel_size: 卷积核大小
+        dilations: 各层的膨胀系数，感受野为 1 + (kernel_size - 1) x sum(dilations) 帧
+        dropout: 每层卷积之后的 Dropout 比例
+
+    Returns:
+        输入 (batch, 时间步, input_dim)、输出 (batch, 时间步, num_classes) 的Keras模型
+    """
+    from tensorflow import keras
+    from tensorflow.keras import layers
+
+    inputs = layers.Input(shape=(None, input_dim))
+    x = inputs
+    for i, dilation in enumerate(dilations):
+        y = layers.Conv1D(channels, kernel_size, dilation_rate=dilation, padding="causal",
+                          activation="relu", name=f"{CONV_PREFIX}{i}")(x)
+        y = layers.Dropout(dropout)(y)
+        # 第一层把输入投影到 channels 维，之后的层使用残差连接
+        x = y if i == 0 else layers.Add(name=f"{ADD_PREFIX}{i}")([x, y])
+    outputs = layers.Dense(num_classes, activation="softmax", name=OUTPUT_LAYER)(x)
+
+    model = keras.Model(inputs, outputs)
+    model.compile(
+        optimizer=keras.optimizers.Adam(learning_rate=0.001),
+        loss="sparse_categorical_crossentropy",
+        metrics=["accuracy"]
+    )
+    return model
+
+
+class _ConvLayer:
+    """一层因果卷积的权重，kernel 展开为 (kernel_size x 输入通道, 输出通道)"""
+
+    __slots__ = ("kernel", "bias", "kernel_size", "dilation", "residual", "in_channels", "history")
+
+    def __init__(self, kernel: np.ndarray, bias: np.ndarray, dilation: int, residual: bool):
+        self.kernel_size, self.in_channels, out_channels = kernel.shape
+        self.kernel = np.ascontiguousarray(kernel.reshape(-1, out_channels), dtype=np.float32)
+        self.bias = bias.astype(np.float32)
+        self.dilation = int(dilation)
+        self.residual = residual
+        # 需要保留的历史帧数
+        self.history = (self.kernel_size - 1) * self.dilation
+
+
+class StreamState:
+    """一路流的卷积历史：每层一个环形缓冲区"""
+
+    __slots__ = ("buffers", "position", "last_features")
+
+    def __init__(self, layers: List[_ConvLayer]):
+        self.buffers = [np.zeros((max(1, layer.history), layer.in_channels), dtype=np.float32) for layer in layers]
+        # 已处理的帧数，各层的写入位置为 position % history
+        self.position = 0
+        self.last_features: Optional[np.ndarray] = None
+
+    @property
+    def nbytes(self) -> int:
+        return sum(buffer.nbytes for buffer in self.buffers)
+
+
+class StreamingTCN:
+    """因果TCN的逐帧推理实现"""
+
+    def __init__(self, model_path: str):
+        """
+        读取 build_sequence_model 训练保存的 .h5 文件
+
+        Args:
+            model_path: Keras保存的 .h5 模型文件
+        """
+        self.model_path = model_path
+        self.layers: List[_ConvLayer] = []
+        self.output_kernel: Optional[np.ndarray] = None
+        self.output_bias: Optional[np.ndarray] = None
+        self._load(model_path)
+
+        self.input_dim = self.layers[0].in_channels
+        self.output_dim = int(self.output_kernel.shape[1])
+        # 每个时间步的输出依赖的帧数
+        self.receptive_field = 1 + sum(layer.history for layer in self.layers)
+        logger.info(
+            f"时序模型加载完成: {len(self.layers)} 层因果卷积, 感受野={self.receptive_field} 帧, "
+            f"输出维度={self.output_dim}"
+        )
+
+    def _load(self, model_path: str):
+        import h5py
+
+        with h5py.File(model_path, "r") as f:
+            model_config = f.attrs.get("model_config")
+            if model_config is None:
+                raise ValueError(f"模型文件缺少 model_config: {model_path}")
+            if isinstance(model_config, bytes):
+                model_config = model_config.decode("utf-8")
+            layer_configs = json.loads(model_config)["config"]["layers"]
+            names = {layer["config"]["name"] for layer in layer_configs}
+            weights_group = f["model_weights"] if "model_weights" in f else f
+
+            for layer in layer_configs:
+                class_name = layer["class_name"]
+                layer_config = layer["config"]
+                name = layer_config["name"]
+
+                if class_name == "Conv1D" and name.startswith(CONV_PREFIX):
+                    if layer_config.get("padding") != "causal" or layer_config.get("activation") != "relu":
+                        raise ValueError(f"时序模型的卷积层需要 causal 填充和 relu 激活: {name}")
+                    weights = _read_layer_weights(weights_group, name)
+                    kernel = weights["kernel"]
+                    bias = weights.get("bias", np.zeros(kernel.shape[2], dtype=np.float32))
+                    index = name[len(CONV_PREFIX):]
+                    self.layers.append(_ConvLayer(
+                        kernel, bias, int(np.ravel(layer_config.get("dilation_rate", 1))[0]),
+                        residual=f"{ADD_PREFIX}{index}" in names
+                    ))
+
+                elif class_name == "Dense" and name == OUTPUT_LAYER:
+                    weights = _read_layer_weights(weights_group, name)
+                    self.output_kernel = np.ascontiguousarray(weights["kernel"], dtype=np.float32)
+                    self.output_bias = weights.get(
+                        "bias", np.zeros(self.output_kernel.shape[1], dtype=np.float32)
+                    ).astype(np.float32)
+
+                elif class_name not in ("InputLayer", "Dropout", "Add"):
+                    raise ValueError(f"时序模型不支持的层类型: {class_name}")
+
+        if not self.layers or self.output_kernel is None:
+            raise ValueError(f"不是 build_sequence_model 构建的时序模型: {model_path}")
+
+    def new_state(self) -> StreamState:
+        """新的一路流，历史为零（与训练时因果卷积在序列开头补零一致）"""
+        return StreamState(self.layers)
+
+    def step(self, state: StreamState, features: np.ndarray) -> np.ndarray:
+        """
+        输入一帧特征，返回这一帧的类别概率
+
+        Args:
+            state: new_state 创建的流状态，原地更新
+            features: shape=(input_dim,) 的特征，未检测到手时传全零向量
+
+        Returns:
+            shape=(类别数,) 的softmax概率
+        """
+        x = np.asarray(features, dtype=np.float32).reshape(-1)
+        t = state.position
+        for layer, buffer in zip(self.layers, state.buffers):
+            if layer.history:
+                # 按卷积核顺序取 (k-1)d, ..., d 帧之前的输入，最后是当前帧
+                slots = [(t - lag) % layer.history
+                         for lag in range((layer.kernel_size - 1) * layer.dilation, 0, -layer.dilation)]
+                window = np.concatenate([buffer[slots].reshape(-1), x])
+                buffer[t % layer.history] = x
+            else:
+                window = x
+            y = window @ layer.kernel
+            y += layer.bias
+            np.maximum(y, 0.0, out=y)
+            x = x + y if layer.residual else y
+        state.position += 1
+
+        logits = (x @ self.output_kernel + self.output_bias).reshape(1, -1)
+        return _softmax(logits)[0]
+
+    def get_info(self) -> Dict[str, Any]:
+        """获取时序模型信息"""
+        return {
+            "model_path": self.model_path,
+            "layers": len(self.layers),
+            "receptive_field": self.receptive_field,
+            "num_classes": self.output_dim
+        }
+
+
+class SequenceStreams:
+    """按会话维护时序模型的流状态，可被多个线程共享"""
+
+    def __init__(self, model: StreamingTCN, labels: List[str], max_sessions: int = 1024):
+        """
+        Args:
+            model: 时序模型
+            labels: 类别标签，与模型输出的下标对应
+            max_sessions: 同时保留的最大会话数
+        """
+        if len(labels) != model.output_dim:
+            raise ValueError(f"标签数 {len(labels)} 与时序模型的输出维度 {model.output_dim} 不一致")
+        self.model = model
+        self.labels = list(labels)
+        self.max_sessions = max(1, int(max_sessions))
+
+        self._states: "OrderedDict[str, StreamState]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._zeros = np.zeros(model.input_dim, dtype=np.float32)
+
+        # 统计信息
+        self._steps = 0
+        self._total_ms = 0.0
+
+    @classmethod
+    def load(cls, model_path: str, labels_path: str, max_sessions: int = 1024) -> "SequenceStreams":
+        """从模型文件和标签文件创建"""
+        with open(labels_path, "r", encoding="utf-8") as f:
+            labels = json.load(f).get("classes", [])
+        return cls(StreamingTCN(model_path), labels, max_sessions=max_sessions)
+
+    def _state(self, session_id: str) -> StreamState:
+        """获取会话状态（调用方持有 self._lock）"""
+        state = self._states.get(session_id)
+        if state is None:
+            state = self.model.new_state()
+            self._states[session_id] = state
+            while len(self._states) > self.max_sessions:
+                self._states.popitem(last=False)
+        else:
+            self._states.move_to_end(session_id)
+        return state
+
+    def _step(self, state: StreamState, features: Optional[np.ndarray]) -> np.ndarray:
+        """推进一帧（调用方持有 self._lock）"""
+        start = time.perf_counter()
+        state.last_features = features
+        probs = self.model.step(state, self._zeros if features is None else features)
+        self._steps += 1
+        self._total_ms += (time.perf_counter() - start) * 1000
+        return probs
+
+    def update(self, session_id: str, features: Optional[np.ndarray]) -> np.ndarray:
+        """
+        输入会话的一帧特征
+
+        Args:
+            session_id: 会话ID
+            features: 该帧的126维特征，未检测到手时为 None
+
+        Returns:
+            时序模型在这一帧的类别概率
+        """
+        with self._lock:
+            return self._step(self._state(str(session_id)), features)
+
+    def repeat(self, session_id: str) -> Optional[np.ndarray]:
+        """画面没有变化、复用了上一次结果的帧：重复输入该会话最近一帧的特征，会话不存在时返回 None"""
+        with self._lock:
+            state = self._states.get(str(session_id))
+            if state is None:
+                return None
+            self._states.move_to_end(str(session_id))
+            return self._step(state, state.last_features)
+
+    def forget(self, session_id: str):
+        """释放会话状态"""
+        with self._lock:
+            self._states.pop(str(session_id), None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """获取会话数、单帧耗时和流状态占用的内存"""
+        with self._lock:
+            return {
+                **self.model.get_info(),
+                "sessions": len(self._states),
+                "steps": self._steps,
+                "avg_step_ms": round(self._total_ms / self._steps, 4) if self._steps else None,
+                "bytes": sum(state.nbytes for state in self._states.values())
+            }
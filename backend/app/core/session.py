@@ -0,0 +1,215 @@
+"""
+会话级手部跟踪模块
+MediaPipe 的视频流模式依赖相邻帧来自同一路视频，多个用户的帧交错送入同一个检测图时，
+跟踪会不断丢失并退回代价更高的手掌检测。这里为每个WebSocket连接或客户端会话ID
+维护独立的检测图，空闲超时后自动回收
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional
+
+# 配置日志
+from ..utils.logger_config import get_module_logger
+logger = get_module_logger(__name__)
+
+
+class _TrackingSession:
+    """单个会话的检测图及其使用状态"""
+
+    __slots__ = ("hands", "lock", "last_used", "frames", "users", "retired")
+
+    def __init__(self, hands: Any):
+        self.hands = hands
+        self.lock = threading.Lock()
+        self.last_used = time.monotonic()
+        self.frames = 0
+        # 已取得引用但尚未归还的调用方数量，大于0时不能关闭
+        self.users = 0
+        # 已从注册表移除，最后一个调用方归还时关闭
+        self.retired = False
+
+
+class HandTrackerRegistry:
+    """
+    会话ID到MediaPipe检测图的映射
+    按最近使用顺序保存，超过空闲时间或数量上限时回收最久未使用的会话
+    """
+
+    def __init__(self, factory: Callable[[], Any], idle_timeout_s: float = 60.0, max_sessions: int = 64):
+        """
+        初始化注册表
+
+        Args:
+            factory: 创建检测图的函数，如 SignLanguageRecognizer._create_hands
+            idle_timeout_s: 会话空闲多久后回收（秒）
+            max_sessions: 同时保留的最大会话数
+        """
+        self.factory = factory
+        self.idle_timeout_s = float(idle_timeout_s)
+        self.max_sessions = max(1, int(max_sessions))
+
+        self._sessions: "OrderedDict[str, _TrackingSession]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._last_sweep = time.monotonic()
+
+        # 统计信息
+        self._created = 0
+        self._evicted = 0
+        self._rejected = 0
+
+    @contextmanager
+    def acquire(self, session_id: str) -> Iterator[Optional[Any]]:
+        """
+        独占某个会话的检测图，不存在时创建
+
+        Args:
+            session_id: 会话ID
+
+        Yields:
+            该会话的检测图；会话数已满且都在使用中时为 None，调用方应改用不保留跟踪状态的检测图
+        """
+        session = self._get_or_create(str(session_id))
+        if session is None:
+            yield None
+            return
+
+        try:
+            with session.lock:
+                session.frames += 1
+                session.last_used = time.monotonic()
+                yield session.hands
+        finally:
+            with self._lock:
+                session.users -= 1
+                close_now = session.retired and session.users == 0
+            if close_now:
+                self._close_all([session])
+
+    def _get_or_create(self, session_id: str) -> Optional[_TrackingSession]:
+        """
+        取得会话并登记一个调用方，不存在时创建；构建检测图（数百毫秒）和关闭回收的检测图都不持有注册表锁，
+        其他会话的 acquire / release 不会被阻塞
+        """
+        expired = []
+        rejected = False
+        with self._lock:
+            now = time.monotonic()
+            if now - self._last_sweep >= self.idle_timeout_s / 4:
+                expired = self._pop_idle(now)
+                self._last_sweep = now
+
+            session = self._sessions.get(session_id)
+            if session is not None:
+                self._sessions.move_to_end(session_id)
+                session.users += 1
+            elif len(self._sessions) >= self.max_sessions and not self._has_idle_session():
+                # 会话数已满且都在使用中，不必构建检测图
+                self._rejected += 1
+                rejected = True
+
+        self._close_all(expired)
+        if session is not None or rejected:
+            return session
+        return self._create(session_id)
+
+    def _create(self, session_id: str) -> Optional[_TrackingSession]:
+        """在锁外构建检测图，再在锁内登记；并发请求已创建同一会话或会话数已满时丢弃新建的检测图"""
+        hands = self.factory()
+        discarded, expired = None, []
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is not None:
+                self._sessions.move_to_end(session_id)
+                discarded = hands
+            else:
+                if len(self._sessions) >= self.max_sessions:
+                    victim = self._pop_least_recent()
+                    if victim is None:
+                        self._rejected += 1
+                        discarded = hands
+                    else:
+                        expired.append(victim)
+                if discarded is None:
+                    session = _TrackingSession(hands)
+                    self._sessions[session_id] = session
+                    self._created += 1
+            if session is not None:
+                session.users += 1
+
+        self._close_all(expired)
+        if discarded is not None:
+            self._close_hands(discarded)
+        return session
+
+    def _pop_idle(self, now: float) -> list:
+        """取出空闲超时且未被使用的会话（调用方持有 self._lock）"""
+        expired = []
+        for session_id, session in list(self._sessions.items()):
+            if now - session.last_used >= self.idle_timeout_s and session.users == 0:
+                expired.append(self._sessions.pop(session_id))
+        self._evicted += len(expired)
+        return expired
+
+    def _has_idle_session(self) -> bool:
+        """是否有未被使用、可以回收的会话（调用方持有 self._lock）"""
+        return any(session.users == 0 for session in self._sessions.values())
+
+    def _pop_least_recent(self) -> Optional[_TrackingSession]:
+        """取出最久未使用且未被使用的会话（调用方持有 self._lock）"""
+        for session_id, session in self._sessions.items():
+            if session.users == 0:
+                self._evicted += 1
+                return self._sessions.pop(session_id)
+        return None
+
+    @staticmethod
+    def _close_hands(hands: Any):
+        try:
+            hands.close()
+        except Exception as e:
+            logger.warning(f"关闭会话检测图失败: {str(e)}")
+
+    @classmethod
+    def _close_all(cls, sessions: list):
+        """关闭会话的检测图，调用方不能持有 self._lock"""
+        for session in sessions:
+            cls._close_hands(session.hands)
+
+    def release(self, session_id: str):
+        """
+        释放会话（如WebSocket断开时）
+
+        Args:
+            session_id: 会话ID
+        """
+        with self._lock:
+            session = self._sessions.pop(str(session_id), None)
+            if session is None:
+                return
+            # 仍有帧在处理时延迟到最后一个调用方归还后关闭
+            session.retired = True
+            close_now = session.users == 0
+        if close_now:
+            self._close_all([session])
+
+    def get_stats(self) -> Dict[str, Any]:
+        """获取会话统计"""
+        with self._lock:
+            return {
+                "active": len(self._sessions),
+                "max_sessions": self.max_sessions,
+                "idle_timeout_s": self.idle_timeout_s,
+                "created": self._created,
+                "evicted": self._evicted,
+                "rejected": self._rejected
+            }
+
+    def close(self):
+        """关闭所有会话"""
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        self._close_all(sessions)
@@ -0,0 +1,193 @@
+"""
+时间平滑模块
+逐帧识别的结果在手势切换、模糊帧上会来回跳动，原先由前端对约20帧的结果投票得到词汇。
+服务端为每个会话保存最近若干帧的概率向量（固定大小的环形缓冲区），按指数滑动平均或
+窗口内多数投票得到各类别的得分，再用迟滞阈值确定稳定词汇：
+新词汇的得分连续 min_frames 帧不低于 enter_threshold 才切换，当前词汇的得分
+不低于 exit_threshold 时保持不变。每个会话的内存为 window x 类别数 个 float32
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+# 配置日志
+from ..utils.logger_config import get_module_logger
+logger = get_module_logger(__name__)
+
+SMOOTHING_EMA = "ema"
+SMOOTHING_VOTE = "vote"
+
+
+class _SmoothingState:
+    """单个会话的概率环形缓冲区和稳定词汇"""
+
+    __slots__ = ("probs", "has_hand", "position", "ema", "last", "stable", "candidate", "candidate_frames")
+
+    def __init__(self, window: int, num_classes: int):
+        self.probs = np.zeros((window, num_classes), dtype=np.float32)
+        self.has_hand = np.zeros(window, dtype=bool)
+        self.position = 0
+        self.ema = np.zeros(num_classes, dtype=np.float32)
+        # 最近一次的观测，复用结果的帧重复使用它
+        self.last: Optional[np.ndarray] = None
+        self.stable: Optional[int] = None
+        self.candidate: Optional[int] = None
+        self.candidate_frames = 0
+
+
+class TemporalSmoother:
+    """按会话平滑逐帧的概率向量，输出带迟滞的稳定词汇，可被多个线程共享"""
+
+    def __init__(self, method: str = SMOOTHING_EMA, window: int = 8, ema_alpha: float = 0.3,
+                 enter_threshold: float = 0.6, exit_threshold: float = 0.4, min_frames: int = 3,
+                 max_sessions: int = 1024):
+        """
+        Args:
+            method: "ema"（指数滑动平均）或 "vote"（窗口内逐帧最高类别的多数投票）
+            window: 环形缓冲区保存的帧数
+            ema_alpha: 滑动平均的平滑系数，越大越跟手
+            enter_threshold: 新词汇成为稳定词汇所需的得分
+            exit_threshold: 当前稳定词汇的得分低于该值时才允许切换
+            min_frames: 新词汇的得分需连续达标的帧数
+            max_sessions: 同时保留的最大会话数
+        """
+        if method not in (SMOOTHING_EMA, SMOOTHING_VOTE):
+            raise ValueError(f"不支持的平滑方式: {method}")
+        if exit_threshold > enter_threshold:
+            raise ValueError("exit_threshold 不能大于 enter_threshold")
+        self.method = method
+        self.window = max(1, int(window))
+        self.ema_alpha = float(ema_alpha)
+        self.enter_threshold = float(enter_threshold)
+        self.exit_threshold = float(exit_threshold)
+        self.min_frames = max(1, int(min_frames))
+        self.max_sessions = max(1, int(max_sessions))
+
+        self._states: "OrderedDict[str, _SmoothingState]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        # 统计信息
+        self._updates = 0
+        self._changes = 0
+
+    def _scores(self, state: _SmoothingState) -> np.ndarray:
+        """各类别的平滑得分"""
+        if self.method == SMOOTHING_EMA:
+            return state.ema
+        # 投票：窗口内每帧最高类别得一票，得分为票数占窗口帧数的比例（未检测到手和尚未填满的位置不投票）
+        counts = np.bincount(
+            np.argmax(state.probs[state.has_hand], axis=1), minlength=state.probs.shape[1]
+        )
+        return counts.astype(np.float32) / self.window
+
+    def _observe(self, state: _SmoothingState, probs: Optional[np.ndarray]) -> bool:
+        """记录一帧观测并更新稳定词汇，返回稳定词汇是否变化（调用方持有 self._lock）"""
+        state.last = probs
+        if probs is None:
+            # 未检测到手：得分向0衰减，手放下后稳定词汇最终会被清除
+            state.has_hand[state.position] = False
+            state.ema *= 1.0 - self.ema_alpha
+        else:
+            state.probs[state.position] = probs
+            state.has_hand[state.position] = True
+            state.ema += self.ema_alpha * (probs - state.ema)
+        state.position = (state.position + 1) % self.window
+
+        scores = self._scores(state)
+        if state.stable is not None and scores[state.stable] >= self.exit_threshold:
+            state.candidate, state.candidate_frames = None, 0
+            return False
+
+        best = int(np.argmax(scores))
+        target = best if scores[best] >= self.enter_threshold else None
+        if target == state.stable:
+            state.candidate, state.candidate_frames = None, 0
+            return False
+        if target == state.candidate:
+            state.candidate_frames += 1
+        else:
+            state.candidate, state.candidate_frames = target, 1
+        if state.candidate_frames < self.min_frames:
+            return False
+
+        state.stable = target
+        state.candidate, state.candidate_frames = None, 0
+        self._changes += 1
+        return True
+
+    def _state(self, session_id: str, num_classes: int) -> _SmoothingState:
+        """获取会话状态（调用方持有 self._lock），类别数变化（切换了模型版本）时重新开始"""
+        state = self._states.get(session_id)
+        if state is None or state.probs.shape[1] != num_classes:
+            state = _SmoothingState(self.window, num_classes)
+            self._states[session_id] = state
+            while len(self._states) > self.max_sessions:
+                self._states.popitem(last=False)
+        self._states.move_to_end(session_id)
+        return state
+
+    @staticmethod
+    def _result(state: _SmoothingState, labels: Sequence[str], scores: np.ndarray,
+                changed: bool) -> Tuple[Optional[str], float, bool]:
+        if state.stable is None or state.stable >= len(labels):
+            return None, 0.0, changed
+        return labels[state.stable], float(scores[state.stable]), changed
+
+    def update(self, session_id: str, probs: Optional[np.ndarray],
+               labels: Sequence[str]) -> Tuple[Optional[str], float, bool]:
+        """
+        记录一帧的识别结果
+
+        Args:
+            session_id: 会话ID
+            probs: 该帧所有类别的概率，未检测到手时为 None
+            labels: 类别标签，与概率的下标对应
+
+        Returns:
+            Tuple[稳定词汇, 平滑后的得分, 稳定词汇是否在这一帧变化]，还没有稳定词汇时为 None
+        """
+        session_id = str(session_id)
+        if probs is not None:
+            probs = np.asarray(probs, dtype=np.float32).reshape(-1)
+        with self._lock:
+            self._updates += 1
+            state = self._state(session_id, len(labels) if probs is None else probs.shape[0])
+            changed = self._observe(state, probs)
+            return self._result(state, labels, self._scores(state), changed)
+
+    def repeat(self, session_id: str, labels: Sequence[str]) -> Tuple[Optional[str], float, bool]:
+        """
+        画面没有变化、复用了上一次结果的帧：重复记录该会话最近一次的观测
+
+        Returns:
+            与 update 相同
+        """
+        session_id = str(session_id)
+        with self._lock:
+            state = self._states.get(session_id)
+            if state is None:
+                return None, 0.0, False
+            self._updates += 1
+            self._states.move_to_end(session_id)
+            changed = self._observe(state, state.last)
+            return self._result(state, labels, self._scores(state), changed)
+
+    def forget(self, session_id: str):
+        """释放会话状态"""
+        with self._lock:
+            self._states.pop(str(session_id), None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """获取会话数、稳定词汇的切换次数和占用的内存"""
+        with self._lock:
+            return {
+                "method": self.method,
+                "sessions": len(self._states),
+                "updates": self._updates,
+                "changes": self._changes,
+                "bytes": sum(state.probs.nbytes + state.ema.nbytes + state.has_hand.nbytes
+                             for state in self._states.values())
+            }
@@ -0,0 +1,122 @@
+"""
+CPU线程预算模块
+TensorFlow、OpenCV 和 ONNX Runtime 默认各自按整机核数创建线程池，同机运行多个服务进程或
+工作进程时线程数远超核数，互相抢占导致尾延迟升高。启动时（加载模型之前）统一设置：
+
+- TensorFlow：算子内 / 算子间线程数（环境变量 TF_NUM_INTRAOP_THREADS / TF_NUM_INTEROP_THREADS，
+  已导入TensorFlow时同时调用 tf.config.threading）
+- OpenCV：cv2.setNumThreads
+- ONNX Runtime / TFLite：由识别器创建会话时传入同样的线程数
+- CPU亲和性（可选，仅Linux）：把进程绑定到指定的核上；MediaPipe 没有线程数接口，只能通过亲和性约束
+
+MediaPipe 和 NumPy 使用的线程池在导入时就已创建，设置亲和性是约束它们的唯一方式
+"""
+
+import os
+import sys
+from typing import Any, Dict, List, Optional
+
+# 配置日志
+from ..utils.logger_config import get_module_logger
+logger = get_module_logger(__name__)
+
+
+def parse_cpu_list(value: str) -> List[int]:
+    """
+    解析CPU列表，如 "0-3,8,10-11"
+
+    Returns:
+        排序后的CPU编号列表
+    """
+    cpus = set()
+    for part in value.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        if "-" in part:
+            first, last = part.split("-", 1)
+            cpus.update(range(int(first), int(last) + 1))
+        else:
+            cpus.add(int(part))
+    return sorted(cpus)
+
+
+def available_cpus() -> List[int]:
+    """当前进程可用的CPU编号"""
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def worker_cpus(worker_index: int, num_workers: int, cpus: Optional[List[int]] = None) -> List[int]:
+    """
+    把CPU平均分给各工作进程
+
+    Args:
+        worker_index: 工作进程编号
+        num_workers: 工作进程数量
+        cpus: 可分配的CPU，默认为当前进程可用的全部CPU
+
+    Returns:
+        分给该工作进程的CPU；核数少于进程数时多个进程共用同一个核，不能整除时余下的核不分配
+    """
+    cpus = cpus if cpus is not None else available_cpus()
+    num_workers = max(1, num_workers)
+    if len(cpus) < num_workers:
+        return [cpus[worker_index % len(cpus)]]
+    share = len(cpus) // num_workers
+    return cpus[worker_index * share:(worker_index + 1) * share]
+
+
+def apply_thread_budget(threads: int = 0, inter_op_threads: int = 1,
+                        cpu_affinity: Optional[List[int]] = None) -> Dict[str, Any]:
+    """
+    设置当前进程的线程预算，应在加载模型之前调用
+
+    Args:
+        threads: TensorFlow 算子内线程数和 OpenCV 线程数，0 表示保持各库的默认值
+        inter_op_threads: TensorFlow 算子间线程数（threads 大于0时生效）
+        cpu_affinity: 绑定的CPU编号，None 表示不绑定
+
+    Returns:
+        实际生效的设置
+    """
+    applied: Dict[str, Any] = {}
+
+    if cpu_affinity:
+        if hasattr(os, "sched_setaffinity"):
+            try:
+                os.sched_setaffinity(0, cpu_affinity)
+                applied["cpu_affinity"] = sorted(os.sched_getaffinity(0))
+            except OSError as e:
+                logger.warning(f"设置CPU亲和性失败: {str(e)}")
+        else:
+            logger.warning("当前平台不支持设置CPU亲和性")
+
+    if threads > 0:
+        os.environ["TF_NUM_INTRAOP_THREADS"] = str(threads)
+        os.environ["TF_NUM_INTEROP_THREADS"] = str(inter_op_threads)
+        applied["tf_intra_op"] = threads
+        applied["tf_inter_op"] = inter_op_threads
+
+        # 已导入TensorFlow时环境变量可能不再生效，运行时初始化之前还可以通过API设置
+        if "tensorflow" in sys.modules:
+            try:
+                tf = sys.modules["tensorflow"]
+                tf.config.threading.set_intra_op_parallelism_threads(threads)
+                tf.config.threading.set_inter_op_parallelism_threads(inter_op_threads)
+            except (RuntimeError, AttributeError) as e:
+                logger.warning(f"TensorFlow运行时已初始化，线程数设置未生效: {str(e)}")
+                applied.pop("tf_intra_op")
+                applied.pop("tf_inter_op")
+
+        try:
+            import cv2
+            cv2.setNumThreads(threads)
+            applied["opencv"] = cv2.getNumThreads()
+        except ImportError:
+            pass
+
+    if applied:
+        logger.info(f"线程预算: {applied}")
+    return applied
@@ -0,0 +1,291 @@
+"""
+关键点二进制传输格式
+每帧 126 个坐标用JSON浮点数组传输约 2.5KB，解析时还要为每个关键点创建对象；
+二进制格式把一帧压缩到 260 字节左右，解码只是一次 np.frombuffer。
+
+所有字段为小端序。消息头（8字节）：
+    magic "SL" | version u8 | kind u8 | sequence u32
+
+kind=1 关键点帧（客户端 -> 服务端，服务端返回关键点时方向相反，格式相同）：
+    关键点块
+kind=2 识别结果（服务端 -> 客户端），sequence 与请求帧相同：
+    flags u8 | confidence f32 | stable_confidence f32 | sequence_confidence f32 | processing_time_ms f32
+    | word str | stable_word str | sequence_word str | message str | 关键点块
+    （flags: bit0 success, bit1 detected, bit2 reused, bit3 启用了平滑, bit4 changed；
+    str 为 u16 字节数 + UTF-8，字节数为 0 表示空值；置信度为 NaN 表示空值）
+
+关键点块：
+    encoding u8 | 手数 u8 | 每只手的 handedness u8（0 未知 / 1 Left / 2 Right） | 手数 x 21 x 3 个坐标
+    encoding=0 为 float16（x/y 在 [0, 1] 内误差不超过 2.5e-4）；
+    encoding=1 为 int16 定点数，坐标 x INT16_SCALE 取整（误差不超过 5e-5，范围 ±3.2767）
+"""
+
+import math
+import struct
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from .landmarks import MAX_HANDS, NUM_COORDS, NUM_LANDMARKS, parse_landmark_array
+
+WIRE_MAGIC = b"SL"
+WIRE_VERSION = 1
+
+KIND_LANDMARKS = 1
+KIND_RESULT = 2
+
+ENCODING_FLOAT16 = 0
+ENCODING_INT16 = 1
+ENCODINGS = {"float16": ENCODING_FLOAT16, "int16": ENCODING_INT16}
+INT16_SCALE = 10000.0
+
+HANDEDNESS = (None, "Left", "Right")
+
+_HEADER = struct.Struct("<2sBBI")
+_BLOCK_HEADER = struct.Struct("<BB")
+_RESULT_FIXED = struct.Struct("<Bffff")
+_STRING_LENGTH = struct.Struct("<H")
+_COORDS_PER_HAND = NUM_LANDMARKS * NUM_COORDS
+
+_FLAG_SUCCESS = 1
+_FLAG_DETECTED = 2
+_FLAG_REUSED = 4
+_FLAG_SMOOTHED = 8
+_FLAG_CHANGED = 16
+
+
+class LandmarkFrame:
+    """解码后的关键点帧"""
+
+    __slots__ = ("landmarks", "handedness", "sequence")
+
+    def __init__(self, landmarks: np.ndarray, handedness: List[Optional[str]], sequence: int):
+        # shape=(手数, 21, 3) 的 float32 数组
+        self.landmarks = landmarks
+        self.handedness = handedness
+        self.sequence = sequence
+
+
+def _encode_header(kind: int, sequence: int) -> bytes:
+    return _HEADER.pack(WIRE_MAGIC, WIRE_VERSION, kind, int(sequence) & 0xFFFFFFFF)
+
+
+def _decode_header(data: bytes, kind: int) -> int:
+    """校验消息头，返回序号"""
+    if len(data) < _HEADER.size:
+        raise ValueError(f"消息过短: {len(data)} 字节")
+    magic, version, actual_kind, sequence = _HEADER.unpack_from(data)
+    if magic != WIRE_MAGIC:
+        raise ValueError("不是关键点二进制消息")
+    if version != WIRE_VERSION:
+        raise ValueError(f"不支持的格式版本: {version}")
+    if actual_kind != kind:
+        raise ValueError(f"消息类型错误: {actual_kind}，需要 {kind}")
+    return sequence
+
+
+def _encode_block(landmarks: Optional[np.ndarray], handedness: Optional[Sequence[Optional[str]]],
+                  encoding: str) -> bytes:
+    if encoding not in ENCODINGS:
+        raise ValueError(f"不支持的坐标编码: {encoding}，可选 {list(ENCODINGS)}")
+    hands = parse_landmark_array([] if landmarks is None else landmarks)
+    handedness = list(handedness or [])
+    if len(handedness) > len(hands):
+        raise ValueError(f"handedness 数量 {len(handedness)} 超过手数 {len(hands)}")
+    handedness += [None] * (len(hands) - len(handedness))
+    try:
+        codes = bytes(HANDEDNESS.index(value) for value in handedness)
+    except ValueError:
+        raise ValueError(f"handedness 只能是 {HANDEDNESS[1:]} 或空值: {handedness}")
+
+    if ENCODINGS[encoding] == ENCODING_INT16:
+        scaled = np.rint(hands * INT16_SCALE)
+        if scaled.size and np.abs(scaled).max() > 32767:
+            raise ValueError(f"坐标超出 int16 编码范围 ±{32767 / INT16_SCALE}")
+        coords = scaled.astype("<i2")
+    else:
+        coords = hands.astype("<f2")
+    return _BLOCK_HEADER.pack(ENCODINGS[encoding], len(hands)) + codes + coords.tobytes()
+
+
+def _decode_block(data: bytes, offset: int):
+    """解码关键点块，返回 (关键点, handedness, 块结束位置)"""
+    if len(data) < offset + _BLOCK_HEADER.size:
+        raise ValueError("消息过短: 缺少关键点块")
+    encoding, count = _BLOCK_HEADER.unpack_from(data, offset)
+    if encoding not in (ENCODING_FLOAT16, ENCODING_INT16):
+        raise ValueError(f"不支持的坐标编码: {encoding}")
+    if count > MAX_HANDS:
+        raise ValueError(f"手数 {count} 超过 {MAX_HANDS}")
+    offset += _BLOCK_HEADER.size
+
+    end = offset + count + count * _COORDS_PER_HAND * 2
+    if len(data) < end:
+        raise ValueError(f"消息长度 {len(data)} 与手数 {count} 不符")
+    codes = data[offset:offset + count]
+    if any(code >= len(HANDEDNESS) for code in codes):
+        raise ValueError(f"无效的 handedness: {list(codes)}")
+    offset += count
+
+    coords = np.frombuffer(data, dtype="<i2" if encoding == ENCODING_INT16 else "<f2",
+                           count=count * _COORDS_PER_HAND, offset=offset)
+    landmarks = coords.astype(np.float32).reshape(count, NUM_LANDMARKS, NUM_COORDS)
+    if encoding == ENCODING_INT16:
+        landmarks /= INT16_SCALE
+    elif not np.all(np.isfinite(landmarks)):
+        raise ValueError("关键点包含非有限值")
+    return landmarks, [HANDEDNESS[code] for code in codes], end
+
+
+def encode_landmark_frame(landmarks: Any, sequence: int = 0, handedness: Optional[Sequence[Optional[str]]] = None,
+                          encoding: str = "float16") -> bytes:
+    """
+    编码一帧关键点
+
+    Args:
+        landmarks: shape=(手数, 21, 3) 的关键点（格式见 parse_landmark_array），未检测到手时传空列表
+        sequence: 帧序号（u32，超出时取低32位），服务端在结果中原样返回
+        handedness: 每只手的 "Left" / "Right" / None，可省略
+        encoding: 坐标编码，"float16" 或 "int16"
+
+    Returns:
+        二进制消息
+
+    Raises:
+        ValueError: 关键点形状错误或超出编码范围
+    """
+    return _encode_header(KIND_LANDMARKS, sequence) + _encode_block(landmarks, handedness, encoding)
+
+
+def decode_landmark_frame(data: bytes) -> LandmarkFrame:
+    """
+    解码一帧关键点
+
+    Args:
+        data: encode_landmark_frame 生成的二进制消息
+
+    Returns:
+        LandmarkFrame
+
+    Raises:
+        ValueError: 消息格式错误
+    """
+    data = bytes(data)
+    sequence = _decode_header(data, KIND_LANDMARKS)
+    landmarks, handedness, end = _decode_block(data, _HEADER.size)
+    if end != len(data):
+        raise ValueError(f"消息长度 {len(data)} 与内容 {end} 不符")
+    return LandmarkFrame(landmarks, handedness, sequence)
+
+
+def _pack_float(value: Optional[float]) -> float:
+    return math.nan if value is None else float(value)
+
+
+def _unpack_float(value: float) -> Optional[float]:
+    return None if math.isnan(value) else value
+
+
+def _pack_string(value: Optional[str]) -> bytes:
+    raw = (value or "").encode("utf-8")[:0xFFFF]
+    return _STRING_LENGTH.pack(len(raw)) + raw
+
+
+def _unpack_string(data: bytes, offset: int):
+    if len(data) < offset + _STRING_LENGTH.size:
+        raise ValueError("消息过短: 缺少字符串字段")
+    (length,) = _STRING_LENGTH.unpack_from(data, offset)
+    offset += _STRING_LENGTH.size
+    if len(data) < offset + length:
+        raise ValueError("消息过短: 字符串字段不完整")
+    return (data[offset:offset + length].decode("utf-8") or None), offset + length
+
+
+def encode_result(result, sequence: int = 0, landmarks: Any = None,
+                  handedness: Optional[Sequence[Optional[str]]] = None, encoding: str = "float16") -> bytes:
+    """
+    编码识别结果
+
+    Args:
+        result: RecognitionResult
+        sequence: 对应请求帧的序号
+        landmarks: 可选的关键点（如服务端检测到的手），客户端上传关键点时不必回传
+        handedness: 每只手的 handedness
+        encoding: 关键点的坐标编码
+
+    Returns:
+        二进制消息
+    """
+    flags = 0
+    if result.success:
+        flags |= _FLAG_SUCCESS
+    if result.detected:
+        flags |= _FLAG_DETECTED
+    if result.reused:
+        flags |= _FLAG_REUSED
+    if result.changed is not None:
+        flags |= _FLAG_SMOOTHED
+        if result.changed:
+            flags |= _FLAG_CHANGED
+    return b"".join((
+        _encode_header(KIND_RESULT, sequence),
+        _RESULT_FIXED.pack(
+            flags, _pack_float(result.confidence), _pack_float(result.stable_confidence),
+            _pack_float(result.sequence_confidence), _pack_float(result.processing_time_ms)
+        ),
+        _pack_string(result.predicted_class),
+        _pack_string(result.stable_word),
+        _pack_string(result.sequence_word),
+        _pack_string(result.message),
+        _encode_block(landmarks, handedness, encoding)
+    ))
+
+
+def decode_result(data: bytes) -> Dict[str, Any]:
+    """
+    解码识别结果
+
+    Args:
+        data: encode_result 生成的二进制消息
+
+    Returns:
+        与 get_service_response 字段相同的字典，另有 sequence、processing_time_ms、landmarks 和 handedness
+
+    Raises:
+        ValueError: 消息格式错误
+    """
+    data = bytes(data)
+    sequence = _decode_header(data, KIND_RESULT)
+    offset = _HEADER.size
+    if len(data) < offset + _RESULT_FIXED.size:
+        raise ValueError("消息过短: 缺少结果字段")
+    flags, confidence, stable_confidence, sequence_confidence, processing_time = _RESULT_FIXED.unpack_from(data, offset)
+    offset += _RESULT_FIXED.size
+    word, offset = _unpack_string(data, offset)
+    stable_word, offset = _unpack_string(data, offset)
+    sequence_word, offset = _unpack_string(data, offset)
+    message, offset = _unpack_string(data, offset)
+    landmarks, handedness, end = _decode_block(data, offset)
+    if end != len(data):
+        raise ValueError(f"消息长度 {len(data)} 与内容 {end} 不符")
+
+    response = {
+        "sequence": sequence,
+        "success": bool(flags & _FLAG_SUCCESS),
+        "detected": bool(flags & _FLAG_DETECTED),
+        "word": word,
+        "confidence": _unpack_float(confidence),
+        "message": message or "",
+        "reused": bool(flags & _FLAG_REUSED),
+        "processing_time_ms": _unpack_float(processing_time),
+        "landmarks": landmarks,
+        "handedness": handedness
+    }
+    if flags & _FLAG_SMOOTHED:
+        response["stable_word"] = stable_word
+        response["stable_confidence"] = _unpack_float(stable_confidence)
+        response["changed"] = bool(flags & _FLAG_CHANGED)
+    if sequence_word is not None:
+        response["sequence_word"] = sequence_word
+        response["sequence_confidence"] = _unpack_float(sequence_confidence)
+    return response
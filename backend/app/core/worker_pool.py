@@ -0,0 +1,686 @@
+"""
+多进程推理模块
+主进程只负责解码，把帧写入共享内存环形缓冲区；每个工作进程持有自己的识别器，
+完成关键点提取和分类后只回传标签、置信度、关键点数组和概率，
+MediaPipe / OpenCV 的计算不再受主进程GIL限制，也不需要序列化整张图像。
+工作进程意外退出（如MediaPipe崩溃、被OOM终止）时，分给它的任务立即失败并归还槽位，
+池随后用相同的参数重新启动该进程；重启期间新请求只交给其余已就绪的进程，池以降低的容量继续服务
+"""
+
+import itertools
+import json
+import multiprocessing
+import multiprocessing.connection
+import queue
+import threading
+import zlib
+from concurrent.futures import Future
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .landmarks import array_to_landmarks, landmarks_to_array
+
+# 配置日志
+from ..utils.logger_config import get_module_logger
+logger = get_module_logger(__name__)
+
+
+class SharedFrameRing:
+    """
+    共享内存帧缓冲区
+    由若干个固定大小的槽位组成，主进程写入帧后把槽位号发给工作进程，
+    工作进程处理完成并回传结果后槽位才被释放
+    """
+
+    def __init__(self, num_slots: int, slot_bytes: int, name: Optional[str] = None):
+        """
+        创建或连接共享内存
+
+        Args:
+            num_slots: 槽位数量
+            slot_bytes: 每个槽位的字节数（需容纳最大的一帧）
+            name: 已存在的共享内存名称，为None时新建
+        """
+        self.num_slots = int(num_slots)
+        self.slot_bytes = int(slot_bytes)
+        self._owner = name is None
+
+        if self._owner:
+            self.shm = shared_memory.SharedMemory(create=True, size=self.num_slots * self.slot_bytes)
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+        self.name = self.shm.name
+
+        # 空闲槽位只在主进程中使用
+        self._free: "queue.Queue[int]" = queue.Queue()
+        if self._owner:
+            for slot in range(self.num_slots):
+                self._free.put(slot)
+
+    def acquire(self, timeout: Optional[float] = None) -> int:
+        """获取一个空闲槽位，超时抛出 TimeoutError"""
+        try:
+            return self._free.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError("共享内存槽位已用尽")
+
+    def release(self, slot: int):
+        """归还槽位"""
+        self._free.put(slot)
+
+    def write(self, slot: int, frame: np.ndarray) -> Tuple[Tuple[int, ...], str]:
+        """
+        将帧写入槽位
+
+        Returns:
+            (帧形状, dtype字符串)，工作进程据此还原数组
+        """
+        frame = np.ascontiguousarray(frame)
+        if frame.nbytes > self.slot_bytes:
+            raise ValueError(f"帧大小 {frame.nbytes} 字节超过槽位大小 {self.slot_bytes} 字节")
+        self.view(slot, frame.shape, frame.dtype.str)[...] = frame
+        return frame.shape, frame.dtype.str
+
+    def view(self, slot: int, shape: Tuple[int, ...], dtype: str) -> np.ndarray:
+        """返回槽位上的数组视图（不复制）"""
+        return np.ndarray(shape, dtype=np.dtype(dtype), buffer=self.shm.buf, offset=slot * self.slot_bytes)
+
+    def close(self):
+        self.shm.close()
+
+    def unlink(self):
+        if self._owner:
+            self.shm.unlink()
+
+
+def _worker_main(worker_index: int, shm_name: str, num_slots: int, slot_bytes: int,
+                 task_queue, result_conn, options: Dict[str, Any]):
+    """
+    工作进程入口：加载识别器，循环处理任务
+    结果经该进程独占的单向管道 result_conn 回传：管道没有跨进程的写锁，进程在写入途中被杀死
+    也不会阻塞其他进程，进程退出后主进程读到 EOF
+
+    任务格式：
+    - ("predict", 任务ID, 槽位, 形状, dtype, session_id, use_memo)
+    - ("release", session_id)
+    - None 表示退出
+    """
+    # 先设置线程预算和CPU亲和性，再导入识别器（TensorFlow / MediaPipe 在导入和首次使用时创建线程池）
+    from .threads import apply_thread_budget, available_cpus, parse_cpu_list, worker_cpus
+    cpu_affinity = None
+    if options.get("cpu_affinity"):
+        base = None if options["cpu_affinity"] == "auto" else parse_cpu_list(options["cpu_affinity"])
+        cpu_affinity = worker_cpus(worker_index, options.get("num_workers", 1), base or available_cpus())
+    apply_thread_budget(
+        threads=options.get("threads", 0),
+        inter_op_threads=options.get("inter_op_threads", 1),
+        cpu_affinity=cpu_affinity
+    )
+
+    # 在子进程中导入，避免主进程加载模型
+    from .recognizer import SignLanguageRecognizer
+
+    ring = SharedFrameRing(num_slots, slot_bytes, name=shm_name)
+    recognizer = SignLanguageRecognizer(
+        options["model_path"],
+        options["labels_path"],
+        backend=options.get("backend", "keras"),
+        fast_path=options.get("fast_path", True),
+        shared_weights=options.get("shared_weights", False),
+        weights_cache_dir=options.get("weights_cache_dir", ""),
+        hands_options=options.get("hands_options"),
+        num_threads=options.get("threads", 0)
+    )
+    if options.get("session_tracking"):
+        recognizer.enable_sessions(
+            idle_timeout_s=options.get("session_idle_timeout_s", 60.0),
+            max_sessions=options.get("session_max_count", 64)
+        )
+    if options.get("prediction_memo_grid", 0) > 0:
+        recognizer.enable_prediction_memo(
+            grid_size=options["prediction_memo_grid"],
+            max_entries=options.get("prediction_memo_size", 4096)
+        )
+    if options.get("prefilter_min_skin_fraction", 0) > 0:
+        recognizer.enable_prefilter(
+            min_skin_fraction=options["prefilter_min_skin_fraction"],
+            audit_interval=options.get("prefilter_audit_interval", 50)
+        )
+    if options.get("resolution_levels"):
+        recognizer.enable_adaptive_resolution(
+            levels=options["resolution_levels"],
+            target_ms=options.get("resolution_target_ms", 40.0),
+            queue_high=options.get("resolution_queue_high", 4)
+        )
+    # 预热完成后才报告就绪，主进程收到的第一帧不再承担初始化开销
+    if recognizer.is_ready() and options.get("warmup_frames", 0) > 0:
+        recognizer.warm_up(options["warmup_frames"])
+    result_conn.send(("ready", worker_index, recognizer.is_ready()))
+
+    try:
+        while True:
+            task = task_queue.get()
+            if task is None:
+                break
+
+            if task[0] == "release":
+                recognizer.release_session(task[1])
+                continue
+
+            if task[0] == "classify":
+                # 客户端上传的关键点：特征向量只有几百字节，直接经队列传递，不占用共享内存槽位
+                _, task_id, features, use_memo = task
+                try:
+                    result_conn.send((
+                        "result", task_id,
+                        recognizer.predict_features(features, return_probs=True, use_memo=use_memo), None
+                    ))
+                except Exception as e:
+                    result_conn.send(("result", task_id, None, str(e)))
+                continue
+
+            _, task_id, slot, shape, dtype, session_id, use_memo = task
+            try:
+                frame = ring.view(slot, shape, dtype)
+                label, confidence, hand_landmarks, probabilities, features = recognizer.predict(
+                    frame, session_id=session_id, return_probs=True, use_memo=use_memo, return_features=True
+                )
+                del frame
+                result_conn.send((
+                    "result", task_id,
+                    (label, confidence, landmarks_to_array(hand_landmarks), probabilities, features),
+                    None
+                ))
+            except Exception as e:
+                result_conn.send(("result", task_id, None, str(e)))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        recognizer.close()
+        ring.close()
+
+
+class ProcessRecognizerPool:
+    """
+    多进程识别器池
+    对外提供与 SignLanguageRecognizer 相同的 predict / draw_landmarks 接口；
+    带 session_id 的帧总是路由到同一个工作进程，保持该会话的手部跟踪状态
+    """
+
+    def __init__(self, model_path: str, labels_path: str, num_workers: int = 2,
+                 num_slots: int = 0, slot_bytes: int = 1920 * 1080 * 3,
+                 backend: str = "keras", fast_path: bool = True, shared_weights: bool = False,
+                 weights_cache_dir: str = "",
+                 hands_options: Optional[Dict[str, Any]] = None, threads: int = 0,
+                 inter_op_threads: int = 1, cpu_affinity: str = "",
+                 session_tracking: bool = True, session_idle_timeout_s: float = 60.0,
+                 session_max_count: int = 64, prediction_memo_grid: float = 0.0,
+                 prediction_memo_size: int = 4096, prefilter_min_skin_fraction: float = 0.0,
+                 prefilter_audit_interval: int = 50, resolution_levels: Optional[List[int]] = None,
+                 resolution_target_ms: float = 40.0, resolution_queue_high: int = 4,
+                 warmup_frames: int = 0, result_timeout: float = 10.0):
+        """
+        初始化池（调用 start 后才会启动工作进程）
+
+        Args:
+            model_path: 模型文件路径
+            labels_path: 标签文件路径
+            num_workers: 工作进程数量
+            num_slots: 共享内存槽位数量，0 表示每个工作进程4个
+            slot_bytes: 每个槽位的字节数，默认可容纳一帧 1080p BGR 图像
+            backend: 工作进程使用的推理后端
+            fast_path: Keras后端是否使用编译后的推理函数
+            shared_weights: numpy 后端是否以内存映射方式加载权重，所有工作进程共享一份
+            weights_cache_dir: 共享权重文件的目录，为空时使用系统临时目录
+            hands_options: 工作进程中MediaPipe的参数，默认使用识别器的默认值
+            threads: 每个工作进程的推理线程数（TensorFlow 算子内 / OpenCV / ONNX Runtime），0 表示默认
+            inter_op_threads: 每个工作进程的 TensorFlow 算子间线程数
+            cpu_affinity: "auto" 把可用的核平分给各工作进程，"0-3,8" 平分指定的核，留空不绑定
+            session_tracking: 工作进程内是否启用会话级手部跟踪
+            session_idle_timeout_s: 会话空闲回收时间（秒）
+            session_max_count: 每个工作进程的最大会话数
+            prediction_memo_grid: 大于0时每个工作进程启用预测缓存，量化网格的边长
+            prediction_memo_size: 每个工作进程预测缓存的最大条目数
+            prefilter_min_skin_fraction: 大于0时每个工作进程启用无手帧预过滤，肤色占比阈值
+            prefilter_audit_interval: 预过滤每丢弃多少帧抽检一次
+            resolution_levels: 提供时每个工作进程启用自适应检测分辨率，可选的分辨率（长边像素）
+            resolution_target_ms: 单帧检测耗时的目标（毫秒）
+            resolution_queue_high: 工作进程内同时处理的帧数达到该值时降低分辨率
+            warmup_frames: 工作进程报告就绪前用于预热的合成帧数量
+            result_timeout: 等待单帧结果的最长时间（秒）
+        """
+        self.model_path = model_path
+        self.labels_path = labels_path
+        self.num_workers = max(1, int(num_workers))
+        self.num_slots = int(num_slots) if num_slots > 0 else self.num_workers * 4
+        self.slot_bytes = int(slot_bytes)
+        self.result_timeout = result_timeout
+        self._options = {
+            "model_path": model_path,
+            "labels_path": labels_path,
+            "backend": backend,
+            "fast_path": fast_path,
+            "shared_weights": shared_weights,
+            "weights_cache_dir": weights_cache_dir,
+            "hands_options": hands_options,
+            "num_workers": self.num_workers,
+            "threads": threads,
+            "inter_op_threads": inter_op_threads,
+            "cpu_affinity": cpu_affinity,
+            "session_tracking": session_tracking,
+            "session_idle_timeout_s": session_idle_timeout_s,
+            "session_max_count": session_max_count,
+            "prediction_memo_grid": prediction_memo_grid,
+            "prediction_memo_size": prediction_memo_size,
+            "prefilter_min_skin_fraction": prefilter_min_skin_fraction,
+            "prefilter_audit_interval": prefilter_audit_interval,
+            "resolution_levels": list(resolution_levels) if resolution_levels else None,
+            "resolution_target_ms": resolution_target_ms,
+            "resolution_queue_high": resolution_queue_high,
+            "warmup_frames": warmup_frames,
+        }
+
+        with open(labels_path, 'r', encoding='utf-8') as f:
+            self.labels: List[str] = json.load(f).get('classes', [])
+
+        self.ring: Optional[SharedFrameRing] = None
+        self._context = None
+        self._processes: List[multiprocessing.Process] = []
+        self._task_queues: list = []
+        # 每个工作进程一个结果管道的读取端
+        self._result_conns: list = []
+        self._listener: Optional[threading.Thread] = None
+        self._closing = threading.Event()
+
+        # 任务ID -> (Future, 槽位, 工作进程编号)，工作进程退出时据此找出它未完成的任务
+        self._pending: Dict[int, Tuple[Future, Optional[int], int]] = {}
+        # 调用方已超时放弃的任务ID -> (槽位, 工作进程编号)，工作进程可能仍在读取槽位，结果回传或进程退出后才归还
+        self._abandoned: Dict[int, Tuple[int, int]] = {}
+        # 保护 _pending、_abandoned 和计数器
+        self._pending_lock = threading.Lock()
+        # 选择工作进程、登记和派发任务在同一把锁内完成，重启时不会漏掉或误判正在派发的任务
+        self._restart_lock = threading.RLock()
+        self._task_ids = itertools.count()
+        self._round_robin = itertools.count()
+        # 已报告就绪的工作进程编号，重启的进程重新加载模型后再次加入
+        self._ready: set = set()
+        # 启动后已报告过加载结果（成功或失败）的工作进程编号
+        self._reported: set = set()
+        self._ready_event = threading.Event()
+        self._completed = 0
+        self._failed = 0
+        self._restarts = 0
+
+    def start(self, timeout: float = 120.0) -> bool:
+        """
+        启动工作进程并等待模型加载完成
+
+        Args:
+            timeout: 等待所有工作进程报告加载结果的最长时间（秒）
+
+        Returns:
+            是否至少有一个工作进程就绪（部分进程加载失败时池以降低的容量运行）
+        """
+        # spawn 启动的子进程不继承主进程中已初始化的TensorFlow / MediaPipe状态
+        self._context = multiprocessing.get_context("spawn")
+        self._closing.clear()
+        self.ring = SharedFrameRing(self.num_slots, self.slot_bytes)
+
+        for worker_index in range(self.num_workers):
+            task_queue, result_conn, process = self._spawn_worker(worker_index)
+            self._task_queues.append(task_queue)
+            self._result_conns.append(result_conn)
+            self._processes.append(process)
+
+        self._listener = threading.Thread(target=self._listen, name="recognizer-results", daemon=True)
+        self._listener.start()
+
+        self._ready_event.wait(timeout)
+        logger.info(
+            f"多进程识别器池已启动: {len(self._ready)}/{self.num_workers} 个工作进程就绪, "
+            f"共享内存 {self.num_slots} x {self.slot_bytes / 1024 / 1024:.1f}MB"
+        )
+        if 0 < len(self._ready) < self.num_workers:
+            logger.warning(f"部分工作进程未就绪，池以 {len(self._ready)}/{self.num_workers} 的容量运行")
+        return self.is_ready()
+
+    def _spawn_worker(self, worker_index: int):
+        """启动一个工作进程，返回 (任务队列, 结果管道读取端, 进程)"""
+        task_queue = self._context.Queue()
+        reader, writer = self._context.Pipe(duplex=False)
+        process = self._context.Process(
+            target=_worker_main,
+            args=(worker_index, self.ring.name, self.num_slots, self.slot_bytes,
+                  task_queue, writer, self._options),
+            name=f"recognizer-worker-{worker_index}",
+            daemon=True
+        )
+        process.start()
+        # 主进程不保留写入端，工作进程退出后读取端才会收到 EOF
+        writer.close()
+        return task_queue, reader, process
+
+    def _restart_worker(self, worker_index: int):
+        """
+        处理已退出的工作进程：分给它的任务立即失败并归还槽位，再用相同的参数启动新进程
+        该进程上的会话跟踪状态随进程丢失，之后的帧从整帧检测重新开始；
+        从未就绪过的进程（如模型加载失败、启动时崩溃）不再重启，避免反复拉起。
+        只在监听线程中调用，结果管道的替换和关闭都不会与 wait 并发
+        """
+        with self._restart_lock:
+            process = self._processes[worker_index]
+            if self._closing.is_set() or process.is_alive():
+                return
+            process.join(0)
+            was_ready = worker_index in self._ready
+            self._ready.discard(worker_index)
+
+            with self._pending_lock:
+                lost = [task_id for task_id, (_, _, owner) in self._pending.items() if owner == worker_index]
+                lost = [self._pending.pop(task_id) for task_id in lost]
+                abandoned = [task_id for task_id, (_, owner) in self._abandoned.items() if owner == worker_index]
+                slots = [self._abandoned.pop(task_id)[0] for task_id in abandoned]
+                self._failed += len(lost)
+            # 进程已退出，不会再读取这些槽位
+            slots += [slot for _, slot, _ in lost if slot is not None]
+            for slot in slots:
+                self.ring.release(slot)
+            for future, _, _ in lost:
+                if not future.done():
+                    future.set_exception(RuntimeError(f"工作进程 {worker_index} 已退出"))
+
+            if not was_ready:
+                logger.error(f"工作进程 {worker_index} 未就绪即退出 (exitcode={process.exitcode})，不再重启")
+                return
+            logger.error(f"工作进程 {worker_index} 意外退出 (exitcode={process.exitcode})，正在重启")
+
+            # 旧队列中未取走的任务已经失败，新进程使用新的队列和管道
+            old_queue, old_conn = self._task_queues[worker_index], self._result_conns[worker_index]
+            old_queue.cancel_join_thread()
+            old_queue.close()
+            (self._task_queues[worker_index], self._result_conns[worker_index],
+             self._processes[worker_index]) = self._spawn_worker(worker_index)
+            old_conn.close()
+            self._restarts += 1
+
+    def _dispatch(self, task_id: int, future: Future, slot: Optional[int], session_id: Optional[str], task: tuple):
+        """
+        选择一个已就绪的工作进程，登记任务并发给它
+        退出的进程由监听线程重启，重启完成前不会被选中，任务不会落入没有读取方的队列
+
+        Raises:
+            RuntimeError: 没有已就绪的工作进程
+        """
+        with self._restart_lock:
+            worker_index = self._pick_worker(session_id)
+            with self._pending_lock:
+                self._pending[task_id] = (future, slot, worker_index)
+            self._task_queues[worker_index].put(task)
+
+    def _abandon(self, task_id: int):
+        """
+        调用方不再等待该任务（超时或派发失败）时移除登记；
+        工作进程可能仍在读取它的槽位，槽位在结果回传或进程退出时才归还
+        """
+        with self._pending_lock:
+            entry = self._pending.pop(task_id, None)
+            if entry is None:
+                return
+            self._failed += 1
+            _, slot, worker_index = entry
+            if slot is not None:
+                self._abandoned[task_id] = (slot, worker_index)
+
+    def _listen(self):
+        """后台线程：接收工作进程的结果并交还给调用方，某个进程的管道读到 EOF 时说明该进程已退出"""
+        while not self._closing.is_set():
+            conns = {
+                conn: worker_index for worker_index, conn in enumerate(self._result_conns)
+                if conn is not None and not conn.closed
+            }
+            try:
+                ready = multiprocessing.connection.wait(list(conns), timeout=0.5)
+            except (OSError, ValueError) as e:
+                # 管道在收集后被关闭（池正在关闭），下一轮重新收集，监听线程不能退出
+                logger.debug(f"等待工作进程结果失败: {str(e)}")
+                continue
+
+            for conn in ready:
+                try:
+                    message = conn.recv()
+                except (EOFError, OSError):
+                    # 重启时已被替换的管道不再处理
+                    if self._result_conns[conns[conn]] is conn:
+                        self._on_worker_exit(conns[conn])
+                    continue
+                try:
+                    self._handle_message(message)
+                except Exception as e:
+                    logger.error(f"处理工作进程消息失败: {str(e)}")
+
+    def _on_worker_exit(self, worker_index: int):
+        """结果管道关闭：等待进程退出后重启；不再重启的进程从监听中移除，避免反复读到 EOF"""
+        self._processes[worker_index].join(5)
+        self._restart_worker(worker_index)
+        with self._restart_lock:
+            if not self._processes[worker_index].is_alive():
+                self._result_conns[worker_index].close()
+                self._result_conns[worker_index] = None
+
+    def _handle_message(self, message: tuple):
+        """处理工作进程发来的一条消息"""
+        if message[0] == "ready":
+            _, worker_index, ok = message
+            with self._restart_lock:
+                self._reported.add(worker_index)
+                if ok:
+                    self._ready.add(worker_index)
+                else:
+                    logger.error(f"工作进程 {worker_index} 模型加载失败")
+            if len(self._reported) >= self.num_workers:
+                self._ready_event.set()
+            return
+
+        _, task_id, payload, error = message
+        with self._pending_lock:
+            entry = self._pending.pop(task_id, None)
+            if entry is None:
+                # 调用方已放弃的任务，只归还槽位
+                future, slot = None, self._abandoned.pop(task_id, (None, None))[0]
+            else:
+                future, slot, _ = entry
+                if error is None:
+                    self._completed += 1
+                else:
+                    self._failed += 1
+        if slot is not None:
+            # 工作进程已读完该槽位
+            self.ring.release(slot)
+        if future is None:
+            return
+
+        if error is None:
+            future.set_result(payload)
+        else:
+            future.set_exception(RuntimeError(error))
+
+    def _available_workers(self) -> List[int]:
+        """已就绪且进程仍在运行的工作进程编号"""
+        return [worker_index for worker_index in sorted(self._ready) if self._processes[worker_index].is_alive()]
+
+    def _pick_worker(self, session_id: Optional[str]) -> int:
+        """
+        同一会话固定路由到同一个工作进程，其余请求在已就绪的进程间轮询；
+        负责该会话的进程不可用（如正在重启）时，会话临时交给其余进程，跟踪从整帧检测重新开始
+
+        Raises:
+            RuntimeError: 没有已就绪的工作进程
+        """
+        available = self._available_workers()
+        if not available:
+            raise RuntimeError("没有可用的工作进程")
+        if session_id is not None:
+            key = zlib.crc32(str(session_id).encode("utf-8"))
+            preferred = key % self.num_workers
+            return preferred if preferred in available else available[key % len(available)]
+        return available[next(self._round_robin) % len(available)]
+
+    def submit(self, image: np.ndarray, session_id: Optional[str] = None, use_memo: bool = True) -> Future:
+        """
+        提交一帧图像
+
+        Args:
+            image: OpenCV格式的图像 (BGR)
+            session_id: 视频流的会话ID
+            use_memo: 工作进程是否使用预测缓存（已启用时）
+
+        Returns:
+            结果为 (标签, 置信度, 关键点数组, 概率数组, 特征向量) 的 Future
+
+        Raises:
+            RuntimeError: 没有已就绪的工作进程
+        """
+        return self._submit(image, session_id, use_memo)[1]
+
+    def _submit(self, image: np.ndarray, session_id: Optional[str], use_memo: bool) -> Tuple[int, Future]:
+        """写入共享内存并派发，返回 (任务ID, Future)"""
+        slot = self.ring.acquire(timeout=self.result_timeout)
+        future: Future = Future()
+        task_id = next(self._task_ids)
+        try:
+            shape, dtype = self.ring.write(slot, image)
+            self._dispatch(task_id, future, slot, session_id,
+                           ("predict", task_id, slot, shape, dtype, session_id, use_memo))
+        except Exception:
+            self.ring.release(slot)
+            raise
+        return task_id, future
+
+    def predict(self, image: np.ndarray, session_id: Optional[str] = None, return_probs: bool = False,
+                use_memo: bool = True, return_features: bool = False) -> Tuple:
+        """预测图像中的手语，参数和返回值与 SignLanguageRecognizer.predict 相同"""
+        task_id = None
+        try:
+            task_id, future = self._submit(image, session_id, use_memo)
+            label, confidence, landmarks, probabilities, features = future.result(timeout=self.result_timeout)
+            result = (label, confidence, array_to_landmarks(landmarks))
+        except Exception as e:
+            if task_id is not None:
+                self._abandon(task_id)
+            logger.error(f"预测失败: {str(e)}")
+            result, probabilities, features = (None, None, None), None, None
+        # 工作进程总是回传概率和特征，按参数决定是否附带（与 SignLanguageRecognizer.predict 相同）
+        if return_probs:
+            result += (probabilities,)
+        if return_features:
+            result += (features,)
+        return result
+
+    def predict_features(self, features: np.ndarray, return_probs: bool = False, use_memo: bool = True) -> Tuple:
+        """
+        对特征向量分类，参数和返回值与 SignLanguageRecognizer.predict_features 相同
+        主进程不加载模型，分类在工作进程中执行（轮询选择，不需要会话的检测图）
+        """
+        future: Future = Future()
+        task_id = next(self._task_ids)
+        try:
+            self._dispatch(task_id, future, None, None,
+                           ("classify", task_id, np.asarray(features, dtype=np.float32), use_memo))
+            label, confidence, probabilities = future.result(timeout=self.result_timeout)
+        except Exception as e:
+            self._abandon(task_id)
+            logger.error(f"预测失败: {str(e)}")
+            return (None, None, None) if return_probs else (None, None)
+        if return_probs:
+            return label, confidence, probabilities
+        return label, confidence
+
+    def draw_landmarks(self, image: np.ndarray, hand_landmarks_list: List) -> np.ndarray:
+        """在主进程中绘制关键点"""
+        from .recognizer import draw_hand_landmarks
+        return draw_hand_landmarks(image, hand_landmarks_list)
+
+    def release_session(self, session_id: str):
+        """通知负责该会话的工作进程释放检测图"""
+        if session_id is None or not self._task_queues:
+            return
+        with self._restart_lock:
+            try:
+                worker_index = self._pick_worker(session_id)
+            except RuntimeError:
+                return
+            self._task_queues[worker_index].put(("release", session_id))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """获取工作进程和共享内存的使用统计，available 小于 workers 时池以降低的容量运行"""
+        with self._pending_lock:
+            in_flight = len(self._pending)
+            completed, failed = self._completed, self._failed
+        available = len(self._available_workers()) if self._processes else 0
+        return {
+            "workers": self.num_workers,
+            "alive": sum(1 for process in self._processes if process.is_alive()),
+            "ready": len(self._ready),
+            "available": available,
+            "degraded": available < self.num_workers,
+            "restarts": self._restarts,
+            "slots": self.num_slots,
+            "slot_bytes": self.slot_bytes,
+            "in_flight": in_flight,
+            "completed": completed,
+            "failed": failed
+        }
+
+    def get_model_info(self) -> dict:
+        """获取模型信息"""
+        return {
+            "model_loaded": self.is_ready(),
+            "labels_loaded": len(self.labels) > 0,
+            "model_path": self.model_path,
+            "labels_path": self.labels_path,
+            "num_classes": len(self.labels),
+            "classes": self.labels,
+            "inference": {"backend": self._options["backend"], "mode": "process"},
+            "workers": self.get_stats()
+        }
+
+    def is_ready(self) -> bool:
+        """至少有一个工作进程可以接收任务时即就绪，个别进程重启期间池以降低的容量继续服务"""
+        return len(self.labels) > 0 and bool(self._processes) and len(self._available_workers()) > 0
+
+    def close(self, timeout: float = 5.0):
+        """停止工作进程并释放共享内存"""
+        # 先标记关闭，工作进程正常退出时监听线程不会把它当作意外退出而重启
+        self._closing.set()
+        for task_queue in self._task_queues:
+            task_queue.put(None)
+        for process in self._processes:
+            process.join(timeout)
+            if process.is_alive():
+                process.terminate()
+
+        if self._listener is not None:
+            self._listener.join(timeout)
+            self._listener = None
+        for conn in self._result_conns:
+            if conn is not None:
+                conn.close()
+
+        with self._pending_lock:
+            pending = list(self._pending.values())
+            self._pending.clear()
+            self._abandoned.clear()
+        for future, _, _ in pending:
+            if not future.done():
+                future.set_exception(RuntimeError("识别器池已关闭"))
+
+        if self.ring is not None:
+            self.ring.close()
+            self.ring.unlink()
+            self.ring = None
+        self._processes = []
+        self._task_queues = []
+        self._result_conns = []
+        logger.info("多进程识别器池已关闭")
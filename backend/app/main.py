@@ -3,13 +3,18 @@ SignLink 手语翻译后端服务
 基于FastAPI构建的RESTful API服务
 """
 
+import asyncio
 import logging
 import sys
+import time
+import uuid
 from contextlib import asynccontextmanager
 
-from fastapi import Body, FastAPI, WebSocket, WebSocketDisconnect
+from fastapi import Body, FastAPI, Request, WebSocket, WebSocketDisconnect
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, Response
 
 # 导入日志配置
 from .utils.logger_config import setup_logging
@@ -25,9 +30,10 @@ logger = setup_logging(
 
 # 导入配置和模块
 from .core.config import config
+from .core.wire_format import decode_landmark_frame, encode_result
 # from .core.recognizer import SignLanguageRecognizer  <-- Removed unused import
 from .services.translator import TranslationService
-from .utils.common_utils import service_manager, get_service_response
+from .utils.common_utils import service_manager, get_service_response, parse_session_id
 from .utils.error_handler import ErrorResponse
 from .database import Base, engine
 from .routers import auth as auth_router
@@ -38,6 +44,113 @@ from .database import SessionLocal
 
 # 导入API路由
 from .api.routes.flask_compat import router as flask_compat_router, init_translator
+from .api.routes.models import router as models_router
+
+def _init_database():
+    """加载数据库模型并建表（在线程池中执行，与识别器加载并行）"""
+    logger.info("正在加载数据库模型...")
+    from . import models
+    logger.info("✅ 数据库模型加载完成")
+
+    Base.metadata.create_all(bind=engine)
+    logger.info("✅ 数据库表检查完成")
+
+def _init_recognizer(model_timings: dict) -> bool:
+    """加载并预热识别器，完成后注册翻译服务（在线程池中执行）"""
+    # 与ai_services保持一致：使用全局变量（识别器池），需在初始化之后读取
+    from .api.routes import flask_compat
+    if not init_translator(timings=model_timings):
+        return False
+    motion_gate = None
+    if config.MOTION_GATE_ENABLED:
+        from .core.motion import MotionGate
+        motion_gate = MotionGate(
+            thumbnail_width=config.MOTION_THUMBNAIL_WIDTH,
+            pixel_threshold=config.MOTION_PIXEL_THRESHOLD,
+            changed_fraction=config.MOTION_CHANGED_FRACTION,
+            max_reuse=config.MOTION_MAX_REUSE,
+            idle_timeout_s=config.SESSION_IDLE_TIMEOUT_S
+        )
+    frame_cache = None
+    if config.FRAME_CACHE_ENABLED:
+        from .core.frame_cache import FrameCache
+        frame_cache = FrameCache(
+            max_entries=config.FRAME_CACHE_MAX_ENTRIES,
+            max_bytes=int(config.FRAME_CACHE_MAX_MB * 1024 * 1024),
+            ttl_s=config.FRAME_CACHE_TTL_S
+        )
+    smoother = None
+    if config.SMOOTHING_ENABLED:
+        from .core.smoothing import TemporalSmoother
+        smoother = TemporalSmoother(
+            method=config.SMOOTHING_METHOD,
+            window=config.SMOOTHING_WINDOW,
+            ema_alpha=config.SMOOTHING_EMA_ALPHA,
+            enter_threshold=config.SMOOTHING_ENTER_THRESHOLD,
+            exit_threshold=config.SMOOTHING_EXIT_THRESHOLD,
+            min_frames=config.SMOOTHING_MIN_FRAMES,
+            max_sessions=config.SMOOTHING_MAX_SESSIONS
+        )
+    sentence_assembler = None
+    if config.SENTENCE_ENABLED:
+        from .core.sentence import SentenceAssembler
+        sentence_assembler = SentenceAssembler(
+            min_consecutive=config.SENTENCE_MIN_CONSECUTIVE,
+            min_confidence=config.SENTENCE_MIN_CONFIDENCE,
+            pause_s=config.SENTENCE_PAUSE_S,
+            dedupe_s=config.SENTENCE_DEDUPE_S,
+            max_words=config.SENTENCE_MAX_WORDS
+        )
+    sequence_streams = None
+    if config.SEQUENCE_MODEL_PATH:
+        from .core.sequence_model import SequenceStreams
+        sequence_model_path, sequence_labels_path = config.get_sequence_paths()
+        try:
+            sequence_streams = SequenceStreams.load(
+                sequence_model_path, sequence_labels_path, max_sessions=config.SEQUENCE_MAX_SESSIONS
+            )
+        except (OSError, ValueError) as e:
+            logger.error(f"⚠️ 时序模型加载失败，不启用连续识别: {str(e)}")
+    service_manager.set_service(
+        TranslationService(flask_compat.translator, motion_gate=motion_gate, frame_cache=frame_cache,
+                           smoother=smoother, sentence_assembler=sentence_assembler,
+                           sequence_streams=sequence_streams)
+    )
+    return True
+
+async def _timed(timings: dict, phase: str, func, *args):
+    """在线程池中执行启动步骤，并记录耗时（毫秒）"""
+    start = time.perf_counter()
+    try:
+        return await run_in_threadpool(func, *args)
+    finally:
+        timings[phase] = (time.perf_counter() - start) * 1000
+
+def _format_timings(timings: dict) -> str:
+    return ", ".join(f"{phase}={ms:.0f}ms" for phase, ms in timings.items())
+
+async def _load_recognizer(startup_start: float):
+    """
+    后台加载识别器
+    预热完成前识别接口返回“模型加载中”，其余接口（认证、答题等）不受影响
+    """
+    timings = service_manager.startup_timings
+    model_timings = {}
+    try:
+        logger.info("正在初始化手语识别器...")
+        if await _timed(timings, "recognizer_ms", _init_recognizer, model_timings):
+            logger.info("✅ 识别器初始化并预热成功！")
+        else:
+            logger.warning("识别器未初始化，相关接口将返回未就绪")
+    except Exception as e:
+        logger.error(f"❌ 识别器初始化失败: {str(e)}")
+        logger.error("详细错误信息:", exc_info=True)
+    finally:
+        service_manager.set_loading(False)
+        timings["ready_ms"] = (time.perf_counter() - startup_start) * 1000
+        logger.info(f"⏱️ 启动耗时: {_format_timings(timings)}")
+        if model_timings:
+            logger.info(f"⏱️ 识别器加载明细: {_format_timings(model_timings)}")
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -46,36 +159,26 @@ async def lifespan(app: FastAPI):
     包含启动和关闭时的处理逻辑
     """
     # ========== 启动逻辑 ==========
+    startup_start = time.perf_counter()
     logger.info("=" * 60)
     logger.info(f"🚀 启动 {config.APP_NAME} v{config.APP_VERSION}")
     logger.info("=" * 60)
 
+    # 数据库初始化和识别器加载（TensorFlow / MediaPipe 导入、模型加载、预热）并行执行
+    service_manager.set_loading(True)
+    recognizer_task = asyncio.create_task(_load_recognizer(startup_start))
+
     # 初始化数据库
     try:
-        logger.info("正在加载数据库模型...")
-        from . import models
-        logger.info("✅ 数据库模型加载完成")
-        
-        Base.metadata.create_all(bind=engine)
-        logger.info("✅ 数据库表检查完成")
+        await _timed(service_manager.startup_timings, "database_ms", _init_database)
     except Exception as e:
         logger.error(f"❌ 数据库初始化失败: {str(e)}")
 
-    # 初始化识别器（使用ai_services的方式）
-    try:
-        logger.info("正在初始化手语识别器...")
-        # 与ai_services保持一致：使用全局变量
-        from .api.routes.flask_compat import translator as global_translator
-        if init_translator():
-            translation_service = TranslationService(global_translator)
-            service_manager.set_service(translation_service)
-            logger.info("✅ 识别器初始化成功！")
-        else:
-            logger.warning("识别器未初始化，相关接口将返回未就绪")
-
-    except Exception as e:
-        logger.error(f"❌ 服务启动失败: {str(e)}")
-        logger.error("详细错误信息:", exc_info=True)
+    if config.STARTUP_WAIT_FOR_MODEL:
+        await recognizer_task
+    else:
+        logger.info("识别器在后台加载，完成预热前识别接口返回未就绪")
+    service_manager.startup_timings["serving_ms"] = (time.perf_counter() - startup_start) * 1000
 
     # 启动完成
     logger.info("=" * 60)
@@ -90,6 +193,10 @@ async def lifespan(app: FastAPI):
     # ========== 关闭逻辑 ==========
     logger.info("🛑 正在关闭后端服务...")
 
+    # 加载线程无法中断，等待其结束后再关闭识别器
+    if not recognizer_task.done():
+        await recognizer_task
+
     try:
         # 清理资源
         service = service_manager.get_service()
@@ -157,9 +264,32 @@ async def root():
         "health": "/api/health"
     }
 
+@app.get("/api/health", summary="健康检查")
+async def health():
+    """
+    服务就绪状态，识别器加载和预热完成前返回503
+    """
+    ready = service_manager.is_service_ready()
+    body = {
+        "status": "ready" if ready else ("loading" if service_manager.is_loading() else "unavailable"),
+        "ready": ready,
+        "startup_ms": {phase: round(ms, 1) for phase, ms in service_manager.startup_timings.items()}
+    }
+    return body if ready else JSONResponse(status_code=503, content=body)
+
+@app.get("/api/metrics", summary="运行指标")
+async def metrics():
+    """
+    识别服务的运行指标：跳帧比例、识别器池、微批、会话等统计
+    """
+    if not service_manager.is_service_ready():
+        return ErrorResponse.service_unavailable(service_manager.not_ready_message())
+    return {"success": True, "metrics": service_manager.get_service().get_metrics()}
+
 # 注册API路由
 # 注册与ai_services兼容的路由（优先级高，放在前面）
 app.include_router(flask_compat_router)
+app.include_router(models_router)
 
 # 注册新的API路由
 app.include_router(auth_router.router)
@@ -167,20 +297,57 @@ app.include_router(users_router.router)
 app.include_router(quiz_router.router)
  
 
+_TRUE_VALUES = ("true", "1", "yes", "on")
+_FALSE_VALUES = ("false", "0", "no", "off")
+
+def _parse_flag(value, default: bool = True) -> bool:
+    """
+    解析请求中的布尔开关（如 use_cache），JSON 布尔值、数字和 "false"/"0" 等字符串都按字面含义处理
+
+    Raises:
+        ValueError: 无法识别的取值
+    """
+    if value is None:
+        return default
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, (int, float)):
+        return value != 0
+    text = str(value).strip().lower()
+    if text in _TRUE_VALUES:
+        return True
+    if text in _FALSE_VALUES:
+        return False
+    raise ValueError(f"无效的布尔值: {value!r}")
+
 @app.post("/recognize/realtime")
 async def recognize_realtime_root(payload: dict = Body(...)):
     if not service_manager.is_service_ready():
-        return ErrorResponse.service_unavailable("服务未初始化")
+        return ErrorResponse.service_unavailable(service_manager.not_ready_message())
 
     image = payload.get("image")
     fmt = payload.get("format", "jpeg")
     quality = int(payload.get("quality", 80))
+    # 可选：use_cache=false 时不复用缓存的结果，总是完整识别
+    try:
+        use_cache = _parse_flag(payload.get("use_cache"))
+    except ValueError as e:
+        return ErrorResponse.bad_request(f"use_cache {str(e)}")
+    # 可选：同一路视频流的连续帧携带相同的session_id，可保持手部跟踪状态
+    try:
+        session_id = parse_session_id(payload.get("session_id"))
+    except ValueError as e:
+        return ErrorResponse.bad_request(str(e))
 
     if not image:
         return ErrorResponse.bad_request("缺少图像数据")
 
     service = service_manager.get_service()
-    result = service.recognize_from_base64(image, format=fmt, quality=quality)
+    # 识别在线程池中执行，并发请求的分类调用才能合并成批
+    result = await run_in_threadpool(
+        service.recognize_from_base64, image, format=fmt, quality=quality, session_id=session_id,
+        use_cache=use_cache
+    )
 
     # 添加到历史记录
     if result.detected and result.predicted_class:
@@ -188,14 +355,74 @@ async def recognize_realtime_root(payload: dict = Body(...)):
 
     return get_service_response(result)
 
+# 二进制关键点帧的内容类型（格式见 app/core/wire_format.py）
+BINARY_CONTENT_TYPE = "application/octet-stream"
+
+@app.post("/recognize/landmarks")
+async def recognize_landmarks_root(request: Request):
+    """
+    客户端自行运行手部跟踪时只上传关键点，跳过图像上传、解码和MediaPipe检测，直接构建特征并分类
+    - JSON：{"landmarks": [[[x, y, z] x 21] x 手数], "session_id": ..., "use_cache": ...}，返回JSON
+    - application/octet-stream：请求体为二进制关键点帧，session_id / use_cache 放在查询参数中，返回二进制识别结果
+    """
+    if not service_manager.is_service_ready():
+        return ErrorResponse.service_unavailable(service_manager.not_ready_message())
+
+    binary = request.headers.get("content-type", "").startswith(BINARY_CONTENT_TYPE)
+    if binary:
+        try:
+            frame = decode_landmark_frame(await request.body())
+        except ValueError as e:
+            return ErrorResponse.bad_request(f"关键点消息格式错误: {str(e)}")
+        landmarks = frame.landmarks
+        session_id = request.query_params.get("session_id")
+        use_cache = request.query_params.get("use_cache")
+    else:
+        try:
+            payload = await request.json()
+        except ValueError:
+            return ErrorResponse.bad_request("无效的JSON格式")
+        if not isinstance(payload, dict):
+            return ErrorResponse.bad_request("请求体需要是JSON对象")
+        landmarks = payload.get("landmarks")
+        session_id = payload.get("session_id")
+        use_cache = payload.get("use_cache")
+
+    try:
+        use_cache = _parse_flag(use_cache)
+    except ValueError as e:
+        return ErrorResponse.bad_request(f"use_cache {str(e)}")
+    try:
+        session_id = parse_session_id(session_id)
+    except ValueError as e:
+        return ErrorResponse.bad_request(str(e))
+    if landmarks is None:
+        return ErrorResponse.bad_request("缺少关键点数据")
+
+    service = service_manager.get_service()
+    result = await run_in_threadpool(
+        service.recognize_from_landmarks, landmarks, session_id=session_id, use_cache=use_cache
+    )
+
+    if result.detected and result.predicted_class:
+        service_manager.add_to_history(result.predicted_class, result.predicted_class)
+
+    if binary:
+        return Response(content=encode_result(result, frame.sequence), media_type=BINARY_CONTENT_TYPE)
+    return get_service_response(result)
+
 @app.post("/recognize/batch")
 async def recognize_batch_root(payload: dict = Body(...)):
     if not service_manager.is_service_ready():
-        return ErrorResponse.service_unavailable("服务未初始化")
+        return ErrorResponse.service_unavailable(service_manager.not_ready_message())
 
     images = payload.get("images", [])
     fmt = payload.get("format", "jpeg")
     quality = int(payload.get("quality", 80))
+    try:
+        use_cache = _parse_flag(payload.get("use_cache"))
+    except ValueError as e:
+        return ErrorResponse.bad_request(f"use_cache {str(e)}")
 
     if not images:
         return ErrorResponse.bad_request("缺少图像数据")
@@ -203,8 +430,13 @@ async def recognize_batch_root(payload: dict = Body(...)):
     service = service_manager.get_service()
     outputs = []
 
-    for img in images:
-        result = service.recognize_from_base64(img, format=fmt, quality=quality)
+    # 同一请求内的多张图像并发提交，分类阶段由微批调度器合并
+    results = await asyncio.gather(*(
+        run_in_threadpool(service.recognize_from_base64, img, format=fmt, quality=quality, use_cache=use_cache)
+        for img in images
+    ))
+
+    for result in results:
         outputs.append(get_service_response(result))
 
         # 添加到历史记录
@@ -223,10 +455,53 @@ async def websocket_endpoint(ws: WebSocket):
     from .utils.common_utils import parse_websocket_payload, create_websocket_response
     import json
 
+    # 每个连接是一路独立的视频流，使用独占的手部跟踪状态
+    session_id = f"ws-{uuid.uuid4().hex}"
+    # /ws?mode=sentence：只推送服务端组装出的词汇和句子事件，不再逐帧返回识别结果
+    sentence_mode = ws.query_params.get("mode") == "sentence"
+
     await ws.accept()
     try:
         while True:
-            data = await ws.receive_text()
+            # 启用语句组装时，超过停顿时长没有收到任何帧也要结束当前句子（客户端可能直接停止发送）
+            service = service_manager.get_service()
+            assembler = service.sentence_assembler if service else None
+            try:
+                message = await asyncio.wait_for(ws.receive(), timeout=assembler.pause_s if assembler else None)
+            except asyncio.TimeoutError:
+                for event in service.expire_sentence(session_id):
+                    await ws.send_text(json.dumps(event, ensure_ascii=False))
+                continue
+            if message["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(message.get("code", 1000))
+
+            # 二进制消息为关键点帧：返回二进制识别结果，词汇 / 句子事件仍以JSON文本推送
+            if message.get("bytes") is not None:
+                try:
+                    frame = decode_landmark_frame(message["bytes"])
+                except ValueError as e:
+                    resp = create_websocket_response(error_message=f"关键点消息格式错误: {str(e)}")
+                    await ws.send_text(json.dumps(resp, ensure_ascii=False))
+                    continue
+                if not service_manager.is_service_ready():
+                    resp = create_websocket_response(service_ready=False)
+                    await ws.send_text(json.dumps(resp, ensure_ascii=False))
+                    continue
+
+                service = service_manager.get_service()
+                result = await run_in_threadpool(service.recognize_from_landmarks, frame.landmarks,
+                                                 session_id=session_id)
+                events = service.sentence_events(session_id, result)
+                if result.detected and result.predicted_class:
+                    service_manager.add_to_history(result.predicted_class, result.predicted_class)
+
+                if not sentence_mode:
+                    await ws.send_bytes(encode_result(result, frame.sequence))
+                for event in events:
+                    await ws.send_text(json.dumps(event, ensure_ascii=False))
+                continue
+
+            data = message.get("text") or ""
 
             # 解析消息
             payload, error_msg = parse_websocket_payload(data)
@@ -234,25 +509,45 @@ async def websocket_endpoint(ws: WebSocket):
                 await ws.send_text(json.dumps({"type": "error", "message": error_msg}, ensure_ascii=False))
                 continue
 
-            # 处理图像识别请求
-            if isinstance(payload, dict) and payload.get("type") == "image":
-                img = payload.get("data")
-                if not img:
+            # 处理图像识别请求；type=landmarks 时 data 为客户端检测到的关键点，不传图像
+            if isinstance(payload, dict) and payload.get("type") in ("image", "landmarks"):
+                is_image = payload["type"] == "image"
+                data = payload.get("data")
+                if is_image and not data:
                     resp = create_websocket_response(error_message="缺少图像数据")
+                elif not is_image and data is None:
+                    resp = create_websocket_response(error_message="缺少关键点数据")
                 elif not service_manager.is_service_ready():
                     resp = create_websocket_response(service_ready=False)
                 else:
                     service = service_manager.get_service()
-                    result = service.recognize_from_base64(img)
+                    recognize = service.recognize_from_base64 if is_image else service.recognize_from_landmarks
+                    result = await run_in_threadpool(recognize, data, session_id=session_id)
                     predicted_class = result.predicted_class if result.success else None
-                    resp = create_websocket_response(predicted_class=predicted_class)
+                    resp = create_websocket_response(predicted_class=predicted_class, reused=result.reused,
+                                                     stable_word=result.stable_word, changed=result.changed,
+                                                     sequence_word=result.sequence_word)
+                    events = service.sentence_events(session_id, result)
 
                     # 添加到历史记录
                     if result.detected and result.predicted_class:
                         service_manager.add_to_history(result.predicted_class, result.predicted_class)
 
+                    if sentence_mode:
+                        for event in events:
+                            await ws.send_text(json.dumps(event, ensure_ascii=False))
+                        continue
+                    if events:
+                        resp["events"] = events
+
                 await ws.send_text(json.dumps(resp, ensure_ascii=False))
 
+            # 结束当前句子（如客户端停止翻译），返回句子事件
+            elif isinstance(payload, dict) and payload.get("type") == "flush":
+                service = service_manager.get_service()
+                events = service.flush_sentence(session_id) if service else []
+                await ws.send_text(json.dumps({"type": "flushed", "events": events}, ensure_ascii=False))
+
             # 处理答题请求 (Secure Flow)
             elif isinstance(payload, dict) and payload.get("type") == "answer_request":
                 img = payload.get("frame") or payload.get("data")
@@ -264,12 +559,13 @@ async def websocket_endpoint(ws: WebSocket):
                 elif not question_id:
                     resp = {"type": "answer_response", "error": "缺少题目ID"}
                 elif not service_manager.is_service_ready():
-                    resp = {"type": "answer_response", "error": "服务未初始化"}
+                    resp = {"type": "answer_response", "error": service_manager.not_ready_message()}
                 else:
                     try:
-                        # 1. 识别
+                        # 1. 识别：判分必须基于这一帧本身，不复用跳帧、帧缓存或预测缓存中之前的结果
                         service = service_manager.get_service()
-                        result = service.recognize_from_base64(img)
+                        result = await run_in_threadpool(service.recognize_from_base64, img, session_id=session_id,
+                                                         use_cache=False)
                         predicted_word = result.predicted_class if (result.success and result.detected) else None
 
                         if not predicted_word:
@@ -334,6 +630,10 @@ async def websocket_endpoint(ws: WebSocket):
             await ws.send_text(json.dumps(error_resp, ensure_ascii=False))
         except:
             pass
+    finally:
+        service = service_manager.get_service()
+        if service:
+            service.release_session(session_id)
 
 # ========== 启动方式 ==========
 
@@ -66,6 +66,18 @@ class RecognitionResult(BaseModel):
     # 处理时间（毫秒）
     processing_time_ms: Optional[float] = Field(None, description="图像处理耗时")
 
+    # 画面与上一次识别时相比没有变化，直接复用了上一次的结果
+    reused: bool = Field(default=False, description="是否复用上一帧的识别结果")
+
+    # 按会话时间平滑后的稳定词汇（仅带会话ID且启用平滑时有值）
+    stable_word: Optional[str] = Field(None, description="平滑后的稳定词汇")
+    stable_confidence: Optional[float] = Field(None, description="稳定词汇的平滑得分")
+    changed: Optional[bool] = Field(None, description="稳定词汇是否在这一帧变化，未启用平滑时为空")
+
+    # 流式时序模型在这一帧的输出（仅带会话ID且配置了时序模型时有值）
+    sequence_word: Optional[str] = Field(None, description="时序模型识别的词汇")
+    sequence_confidence: Optional[float] = Field(None, description="时序模型的置信度")
+
     # 时间戳
     timestamp: datetime = Field(default_factory=datetime.now, description="识别时间戳")
 
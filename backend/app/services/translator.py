@@ -5,7 +5,8 @@
 
 import time
 import logging
-from typing import Optional, Tuple, Dict, Any, TYPE_CHECKING
+import numpy as np
+from typing import Optional, Tuple, Dict, Any, List, TYPE_CHECKING
 from datetime import datetime
 import traceback
 
@@ -13,36 +14,62 @@ import traceback
 from ..utils.logger_config import get_module_logger
 
 if TYPE_CHECKING:
+    from ..core.frame_cache import FrameCache
+    from ..core.motion import MotionGate
     from ..core.recognizer import SignLanguageRecognizer
+    from ..core.sentence import SentenceAssembler
+    from ..core.sequence_model import SequenceStreams
+    from ..core.smoothing import TemporalSmoother
 
 from ..utils.image_processing import (
+    base64_to_bytes,
+    bytes_to_image,
+    bytes_to_thumbnail,
     base64_to_image,
     image_to_base64,
-    preprocess_image_for_model,
     create_visualization_image
 )
+from ..core.landmarks import build_features, landmarks_to_array, parse_landmark_array
 from ..models.schemas import RecognitionResult, HandLandmark, HandData
 
 logger = logging.getLogger(__name__)
 
+# 帧缓存中识别结果的估算内存占用（字节）：不含手部数据的结果约1KB，每只手的21个关键点约11KB
+RESULT_BASE_BYTES = 1024
+RESULT_HAND_BYTES = 11 * 1024
+
 class TranslationService:
     """
     手语翻译服务
     封装识别器的功能，提供更高级的翻译接口
     """
 
-    def __init__(self, recognizer: "SignLanguageRecognizer"):
+    def __init__(self, recognizer: "SignLanguageRecognizer", motion_gate: Optional["MotionGate"] = None,
+                 frame_cache: Optional["FrameCache"] = None, smoother: Optional["TemporalSmoother"] = None,
+                 sentence_assembler: Optional["SentenceAssembler"] = None,
+                 sequence_streams: Optional["SequenceStreams"] = None):
         """
         初始化翻译服务
 
         Args:
             recognizer: 已初始化的手语识别器
+            motion_gate: 可选的帧间变化检测器，带会话ID的帧画面不变时复用上一次的结果
+            frame_cache: 可选的帧内容缓存，内容完全相同的图像直接返回缓存的结果
+            smoother: 可选的时间平滑器，带会话ID的帧在结果中附带平滑后的稳定词汇
+            sentence_assembler: 可选的语句组装器，按会话把逐帧结果组装成词汇和句子事件
+            sequence_streams: 可选的流式时序模型，带会话ID的帧逐帧更新该会话的时序状态
         """
         self.recognizer = recognizer
+        self.motion_gate = motion_gate
+        self.frame_cache = frame_cache
+        self.smoother = smoother
+        self.sentence_assembler = sentence_assembler
+        self.sequence_streams = sequence_streams
         self.translation_count = 0  # 翻译次数统计
         self.start_time = datetime.now()
 
-    def recognize_from_base64(self, base64_image: str, format: str = "jpeg", quality: int = 80) -> RecognitionResult:
+    def recognize_from_base64(self, base64_image: str, format: str = "jpeg", quality: int = 80,
+                              session_id: Optional[str] = None, use_cache: bool = True) -> RecognitionResult:
         """
         从Base64图像进行手语识别
 
@@ -50,82 +77,70 @@ class TranslationService:
             base64_image: Base64编码的图像字符串
             format: 图像格式
             quality: 图像质量
+            session_id: 视频流的会话ID，同一会话的连续帧共享手部跟踪状态
+            use_cache: 为False时本次请求不复用任何结果（帧缓存、跳帧和预测缓存），总是完整识别
 
         Returns:
             RecognitionResult: 识别结果
         """
         start_time = time.time()
+        smoothing = session_id is not None and self.smoother is not None
 
         try:
+            # 内容完全相同的图像（重试、暂停的视频、批量请求中的重复帧）：连Base64解码也跳过
+            cache_key = None
+            if use_cache and self.frame_cache is not None:
+                cache_key = self._frame_cache_key(base64_image)
+                cached = self.frame_cache.get(cache_key)
+                if cached is not None:
+                    return self._reuse_result(cached, start_time, session_id)
+
             # 1. 解析Base64图像
             logger.debug("正在解析Base64图像...")
-            image = base64_to_image(base64_image)
+            image_bytes = base64_to_bytes(base64_image)
 
-            # 2. 预处理图像
-            logger.debug("正在预处理图像...")
-            processed_image = preprocess_image_for_model(image)
+            # 画面与该会话上一次完整识别时相比没有变化：只解码缩略图，复用上一次的结果
+            gated = use_cache and session_id is not None and self.motion_gate is not None
+            if gated:
+                thumbnail = bytes_to_thumbnail(image_bytes, self.motion_gate.thumbnail_width)
+                cached = self.motion_gate.check(session_id, thumbnail)
+                if cached is not None:
+                    return self._reuse_result(cached, start_time, session_id)
 
-            # 3. 进行识别
-            logger.debug("正在进行手语识别...")
-            predicted_label, confidence, hand_landmarks = self.recognizer.predict(processed_image)
+            image = bytes_to_image(image_bytes)
 
-            # 4. 计算处理时间
-            processing_time = (time.time() - start_time) * 1000  # 毫秒
-
-            # 5. 统计翻译次数
+            # 2. 进行识别：直接使用解码后的uint8图像，送入MediaPipe的分辨率由识别器按负载选择
+            logger.debug("正在进行手语识别...")
+            # 只传递需要的可选参数，兼容不支持这些参数的引擎
+            options = {} if use_cache else {"use_memo": False}
+            if smoothing:
+                options["return_probs"] = True
+            # 时序模型直接使用识别器构建好的特征，不再由关键点重新构建
+            sequencing = session_id is not None and self.sequence_streams is not None
+            if sequencing:
+                options["return_features"] = True
+            outputs = self.recognizer.predict(image, session_id=session_id, **options)
+            predicted_label, confidence, hand_landmarks = outputs[:3]
+            probabilities = outputs[3] if smoothing else None
+            features = outputs[-1] if sequencing else None
             self.translation_count += 1
 
-            # 6. 构建手部数据
-            hands_data = None
-            hands_count = 0
-
-            if hand_landmarks:
-                hands_count = len(hand_landmarks)
-                hands_data = []
-
-                # 假设每只手都是右手（MediaPipe不直接提供handedness信息）
-                for landmarks in hand_landmarks:
-                    landmark_list = []
-                    for landmark in landmarks.landmark:
-                        landmark_list.append(
-                            HandLandmark(
-                                x=float(landmark.x),
-                                y=float(landmark.y),
-                                z=float(landmark.z)
-                            )
-                        )
-                    hands_data.append(
-                        HandData(
-                            landmarks=landmark_list,
-                            handedness="Right"  # 默认值，实际应用中可能需要从MediaPipe获取
-                        )
-                    )
-
-            # 7. 检查是否检测到手语
-            detected = predicted_label is not None and confidence > 0.5
-
-            # 8. 构建结果
-            result = RecognitionResult(
-                success=True,
-                detected=detected,
-                predicted_class=predicted_label,
-                confidence=confidence,
-                message=(
-                    "识别成功"
-                    if detected
-                    else ("未检测到手语手势" if confidence == 0.0 else "置信度太低")
-                ),
-                hands_count=hands_count,
-                hands=hands_data,
-                processing_time_ms=processing_time,
-                timestamp=datetime.now()
-            )
+            # 3. 构建结果
+            result = self._build_result(predicted_label, confidence, hand_landmarks, probabilities,
+                                        start_time, session_id, features)
+            hands_count = result.hands_count
+            processing_time = result.processing_time_ms
 
             logger.info(
                 f"识别完成: {predicted_label} (置信度: {confidence:.2%}, "
                 f"处理时间: {processing_time:.1f}ms, 手部数: {hands_count})"
             )
 
+            if gated:
+                self.motion_gate.update(session_id, result)
+            if cache_key is not None:
+                self.frame_cache.put(cache_key, result, RESULT_BASE_BYTES + hands_count * RESULT_HAND_BYTES)
+
             return result
 
         except ValueError as e:
@@ -153,6 +168,208 @@ class TranslationService:
                 timestamp=datetime.now()
             )
 
+    def recognize_from_landmarks(self, landmarks: Any, session_id: Optional[str] = None,
+                                 use_cache: bool = True) -> RecognitionResult:
+        """
+        由客户端上传的手部关键点进行识别（客户端自行运行手部跟踪）
+        跳过图像上传、解码和MediaPipe检测，直接构建特征并分类；帧缓存和跳帧按图像内容工作，不参与
+
+        Args:
+            landmarks: shape=(手数, 21, 3) 的关键点（格式见 parse_landmark_array），空列表表示未检测到手
+            session_id: 视频流的会话ID，用于时间平滑、语句组装和时序模型
+            use_cache: 为False时本次不使用预测缓存
+
+        Returns:
+            RecognitionResult: 识别结果，关键点形状错误时 success=False
+        """
+        start_time = time.time()
+
+        try:
+            hands = parse_landmark_array(landmarks)
+            features = build_features(hands)
+            probabilities = None
+            if features is None:
+                predicted_label, confidence = None, 0.0
+            else:
+                options = {} if use_cache else {"use_memo": False}
+                predicted_label, confidence, probabilities = self.recognizer.predict_features(
+                    features, return_probs=True, **options
+                )
+            self.translation_count += 1
+            # 关键点来自客户端，不再逐点构建 HandData 回传
+            return self._build_result(predicted_label, confidence, hands, probabilities,
+                                      start_time, session_id, features, include_hands=False)
+
+        except ValueError as e:
+            logger.warning(f"关键点解析失败: {str(e)}")
+            return RecognitionResult(
+                success=False,
+                detected=False,
+                predicted_class=None,
+                confidence=0.0,
+                message=f"关键点格式错误: {str(e)}",
+                processing_time_ms=(time.time() - start_time) * 1000,
+                timestamp=datetime.now()
+            )
+
+        except Exception as e:
+            logger.error(f"识别过程出错: {str(e)}")
+            logger.debug(traceback.format_exc())
+            return RecognitionResult(
+                success=False,
+                detected=False,
+                predicted_class=None,
+                confidence=0.0,
+                message=f"识别失败: {str(e)}",
+                processing_time_ms=(time.time() - start_time) * 1000,
+                timestamp=datetime.now()
+            )
+
+    def _build_result(self, predicted_label: Optional[str], confidence: Optional[float], hand_landmarks,
+                      probabilities: Optional[np.ndarray], start_time: float, session_id: Optional[str],
+                      features: Optional[np.ndarray] = None, include_hands: bool = True) -> RecognitionResult:
+        """
+        由一帧的分类结果构建识别结果，并推进该会话的时间平滑和时序模型
+
+        Args:
+            predicted_label: 预测类别
+            confidence: 置信度
+            hand_landmarks: MediaPipe手部关键点列表或 shape=(手数, 21, 3) 数组，未检测到手时为 None
+            probabilities: 所有类别的概率，只在启用时间平滑时需要
+            start_time: 请求开始的时间
+            session_id: 会话ID
+            features: 已构建的特征向量（识别器返回或由上传的关键点构建），未检测到手时为 None
+            include_hands: 是否在结果中附带逐点的手部数据，为False时只填写手数
+
+        Returns:
+            RecognitionResult: 识别结果
+        """
+        processing_time = (time.time() - start_time) * 1000  # 毫秒
+
+        # 构建手部数据
+        hands_data = None
+        hands_count = 0
+
+        if hand_landmarks is not None and len(hand_landmarks):
+            hands_count = len(hand_landmarks)
+
+        if hands_count and include_hands:
+            coordinates = hand_landmarks if isinstance(hand_landmarks, np.ndarray) else landmarks_to_array(hand_landmarks)
+
+            # 假设每只手都是右手（MediaPipe不直接提供handedness信息）
+            hands_data = [
+                HandData(
+                    landmarks=[HandLandmark(x=x, y=y, z=z) for x, y, z in hand.tolist()],
+                    handedness="Right"  # 默认值，实际应用中可能需要从MediaPipe获取
+                )
+                for hand in coordinates
+            ]
+
+        # 检查是否检测到手语
+        detected = predicted_label is not None and confidence > 0.5
+
+        result = RecognitionResult(
+            success=True,
+            detected=detected,
+            predicted_class=predicted_label,
+            confidence=confidence,
+            message=(
+                "识别成功"
+                if detected
+                else ("未检测到手语手势" if confidence == 0.0 else "置信度太低")
+            ),
+            hands_count=hands_count,
+            hands=hands_data,
+            processing_time_ms=processing_time,
+            timestamp=datetime.now()
+        )
+        if session_id is not None and self.smoother is not None:
+            self._apply_smoothing(result, self.smoother.update(session_id, probabilities, self.recognizer.labels))
+        if session_id is not None and self.sequence_streams is not None:
+            self._apply_sequence(result, self.sequence_streams.update(session_id, features))
+        return result
+
+    def _frame_cache_key(self, base64_image: str) -> bytes:
+        """
+        帧缓存的键：Base64数据部分的哈希，以当前模型版本区分，热切换后不会命中旧模型的结果
+        """
+        payload = base64_image.split(',', 1)[1] if ',' in base64_image else base64_image
+        version = getattr(self.recognizer, "version", None)
+        return self.frame_cache.make_key(payload, namespace=str(version or ""))
+
+    def _reuse_result(self, cached: RecognitionResult, start_time: float,
+                      session_id: Optional[str] = None) -> RecognitionResult:
+        """
+        复制上一次的识别结果，标记为复用并更新耗时和时间戳
+        传入会话ID时画面视为没有变化，时间平滑器和时序模型重复输入该会话最近一次的观测
+        """
+        update = {
+            "reused": True,
+            "processing_time_ms": (time.time() - start_time) * 1000,
+            "timestamp": datetime.now()
+        }
+        # 兼容 Pydantic v1 / v2
+        copy_model = getattr(cached, "model_copy", None) or cached.copy
+        result = copy_model(update=update)
+        # 帧缓存跨会话共享，缓存的结果可能带着其他会话的平滑和时序结果
+        if session_id is not None and self.smoother is not None:
+            self._apply_smoothing(result, self.smoother.repeat(session_id, self.recognizer.labels))
+        elif cached.changed is not None:
+            self._apply_smoothing(result, (None, None, None))
+        if session_id is not None and self.sequence_streams is not None:
+            self._apply_sequence(result, self.sequence_streams.repeat(session_id))
+        elif cached.sequence_word is not None:
+            self._apply_sequence(result, None)
+        return result
+
+    @staticmethod
+    def _apply_smoothing(result: RecognitionResult, smoothed: Tuple[Optional[str], Optional[float], Optional[bool]]):
+        """把时间平滑的结果写入识别结果"""
+        result.stable_word, result.stable_confidence, result.changed = smoothed
+
+    def _apply_sequence(self, result: RecognitionResult, probabilities: Optional[np.ndarray]):
+        """把时序模型在这一帧的输出写入识别结果"""
+        if probabilities is None:
+            result.sequence_word, result.sequence_confidence = None, None
+            return
+        index = int(np.argmax(probabilities))
+        result.sequence_word = self.sequence_streams.labels[index]
+        result.sequence_confidence = float(probabilities[index])
+
+    def sentence_events(self, session_id: str, result: RecognitionResult) -> List[Dict[str, Any]]:
+        """
+        把一帧的识别结果交给语句组装器
+
+        Args:
+            session_id: 会话ID
+            result: recognize_from_base64 返回的识别结果
+
+        Returns:
+            这一帧产生的词汇 / 句子事件，未启用语句组装时为空列表
+        """
+        if self.sentence_assembler is None:
+            return []
+        if result.changed is not None:
+            # 启用了时间平滑：使用稳定词汇，避免平滑器和组装器两套连续帧判断结果不一致
+            has_hand = result.success and bool(result.hands_count)
+            return self.sentence_assembler.add_stable(
+                session_id, result.stable_word, result.stable_confidence, result.changed, has_hand
+            )
+        word = result.predicted_class if result.success and result.detected else None
+        return self.sentence_assembler.add(session_id, word, result.confidence)
+
+    def expire_sentence(self, session_id: str) -> List[Dict[str, Any]]:
+        """客户端一段时间没有发送帧时调用：距最后一次检测到手超过停顿时长则结束当前句子"""
+        if self.sentence_assembler is None:
+            return []
+        return self.sentence_assembler.expire(session_id)
+
+    def flush_sentence(self, session_id: str) -> List[Dict[str, Any]]:
+        """结束会话当前的句子，返回句子事件"""
+        if self.sentence_assembler is None:
+            return []
+        return self.sentence_assembler.flush(session_id)
+
     def recognize_with_visualization(self, base64_image: str) -> Tuple[RecognitionResult, str]:
         """
         识别手语并返回可视化结果
@@ -169,30 +386,27 @@ class TranslationService:
             # 1. 解析图像
             image = base64_to_image(base64_image)
 
-            # 2. 预处理
-            processed_image = preprocess_image_for_model(image)
-
-            # 3. 识别
-            predicted_label, confidence, hand_landmarks = self.recognizer.predict(processed_image)
+            # 2. 识别
+            predicted_label, confidence, hand_landmarks = self.recognizer.predict(image)
 
-            # 4. 创建可视化图像
+            # 3. 创建可视化图像（关键点是归一化坐标，直接绘制在原图上）
             if hand_landmarks:
                 visualization_image = create_visualization_image(
-                    processed_image.copy(),
+                    image.copy(),
                     hand_landmarks,
                     predicted_label,
                     confidence
                 )
             else:
-                visualization_image = processed_image
+                visualization_image = image
 
-            # 5. 转换为Base64
+            # 4. 转换为Base64
             visualization_base64 = image_to_base64(visualization_image)
 
-            # 6. 计算处理时间
+            # 5. 计算处理时间
             processing_time = (time.time() - start_time) * 1000
 
-            # 7. 构建结果
+            # 6. 构建结果
             result = RecognitionResult(
                 success=True,
                 detected=predicted_label is not None and confidence > 0.5,
@@ -223,6 +437,24 @@ class TranslationService:
             )
             return error_result, ""
 
+    def release_session(self, session_id: str):
+        """
+        释放会话的手部跟踪状态
+
+        Args:
+            session_id: 会话ID
+        """
+        if hasattr(self.recognizer, "release_session"):
+            self.recognizer.release_session(session_id)
+        if self.motion_gate is not None:
+            self.motion_gate.release(session_id)
+        if self.smoother is not None:
+            self.smoother.forget(session_id)
+        if self.sentence_assembler is not None:
+            self.sentence_assembler.forget(session_id)
+        if self.sequence_streams is not None:
+            self.sequence_streams.forget(session_id)
+
     def get_service_info(self) -> Dict[str, Any]:
         """
         获取服务信息
@@ -247,6 +479,28 @@ class TranslationService:
             "timestamp": datetime.now().isoformat()
         }
 
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        获取运行指标：跳帧比例、帧缓存命中率、时间平滑、语句组装、时序模型以及识别器的微批、会话等统计
+
+        Returns:
+            包含各项指标的字典
+        """
+        model_info = self.recognizer.get_model_info()
+        metrics = {
+            "translation_count": self.translation_count,
+            "motion_gate": self.motion_gate.get_stats() if self.motion_gate else None,
+            "frame_cache": self.frame_cache.get_stats() if self.frame_cache else None,
+            "smoothing": self.smoother.get_stats() if self.smoother else None,
+            "sentence": self.sentence_assembler.get_stats() if self.sentence_assembler else None,
+            "sequence": self.sequence_streams.get_stats() if self.sequence_streams else None
+        }
+        for key in ("pool", "workers", "batching", "sessions", "prediction_memo", "prefilter", "resolution", "version"):
+            if model_info.get(key) is not None:
+                metrics[key] = model_info[key]
+        metrics["timestamp"] = datetime.now().isoformat()
+        return metrics
+
     def reset_statistics(self):
         """重置统计信息"""
         self.translation_count = 0
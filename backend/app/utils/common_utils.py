@@ -19,6 +19,9 @@ class ServiceManager:
         self._translation_service: Optional[TranslationService] = None
         self._history: List[Dict[str, Any]] = []
         self._max_history_size = 100
+        # 启动时识别器在后台加载和预热，期间识别接口返回“加载中”
+        self._loading = False
+        self.startup_timings: Dict[str, float] = {}
 
     def set_service(self, service: TranslationService):
         """设置翻译服务实例"""
@@ -33,6 +36,18 @@ class ServiceManager:
         """检查服务是否已就绪"""
         return self._translation_service is not None and self._translation_service.recognizer.is_ready()
 
+    def set_loading(self, loading: bool):
+        """标记识别器是否正在后台加载"""
+        self._loading = loading
+
+    def is_loading(self) -> bool:
+        """识别器是否正在后台加载和预热"""
+        return self._loading
+
+    def not_ready_message(self) -> str:
+        """服务未就绪时返回给客户端的提示"""
+        return "模型加载中，请稍后重试" if self._loading else "服务未初始化"
+
     def add_to_history(self, sign_input: str, sign_translation: str):
         """添加到历史记录"""
         entry = {
@@ -70,13 +85,23 @@ def get_service_response(result: RecognitionResult) -> Dict[str, Any]:
     Returns:
         标准格式的响应字典
     """
-    return {
+    response = {
         "success": result.success,
         "detected": result.detected,
         "word": result.predicted_class,
         "confidence": result.confidence,
-        "message": result.message
+        "message": result.message,
+        "reused": result.reused
     }
+    # 启用时间平滑时附带稳定词汇，客户端不必再对逐帧结果投票
+    if result.changed is not None:
+        response["stable_word"] = result.stable_word
+        response["stable_confidence"] = result.stable_confidence
+        response["changed"] = result.changed
+    if result.sequence_word is not None:
+        response["sequence_word"] = result.sequence_word
+        response["sequence_confidence"] = result.sequence_confidence
+    return response
 
 def validate_base64_image(image_data: str) -> bool:
     """
@@ -105,6 +130,25 @@ def validate_base64_image(image_data: str) -> bool:
 
     return True
 
+def parse_session_id(value: Any) -> Optional[str]:
+    """
+    校验请求中的会话ID，会话ID用作检测图、平滑器和句子组装的键，只接受非空字符串
+
+    Args:
+        value: 请求中的 session_id，未提供时为 None
+
+    Returns:
+        会话ID，未提供时为 None
+
+    Raises:
+        ValueError: 不是字符串或为空字符串
+    """
+    if value is None:
+        return None
+    if not isinstance(value, str) or not value.strip():
+        raise ValueError(f"session_id 需要是非空字符串: {value!r}")
+    return value
+
 def parse_websocket_payload(data: str) -> tuple[Optional[Dict[str, Any]], Optional[str]]:
     """
     解析WebSocket消息负载
@@ -129,7 +173,11 @@ def parse_websocket_payload(data: str) -> tuple[Optional[Dict[str, Any]], Option
 def create_websocket_response(
     predicted_class: Optional[str] = None,
     service_ready: bool = True,
-    error_message: Optional[str] = None
+    error_message: Optional[str] = None,
+    reused: bool = False,
+    stable_word: Optional[str] = None,
+    changed: Optional[bool] = None,
+    sequence_word: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     创建WebSocket响应消息
@@ -138,6 +186,10 @@ def create_websocket_response(
         predicted_class: 预测的类别
         service_ready: 服务是否就绪
         error_message: 错误消息（如果有）
+        reused: 画面没有变化，复用了上一帧的识别结果
+        stable_word: 时间平滑后的稳定词汇
+        changed: 稳定词汇是否在这一帧变化，为 None 时表示未启用平滑
+        sequence_word: 流式时序模型识别的词汇
 
     Returns:
         WebSocket响应消息
@@ -162,15 +214,22 @@ def create_websocket_response(
             "signTranslation": ""
         }
 
-    return {
+    response = {
         "type": "recognition_result",
         "data": {
             "success": True,
             "detected": predicted_class is not None,
             "predicted_class": predicted_class,
             "confidence": 0.0 if predicted_class is None else 1.0,  # 简化处理
-            "message": "识别成功" if predicted_class else "未检测到手势"
+            "message": "识别成功" if predicted_class else "未检测到手势",
+            "reused": reused
         },
         "signInput": predicted_class or "",
         "signTranslation": predicted_class or ""
-    }
\ No newline at end of file
+    }
+    if changed is not None:
+        response["data"]["stable_word"] = stable_word
+        response["data"]["changed"] = changed
+    if sequence_word is not None:
+        response["data"]["sequence_word"] = sequence_word
+    return response
\ No newline at end of file
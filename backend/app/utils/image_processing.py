@@ -10,15 +10,9 @@ from typing import Tuple, Optional
 import base64
 from io import BytesIO
 
-def base64_to_image(base64_str: str) -> np.ndarray:
+def base64_to_bytes(base64_str: str) -> bytes:
     """
-    将Base64字符串转换为OpenCV图像格式
-
-    Args:
-        base64_str: Base64编码的图像字符串（可能包含data:image前缀）
-
-    Returns:
-        OpenCV图像格式 (BGR)
+    解码Base64字符串（可能包含data:image前缀）为图像文件字节
 
     Raises:
         ValueError: 如果Base64字符串无效
@@ -28,9 +22,19 @@ def base64_to_image(base64_str: str) -> np.ndarray:
         if ',' in base64_str:
             base64_str = base64_str.split(',')[1]
 
-        # 解码Base64
-        image_bytes = base64.b64decode(base64_str)
+        return base64.b64decode(base64_str)
+
+    except Exception as e:
+        raise ValueError(f"无法解析Base64图像: {str(e)}")
 
+def bytes_to_image(image_bytes: bytes) -> np.ndarray:
+    """
+    将图像文件字节解码为OpenCV图像格式 (BGR)
+
+    Raises:
+        ValueError: 如果图像数据无效
+    """
+    try:
         # 转换为PIL Image
         pil_image = Image.open(BytesIO(image_bytes))
 
@@ -51,6 +55,46 @@ def base64_to_image(base64_str: str) -> np.ndarray:
     except Exception as e:
         raise ValueError(f"无法解析Base64图像: {str(e)}")
 
+def base64_to_image(base64_str: str) -> np.ndarray:
+    """
+    将Base64字符串转换为OpenCV图像格式
+
+    Args:
+        base64_str: Base64编码的图像字符串（可能包含data:image前缀）
+
+    Returns:
+        OpenCV图像格式 (BGR)
+
+    Raises:
+        ValueError: 如果Base64字符串无效
+    """
+    return bytes_to_image(base64_to_bytes(base64_str))
+
+def bytes_to_thumbnail(image_bytes: bytes, width: int = 64) -> np.ndarray:
+    """
+    解码为小尺寸灰度缩略图，用于帧间变化检测
+    JPEG 使用 DCT 缩放直接解码出 1/2~1/8 尺寸的灰度图，耗时只有完整解码的一小部分
+
+    Args:
+        image_bytes: 图像文件字节
+        width: 缩略图宽度，高度按原图比例计算
+
+    Returns:
+        uint8 灰度缩略图
+
+    Raises:
+        ValueError: 如果图像数据无效
+    """
+    try:
+        pil_image = Image.open(BytesIO(image_bytes))
+        height = max(1, round(width * pil_image.height / pil_image.width))
+        pil_image.draft("L", (width, height))
+        gray = np.asarray(pil_image.convert("L"))
+        return cv2.resize(gray, (width, height), interpolation=cv2.INTER_AREA)
+
+    except Exception as e:
+        raise ValueError(f"无法解析Base64图像: {str(e)}")
+
 def image_to_base64(image: np.ndarray, format: str = "jpeg", quality: int = 80) -> str:
     """
     将OpenCV图像转换为Base64字符串
@@ -157,38 +201,6 @@ def normalize_image(image: np.ndarray) -> np.ndarray:
     normalized = image.astype(np.float32) / 255.0
     return normalized
 
-def preprocess_image_for_model(image: np.ndarray,
-                               target_size: Tuple[int, int] = (224, 224),
-                               enhance: bool = True,
-                               normalize: bool = True) -> np.ndarray:
-    """
-    为模型预处理图像
-
-    Args:
-        image: 输入图像 (BGR)
-        target_size: 目标尺寸 (width, height)
-        enhance: 是否增强对比度
-        normalize: 是否归一化
-
-    Returns:
-        预处理后的图像
-    """
-    # 1. 缩放
-    processed = resize_image(image, max_width=target_size[0], max_height=target_size[1])
-
-    # 2. 增强对比度
-    if enhance:
-        processed = enhance_image_contrast(processed, alpha=1.1, beta=5)
-
-    # 3. 应用轻微模糊
-    processed = apply_gaussian_blur(processed, kernel_size=3)
-
-    # 4. 归一化
-    if normalize:
-        processed = normalize_image(processed)
-
-    return processed
-
 def create_visualization_image(image: np.ndarray,
                                hand_landmarks_list: list,
                                predicted_text: Optional[str] = None,
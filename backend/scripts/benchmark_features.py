@@ -0,0 +1,64 @@
+"""
+特征构建微基准
+对比原先逐点 list.extend 再转换为数组的实现与共享的 build_features
+
+用法:
+    python scripts/benchmark_features.py
+    python scripts/benchmark_features.py --iterations 50000
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from app.core.landmarks import array_to_landmarks, build_features
+
+
+def legacy_features(hand_landmarks_list):
+    """原先各识别路径中的实现"""
+    features = []
+    for hand_landmarks in hand_landmarks_list:
+        hand_features = []
+        for landmark in hand_landmarks.landmark:
+            hand_features.extend([landmark.x, landmark.y, landmark.z])
+        features.extend(hand_features)
+
+    if len(hand_landmarks_list) == 1:
+        features.extend([0.0] * 63)
+
+    return np.array(features[:126], dtype=np.float32)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="特征构建微基准")
+    parser.add_argument("--iterations", type=int, default=20000, help="每种实现的调用次数")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    buffer = np.zeros(126, dtype=np.float32)
+
+    for num_hands in (1, 2):
+        hand_landmarks_list = array_to_landmarks(rng.random((num_hands, 21, 3), dtype=np.float32))
+        assert np.array_equal(legacy_features(hand_landmarks_list), build_features(hand_landmarks_list))
+
+        candidates = {
+            "legacy (list.extend)": lambda: legacy_features(hand_landmarks_list),
+            "build_features": lambda: build_features(hand_landmarks_list),
+            "build_features (out=)": lambda: build_features(hand_landmarks_list, out=buffer),
+        }
+
+        print(f"\n{num_hands} 只手, {args.iterations} 次调用:")
+        baseline = None
+        for name, fn in candidates.items():
+            per_call_us = timeit.timeit(fn, number=args.iterations) / args.iterations * 1e6
+            baseline = baseline or per_call_us
+            print(f"   {name:<24} {per_call_us:7.2f} µs/次  ({baseline / per_call_us:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""
+比较不同CPU线程预算下的吞吐量和尾延迟
+每种预算在新的子进程中运行（TensorFlow 的线程数只能在运行时初始化之前设置），
+可以同时启动多个子进程模拟同机部署的多个服务进程，并发客户端持续调用 create_engine
+创建的识别器，统计总吞吐量和合并后的延迟分位数
+
+用法:
+    python scripts/benchmark_threads.py --budgets 0,1,2,4
+    python scripts/benchmark_threads.py --budgets 0,1,2 --processes 2 --pin --backend numpy
+    python scripts/benchmark_threads.py --frames recordings/session1/ --clients 8 --duration 20
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+
+def synthetic_frames(count=16, seed=0):
+    """不含手的噪声帧，MediaPipe 仍然完整运行手掌检测"""
+    rng = np.random.default_rng(seed)
+    return [rng.integers(0, 256, size=(480, 640, 3), dtype=np.uint8) for _ in range(count)]
+
+
+def run_child(args):
+    """子进程：按环境变量中的线程预算创建识别器，并发调用并输出每帧延迟（JSON）"""
+    from app.core.engine import create_engine
+
+    if args.frames:
+        from profile_mediapipe import load_frames
+        frames = load_frames(args.frames, args.limit)
+    else:
+        frames = synthetic_frames()
+
+    engine = create_engine(backend=args.backend)
+    if engine is None:
+        sys.exit("识别器加载失败")
+
+    latencies = []
+    lock = threading.Lock()
+    deadline = time.perf_counter() + args.duration
+
+    def client(index):
+        local = []
+        i = index
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            engine.predict(frames[i % len(frames)], session_id=f"client-{index}")
+            local.append((time.perf_counter() - start) * 1000)
+            i += 1
+        with lock:
+            latencies.extend(local)
+
+    try:
+        clients = [threading.Thread(target=client, args=(i,)) for i in range(args.clients)]
+        for thread in clients:
+            thread.start()
+        for thread in clients:
+            thread.join()
+    finally:
+        engine.close()
+
+    print(json.dumps({"latencies": latencies}))
+
+
+def run_budget(args, threads):
+    """同时启动 --processes 个子进程运行一种线程预算，返回汇总结果"""
+    from app.core.threads import worker_cpus
+
+    children = []
+    for index in range(args.processes):
+        env = dict(os.environ)
+        env["INFERENCE_THREADS"] = str(threads)
+        env["INFERENCE_INTER_OP_THREADS"] = str(args.inter_op_threads)
+        env["CPU_AFFINITY"] = ""
+        if args.pin:
+            env["CPU_AFFINITY"] = ",".join(str(cpu) for cpu in worker_cpus(index, args.processes))
+        command = [sys.executable, os.path.abspath(__file__), "--child",
+                   "--backend", args.backend, "--clients", str(args.clients),
+                   "--duration", str(args.duration), "--limit", str(args.limit)]
+        if args.frames:
+            command += ["--frames", args.frames]
+        children.append(subprocess.Popen(command, env=env, stdout=subprocess.PIPE, text=True))
+
+    latencies = []
+    for child in children:
+        output, _ = child.communicate()
+        if child.returncode != 0:
+            raise RuntimeError(f"线程预算 {threads} 的子进程退出码 {child.returncode}")
+        latencies.extend(json.loads(output.strip().splitlines()[-1])["latencies"])
+
+    latencies = np.asarray(latencies)
+    return {
+        "threads": threads,
+        "frames": int(latencies.size),
+        "throughput_fps": round(latencies.size / args.duration, 1),
+        "p50_ms": round(float(np.percentile(latencies, 50)), 2),
+        "p99_ms": round(float(np.percentile(latencies, 99)), 2)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="比较不同CPU线程预算下的吞吐量和尾延迟")
+    parser.add_argument("--budgets", default="0,1,2,4",
+                        help="INFERENCE_THREADS 取值，逗号分隔，0 表示各库的默认线程数")
+    parser.add_argument("--inter-op-threads", type=int, default=1, help="TensorFlow 算子间线程数")
+    parser.add_argument("--processes", type=int, default=1, help="同时运行的服务进程数")
+    parser.add_argument("--pin", action="store_true", help="把各服务进程绑定到互不重叠的CPU上")
+    parser.add_argument("--clients", type=int, default=4, help="每个进程的并发客户端数")
+    parser.add_argument("--duration", type=float, default=10.0, help="每种预算的压测时长（秒）")
+    parser.add_argument("--backend", default="keras", help="推理后端")
+    parser.add_argument("--frames", help="录制的帧：图像目录或视频文件，默认使用合成帧")
+    parser.add_argument("--limit", type=int, default=0, help="最多使用的帧数，0 表示全部")
+    parser.add_argument("--output", help="把结果写入JSON文件")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args)
+        return
+
+    budgets = [int(item) for item in args.budgets.split(",") if item.strip()]
+    print(f"服务进程: {args.processes}，每进程客户端: {args.clients}，后端: {args.backend}，"
+          f"CPU: {os.cpu_count()}{'，绑核' if args.pin else ''}")
+    results = []
+    for threads in budgets:
+        result = run_budget(args, threads)
+        results.append(result)
+        print(f"threads={threads if threads else 'default':<8} 吞吐量={result['throughput_fps']:>7.1f} fps  "
+              f"p50={result['p50_ms']:>7.2f}ms  p99={result['p99_ms']:>7.2f}ms")
+
+    best = min(results, key=lambda result: result["p99_ms"])
+    print()
+    print(f"p99 最低的设置: INFERENCE_THREADS={best['threads']}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({"processes": args.processes, "clients": args.clients, "pin": args.pin,
+                       "results": results}, f, ensure_ascii=False, indent=2)
+        print(f"结果已写入 {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+在带标注的回放集上校准无手帧预过滤的阈值
+回放集是一个图像目录；--labels 指定的JSON文件把文件名映射为是否有手（true/false），
+不提供时用MediaPipe逐帧检测的结果作为标注（预过滤的目标就是不丢弃MediaPipe能检测到的手）
+
+用法:
+    python scripts/calibrate_prefilter.py --frames replay/ --budget 0.01
+    python scripts/calibrate_prefilter.py --frames replay/ --labels replay/labels.json --budget 0.005
+
+输出在漏检预算内最大的 HAND_PREFILTER_MIN_SKIN_FRACTION，以及该阈值节省的帧数和误丢弃的帧数
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+import cv2
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.hand_prefilter import calibrate_threshold, evaluate_threshold, skin_fraction
+
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".bmp")
+
+
+def label_with_mediapipe(frames):
+    """用MediaPipe静态图像模式检测每帧是否有手"""
+    import mediapipe as mp
+    with mp.solutions.hands.Hands(static_image_mode=True, max_num_hands=2, min_detection_confidence=0.5) as hands:
+        return [bool(hands.process(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)).multi_hand_landmarks) for frame in frames]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="校准无手帧预过滤阈值")
+    parser.add_argument("--frames", required=True, help="回放集图像目录")
+    parser.add_argument("--labels", help="标注文件（文件名 -> 是否有手），缺省时用MediaPipe标注")
+    parser.add_argument("--budget", type=float, default=0.01, help="允许的漏检率，默认 0.01")
+    parser.add_argument("--width", type=int, default=64, help="计算肤色占比时缩小到的宽度")
+    args = parser.parse_args()
+
+    names = sorted(name for name in os.listdir(args.frames) if name.lower().endswith(IMAGE_EXTENSIONS))
+    frames = [cv2.imread(os.path.join(args.frames, name)) for name in names]
+    names = [name for name, frame in zip(names, frames) if frame is not None]
+    frames = [frame for frame in frames if frame is not None]
+    if not frames:
+        parser.error(f"{args.frames} 中没有可读取的图像")
+
+    if args.labels:
+        with open(args.labels, 'r', encoding='utf-8') as f:
+            labels = json.load(f)
+        missing = [name for name in names if name not in labels]
+        if missing:
+            parser.error(f"标注文件缺少 {len(missing)} 帧，如 {missing[0]}")
+        has_hand = [bool(labels[name]) for name in names]
+    else:
+        print("未提供标注文件，使用MediaPipe检测结果作为标注...")
+        has_hand = label_with_mediapipe(frames)
+
+    start = time.perf_counter()
+    fractions = [skin_fraction(frame, args.width) for frame in frames]
+    check_ms = (time.perf_counter() - start) * 1000 / len(frames)
+
+    threshold = calibrate_threshold(fractions, has_hand, args.budget)
+    report = evaluate_threshold(fractions, has_hand, threshold)
+
+    print(f"回放集: {report['frames']} 帧（有手 {report['hand_frames']}，无手 {report['empty_frames']}）")
+    print(f"漏检预算: {args.budget:.2%}，单帧预过滤耗时: {check_ms:.3f}ms")
+    print(f"节省: {report['saved']} 帧（无手帧的 {report['saved_ratio']:.1%}）")
+    print(f"误丢弃: {report['false_negatives']} 帧（有手帧的 {report['false_negative_rate']:.2%}）")
+    print()
+    print("HAND_PREFILTER_ENABLED=true")
+    print(f"HAND_PREFILTER_MIN_SKIN_FRACTION={threshold:.6f}")
+
+
+if __name__ == "__main__":
+    main()
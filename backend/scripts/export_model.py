@@ -0,0 +1,107 @@
+"""
+导出分类模型为 ONNX 和 TFLite 格式
+导出文件与 .h5 同名同目录，供 INFERENCE_BACKEND=onnx/tflite 使用
+
+用法:
+    python scripts/export_model.py
+    python scripts/export_model.py --formats tflite --output-dir /path/to/models
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from app.core.config import config, MODEL_EXTENSIONS
+from app.core.classifier import load_classifier, measure_latency
+
+
+def build_serving_function(model):
+    """构建固定输入签名的推理函数，输入名为 features，输出名为 probabilities"""
+    import tensorflow as tf
+
+    input_dim = int(model.input_shape[-1])
+    signature = (tf.TensorSpec((None, input_dim), tf.float32, name="features"),)
+
+    @tf.function(input_signature=signature)
+    def serve(features):
+        return {"probabilities": model(features, training=False)}
+
+    return serve, signature
+
+
+def export_onnx(model, output_path: str, opset: int = 13):
+    """使用 tf2onnx 导出 ONNX 模型"""
+    import tf2onnx
+
+    serve, signature = build_serving_function(model)
+    tf2onnx.convert.from_function(serve, input_signature=signature, opset=opset, output_path=output_path)
+
+
+def export_tflite(model, output_path: str):
+    """导出 float32 的 TFLite 模型，批大小维度保持动态"""
+    import tensorflow as tf
+
+    converter = tf.lite.TFLiteConverter.from_keras_model(model)
+    with open(output_path, "wb") as f:
+        f.write(converter.convert())
+
+
+def verify_export(model, backend: str, output_path: str, samples: int = 256):
+    """对比导出模型与Keras模型的输出，并测量单样本延迟"""
+    classifier = load_classifier(output_path, backend=backend)
+    features = np.random.default_rng(0).random((samples, classifier.input_dim), dtype=np.float32)
+
+    expected = model.predict(features, verbose=0)
+    actual = classifier.predict(features)
+
+    max_error = float(np.abs(expected - actual).max())
+    agreement = float((expected.argmax(axis=1) == actual.argmax(axis=1)).mean())
+    latency = measure_latency(classifier.predict, classifier.input_dim)
+
+    print(f"   最大误差: {max_error:.2e}, top-1一致率: {agreement:.2%}, 单样本延迟: {latency:.3f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="导出手语分类模型为 ONNX / TFLite")
+    parser.add_argument("--model", default=config.get_model_path(), help="Keras .h5 模型路径")
+    parser.add_argument("--output-dir", default=None, help="输出目录，默认与模型同目录")
+    parser.add_argument("--formats", nargs="+", default=["onnx", "tflite"], choices=["onnx", "tflite"])
+    parser.add_argument("--opset", type=int, default=13, help="ONNX opset版本")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.model):
+        print(f"❌ 模型文件不存在: {args.model}")
+        sys.exit(1)
+
+    from tensorflow import keras
+    model = keras.models.load_model(args.model)
+
+    output_dir = args.output_dir or os.path.dirname(os.path.abspath(args.model))
+    os.makedirs(output_dir, exist_ok=True)
+    base_name = os.path.splitext(os.path.basename(args.model))[0]
+
+    exporters = {
+        "onnx": lambda path: export_onnx(model, path, args.opset),
+        "tflite": lambda path: export_tflite(model, path),
+    }
+
+    for backend in args.formats:
+        output_path = os.path.join(output_dir, base_name + MODEL_EXTENSIONS[backend])
+        print(f"\n📦 导出 {backend}: {output_path}")
+        try:
+            exporters[backend](output_path)
+        except ImportError as e:
+            print(f"❌ 缺少依赖，跳过 {backend}: {e}")
+            continue
+
+        size_kb = os.path.getsize(output_path) / 1024
+        print(f"✅ 导出完成 ({size_kb:.1f} KB)")
+        verify_export(model, backend, output_path)
+
+
+if __name__ == "__main__":
+    main()
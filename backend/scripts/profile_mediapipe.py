@@ -0,0 +1,143 @@
+"""
+比较MediaPipe手部检测参数组合的耗时和检测率
+在录制的帧序列上（图像目录或视频文件）按视频流模式逐帧检测，对每种
+model_complexity / max_num_hands / 检测阈值 / 跟踪阈值 组合统计单帧耗时和检测到手的帧占比，
+并给出检测率不低于最佳组合一定比例时耗时最低的组合
+
+用法:
+    python scripts/profile_mediapipe.py --frames recordings/session1/
+    python scripts/profile_mediapipe.py --frames recordings/session1.mp4 --complexity 0,1 \
+        --max-hands 1,2 --detection 0.3,0.5,0.7 --tracking 0.5 --min-detection-ratio 0.95
+    python scripts/profile_mediapipe.py --frames recordings/ --output profile.json
+"""
+
+import argparse
+import itertools
+import json
+import os
+import time
+
+import cv2
+import numpy as np
+
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".bmp")
+
+
+def load_frames(path, limit=0):
+    """读取图像目录（按文件名排序）或视频文件中的帧"""
+    frames = []
+    if os.path.isdir(path):
+        for name in sorted(os.listdir(path)):
+            if name.lower().endswith(IMAGE_EXTENSIONS):
+                frame = cv2.imread(os.path.join(path, name))
+                if frame is not None:
+                    frames.append(frame)
+            if limit and len(frames) >= limit:
+                break
+    else:
+        capture = cv2.VideoCapture(path)
+        while not limit or len(frames) < limit:
+            ok, frame = capture.read()
+            if not ok:
+                break
+            frames.append(frame)
+        capture.release()
+    return frames
+
+
+def profile_setting(frames_rgb, options, warmup=3):
+    """
+    用一组参数逐帧检测
+
+    Returns:
+        包含耗时分位数和检测率的字典
+    """
+    import mediapipe as mp
+
+    with mp.solutions.hands.Hands(static_image_mode=False, **options) as hands:
+        # 预热帧不计入统计，之后重新创建检测图，跟踪状态从第一帧开始
+        for frame in frames_rgb[:warmup]:
+            hands.process(frame)
+
+    latencies = []
+    detected = 0
+    with mp.solutions.hands.Hands(static_image_mode=False, **options) as hands:
+        for frame in frames_rgb:
+            start = time.perf_counter()
+            results = hands.process(frame)
+            latencies.append((time.perf_counter() - start) * 1000)
+            detected += int(bool(results.multi_hand_landmarks))
+
+    latencies = np.asarray(latencies)
+    return {
+        **options,
+        "mean_ms": round(float(latencies.mean()), 2),
+        "p50_ms": round(float(np.percentile(latencies, 50)), 2),
+        "p95_ms": round(float(np.percentile(latencies, 95)), 2),
+        "detection_rate": round(detected / len(frames_rgb), 4)
+    }
+
+
+def _parse_list(value, cast):
+    return [cast(item) for item in value.split(",") if item.strip()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="比较MediaPipe参数组合的耗时和检测率")
+    parser.add_argument("--frames", required=True, help="录制的帧：图像目录或视频文件")
+    parser.add_argument("--limit", type=int, default=0, help="最多使用的帧数，0 表示全部")
+    parser.add_argument("--complexity", default="0,1", help="model_complexity 取值，逗号分隔")
+    parser.add_argument("--max-hands", default="2", help="max_num_hands 取值，逗号分隔")
+    parser.add_argument("--detection", default="0.3,0.5,0.7", help="min_detection_confidence 取值，逗号分隔")
+    parser.add_argument("--tracking", default="0.5", help="min_tracking_confidence 取值，逗号分隔")
+    parser.add_argument("--min-detection-ratio", type=float, default=0.95,
+                        help="推荐组合的检测率至少为最佳检测率的该比例")
+    parser.add_argument("--output", help="把全部结果写入JSON文件")
+    args = parser.parse_args()
+
+    frames = load_frames(args.frames, args.limit)
+    if not frames:
+        parser.error(f"{args.frames} 中没有可读取的帧")
+    frames_rgb = [cv2.cvtColor(frame, cv2.COLOR_BGR2RGB) for frame in frames]
+    print(f"帧数: {len(frames_rgb)}，分辨率: {frames_rgb[0].shape[1]}x{frames_rgb[0].shape[0]}")
+
+    grid = itertools.product(
+        _parse_list(args.complexity, int),
+        _parse_list(args.max_hands, int),
+        _parse_list(args.detection, float),
+        _parse_list(args.tracking, float)
+    )
+    results = []
+    for complexity, max_hands, detection, tracking in grid:
+        options = {
+            "model_complexity": complexity,
+            "max_num_hands": max_hands,
+            "min_detection_confidence": detection,
+            "min_tracking_confidence": tracking
+        }
+        result = profile_setting(frames_rgb, options)
+        results.append(result)
+        print(f"complexity={complexity} hands={max_hands} det={detection:.2f} track={tracking:.2f}  "
+              f"mean={result['mean_ms']:.2f}ms p95={result['p95_ms']:.2f}ms "
+              f"检测率={result['detection_rate']:.1%}")
+
+    best_rate = max(result["detection_rate"] for result in results)
+    eligible = [result for result in results if result["detection_rate"] >= best_rate * args.min_detection_ratio]
+    choice = min(eligible, key=lambda result: result["mean_ms"])
+
+    print()
+    print(f"最佳检测率: {best_rate:.1%}；检测率不低于其 {args.min_detection_ratio:.0%} 时耗时最低的组合:")
+    print(f"MEDIAPIPE_MODEL_COMPLEXITY={choice['model_complexity']}")
+    print(f"MAX_NUM_HANDS={choice['max_num_hands']}")
+    print(f"MIN_DETECTION_CONFIDENCE={choice['min_detection_confidence']}")
+    print(f"MIN_TRACKING_CONFIDENCE={choice['min_tracking_confidence']}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({"frames": len(frames_rgb), "results": results, "recommended": choice}, f,
+                      ensure_ascii=False, indent=2)
+        print(f"结果已写入 {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,212 @@
+"""
+分类模型训练后量化
+使用训练时缓存的特征 (sign_language_features.npz) 做校准，生成 float16 和 int8 的 TFLite 模型，
+并在与校准集不重叠的留出集上输出各版本相对浮点模型的 top-1 一致率和单帧延迟报告
+
+用法:
+    python scripts/quantize_model.py --features /path/to/sign_language_features.npz
+    python scripts/quantize_model.py --features ... --min-agreement 0.995
+    python scripts/quantize_model.py --features ... --eval-fraction 0.3
+
+生成的文件与 .h5 同目录，如 sign_language_model.int8.tflite，
+通过 INFERENCE_BACKEND=tflite 与 INFERENCE_MODEL_VARIANT=int8 启用
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import datetime
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from app.core.config import config
+from app.core.classifier import load_classifier
+from export_model import export_tflite
+
+
+def load_calibration_features(features_path: str) -> np.ndarray:
+    """读取训练脚本缓存的特征矩阵"""
+    data = np.load(features_path, allow_pickle=False)
+    features = np.asarray(data["features"], dtype=np.float32)
+    if features.ndim != 2 or len(features) == 0:
+        raise ValueError(f"特征文件格式错误: {features_path}")
+    return features
+
+
+def split_features(features: np.ndarray, calibration_samples: int, eval_fraction: float,
+                   seed: int = 0) -> tuple:
+    """
+    随机划分互不重叠的校准集和评估集，一致率只在校准时没见过的样本上统计
+
+    Args:
+        features: 全部特征
+        calibration_samples: 校准集的最大样本数
+        eval_fraction: 留作评估的样本比例
+        seed: 随机种子
+
+    Returns:
+        (校准特征, 评估特征)
+
+    Raises:
+        ValueError: 比例不在 (0, 1) 内，或划分后任一部分为空
+    """
+    if not 0 < eval_fraction < 1:
+        raise ValueError(f"评估集比例必须在 (0, 1) 内: {eval_fraction}")
+
+    order = np.random.default_rng(seed).permutation(len(features))
+    num_eval = int(round(len(features) * eval_fraction))
+    evaluation = features[order[:num_eval]]
+    calibration = features[order[num_eval:num_eval + calibration_samples]]
+    if len(evaluation) == 0 or len(calibration) == 0:
+        raise ValueError(f"样本数不足以划分校准集和评估集: {len(features)}")
+    return calibration, evaluation
+
+
+def quantize_float16(model, output_path: str):
+    """权重量化为 float16，计算仍为 float32"""
+    import tensorflow as tf
+
+    converter = tf.lite.TFLiteConverter.from_keras_model(model)
+    converter.optimizations = [tf.lite.Optimize.DEFAULT]
+    converter.target_spec.supported_types = [tf.float16]
+    with open(output_path, "wb") as f:
+        f.write(converter.convert())
+
+
+def quantize_int8(model, calibration_features: np.ndarray, output_path: str):
+    """
+    权重和激活全部量化为 int8
+    输入输出保持 float32，识别器无需处理量化参数
+    """
+    import tensorflow as tf
+
+    def representative_dataset():
+        for row in calibration_features:
+            yield [row.reshape(1, -1)]
+
+    converter = tf.lite.TFLiteConverter.from_keras_model(model)
+    converter.optimizations = [tf.lite.Optimize.DEFAULT]
+    converter.representative_dataset = representative_dataset
+    converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+    with open(output_path, "wb") as f:
+        f.write(converter.convert())
+
+
+def evaluate_variant(model_path: str, features: np.ndarray, reference: np.ndarray,
+                     latency_frames: int = 500) -> dict:
+    """
+    评估一个量化版本
+
+    Args:
+        model_path: .tflite 文件路径
+        features: 评估用特征（留出集，不参与校准）
+        reference: 浮点模型在同一批特征上的输出
+        latency_frames: 逐帧测量延迟的帧数
+
+    Returns:
+        文件大小、一致率、误差和单帧延迟
+    """
+    classifier = load_classifier(model_path, backend="tflite")
+    probabilities = classifier.predict(features)
+
+    # 逐帧调用，模拟线上 batch=1 的推理
+    frame_times = []
+    classifier.predict(features[:1])
+    for row in features[:latency_frames]:
+        start = time.perf_counter()
+        classifier.predict(row.reshape(1, -1))
+        frame_times.append((time.perf_counter() - start) * 1000)
+
+    return {
+        "path": model_path,
+        "size_kb": round(os.path.getsize(model_path) / 1024, 1),
+        "top1_agreement": float((probabilities.argmax(axis=1) == reference.argmax(axis=1)).mean()),
+        "max_abs_error": float(np.abs(probabilities - reference).max()),
+        "latency_ms_mean": float(np.mean(frame_times)),
+        "latency_ms_p95": float(np.percentile(frame_times, 95)),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="手语分类模型训练后量化")
+    parser.add_argument("--model", default=config.get_model_path(), help="Keras .h5 模型路径")
+    parser.add_argument("--features", required=True, help="训练时缓存的特征文件 (.npz)")
+    parser.add_argument("--output-dir", default=None, help="输出目录，默认与模型同目录")
+    parser.add_argument("--calibration-samples", type=int, default=500, help="int8 校准使用的样本数")
+    parser.add_argument("--eval-fraction", type=float, default=0.2, help="留作评估、不参与校准的样本比例")
+    parser.add_argument("--min-agreement", type=float, default=0.99, help="可接受的最低 top-1 一致率")
+    parser.add_argument("--report", default=None, help="报告路径，默认 <输出目录>/quantization_report.json")
+    args = parser.parse_args()
+
+    for path in (args.model, args.features):
+        if not os.path.exists(path):
+            print(f"❌ 文件不存在: {path}")
+            sys.exit(1)
+
+    from tensorflow import keras
+    model = keras.models.load_model(args.model)
+    features = load_calibration_features(args.features)
+    try:
+        calibration, evaluation = split_features(features, args.calibration_samples, args.eval_fraction)
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    print(f"📊 特征: {features.shape[0]} 个样本，校准 {len(calibration)} 个，留出评估 {len(evaluation)} 个")
+
+    reference = model.predict(evaluation, verbose=0)
+
+    output_dir = args.output_dir or os.path.dirname(os.path.abspath(args.model))
+    os.makedirs(output_dir, exist_ok=True)
+    base_name = os.path.splitext(os.path.basename(args.model))[0]
+
+    variants = {
+        "float32": lambda path: export_tflite(model, path),
+        "float16": lambda path: quantize_float16(model, path),
+        "int8": lambda path: quantize_int8(model, calibration, path),
+    }
+
+    results = {}
+    for name, build in variants.items():
+        suffix = ".tflite" if name == "float32" else f".{name}.tflite"
+        output_path = os.path.join(output_dir, base_name + suffix)
+        print(f"\n📦 生成 {name}: {output_path}")
+        build(output_path)
+        results[name] = evaluate_variant(output_path, evaluation, reference)
+        print(
+            f"   大小: {results[name]['size_kb']} KB, "
+            f"留出集一致率: {results[name]['top1_agreement']:.2%}, "
+            f"单帧延迟: {results[name]['latency_ms_mean']:.3f}ms (p95 {results[name]['latency_ms_p95']:.3f}ms)"
+        )
+
+    # 选择满足一致率阈值的最小模型；float32 与浮点模型等价，始终作为兜底
+    eligible = [name for name, result in results.items() if result["top1_agreement"] >= args.min_agreement]
+    recommended = min(eligible or ["float32"], key=lambda name: results[name]["size_kb"])
+
+    report = {
+        "model": os.path.abspath(args.model),
+        "features": os.path.abspath(args.features),
+        "num_samples": int(features.shape[0]),
+        "num_calibration_samples": int(len(calibration)),
+        "num_eval_samples": int(len(evaluation)),
+        "eval_fraction": args.eval_fraction,
+        "min_agreement": args.min_agreement,
+        "variants": results,
+        "recommended": recommended,
+        "created_at": datetime.now().isoformat(),
+    }
+    report_path = args.report or os.path.join(output_dir, "quantization_report.json")
+    with open(report_path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+    print(f"\n✅ 推荐版本: {recommended}")
+    if recommended != "float32":
+        print(f"   在 .env 中设置 INFERENCE_BACKEND=tflite 和 INFERENCE_MODEL_VARIANT={recommended}")
+    print(f"📝 报告已保存: {report_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+把训练好的模型注册到模型仓库
+复制模型和标签文件到 <MODEL_REGISTRY_DIR>/<版本号>/ 并更新 manifest.json；
+.h5 同目录下同名的 .onnx / .tflite（含 .int8.tflite 等量化版本）一并复制，供对应推理后端加载
+
+用法:
+    python scripts/register_model.py --version v2 --model /path/to/sign_language_model.h5 \
+        --labels /path/to/sign_language_labels.json --notes "新增 goodbye"
+    python scripts/register_model.py --version v2 ... --activate
+    python scripts/register_model.py --list
+
+--activate 只修改 manifest（服务重启后生效）；运行中的服务通过 POST /api/models/activate 热切换
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.config import config
+from app.core.model_registry import ModelRegistry
+
+
+def main():
+    parser = argparse.ArgumentParser(description="注册模型版本")
+    parser.add_argument("--registry", default=config.MODEL_REGISTRY_DIR, help="模型仓库目录，默认使用 MODEL_REGISTRY_DIR")
+    parser.add_argument("--version", help="版本号，如 v2 或 2024-06-01")
+    parser.add_argument("--model", default=config.get_model_path(), help=".h5 模型文件")
+    parser.add_argument("--labels", default=config.get_labels_path(), help="标签文件")
+    parser.add_argument("--notes", default="", help="版本说明")
+    parser.add_argument("--activate", action="store_true", help="设为启用版本")
+    parser.add_argument("--list", action="store_true", help="列出已注册的版本")
+    args = parser.parse_args()
+
+    if not args.registry:
+        parser.error("请通过 --registry 或 MODEL_REGISTRY_DIR 指定模型仓库目录")
+
+    registry = ModelRegistry(args.registry)
+
+    if args.list:
+        for entry in registry.list_versions():
+            marker = "*" if entry["active"] else " "
+            print(f"{marker} {entry['version']:<16} {entry.get('num_classes', '?'):>3} 类  "
+                  f"{entry.get('registered_at', '')}  {entry.get('notes', '')}")
+        return
+
+    if not args.version:
+        parser.error("注册版本需要 --version")
+
+    entry = registry.register(args.version, args.model, args.labels, notes=args.notes, activate=args.activate)
+    print(f"✅ 已注册 {args.version}: {entry}")
+    if not entry["artifacts"]:
+        print("   未找到 .onnx / .tflite 导出文件，该版本只能用 keras 或 numpy 推理后端加载")
+    print(f"   启用版本: {registry.active_version()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+"""
+训练流式时序模型（因果TCN）
+训练数据是关键点特征序列，来源二选一：
+- --data: 已提取的序列文件 (.npz)，sequences 为 (N, 帧数, 126)，labels 为 (N,) 的词汇
+- --videos: 视频目录，结构为 videos/词汇/片段.mp4，逐帧用MediaPipe（视频流模式）提取特征，
+  未检测到手的帧为全零，结果可用 --cache 保存为上面的 .npz 格式
+
+每个片段切成 --window 帧的窗口（步长 --stride），窗口内每个时间步都以片段的词汇为标签训练。
+保存后用 StreamingTCN 逐帧回放验证集，检查与整段推理的输出一致
+
+用法:
+    python scripts/train_sequence_model.py --videos recordings/clips/ --cache sequences.npz
+    python scripts/train_sequence_model.py --data sequences.npz --window 32 --dilations 1,2,4,8 --epochs 50
+
+生成的模型通过 SEQUENCE_MODEL_PATH / SEQUENCE_LABELS_PATH 启用
+"""
+
+import argparse
+import json
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import cv2
+import numpy as np
+
+from app.core.config import config
+from app.core.landmarks import FEATURE_DIM, build_features
+from app.core.sequence_model import StreamingTCN, build_sequence_model
+
+VIDEO_EXTENSIONS = (".mp4", ".avi", ".mov", ".mkv", ".webm")
+
+
+def extract_clip(path, hands):
+    """逐帧提取一个视频片段的特征，返回 (帧数, 126)"""
+    frames = []
+    capture = cv2.VideoCapture(path)
+    while True:
+        ok, frame = capture.read()
+        if not ok:
+            break
+        results = hands.process(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+        features = build_features(results.multi_hand_landmarks) if results.multi_hand_landmarks else None
+        frames.append(features if features is not None else np.zeros(FEATURE_DIM, dtype=np.float32))
+    capture.release()
+    return np.asarray(frames, dtype=np.float32).reshape(-1, FEATURE_DIM)
+
+
+def load_videos(videos_dir):
+    """读取 videos/词汇/片段 目录，返回片段特征列表和对应的词汇"""
+    import mediapipe as mp
+
+    clips, labels = [], []
+    for label in sorted(os.listdir(videos_dir)):
+        label_dir = os.path.join(videos_dir, label)
+        if not os.path.isdir(label_dir):
+            continue
+        for name in sorted(os.listdir(label_dir)):
+            if not name.lower().endswith(VIDEO_EXTENSIONS):
+                continue
+            # 每个片段使用新的检测图，跟踪状态不跨片段
+            with mp.solutions.hands.Hands(**config.hands_options()) as hands:
+                clip = extract_clip(os.path.join(label_dir, name), hands)
+            if len(clip):
+                clips.append(clip)
+                labels.append(label)
+        print(f"加载标签: {label}")
+    return clips, labels
+
+
+def make_windows(clips, labels, window, stride):
+    """把片段切成固定长度的窗口，不足一个窗口的片段在开头补零（与因果卷积的零填充一致）"""
+    sequences, targets = [], []
+    for clip, label in zip(clips, labels):
+        if len(clip) < window:
+            clip = np.concatenate([np.zeros((window - len(clip), clip.shape[1]), dtype=np.float32), clip])
+        for start in range(0, len(clip) - window + 1, stride):
+            sequences.append(clip[start:start + window])
+            targets.append(label)
+    return np.asarray(sequences, dtype=np.float32), np.asarray(targets)
+
+
+def check_streaming(model_path, model, sequences):
+    """逐帧回放若干序列，返回与整段推理输出的最大绝对误差"""
+    streaming = StreamingTCN(model_path)
+    expected = model.predict(sequences, verbose=0)
+    max_error = 0.0
+    for sequence, reference in zip(sequences, expected):
+        state = streaming.new_state()
+        outputs = np.stack([streaming.step(state, frame) for frame in sequence])
+        max_error = max(max_error, float(np.abs(outputs - reference).max()))
+    return max_error
+
+
+def _parse_list(value):
+    return [int(item) for item in value.split(",") if item.strip()]
+
+
+def main():
+    models_dir = os.path.dirname(config.get_model_path())
+    parser = argparse.ArgumentParser(description="训练流式时序模型")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--data", help="已提取的序列文件 (.npz)")
+    source.add_argument("--videos", help="视频目录：videos/词汇/片段.mp4")
+    parser.add_argument("--cache", help="把从视频提取的片段窗口保存为 .npz")
+    parser.add_argument("--window", type=int, default=32, help="训练窗口的帧数")
+    parser.add_argument("--stride", type=int, default=8, help="切窗口的步长")
+    parser.add_argument("--channels", type=int, default=64, help="卷积通道数")
+    parser.add_argument("--kernel-size", type=int, default=3, help="卷积核大小")
+    parser.add_argument("--dilations", default="1,2,4,8", help="各层的膨胀系数，逗号分隔")
+    parser.add_argument("--epochs", type=int, default=50)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--output", default=os.path.join(models_dir, "sign_language_sequence_model.h5"))
+    parser.add_argument("--labels-output", default=os.path.join(models_dir, "sign_language_sequence_labels.json"))
+    args = parser.parse_args()
+
+    if args.data:
+        data = np.load(args.data, allow_pickle=False)
+        sequences, targets = np.asarray(data["sequences"], dtype=np.float32), np.asarray(data["labels"])
+    else:
+        clips, labels = load_videos(args.videos)
+        sequences, targets = make_windows(clips, labels, args.window, args.stride)
+        if args.cache:
+            np.savez_compressed(args.cache, sequences=sequences, labels=targets)
+            print(f"序列已缓存到: {args.cache}")
+    if len(sequences) == 0:
+        parser.error("没有可用的训练序列")
+
+    classes = sorted(set(targets.tolist()))
+    y = np.array([classes.index(label) for label in targets])
+    # 窗口内每个时间步使用同一个标签
+    y = np.repeat(y[:, None], sequences.shape[1], axis=1)
+
+    rng = np.random.default_rng(42)
+    order = rng.permutation(len(sequences))
+    split = max(1, int(len(order) * 0.8))
+    train, val = order[:split], order[split:] if split < len(order) else order[:1]
+    print(f"序列: {len(sequences)}（训练 {len(train)} / 验证 {len(val)}），窗口 {sequences.shape[1]} 帧，类别: {classes}")
+
+    from tensorflow import keras
+
+    model = build_sequence_model(len(classes), input_dim=sequences.shape[2], channels=args.channels,
+                                 kernel_size=args.kernel_size, dilations=_parse_list(args.dilations))
+    model.summary()
+    model.fit(
+        sequences[train], y[train],
+        validation_data=(sequences[val], y[val]),
+        epochs=args.epochs,
+        batch_size=args.batch_size,
+        callbacks=[keras.callbacks.EarlyStopping(monitor="val_loss", patience=10, restore_best_weights=True)],
+        verbose=2
+    )
+
+    # 只看最后一个时间步（感受野覆盖最完整）的准确率
+    last_step = np.argmax(model.predict(sequences[val], verbose=0)[:, -1], axis=-1)
+    print(f"验证集最后一帧准确率: {np.mean(last_step == y[val, -1]):.2%}")
+
+    model.save(args.output)
+    with open(args.labels_output, "w", encoding="utf-8") as f:
+        json.dump({"classes": classes}, f, ensure_ascii=False, indent=2)
+    print(f"模型已保存到: {args.output}")
+    print(f"标签映射已保存到: {args.labels_output}")
+
+    error = check_streaming(args.output, model, sequences[val[:8]])
+    print(f"逐帧推理与整段推理的最大误差: {error:.2e}")
+
+
+if __name__ == "__main__":
+    main()
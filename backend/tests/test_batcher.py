@@ -0,0 +1,104 @@
+import os
+import sys
+import threading
+import time
+import numpy as np
+
+# Ensure we can import from backend app
+current_dir = os.path.dirname(os.path.abspath(__file__))
+backend_dir = os.path.dirname(current_dir)
+sys.path.append(backend_dir)
+
+from app.core.batcher import InferenceBatcher
+from app.core.config import config
+from app.core.recognizer import SignLanguageRecognizer
+from app.utils.error_handler import RecognitionError
+
+def test_batcher_merges_concurrent_requests():
+    """并发提交的特征向量应合并成批，且结果回到各自的调用方"""
+    batch_sizes = []
+
+    def fake_predict(batch):
+        batch_sizes.append(len(batch))
+        # 每一行返回其第一个元素，便于核对结果归属
+        return batch[:, 0].copy()
+
+    batcher = InferenceBatcher(fake_predict, max_batch_size=8, max_wait_ms=50).start()
+    results = {}
+    barrier = threading.Barrier(8)
+
+    def worker(index):
+        features = np.full(126, index, dtype=np.float32)
+        barrier.wait()
+        results[index] = batcher.predict(features, timeout=5)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    batcher.close()
+
+    print("Batch sizes:", batch_sizes)
+    assert results == {i: float(i) for i in range(8)}
+    assert sum(batch_sizes) == 8
+    assert max(batch_sizes) > 1, "并发请求没有被合并成批"
+
+    stats = batcher.get_stats()
+    assert stats["item_count"] == 8
+    assert stats["batch_count"] == len(batch_sizes)
+
+def test_batcher_propagates_errors():
+    """推理函数抛出异常时，调用方应收到同样的异常"""
+    def failing_predict(batch):
+        raise RuntimeError("boom")
+
+    batcher = InferenceBatcher(failing_predict, max_batch_size=4, max_wait_ms=1).start()
+    try:
+        batcher.predict(np.zeros(126, dtype=np.float32), timeout=5)
+        assert False, "应当抛出异常"
+    except RuntimeError as e:
+        assert "boom" in str(e)
+    finally:
+        batcher.close()
+
+def test_recognizer_batch_wait_times_out():
+    """批次结果迟迟不返回时，识别器在 timeout_ms 后抛出 RecognitionError 而不是一直阻塞"""
+    recognizer = SignLanguageRecognizer(config.get_model_path("numpy"), config.get_labels_path(), backend="numpy")
+    model_predict = recognizer.predict_proba
+
+    def slow_predict(batch):
+        time.sleep(0.5)
+        return model_predict(batch)
+
+    recognizer.predict_proba = slow_predict
+    recognizer.enable_batching(max_batch_size=4, max_wait_ms=1, timeout_ms=50)
+    features = np.zeros(126, dtype=np.float32)
+    try:
+        start = time.perf_counter()
+        try:
+            recognizer.predict_features(features)
+            assert False, "应当抛出 RecognitionError"
+        except RecognitionError as e:
+            assert e.details["timeout_s"] == 0.05
+        assert time.perf_counter() - start < 0.4
+
+        recognizer.extract_features = lambda image, session_id=None: (features, [])
+        try:
+            recognizer.predict(np.zeros((48, 64, 3), dtype=np.uint8))
+            assert False, "predict 不应吞掉超时错误"
+        except RecognitionError:
+            pass
+
+        # 不限时（timeout_ms=0 对应 batch_timeout_s=None）时慢批次也能拿到结果
+        recognizer.batch_timeout_s = None
+        label, confidence = recognizer.predict_features(features)
+        assert label in recognizer.labels
+    finally:
+        recognizer.close()
+
+if __name__ == "__main__":
+    test_batcher_merges_concurrent_requests()
+    test_batcher_propagates_errors()
+    test_recognizer_batch_wait_times_out()
+    print("✅ Batcher tests passed")
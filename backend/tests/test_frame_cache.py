@@ -0,0 +1,99 @@
+import base64
+import os
+import sys
+import time
+import cv2
+import numpy as np
+
+# Ensure we can import from backend app
+current_dir = os.path.dirname(os.path.abspath(__file__))
+backend_dir = os.path.dirname(current_dir)
+sys.path.append(backend_dir)
+
+from app.core.frame_cache import FrameCache
+from app.services.translator import TranslationService
+
+class CountingRecognizer:
+    """记录调用次数的识别器，version 模拟热切换后的模型版本"""
+
+    def __init__(self):
+        self.calls = 0
+        self.version = "v1"
+
+    def predict(self, image, session_id=None):
+        self.calls += 1
+        return "hello", 0.9, None
+
+    def get_model_info(self):
+        return {}
+
+def _jpeg_base64(seed):
+    frame = np.random.default_rng(seed).integers(0, 255, size=(120, 160, 3), dtype=np.uint8)
+    _, buffer = cv2.imencode(".jpg", frame)
+    return "data:image/jpeg;base64," + base64.b64encode(buffer).decode("ascii")
+
+def test_lru_bounds_and_ttl():
+    """按条目数和内存上限淘汰最久未使用的条目，过期条目不会命中"""
+    cache = FrameCache(max_entries=3, max_bytes=1000, ttl_s=30)
+    keys = [FrameCache.make_key(f"frame-{i}") for i in range(4)]
+    for i in range(3):
+        cache.put(keys[i], i, 100)
+    assert cache.get(keys[0]) == 0  # keys[0] 变为最近使用
+    cache.put(keys[3], 3, 100)
+    assert cache.get(keys[1]) is None and cache.get(keys[0]) == 0
+
+    # 内存上限：大条目挤出旧条目，超过上限的值不缓存
+    cache.put(FrameCache.make_key("large"), "large", 900)
+    assert cache.get_stats()["bytes"] <= 1000
+    cache.put(FrameCache.make_key("huge"), "huge", 2000)
+    assert cache.get(FrameCache.make_key("huge")) is None
+
+    short = FrameCache(ttl_s=0.05)
+    short.put(keys[0], "value", 10)
+    time.sleep(0.1)
+    assert short.get(keys[0]) is None
+    assert short.get_stats()["expired"] == 1
+
+    stats = cache.get_stats()
+    print(f"Frame cache stats: {stats}")
+    assert stats["evictions"] >= 2 and stats["hits"] == 2
+
+def test_namespace_separates_versions():
+    """相同数据在不同命名空间（模型版本）下是不同的键"""
+    assert FrameCache.make_key("abc") == FrameCache.make_key(b"abc")
+    assert FrameCache.make_key("abc", namespace="v1") != FrameCache.make_key("abc", namespace="v2")
+
+def test_duplicate_frames_skip_recognition():
+    """重复的图像直接返回缓存结果并标记 reused，模型版本切换后重新识别"""
+    recognizer = CountingRecognizer()
+    cache = FrameCache()
+    service = TranslationService(recognizer, frame_cache=cache)
+
+    frame = _jpeg_base64(0)
+    first = service.recognize_from_base64(frame)
+    assert first.success and not first.reused and recognizer.calls == 1
+
+    # data:image 前缀不同但数据相同的图像同样命中
+    repeated = service.recognize_from_base64(frame.split(",", 1)[1])
+    assert repeated.reused and repeated.predicted_class == "hello" and recognizer.calls == 1
+
+    service.recognize_from_base64(_jpeg_base64(1))
+    assert recognizer.calls == 2
+
+    recognizer.version = "v2"
+    assert not service.recognize_from_base64(frame).reused and recognizer.calls == 3
+
+    # 解析失败的结果不缓存
+    assert not service.recognize_from_base64("not-an-image").success
+    assert not service.recognize_from_base64("not-an-image").success
+    assert cache.get_stats()["entries"] == 3
+
+    metrics = service.get_metrics()
+    print(f"Metrics: {metrics['frame_cache']}")
+    assert metrics["frame_cache"]["hits"] == 1
+
+if __name__ == "__main__":
+    test_lru_bounds_and_ttl()
+    test_namespace_separates_versions()
+    test_duplicate_frames_skip_recognition()
+    print("✅ Frame cache works")
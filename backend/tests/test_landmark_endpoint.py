@@ -0,0 +1,149 @@
+import json
+import os
+import sys
+import numpy as np
+
+# Ensure we can import from backend app
+current_dir = os.path.dirname(os.path.abspath(__file__))
+backend_dir = os.path.dirname(current_dir)
+sys.path.append(backend_dir)
+
+from app.core.config import config
+from app.core.landmarks import FEATURE_DIM, array_to_landmarks, build_features, parse_landmark_array
+from app.core.recognizer import SignLanguageRecognizer
+from app.core.recognizer_pool import RecognizerPool
+from app.services.translator import TranslationService
+
+def test_parse_landmark_array_shapes():
+    """接受 (手数, 21, 3)、单手 (21, 3) 和扁平数组，形状错误或非有限值时报错"""
+    rng = np.random.default_rng(0)
+    two_hands = rng.random((2, 21, 3), dtype=np.float32)
+    assert parse_landmark_array(two_hands.tolist()).shape == (2, 21, 3)
+    assert parse_landmark_array(two_hands[0].tolist()).shape == (1, 21, 3)
+    assert np.array_equal(parse_landmark_array(two_hands.reshape(-1).tolist()), two_hands)
+    assert parse_landmark_array([]).shape == (0, 21, 3)
+
+    for bad in ([[1, 2, 3]], np.zeros((3, 21, 3)), np.zeros((2, 20, 3)), np.zeros(100), "abc",
+                [[[float("nan")] * 3] * 21]):
+        try:
+            parse_landmark_array(bad)
+            assert False, f"应当拒绝: {np.shape(bad)}"
+        except ValueError:
+            pass
+
+def test_array_features_match_mediapipe_path():
+    """上传的关键点与MediaPipe对象构建出的特征逐位一致"""
+    rng = np.random.default_rng(1)
+    for num_hands in (1, 2):
+        array = rng.random((num_hands, 21, 3), dtype=np.float32)
+        features = build_features(parse_landmark_array(array.tolist()))
+        assert features.shape == (FEATURE_DIM,)
+        assert np.array_equal(features, build_features(array_to_landmarks(array)))
+    assert build_features(parse_landmark_array([])) is None
+
+def _service():
+    recognizer = SignLanguageRecognizer(config.get_model_path("numpy"), config.get_labels_path(), backend="numpy")
+    return TranslationService(RecognizerPool(recognizer, size=1))
+
+def test_recognize_from_landmarks():
+    """关键点直接分类，结果与分类模型对同一特征的输出一致"""
+    service = _service()
+    try:
+        array = np.random.default_rng(2).random((2, 21, 3), dtype=np.float32)
+        result = service.recognize_from_landmarks(array.tolist(), session_id="s1")
+        expected = service.recognizer.predict_proba(build_features(array)[None])[0]
+        assert result.success and result.hands_count == 2
+        assert result.predicted_class == service.recognizer.labels[int(np.argmax(expected))]
+        assert abs(result.confidence - float(np.max(expected))) < 1e-6
+
+        empty = service.recognize_from_landmarks([])
+        assert empty.success and not empty.detected and empty.hands_count == 0
+
+        invalid = service.recognize_from_landmarks([[0.1, 0.2]])
+        assert not invalid.success and "关键点" in invalid.message
+    finally:
+        service.recognizer.close()
+
+def test_predict_returns_built_features():
+    """return_features=True 时 predict 在末尾附带特征向量，与由返回的关键点构建的特征一致"""
+    recognizer = SignLanguageRecognizer(config.get_model_path("numpy"), config.get_labels_path(), backend="numpy")
+    pool = RecognizerPool(recognizer, size=1)
+    try:
+        array = np.random.default_rng(4).random((1, 21, 3), dtype=np.float32)
+        features = build_features(array)
+        recognizer.extract_features = lambda image, session_id=None: (features, array_to_landmarks(array))
+        image = np.zeros((48, 64, 3), dtype=np.uint8)
+
+        label, confidence, hand_landmarks, probabilities, returned = pool.predict(
+            image, return_probs=True, return_features=True
+        )
+        assert returned is features and np.array_equal(build_features(hand_landmarks), features)
+        assert len(pool.predict(image, return_features=True)) == 4
+        assert len(pool.predict(image)) == 3
+
+        recognizer.extract_features = lambda image, session_id=None: (None, None)
+        assert pool.predict(image, return_probs=True, return_features=True) == (None, 0.0, None, None, None)
+    finally:
+        recognizer.close()
+
+def test_landmark_routes():
+    """REST 和 WebSocket 的关键点消息走同一条识别路径"""
+    from fastapi.testclient import TestClient
+    from app.main import app
+    from app.utils.common_utils import service_manager
+
+    previous = service_manager.get_service()
+    service = _service()
+    service_manager.set_service(service)
+    try:
+        client = TestClient(app)
+        landmarks = np.random.default_rng(3).random((1, 21, 3)).round(4).tolist()
+        body = json.dumps({"landmarks": landmarks})
+        print(f"Landmark request: {len(body)} bytes")
+
+        response = client.post("/recognize/landmarks", content=body, headers={"Content-Type": "application/json"})
+        assert response.status_code == 200
+        word = response.json()["word"]
+        assert word in service.recognizer.labels
+        assert client.post("/recognize/landmarks", json={}).status_code == 400
+
+        with client.websocket_connect("/ws") as ws:
+            ws.send_text(json.dumps({"type": "landmarks", "data": landmarks}))
+            message = json.loads(ws.receive_text())
+            assert message["type"] == "recognition_result"
+            assert message["data"]["predicted_class"] == word
+    finally:
+        service_manager.set_service(previous)
+        service.recognizer.close()
+
+def test_routes_reject_invalid_session_id():
+    """session_id 不是非空字符串时在路由层返回 400，不进入会话注册表"""
+    from fastapi.testclient import TestClient
+    from app.main import app
+    from app.utils.common_utils import service_manager
+
+    previous = service_manager.get_service()
+    service = _service()
+    service_manager.set_service(service)
+    try:
+        client = TestClient(app)
+        landmarks = np.random.default_rng(5).random((1, 21, 3)).round(4).tolist()
+        for bad in (["a"], {"id": 1}, 1, "", "  "):
+            response = client.post("/recognize/landmarks", json={"landmarks": landmarks, "session_id": bad})
+            assert response.status_code == 400, f"session_id={bad!r}"
+            assert client.post("/recognize/realtime", json={"image": "x", "session_id": bad}).status_code == 400
+
+        response = client.post("/recognize/landmarks", json={"landmarks": landmarks, "session_id": "stream-1"})
+        assert response.status_code == 200 and response.json()["success"]
+    finally:
+        service_manager.set_service(previous)
+        service.recognizer.close()
+
+if __name__ == "__main__":
+    test_parse_landmark_array_shapes()
+    test_array_features_match_mediapipe_path()
+    test_recognize_from_landmarks()
+    test_predict_returns_built_features()
+    test_landmark_routes()
+    test_routes_reject_invalid_session_id()
+    print("✅ Landmark-only recognition works")
@@ -0,0 +1,54 @@
+import os
+import sys
+from types import SimpleNamespace
+import numpy as np
+
+# Ensure we can import from backend app
+current_dir = os.path.dirname(os.path.abspath(__file__))
+backend_dir = os.path.dirname(current_dir)
+sys.path.append(backend_dir)
+
+from app.core.landmarks import array_to_landmarks, build_features, FEATURE_DIM
+
+def legacy_features(hand_landmarks_list):
+    """原先各识别路径中的逐点实现，作为参照"""
+    features = []
+    for hand_landmarks in hand_landmarks_list:
+        for landmark in hand_landmarks.landmark:
+            features.extend([landmark.x, landmark.y, landmark.z])
+    if len(hand_landmarks_list) == 1:
+        features.extend([0.0] * 63)
+    return np.array(features[:126], dtype=np.float32)
+
+def test_build_features_matches_legacy():
+    """单手补零、双手按顺序拼接、超过两只手截断，与原实现逐位一致"""
+    rng = np.random.default_rng(0)
+    for num_hands in (1, 2, 3):
+        hands = array_to_landmarks(rng.random((num_hands, 21, 3), dtype=np.float32))
+        features = build_features(hands)
+        assert features.dtype == np.float32 and features.shape == (FEATURE_DIM,)
+        assert np.array_equal(features, legacy_features(hands))
+
+    assert build_features(None) is None
+    assert build_features([]) is None
+
+def test_build_features_fallback_paths():
+    """含 visibility 字段的protobuf和普通对象走逐点读取，结果一致；out 参数被复用并清零"""
+    rng = np.random.default_rng(1)
+    hands = array_to_landmarks(rng.random((2, 21, 3), dtype=np.float32))
+    hands[1].landmark[5].visibility = 0.5
+    assert np.array_equal(build_features(hands), legacy_features(hands))
+
+    plain = [SimpleNamespace(landmark=[
+        SimpleNamespace(x=float(x), y=float(y), z=float(z)) for x, y, z in rng.random((21, 3))
+    ])]
+    assert np.array_equal(build_features(plain), legacy_features(plain))
+
+    out = np.full(FEATURE_DIM, 7.0, dtype=np.float32)
+    assert build_features(plain, out=out) is out
+    assert not out[63:].any()
+
+if __name__ == "__main__":
+    test_build_features_matches_legacy()
+    test_build_features_fallback_paths()
+    print("✅ Shared feature builder matches the legacy implementation")
@@ -0,0 +1,58 @@
+import os
+import subprocess
+import sys
+
+# Ensure we can import from backend app
+current_dir = os.path.dirname(os.path.abspath(__file__))
+backend_dir = os.path.dirname(current_dir)
+sys.path.append(backend_dir)
+
+from app.core.config import MEDIAPIPE_PROFILES, config
+from app.core.recognizer import SignLanguageRecognizer
+
+def _config_in_subprocess(env, return_stderr=False):
+    """在新进程中按给定环境变量加载配置，返回 hands_options（return_stderr=True 时同时返回标准错误输出）"""
+    code = "from app.core.config import config; print(config.MEDIAPIPE_PROFILE, config.hands_options())"
+    completed = subprocess.run(
+        [sys.executable, "-c", code], cwd=backend_dir, capture_output=True, text=True, check=True,
+        env={**os.environ, **env}
+    )
+    output = completed.stdout.strip().splitlines()[-1]
+    return (output, completed.stderr) if return_stderr else output
+
+def test_profiles_and_overrides():
+    """档位决定默认值，单项环境变量覆盖档位中的值，未知档位使用 balanced"""
+    assert all(set(profile) == set(MEDIAPIPE_PROFILES["balanced"]) for profile in MEDIAPIPE_PROFILES.values())
+
+    fast = _config_in_subprocess({"MEDIAPIPE_PROFILE": "fast"})
+    assert fast.startswith("fast") and "'model_complexity': 0" in fast
+
+    overridden = _config_in_subprocess({"MEDIAPIPE_PROFILE": "fast", "MIN_DETECTION_CONFIDENCE": "0.3"})
+    assert "'min_detection_confidence': 0.3" in overridden and "'model_complexity': 0" in overridden
+
+    output, stderr = _config_in_subprocess({"MEDIAPIPE_PROFILE": "unknown"}, return_stderr=True)
+    assert output.startswith("balanced")
+    # 未知档位记录警告，给出错误的取值和可选值
+    assert "'unknown'" in stderr and "fast, balanced, accurate" in stderr
+    assert "MEDIAPIPE_PROFILE" not in _config_in_subprocess({"MEDIAPIPE_PROFILE": "fast"}, return_stderr=True)[1]
+
+def test_recognizer_uses_configured_options():
+    """识别器按传入的参数创建检测图，类属性中的默认值不受影响"""
+    options = {**config.hands_options(), "model_complexity": 0, "min_detection_confidence": 0.4}
+    recognizer = SignLanguageRecognizer(
+        config.get_model_path("numpy"), config.get_labels_path(), backend="numpy", hands_options=options
+    )
+    try:
+        info = recognizer.get_model_info()
+        assert info["model_complexity"] == 0 and info["detection_confidence"] == 0.4
+        assert SignLanguageRecognizer.hands_options["model_complexity"] == 1
+        twin = recognizer.clone()
+        assert twin.hands_options is recognizer.hands_options
+        twin.close()
+    finally:
+        recognizer.close()
+
+if __name__ == "__main__":
+    test_profiles_and_overrides()
+    test_recognizer_uses_configured_options()
+    print("✅ MediaPipe options are configurable")
@@ -0,0 +1,215 @@
+import os
+import sys
+import tempfile
+import threading
+import time
+import numpy as np
+
+# Ensure we can import from backend app
+current_dir = os.path.dirname(os.path.abspath(__file__))
+backend_dir = os.path.dirname(current_dir)
+sys.path.append(backend_dir)
+
+from app.core.config import config
+from app.core.hot_swap import HotSwapRecognizer
+from app.core.model_registry import ModelRegistry
+
+class FakeEngine:
+    """按固定标签返回结果的识别器，predict 可以被阻塞以模拟处理中的帧"""
+
+    def __init__(self, label, delay=0.0):
+        self.label = label
+        self.delay = delay
+        self.labels = [label]
+        self.closed = False
+        self.calls = 0
+
+    def predict(self, image, session_id=None, return_probs=False):
+        assert not self.closed, "已关闭的版本不应再处理帧"
+        self.calls += 1
+        time.sleep(self.delay)
+        return (self.label, 0.9, None, None) if return_probs else (self.label, 0.9, None)
+
+    def release_session(self, session_id):
+        pass
+
+    def get_model_info(self):
+        return {"label": self.label}
+
+    def is_ready(self):
+        return not self.closed
+
+    def close(self):
+        self.closed = True
+
+def _wait_until(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+def test_registry_register_and_activate():
+    """注册版本后可按版本号解析路径，第一个版本自动启用"""
+    with tempfile.TemporaryDirectory() as root:
+        registry = ModelRegistry(root)
+        assert registry.active_version() is None
+
+        registry.register("v1", config.get_model_path(), config.get_labels_path(), notes="baseline")
+        registry.register("v2", config.get_model_path(), config.get_labels_path())
+        assert registry.active_version() == "v1"
+
+        version, model_path, labels_path = registry.resolve("v2")
+        assert version == "v2" and os.path.exists(model_path) and os.path.exists(labels_path)
+
+        registry.set_active("v2")
+        assert registry.resolve()[0] == "v2"
+        assert [entry["version"] for entry in registry.list_versions()] == ["v1", "v2"]
+        assert [entry["active"] for entry in registry.list_versions()] == [False, True]
+
+        for bad_version in ("v1", "../escape", ""):
+            try:
+                registry.register(bad_version, config.get_model_path(), config.get_labels_path())
+                assert False, f"应拒绝版本号 {bad_version!r}"
+            except ValueError:
+                pass
+        try:
+            registry.resolve("missing")
+            assert False, "不存在的版本应抛出 KeyError"
+        except KeyError:
+            pass
+
+def test_swap_keeps_in_flight_frames():
+    """切换期间正在处理的帧在旧版本上完成，之后旧版本才关闭"""
+    old = FakeEngine("hello", delay=0.3)
+    new = FakeEngine("thanks")
+    recognizer = HotSwapRecognizer(old, "v1", loader=lambda version: new)
+    image = np.zeros((4, 4, 3), dtype=np.uint8)
+
+    results = []
+    in_flight = threading.Thread(target=lambda: results.append(recognizer.predict(image)))
+    in_flight.start()
+    assert _wait_until(lambda: old.calls == 1)
+
+    swapped = []
+    assert recognizer.load_version("v2", on_swapped=swapped.append)
+    assert _wait_until(lambda: swapped == ["v2"])
+
+    # 新请求立即由新版本处理，旧版本仍在处理中的帧不受影响
+    assert recognizer.predict(image)[0] == "thanks"
+    assert recognizer.version == "v2"
+    assert not old.closed
+
+    in_flight.join()
+    print(f"In-flight result: {results}, stats: {recognizer.get_stats()}")
+    assert results == [("hello", 0.9, None)]
+    assert old.closed
+    assert recognizer.get_stats()["swaps"] == 1
+
+    recognizer.close()
+    assert new.closed
+
+def test_shadow_records_agreement():
+    """影子模式按比例采样，并统计候选版本与当前版本的一致率"""
+    candidates = {"agree": FakeEngine("hello"), "disagree": FakeEngine("bye")}
+    recognizer = HotSwapRecognizer(FakeEngine("hello"), "v1", loader=candidates.get)
+    image = np.zeros((4, 4, 3), dtype=np.uint8)
+
+    assert recognizer.start_shadow("agree", 0.5)
+    assert _wait_until(lambda: recognizer.get_stats()["shadow"] is not None)
+    for _ in range(20):
+        assert recognizer.predict(image)[0] == "hello"
+    assert _wait_until(lambda: recognizer.get_stats()["shadow"]["frames"] == 10)
+    assert recognizer.get_stats()["shadow"]["agreement"] == 1.0
+
+    assert recognizer.start_shadow("disagree", 1.0)
+    assert _wait_until(lambda: recognizer.get_stats()["shadow"]["version"] == "disagree")
+    assert candidates["agree"].closed
+    for _ in range(5):
+        recognizer.predict(image)
+    assert _wait_until(lambda: recognizer.get_stats()["shadow"]["frames"] == 5)
+    shadow = recognizer.get_stats()["shadow"]
+    print(f"Shadow stats: {shadow}")
+    assert shadow["agreement"] == 0.0
+    assert shadow["shadow_latency_ms"] is not None
+
+    recognizer.stop_shadow()
+    assert candidates["disagree"].closed
+    recognizer.close()
+
+def test_admin_routes_require_token_and_validate_payload():
+    """热切换和影子模式需要管理令牌，version 和 fraction 格式错误时返回 400"""
+    from fastapi.testclient import TestClient
+    from app.main import app
+
+    client = TestClient(app)
+    previous = config.MODEL_ADMIN_TOKEN
+    try:
+        config.MODEL_ADMIN_TOKEN = ""
+        assert client.post("/api/models/activate", json={"version": "v2"}).status_code == 403
+
+        config.MODEL_ADMIN_TOKEN = "secret"
+        assert client.post("/api/models/activate", json={"version": "v2"}).status_code == 401
+        wrong = {"X-Admin-Token": "wrong"}
+        assert client.post("/api/models/shadow", json={"version": "v2"}, headers=wrong).status_code == 401
+
+        headers = {"X-Admin-Token": "secret"}
+        for payload in ({}, {"version": None}, {"version": ""}, {"version": 2}):
+            assert client.post("/api/models/activate", json=payload, headers=headers).status_code == 400
+        for payload in ({"version": "v2", "fraction": "abc"}, {"version": "v2", "fraction": None},
+                        {"fraction": 0.5}, {"version": "", "fraction": 0.5}):
+            assert client.post("/api/models/shadow", json=payload, headers=headers).status_code == 400
+        # 格式正确但未启用模型仓库
+        assert client.post("/api/models/shadow", json={"version": "v2", "fraction": 5},
+                           headers=headers).status_code == 503
+    finally:
+        config.MODEL_ADMIN_TOKEN = previous
+
+def test_registry_requires_backend_artifacts():
+    """注册时复制 .h5 同目录下的 ONNX / TFLite 文件；非 keras 后端缺少对应文件的版本不能热切换"""
+    import shutil
+    from fastapi.testclient import TestClient
+    from app.main import app
+
+    with tempfile.TemporaryDirectory() as source, tempfile.TemporaryDirectory() as root:
+        model_path = os.path.join(source, "retrained.h5")
+        shutil.copy2(config.get_model_path(), model_path)
+        for name in ("retrained.onnx", "retrained.int8.tflite"):
+            with open(os.path.join(source, name), "wb") as f:
+                f.write(b"model")
+
+        registry = ModelRegistry(root)
+        entry = registry.register("v1", model_path, config.get_labels_path())
+        assert entry["artifacts"] == ["sign_language_model.int8.tflite", "sign_language_model.onnx"]
+        assert registry.resolve("v1", backend="onnx")[1].endswith(os.path.join("v1", "sign_language_model.onnx"))
+        assert registry.resolve("v1", backend="numpy")[1].endswith("sign_language_model.h5")
+
+        registry.register("v2", config.get_model_path(), config.get_labels_path())
+        try:
+            registry.resolve("v2", backend="onnx")
+            assert False, "缺少 .onnx 的版本应抛出 FileNotFoundError"
+        except FileNotFoundError as e:
+            assert "onnx" in str(e)
+
+        client = TestClient(app)
+        previous = (config.MODEL_ADMIN_TOKEN, config.MODEL_REGISTRY_DIR, config.INFERENCE_BACKEND)
+        config.MODEL_ADMIN_TOKEN, config.MODEL_REGISTRY_DIR, config.INFERENCE_BACKEND = "secret", root, "onnx"
+        try:
+            headers = {"X-Admin-Token": "secret"}
+            response = client.post("/api/models/activate", json={"version": "v2"}, headers=headers)
+            assert response.status_code == 400 and "onnx" in response.json()["message"]
+            response = client.post("/api/models/shadow", json={"version": "v2", "fraction": 0.5}, headers=headers)
+            assert response.status_code == 400
+        finally:
+            config.MODEL_ADMIN_TOKEN, config.MODEL_REGISTRY_DIR, config.INFERENCE_BACKEND = previous
+
+if __name__ == "__main__":
+    test_registry_register_and_activate()
+    print("✅ Registry registers and activates versions")
+    test_swap_keeps_in_flight_frames()
+    print("✅ Swap keeps in-flight frames")
+    test_shadow_records_agreement()
+    print("✅ Shadow mode records agreement")
+    test_admin_routes_require_token_and_validate_payload()
+    print("✅ Model admin routes are protected")
+    test_registry_requires_backend_artifacts()
+    print("✅ Registry checks backend artifacts")
@@ -0,0 +1,137 @@
+import base64
+import os
+import sys
+import time
+import cv2
+import numpy as np
+
+# Ensure we can import from backend app
+current_dir = os.path.dirname(os.path.abspath(__file__))
+backend_dir = os.path.dirname(current_dir)
+sys.path.append(backend_dir)
+
+from app.core.motion import MotionGate
+from app.services.translator import TranslationService
+from app.utils.image_processing import base64_to_bytes, bytes_to_image, bytes_to_thumbnail
+
+class CountingRecognizer:
+    """记录调用次数的识别器"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def predict(self, image, session_id=None):
+        self.calls += 1
+        return "hello", 0.9, None
+
+    def release_session(self, session_id):
+        pass
+
+def _jpeg_base64(frame):
+    _, buffer = cv2.imencode(".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, 80])
+    return "data:image/jpeg;base64," + base64.b64encode(buffer).decode("ascii")
+
+def _scene(hand_x, noise_seed=None):
+    rng = np.random.default_rng(0)
+    frame = rng.integers(60, 120, size=(480, 640, 3), dtype=np.uint8)
+    frame = cv2.GaussianBlur(frame, (9, 9), 0)
+    if noise_seed is not None:
+        # 摄像头噪声：每帧不同的小幅扰动
+        noise = np.random.default_rng(noise_seed).integers(-3, 4, size=frame.shape)
+        frame = np.clip(frame.astype(np.int16) + noise, 0, 255).astype(np.uint8)
+    cv2.rectangle(frame, (hand_x, 200), (hand_x + 80, 320), (220, 200, 180), -1)
+    return frame
+
+def test_static_frames_reuse_result():
+    """画面静止时复用结果并标记 reused，画面变化或达到复用上限时重新识别"""
+    recognizer = CountingRecognizer()
+    gate = MotionGate(max_reuse=5)
+    service = TranslationService(recognizer, motion_gate=gate)
+
+    first = service.recognize_from_base64(_jpeg_base64(_scene(200)), session_id="s1")
+    assert first.success and not first.reused and recognizer.calls == 1
+
+    # 只有噪声变化的静止画面：全部复用
+    for seed in range(4):
+        result = service.recognize_from_base64(_jpeg_base64(_scene(200, noise_seed=seed)), session_id="s1")
+        assert result.reused and result.predicted_class == "hello"
+    assert recognizer.calls == 1
+
+    # 手移动：重新识别
+    moved = service.recognize_from_base64(_jpeg_base64(_scene(260)), session_id="s1")
+    assert not moved.reused and recognizer.calls == 2
+
+    # 连续复用达到上限后强制识别一次
+    frame = _jpeg_base64(_scene(260))
+    reused = [service.recognize_from_base64(frame, session_id="s1").reused for _ in range(7)]
+    assert reused == [True] * 5 + [False, True]
+
+    # 不带会话ID的请求不做跳帧
+    service.recognize_from_base64(frame)
+    stats = gate.get_stats()
+    print(f"Motion gate stats: {stats}")
+    assert stats["skipped"] == 10
+    assert stats["frames"] == 1 + 4 + 1 + 7
+
+    service.release_session("s1")
+    assert gate.get_stats()["sessions"] == 0
+
+def test_thumbnail_is_cheaper_than_decode():
+    """缩略图解码明显快于完整解码"""
+    image_bytes = base64_to_bytes(_jpeg_base64(_scene(200)))
+    thumbnail = bytes_to_thumbnail(image_bytes, 64)
+    assert thumbnail.shape == (48, 64) and thumbnail.dtype == np.uint8
+
+    def timed(func, iterations=30):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            func(image_bytes)
+        return (time.perf_counter() - start) * 1000 / iterations
+
+    thumbnail_ms = timed(lambda data: bytes_to_thumbnail(data, 64))
+    decode_ms = timed(bytes_to_image)
+    print(f"Thumbnail: {thumbnail_ms:.2f}ms, full decode: {decode_ms:.2f}ms")
+    assert thumbnail_ms < decode_ms
+
+def test_answer_requests_never_reuse_results():
+    """答题请求总是完整识别这一帧，不会把跳帧复用的结果当作答案"""
+    import json
+    from fastapi.testclient import TestClient
+    from app.main import app
+    from app.utils.common_utils import service_manager
+
+    class NoHandRecognizer(CountingRecognizer):
+        def predict(self, image, session_id=None, **kwargs):
+            self.calls += 1
+            return None, 0.0, None
+
+        def is_ready(self):
+            return True
+
+        def get_model_info(self):
+            return {}
+
+    previous = service_manager.get_service()
+    recognizer = NoHandRecognizer()
+    service_manager.set_service(TranslationService(recognizer, motion_gate=MotionGate()))
+    try:
+        image = _jpeg_base64(_scene(100))
+        with TestClient(app).websocket_connect("/ws") as ws:
+            for _ in range(2):
+                ws.send_text(json.dumps({"type": "image", "data": image}))
+                ws.receive_text()
+            assert recognizer.calls == 1
+
+            ws.send_text(json.dumps({"type": "answer_request", "data": image, "question_id": 1}))
+            assert json.loads(ws.receive_text())["type"] == "answer_response"
+        assert recognizer.calls == 2
+    finally:
+        service_manager.set_service(previous)
+
+if __name__ == "__main__":
+    test_static_frames_reuse_result()
+    print("✅ Static frames reuse the last result")
+    test_thumbnail_is_cheaper_than_decode()
+    print("✅ Thumbnail decode is cheap")
+    test_answer_requests_never_reuse_results()
+    print("✅ Answer requests never reuse results")
@@ -0,0 +1,68 @@
+import os
+import shutil
+import sys
+import tempfile
+import numpy as np
+
+# Ensure we can import from backend app
+current_dir = os.path.dirname(os.path.abspath(__file__))
+backend_dir = os.path.dirname(current_dir)
+sys.path.append(backend_dir)
+
+from app.core.config import config
+from app.core.classifier import folded_weights_path
+from app.core.numpy_engine import NumpyMLPClassifier, NUMPY_ENGINE_TOLERANCE
+
+def test_numpy_engine_matches_keras():
+    """NumPy推理引擎（BN已折叠）与Keras模型的输出误差应在容差范围内"""
+    from tensorflow import keras
+
+    model_path = config.get_model_path()
+    engine = NumpyMLPClassifier(model_path)
+    keras_model = keras.models.load_model(model_path)
+
+    rng = np.random.default_rng(0)
+    features = rng.random((64, 126), dtype=np.float32)
+    # 一半样本模拟单手输入（第二只手补零）
+    features[::2, 63:] = 0.0
+
+    expected = keras_model.predict(features, verbose=0)
+    actual = engine.predict(features)
+
+    max_error = float(np.abs(expected - actual).max())
+    print(f"Max abs error: {max_error:.2e}")
+
+    assert actual.shape == expected.shape
+    assert max_error < NUMPY_ENGINE_TOLERANCE
+    assert (actual.argmax(axis=1) == expected.argmax(axis=1)).all()
+
+def test_shared_weights_are_memory_mapped():
+    """第一次加载保存折叠后的权重，之后的加载以内存映射方式共用，结果完全一致"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        model_path = os.path.join(tmp_dir, "model.h5")
+        shutil.copy(config.get_model_path(), model_path)
+        cache_dir = os.path.join(tmp_dir, "cache")
+        shared_path = folded_weights_path(model_path, cache_dir)
+        # 权重文件写在缓存目录，不写模型目录；不同目录下的同名模型使用不同文件
+        assert os.path.dirname(shared_path) == cache_dir
+        assert shared_path != folded_weights_path(os.path.join(tmp_dir, "v2", "model.h5"), cache_dir)
+
+        assert not os.path.exists(shared_path)
+        first = NumpyMLPClassifier(model_path, shared_weights_path=shared_path)
+        assert os.path.exists(shared_path)
+        second = NumpyMLPClassifier(model_path, shared_weights_path=shared_path)
+        print(f"Weights source: first={first.weights_source}, second={second.weights_source}")
+
+        # 生成缓存的进程也改用映射，释放读取 .h5 时的进程内副本
+        assert first.weights_source == "mmap"
+        assert second.weights_source == "mmap"
+
+        features = np.random.default_rng(1).random((8, 126), dtype=np.float32)
+        assert np.array_equal(first.predict(features), second.predict(features))
+        assert sorted(os.listdir(tmp_dir)) == ["cache", "model.h5"]
+
+if __name__ == "__main__":
+    test_numpy_engine_matches_keras()
+    print("✅ NumPy engine matches Keras")
+    test_shared_weights_are_memory_mapped()
+    print("✅ Shared weights are memory mapped")
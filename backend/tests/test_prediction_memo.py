@@ -0,0 +1,115 @@
+import os
+import sys
+import numpy as np
+
+# Ensure we can import from backend app
+current_dir = os.path.dirname(os.path.abspath(__file__))
+backend_dir = os.path.dirname(current_dir)
+sys.path.append(backend_dir)
+
+from app.core.config import config
+from app.core.landmarks import FEATURE_DIM
+from app.core.prediction_memo import PredictionMemo
+from app.core.recognizer import SignLanguageRecognizer
+
+def test_memo_quantizes_and_evicts():
+    """同一网格内的特征共用一个键，超出容量时淘汰最久未使用的条目"""
+    memo = PredictionMemo(grid_size=0.01, max_entries=2)
+    base = np.full(FEATURE_DIM, 0.5, dtype=np.float32)
+    assert memo.make_key(base) == memo.make_key(base + 0.003)
+    assert memo.make_key(base) != memo.make_key(base + 0.02)
+
+    for i in range(3):
+        memo.put(memo.make_key(base + 0.02 * i), np.array([i, 1.0 - i]))
+    assert memo.get(memo.make_key(base)) is None
+    cached = memo.get(memo.make_key(base + 0.04))
+    assert cached[0] == 2 and not cached.flags.writeable
+
+    stats = memo.get_stats()
+    assert stats["evictions"] == 1 and stats["hits"] == 1 and stats["misses"] == 1
+
+def test_recognizer_reuses_classifier_output():
+    """手势几乎不变时复用分类结果，use_memo=False 时总是调用分类模型"""
+    recognizer = SignLanguageRecognizer(
+        config.get_model_path("numpy"), config.get_labels_path(), backend="numpy"
+    )
+    try:
+        memo = recognizer.enable_prediction_memo(grid_size=0.01, max_entries=64)
+
+        calls = []
+        classify = recognizer.predict_proba
+
+        def counting_predict_proba(features_batch):
+            calls.append(len(features_batch))
+            return classify(features_batch)
+
+        recognizer.predict_proba = counting_predict_proba
+
+        # 保持同一手势：关键点在网格中心附近小幅抖动
+        rng = np.random.default_rng(0)
+        pose = (rng.integers(20, 80, size=FEATURE_DIM) / 100).astype(np.float32)
+        frames = [pose + rng.uniform(-0.002, 0.002, size=FEATURE_DIM).astype(np.float32) for _ in range(10)]
+        feed = iter(frames)
+        recognizer.extract_features = lambda image, session_id=None: (next(feed), [])
+
+        blank = np.zeros((48, 64, 3), dtype=np.uint8)
+        results = [recognizer.predict(blank, return_probs=True) for _ in range(8)]
+        assert len(calls) == 1
+        assert all(result[0] == results[0][0] for result in results)
+
+        # 缓存的输出与直接分类的结果一致
+        direct = classify(frames[7].reshape(1, -1))[0]
+        assert np.allclose(results[7][3], direct, atol=0.05)
+
+        recognizer.predict(blank, use_memo=False)
+        recognizer.predict(blank, use_memo=False)
+        assert len(calls) == 3
+
+        stats = recognizer.get_model_info()["prediction_memo"]
+        print(f"Prediction memo stats: {stats}")
+        assert stats["hits"] == 7 and stats["misses"] == 1
+    finally:
+        recognizer.close()
+
+def test_routes_parse_use_cache_strings():
+    """use_cache 的字符串 "false" 按字面含义关闭缓存，无法识别的取值返回 400"""
+    from fastapi.testclient import TestClient
+    from app.core.recognizer_pool import RecognizerPool
+    from app.main import app
+    from app.services.translator import TranslationService
+    from app.utils.common_utils import service_manager
+
+    previous = service_manager.get_service()
+    recognizer = SignLanguageRecognizer(config.get_model_path("numpy"), config.get_labels_path(), backend="numpy")
+    service = TranslationService(RecognizerPool(recognizer, size=1))
+    seen = []
+    recognize = service.recognize_from_landmarks
+
+    def recording_recognize(landmarks, session_id=None, use_cache=True):
+        seen.append(use_cache)
+        return recognize(landmarks, session_id=session_id, use_cache=use_cache)
+
+    service.recognize_from_landmarks = recording_recognize
+    service_manager.set_service(service)
+    try:
+        client = TestClient(app)
+        landmarks = np.random.default_rng(1).random((1, 21, 3)).tolist()
+        for value, expected in (("false", False), ("0", False), (False, False), ("true", True), (None, True)):
+            body = {"landmarks": landmarks}
+            if value is not None:
+                body["use_cache"] = value
+            assert client.post("/recognize/landmarks", json=body).status_code == 200
+            assert seen[-1] is expected, f"use_cache={value!r}"
+
+        assert client.post("/recognize/landmarks", json={"landmarks": landmarks, "use_cache": "maybe"}).status_code == 400
+        assert client.post("/recognize/realtime", json={"image": "x", "use_cache": "maybe"}).status_code == 400
+        assert client.post("/recognize/batch", json={"images": ["x"], "use_cache": "maybe"}).status_code == 400
+    finally:
+        service_manager.set_service(previous)
+        recognizer.close()
+
+if __name__ == "__main__":
+    test_memo_quantizes_and_evicts()
+    test_recognizer_reuses_classifier_output()
+    test_routes_parse_use_cache_strings()
+    print("✅ Prediction memo works")
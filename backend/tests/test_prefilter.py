@@ -0,0 +1,110 @@
+import os
+import sys
+import time
+import cv2
+import numpy as np
+
+# Ensure we can import from backend app
+current_dir = os.path.dirname(os.path.abspath(__file__))
+backend_dir = os.path.dirname(current_dir)
+sys.path.append(backend_dir)
+
+from app.core.config import config
+from app.core.hand_prefilter import (
+    PREFILTER_AUDIT, PREFILTER_PASS, PREFILTER_REJECT,
+    HandPrefilter, calibrate_threshold, evaluate_threshold, skin_fraction
+)
+from app.core.recognizer import SignLanguageRecognizer
+
+# 常见肤色（BGR）
+SKIN_TONES = [(180, 200, 240), (120, 150, 200), (80, 110, 160), (60, 80, 120)]
+
+def _replay_set(seed=0, frames=80):
+    """合成回放集：无手帧是不同颜色的背景加噪声，有手帧在背景上叠加一块肤色区域"""
+    rng = np.random.default_rng(seed)
+    images, has_hand = [], []
+    for i in range(frames):
+        background = np.array([rng.integers(0, 256), rng.integers(0, 120), rng.integers(0, 120)], dtype=np.uint8)
+        frame = np.tile(background, (480, 640, 1))
+        frame = np.clip(frame + rng.integers(-10, 11, size=frame.shape), 0, 255).astype(np.uint8)
+        hand = i % 2 == 0
+        if hand:
+            x, y = int(rng.integers(0, 560)), int(rng.integers(0, 380))
+            size = int(rng.integers(40, 100))
+            cv2.ellipse(frame, (x + size // 2, y + size // 2), (size // 2, size // 3), 0, 0, 360,
+                        SKIN_TONES[i // 2 % len(SKIN_TONES)], -1)
+        images.append(frame)
+        has_hand.append(hand)
+    return images, has_hand
+
+def test_calibration_respects_budget():
+    """校准得到的阈值在回放集上不超过漏检预算，并且过滤掉大部分无手帧"""
+    images, has_hand = _replay_set()
+    fractions = [skin_fraction(image) for image in images]
+
+    threshold = calibrate_threshold(fractions, has_hand, fn_budget=0.0)
+    report = evaluate_threshold(fractions, has_hand, threshold)
+    print(f"Calibration report: {report}")
+    assert report["false_negatives"] == 0
+    assert report["saved_ratio"] > 0.8
+
+    # 放宽预算后阈值更高，误丢弃的帧数不超过预算
+    loose = evaluate_threshold(fractions, has_hand, calibrate_threshold(fractions, has_hand, fn_budget=0.1))
+    assert loose["threshold"] >= threshold
+    assert loose["false_negatives"] <= 0.1 * loose["hand_frames"]
+
+def test_check_is_fast_and_audits():
+    """单帧判断远低于1ms，每丢弃 audit_interval 帧抽检一次"""
+    prefilter = HandPrefilter(min_skin_fraction=0.002, audit_interval=5)
+    blank = np.zeros((480, 640, 3), dtype=np.uint8)
+    hand = blank.copy()
+    cv2.ellipse(hand, (320, 240), (50, 35), 0, 0, 360, SKIN_TONES[0], -1)
+
+    assert prefilter.check(hand) == PREFILTER_PASS
+    decisions = [prefilter.check(blank) for _ in range(10)]
+    assert decisions.count(PREFILTER_AUDIT) == 2
+    assert decisions.count(PREFILTER_REJECT) == 8
+
+    # 归一化到 0-1 的浮点图像同样可以判断
+    assert prefilter.check(hand.astype(np.float32) / 255.0) == PREFILTER_PASS
+
+    start = time.perf_counter()
+    for _ in range(200):
+        prefilter.check(blank)
+    per_frame_ms = (time.perf_counter() - start) * 1000 / 200
+    print(f"Prefilter check: {per_frame_ms:.3f}ms per frame")
+    assert per_frame_ms < 1.0
+
+def test_recognizer_skips_mediapipe_for_empty_frames():
+    """启用预过滤后无手帧不调用MediaPipe，抽检帧仍然检测并记录结果"""
+    recognizer = SignLanguageRecognizer(
+        config.get_model_path("numpy"), config.get_labels_path(), backend="numpy"
+    )
+    try:
+        prefilter = recognizer.enable_prefilter(min_skin_fraction=0.002, audit_interval=4)
+        processed = []
+        process_hands = recognizer._process_hands
+
+        def counting_process_hands(image_rgb, session_id=None):
+            processed.append(image_rgb.shape)
+            return process_hands(image_rgb, session_id)
+
+        recognizer._process_hands = counting_process_hands
+
+        blank = np.zeros((480, 640, 3), dtype=np.uint8)
+        for _ in range(8):
+            assert recognizer.predict(blank) == (None, 0.0, None)
+        assert len(processed) == 2
+
+        stats = recognizer.get_model_info()["prefilter"]
+        print(f"Prefilter stats: {stats}")
+        assert stats["saved"] == 6 and stats["audited"] == 2 and stats["audit_misses"] == 0
+        assert prefilter.get_stats()["frames"] == 8
+    finally:
+        recognizer.close()
+
+if __name__ == "__main__":
+    test_calibration_respects_budget()
+    test_check_is_fast_and_audits()
+    test_recognizer_skips_mediapipe_for_empty_frames()
+    print("✅ Hand prefilter works")
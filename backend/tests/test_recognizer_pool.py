@@ -0,0 +1,71 @@
+import os
+import sys
+import threading
+import numpy as np
+
+# Ensure we can import from backend app
+current_dir = os.path.dirname(os.path.abspath(__file__))
+backend_dir = os.path.dirname(current_dir)
+sys.path.append(backend_dir)
+
+from app.core.config import config
+from app.core.recognizer import SignLanguageRecognizer
+from app.core.recognizer_pool import RecognizerPool
+
+def test_pool_members_share_model():
+    """池中成员共享模型和标签，但各自拥有独立的MediaPipe图"""
+    recognizer = SignLanguageRecognizer(
+        config.get_model_path("numpy"), config.get_labels_path(), backend="numpy"
+    )
+    pool = RecognizerPool(recognizer, size=3)
+    try:
+        members = pool._members
+        assert len(members) == 3
+        assert all(member.model is recognizer.model for member in members)
+        assert all(member.labels is recognizer.labels for member in members)
+        assert len({id(member.hands) for member in members}) == 3
+
+        batcher = pool.enable_batching(max_batch_size=8, max_wait_ms=1)
+        assert all(member.batcher is batcher for member in members)
+
+        # 并发请求：每个线程签出不同的识别器
+        blank = np.zeros((240, 320, 3), dtype=np.uint8)
+        results = []
+
+        def worker():
+            results.append(pool.predict(blank))
+
+        threads = [threading.Thread(target=worker) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = pool.get_stats()
+        print(f"Pool stats: {stats}")
+        assert len(results) == 6
+        assert all(result == (None, 0.0, None) for result in results)
+        assert stats["checkouts"] == 6
+        assert stats["idle"] == 3
+
+        # 带会话ID的帧使用会话独占的检测图，不占用池中的实例
+        sessions = pool.enable_sessions(idle_timeout_s=60, max_sessions=4)
+        assert pool.predict(blank, session_id="stream-1") == (None, 0.0, None)
+        assert sessions.get_stats()["active"] == 1
+        assert pool.get_stats()["checkouts"] == 6
+        pool.release_session("stream-1")
+        assert sessions.get_stats()["active"] == 0
+
+        # 会话数已满时，超出的会话签出一个成员做静态图片模式检测，不落在主识别器的视频流检测图上
+        sessions.max_sessions = 1
+        with sessions.acquire("stream-busy"):
+            assert pool.predict(blank, session_id="stream-overflow") == (None, 0.0, None)
+        assert sessions.get_stats()["rejected"] == 1
+        assert pool.get_stats()["checkouts"] == 7
+        assert sum(member.static_hands is not None for member in members) == 1
+    finally:
+        pool.close()
+
+if __name__ == "__main__":
+    test_pool_members_share_model()
+    print("✅ Recognizer pool works")
@@ -0,0 +1,109 @@
+import base64
+import os
+import sys
+import cv2
+import numpy as np
+
+# Ensure we can import from backend app
+current_dir = os.path.dirname(os.path.abspath(__file__))
+backend_dir = os.path.dirname(current_dir)
+sys.path.append(backend_dir)
+
+from app.core.config import config
+from app.core.recognizer import SignLanguageRecognizer
+from app.core.resolution import ResolutionController, fit_to_side
+from app.services.translator import TranslationService
+
+def _run(controller, session_id, frames, latency_ms, detected=True):
+    sides = []
+    for _ in range(frames):
+        side = controller.acquire(session_id)
+        controller.release(session_id, side, latency_ms, detected)
+        sides.append(side)
+    return sides
+
+def test_fit_to_side_only_downscales():
+    frame = np.zeros((480, 640, 3), dtype=np.uint8)
+    assert fit_to_side(frame, 320).shape == (240, 320, 3)
+    assert fit_to_side(frame, 1280) is frame
+
+def test_controller_follows_latency_and_load():
+    """耗时超过目标时逐档降低分辨率，空闲时逐档升回，各会话独立"""
+    controller = ResolutionController(levels=(320, 640, 480), target_ms=20, step_interval=5)
+    assert controller.levels == [640, 480, 320]
+
+    slow = _run(controller, "slow", 15, latency_ms=35)
+    assert slow[:5] == [640] * 5 and slow[5:10] == [480] * 5 and slow[10:] == [320] * 5
+    assert _run(controller, "fast", 5, latency_ms=5) == [640] * 5
+
+    # 耗时的滑动平均降到目标的一半以下后逐档升回
+    recovered = _run(controller, "slow", 30, latency_ms=5)
+    assert recovered[0] == 320 and recovered[-1] == 640
+    assert recovered == sorted(recovered) and 480 in recovered
+
+    # 同时处理的帧数达到水位时即使单帧很快也降分辨率
+    busy = ResolutionController(levels=(640, 320), target_ms=20, queue_high=3, step_interval=1)
+    held = [busy.acquire("other") for _ in range(2)]
+    busy.release("s", busy.acquire("s"), 5, True)
+    assert busy.acquire("s") == 320
+
+    stats = controller.get_stats()
+    print(f"Resolution stats: {stats}")
+    assert stats["steps_down"] == 2 and stats["steps_up"] == 2
+    assert stats["levels"]["640"]["detection_rate"] == 1.0
+    assert held == [640, 640]
+
+def test_recognizer_downscales_frames_under_load():
+    """识别器按控制器选择的分辨率把帧送入MediaPipe，并按分辨率统计检测率"""
+    recognizer = SignLanguageRecognizer(
+        config.get_model_path("numpy"), config.get_labels_path(), backend="numpy"
+    )
+    try:
+        controller = recognizer.enable_adaptive_resolution(levels=(480, 240), target_ms=0.001)
+        controller.step_interval = 3
+        shapes = []
+        process_hands = recognizer._process_hands
+
+        def recording_process_hands(image_rgb, session_id=None):
+            shapes.append(image_rgb.shape[:2])
+            return process_hands(image_rgb, session_id)
+
+        recognizer._process_hands = recording_process_hands
+
+        frame = np.zeros((720, 960, 3), dtype=np.uint8)
+        for _ in range(5):
+            recognizer.predict(frame, session_id="s1")
+        assert shapes == [(360, 480)] * 3 + [(180, 240)] * 2
+
+        stats = recognizer.get_model_info()["resolution"]
+        assert stats["levels"]["480"]["frames"] == 3 and stats["levels"]["480"]["detection_rate"] == 0.0
+        recognizer.release_session("s1")
+        assert stats["sessions_by_level"]["240"] == 1
+        assert recognizer.get_model_info()["resolution"]["sessions_by_level"]["240"] == 0
+    finally:
+        recognizer.close()
+
+class RecordingRecognizer:
+    def __init__(self):
+        self.images = []
+
+    def predict(self, image, session_id=None):
+        self.images.append(image)
+        return None, 0.0, None
+
+def test_service_passes_decoded_frame():
+    """服务把解码后的uint8图像交给识别器（MediaPipe不接受归一化的浮点图像）"""
+    recognizer = RecordingRecognizer()
+    service = TranslationService(recognizer)
+    frame = np.full((480, 640, 3), 90, dtype=np.uint8)
+    _, buffer = cv2.imencode(".jpg", frame)
+    result = service.recognize_from_base64(base64.b64encode(buffer).decode("ascii"))
+    assert result.success
+    assert recognizer.images[0].dtype == np.uint8 and recognizer.images[0].shape == (480, 640, 3)
+
+if __name__ == "__main__":
+    test_fit_to_side_only_downscales()
+    test_controller_follows_latency_and_load()
+    test_recognizer_downscales_frames_under_load()
+    test_service_passes_decoded_frame()
+    print("✅ Adaptive resolution works")
@@ -0,0 +1,172 @@
+import base64
+import json
+import os
+import sys
+import cv2
+import numpy as np
+
+# Ensure we can import from backend app
+current_dir = os.path.dirname(os.path.abspath(__file__))
+backend_dir = os.path.dirname(current_dir)
+sys.path.append(backend_dir)
+
+from app.core.sentence import SentenceAssembler
+from app.services.translator import TranslationService
+
+FRAME_S = 0.1
+
+def _replay(assembler, session_id, frames, start=0.0):
+    """按100ms一帧回放 (词汇, 置信度) 序列，返回所有事件"""
+    events = []
+    for i, (word, confidence) in enumerate(frames):
+        events.extend(assembler.add(session_id, word, confidence, now=start + i * FRAME_S))
+    return events
+
+def test_assembles_words_and_sentences():
+    """文档中的场景：准备阶段、hello、thank you、停顿后断句"""
+    assembler = SentenceAssembler(min_consecutive=3, min_confidence=0.8, pause_s=1.0, dedupe_s=2.0)
+    frames = (
+        [(None, 0.0)] * 5
+        + [("hello", 0.95)] * 15
+        + [("hello", 0.5)] * 2            # 低置信度的帧不计数
+        + [("thank you", 0.9)] * 15
+        + [(None, 0.0)] * 12
+    )
+    events = _replay(assembler, "s1", frames)
+    assert [event["type"] for event in events] == ["word", "word", "sentence"]
+    assert events[1]["sentence"] == "hello thank you"
+    assert events[2]["text"] == "hello thank you" and events[2]["reason"] == "pause"
+
+    stats = assembler.get_stats()
+    print(f"Sentence stats: {stats}")
+    assert stats["frames"] == len(frames) and stats["message_reduction"] >= 10
+
+def test_dedupe_flicker_and_limits():
+    """短暂中断后的同一词汇不重复添加，单帧的误识别不确认，达到词数上限时断句"""
+    assembler = SentenceAssembler(min_consecutive=3, pause_s=1.0, dedupe_s=2.0, max_words=2)
+    frames = (
+        [("yes", 0.9)] * 5 + [(None, 0.0)] * 3 + [("yes", 0.9)] * 5    # 中断后仍是 yes
+        + [("no", 0.9)] + [("yes", 0.9)] * 2                             # 单帧 no 不确认
+    )
+    events = _replay(assembler, "s1", frames)
+    assert [event.get("word") for event in events] == ["yes"]
+
+    events = _replay(assembler, "s1", [("no", 0.9)] * 3, start=10.0)
+    assert [event["type"] for event in events] == ["word", "sentence"]
+    assert events[1]["words"] == ["yes", "no"] and events[1]["reason"] == "max_words"
+
+    # 主动结束句子；会话之间互不影响
+    _replay(assembler, "s2", [("thanks", 0.9)] * 3)
+    assert assembler.flush("s2")[0]["text"] == "thanks"
+    assert assembler.flush("s2") == [] and assembler.flush("unknown") == []
+
+def test_stable_words_and_timeout():
+    """平滑后的稳定词汇在切换的那一帧确认；客户端停止发送帧后按时间断句"""
+    assembler = SentenceAssembler(min_consecutive=3, pause_s=1.0, dedupe_s=2.0)
+    frames = [
+        ("hello", 0.7, True, True), ("hello", 0.8, False, True),   # 切换的帧确认，之后保持
+        (None, 0.0, True, True),                                     # 稳定词汇被清除
+        ("thanks", 0.7, True, True), ("thanks", 0.7, False, True),
+    ]
+    events = []
+    for i, (word, confidence, changed, has_hand) in enumerate(frames):
+        events.extend(assembler.add_stable("s1", word, confidence, changed, has_hand, now=i * FRAME_S))
+    assert [event["word"] for event in events] == ["hello", "thanks"]
+
+    assert assembler.expire("s1", now=1.0) == []
+    events = assembler.expire("s1", now=1.5)
+    assert events[0]["text"] == "hello thanks" and events[0]["reason"] == "timeout"
+    assert assembler.expire("s1", now=3.0) == [] and assembler.expire("unknown") == []
+
+def test_service_uses_smoothed_word():
+    """启用时间平滑时，语句组装使用稳定词汇而不是逐帧的原始结果"""
+    from app.models.schemas import RecognitionResult
+
+    service = TranslationService(SequenceRecognizer([]), sentence_assembler=SentenceAssembler(min_consecutive=3))
+    flicker = RecognitionResult(success=True, detected=True, predicted_class="thanks", confidence=0.95,
+                                hands_count=1, stable_word="hello", stable_confidence=0.7, changed=True)
+    events = service.sentence_events("s1", flicker)
+    assert [event["word"] for event in events] == ["hello"]
+
+class SequenceRecognizer:
+    """按预设序列返回识别结果的识别器"""
+
+    labels = ["hello", "thanks"]
+
+    def __init__(self, sequence):
+        self.sequence = list(sequence)
+        self.calls = 0
+
+    def predict(self, image, session_id=None, **kwargs):
+        word = self.sequence[min(self.calls, len(self.sequence) - 1)]
+        self.calls += 1
+        return (word, 0.95, None) if word else (None, 0.0, None)
+
+    def is_ready(self):
+        return True
+
+    def get_model_info(self):
+        return {}
+
+    def release_session(self, session_id):
+        pass
+
+def _jpeg_base64(seed):
+    frame = np.random.default_rng(seed).integers(0, 255, size=(60, 80, 3), dtype=np.uint8)
+    _, buffer = cv2.imencode(".jpg", frame)
+    return "data:image/jpeg;base64," + base64.b64encode(buffer).decode("ascii")
+
+def test_websocket_sentence_mode_pushes_only_events():
+    """以 /ws?mode=sentence 连接时只推送词汇事件，flush 返回句子"""
+    from fastapi.testclient import TestClient
+    from app.main import app
+    from app.utils.common_utils import service_manager
+
+    previous = service_manager.get_service()
+    recognizer = SequenceRecognizer(["hello"] * 4 + ["thanks"] * 4)
+    service_manager.set_service(TranslationService(recognizer, sentence_assembler=SentenceAssembler(pause_s=60)))
+    try:
+        client = TestClient(app)
+        with client.websocket_connect("/ws?mode=sentence") as ws:
+            for i in range(8):
+                ws.send_text(json.dumps({"type": "image", "data": _jpeg_base64(i)}))
+            ws.send_text(json.dumps({"type": "flush"}))
+            messages = []
+            while True:
+                message = json.loads(ws.receive_text())
+                messages.append(message)
+                if message["type"] == "flushed":
+                    break
+        assert [message["type"] for message in messages] == ["word", "word", "flushed"]
+        assert messages[-1]["events"][0]["text"] == "hello thanks"
+    finally:
+        service_manager.set_service(previous)
+
+def test_websocket_flushes_after_idle():
+    """客户端停止发送帧超过停顿时长后，服务端主动推送句子"""
+    from fastapi.testclient import TestClient
+    from app.main import app
+    from app.utils.common_utils import service_manager
+
+    previous = service_manager.get_service()
+    recognizer = SequenceRecognizer(["hello"] * 3)
+    service_manager.set_service(TranslationService(recognizer, sentence_assembler=SentenceAssembler(pause_s=0.3)))
+    try:
+        client = TestClient(app)
+        with client.websocket_connect("/ws?mode=sentence") as ws:
+            for i in range(3):
+                ws.send_text(json.dumps({"type": "image", "data": _jpeg_base64(i)}))
+            assert json.loads(ws.receive_text())["type"] == "word"
+            message = json.loads(ws.receive_text())
+        assert message["type"] == "sentence" and message["reason"] == "timeout" and message["text"] == "hello"
+    finally:
+        service_manager.set_service(previous)
+
+if __name__ == "__main__":
+    test_assembles_words_and_sentences()
+    test_dedupe_flicker_and_limits()
+    test_stable_words_and_timeout()
+    test_service_uses_smoothed_word()
+    test_websocket_flushes_after_idle()
+    test_websocket_sentence_mode_pushes_only_events()
+    print("✅ Sentence assembler works")
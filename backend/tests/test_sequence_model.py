@@ -0,0 +1,125 @@
+import base64
+import json
+import os
+import sys
+import tempfile
+import cv2
+import numpy as np
+
+# Ensure we can import from backend app
+current_dir = os.path.dirname(os.path.abspath(__file__))
+backend_dir = os.path.dirname(current_dir)
+sys.path.append(backend_dir)
+
+from app.core.landmarks import array_to_landmarks
+from app.core.motion import MotionGate
+from app.core.sequence_model import SequenceStreams, StreamingTCN, build_sequence_model
+from app.services.translator import TranslationService
+from app.utils.common_utils import get_service_response
+
+LABELS = ["hello", "thanks", "yes"]
+
+def _save_model(directory):
+    model = build_sequence_model(len(LABELS), channels=16, kernel_size=3, dilations=(1, 2, 4))
+    model_path = os.path.join(directory, "sequence.h5")
+    model.save(model_path)
+    labels_path = os.path.join(directory, "sequence_labels.json")
+    with open(labels_path, "w", encoding="utf-8") as f:
+        json.dump({"classes": LABELS}, f)
+    return model, model_path, labels_path
+
+def test_streaming_matches_full_sequence():
+    """逐帧推理与对整段序列做因果卷积的每个时间步一致，流状态的大小不随帧数增长"""
+    with tempfile.TemporaryDirectory() as directory:
+        model, model_path, _ = _save_model(directory)
+        streaming = StreamingTCN(model_path)
+        assert streaming.receptive_field == 1 + 2 * (1 + 2 + 4)
+
+        sequence = np.random.default_rng(0).random((1, 60, 126), dtype=np.float32)
+        sequence[0, 20:25] = 0.0  # 未检测到手的帧
+        expected = model.predict(sequence, verbose=0)[0]
+
+        state = streaming.new_state()
+        initial_bytes = state.nbytes
+        outputs = np.stack([streaming.step(state, frame) for frame in sequence[0]])
+        error = float(np.abs(outputs - expected).max())
+        print(f"Streaming max error: {error:.2e}")
+        assert error < 1e-5
+        assert state.nbytes == initial_bytes
+
+def test_streams_per_session_in_service():
+    """服务按会话推进时序状态，复用结果的帧重复输入上一帧的特征"""
+    with tempfile.TemporaryDirectory() as directory:
+        _, model_path, labels_path = _save_model(directory)
+        streams = SequenceStreams.load(model_path, labels_path, max_sessions=2)
+
+    landmarks = array_to_landmarks(np.random.default_rng(1).random((1, 21, 3), dtype=np.float32))
+    features = np.random.default_rng(3).random(126, dtype=np.float32)
+
+    class LandmarkRecognizer:
+        labels = LABELS
+        calls = 0
+
+        def predict(self, image, session_id=None, return_features=False, **kwargs):
+            self.calls += 1
+            result = ("hello", 0.9, landmarks)
+            return result + (features,) if return_features else result
+
+        def get_model_info(self):
+            return {}
+
+    recognizer = LandmarkRecognizer()
+    service = TranslationService(recognizer, motion_gate=MotionGate(), sequence_streams=streams)
+    # 时序模型收到的是识别器返回的特征，而不是由关键点重新构建的特征
+    received = []
+    update = streams.update
+    streams.update = lambda session_id, frame_features: received.append(frame_features) or update(session_id, frame_features)
+    frame = np.random.default_rng(2).integers(0, 255, size=(60, 80, 3), dtype=np.uint8)
+    _, buffer = cv2.imencode(".jpg", frame)
+    image = "data:image/jpeg;base64," + base64.b64encode(buffer).decode("ascii")
+
+    results = [service.recognize_from_base64(image, session_id="s1") for _ in range(4)]
+    assert recognizer.calls == 1 and results[-1].reused
+    assert received and received[0] is features
+    assert all(result.sequence_word in LABELS for result in results)
+    assert "sequence_word" in get_service_response(results[-1])
+
+    stats = service.get_metrics()["sequence"]
+    print(f"Sequence stats: {stats}")
+    assert stats["steps"] == 4 and stats["sessions"] == 1
+
+    # 不带会话ID的请求不经过时序模型
+    assert service.recognize_from_base64(image).sequence_word is None
+    service.release_session("s1")
+    assert streams.get_stats()["sessions"] == 0
+
+    try:
+        SequenceStreams(streams.model, ["only-one"])
+        assert False, "标签数与模型输出不一致时应当报错"
+    except ValueError:
+        pass
+
+def test_sequence_paths_resolve_against_models_dir():
+    """相对路径按分类模型所在目录解析，标签文件留空时与时序模型同目录，绝对路径保持不变"""
+    from app.core.config import Config
+
+    models_dir = os.path.dirname(os.path.abspath(Config.get_model_path()))
+    previous = (Config.SEQUENCE_MODEL_PATH, Config.SEQUENCE_LABELS_PATH)
+    try:
+        Config.SEQUENCE_MODEL_PATH, Config.SEQUENCE_LABELS_PATH = "sign_language_sequence_model.h5", ""
+        assert Config.get_sequence_paths() == (
+            os.path.join(models_dir, "sign_language_sequence_model.h5"),
+            os.path.join(models_dir, "sign_language_sequence_labels.json")
+        )
+
+        absolute = os.path.join(tempfile.gettempdir(), "seq", "model.h5")
+        Config.SEQUENCE_MODEL_PATH, Config.SEQUENCE_LABELS_PATH = absolute, "v2/labels.json"
+        assert Config.get_sequence_paths() == (absolute, os.path.join(models_dir, "v2", "labels.json"))
+    finally:
+        Config.SEQUENCE_MODEL_PATH, Config.SEQUENCE_LABELS_PATH = previous
+
+if __name__ == "__main__":
+    test_streaming_matches_full_sequence()
+    test_streams_per_session_in_service()
+    test_sequence_paths_resolve_against_models_dir()
+    print("✅ Streaming sequence model works")
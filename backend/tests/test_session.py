@@ -0,0 +1,101 @@
+import os
+import sys
+import time
+
+# Ensure we can import from backend app
+current_dir = os.path.dirname(os.path.abspath(__file__))
+backend_dir = os.path.dirname(current_dir)
+sys.path.append(backend_dir)
+
+from app.core.session import HandTrackerRegistry
+
+class FakeHands:
+    """记录是否被关闭的检测图替身"""
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+def test_registry_reuses_and_evicts():
+    """同一会话复用检测图；超过上限淘汰最久未使用的；空闲超时后回收"""
+    created = []
+
+    def factory():
+        hands = FakeHands()
+        created.append(hands)
+        return hands
+
+    registry = HandTrackerRegistry(factory, idle_timeout_s=0.2, max_sessions=2)
+
+    with registry.acquire("a") as first:
+        pass
+    with registry.acquire("a") as again:
+        assert again is first
+    with registry.acquire("b"):
+        pass
+    assert len(created) == 2
+
+    # 第三个会话挤掉最久未使用的 "a"
+    with registry.acquire("c"):
+        pass
+    assert first.closed
+    assert registry.get_stats()["active"] == 2
+
+    # 使用中的会话不会被淘汰，满员时不分配检测图
+    with registry.acquire("b"), registry.acquire("c"):
+        with registry.acquire("d") as hands:
+            assert hands is None
+    assert registry.get_stats()["rejected"] == 1
+
+    # 空闲超时回收
+    time.sleep(0.25)
+    with registry.acquire("e"):
+        pass
+    stats = registry.get_stats()
+    print(f"Session stats: {stats}")
+    assert stats["active"] == 1
+
+    registry.release("e")
+    assert created[-1].closed
+    registry.close()
+
+def test_registry_builds_graphs_outside_lock():
+    """构建新会话的检测图时不持有注册表锁，已有会话的帧不被阻塞"""
+    import threading
+
+    building, release = threading.Event(), threading.Event()
+
+    def factory():
+        if threading.current_thread().name == "slow-session":
+            building.set()
+            release.wait(5)
+        return FakeHands()
+
+    registry = HandTrackerRegistry(factory, idle_timeout_s=60, max_sessions=4)
+    with registry.acquire("a"):
+        pass
+
+    def open_slow_session():
+        with registry.acquire("b"):
+            pass
+
+    thread = threading.Thread(target=open_slow_session, name="slow-session")
+    thread.start()
+    try:
+        assert building.wait(5)
+        start = time.perf_counter()
+        with registry.acquire("a") as hands:
+            assert hands is not None
+        registry.release("a")
+        assert time.perf_counter() - start < 1
+    finally:
+        release.set()
+        thread.join()
+    assert registry.get_stats()["active"] == 1
+    registry.close()
+
+if __name__ == "__main__":
+    test_registry_reuses_and_evicts()
+    test_registry_builds_graphs_outside_lock()
+    print("✅ Session registry works")
@@ -0,0 +1,120 @@
+import base64
+import os
+import sys
+import cv2
+import numpy as np
+
+# Ensure we can import from backend app
+current_dir = os.path.dirname(os.path.abspath(__file__))
+backend_dir = os.path.dirname(current_dir)
+sys.path.append(backend_dir)
+
+from app.core.motion import MotionGate
+from app.core.smoothing import TemporalSmoother
+from app.services.translator import TranslationService
+from app.utils.common_utils import get_service_response
+
+LABELS = ["hello", "thanks", "yes"]
+
+def _probs(index, confidence=0.9):
+    probs = np.full(len(LABELS), (1.0 - confidence) / (len(LABELS) - 1), dtype=np.float32)
+    probs[index] = confidence
+    return probs
+
+def _feed(smoother, session_id, sequence):
+    return [smoother.update(session_id, None if index is None else _probs(index), LABELS) for index in sequence]
+
+def test_ema_ignores_flicker_and_switches_with_hysteresis():
+    """单帧的跳变不改变稳定词汇，持续的新手势在 min_frames 帧后切换"""
+    smoother = TemporalSmoother(method="ema", ema_alpha=0.5, enter_threshold=0.6, exit_threshold=0.4, min_frames=2)
+    outputs = _feed(smoother, "s1", [0, 0, 0, 0, 1, 0, 0])
+    assert [word for word, _, _ in outputs] == [None, None, "hello", "hello", "hello", "hello", "hello"]
+    assert [changed for _, _, changed in outputs].count(True) == 1
+
+    outputs = _feed(smoother, "s1", [1] * 6)
+    words = [word for word, _, _ in outputs]
+    assert words[0] == "hello" and words[-1] == "thanks"
+    assert sum(changed for _, _, changed in outputs) == 1
+
+    # 手放下后得分衰减，稳定词汇被清除
+    outputs = _feed(smoother, "s1", [None] * 8)
+    assert outputs[-1][0] is None and sum(changed for _, _, changed in outputs) == 1
+
+def test_vote_and_bounded_sessions():
+    """多数投票按窗口计票；会话数和每个会话的内存有上限"""
+    smoother = TemporalSmoother(method="vote", window=5, enter_threshold=0.6, exit_threshold=0.4,
+                                min_frames=1, max_sessions=2)
+    outputs = _feed(smoother, "a", [2, 1, 2, 2, 1])
+    assert [word for word, _, _ in outputs] == [None, None, None, "yes", "yes"]
+
+    _feed(smoother, "b", [0])
+    _feed(smoother, "c", [0])
+    stats = smoother.get_stats()
+    print(f"Smoothing stats: {stats}")
+    assert stats["sessions"] == 2
+    assert stats["bytes"] <= 2 * (5 * len(LABELS) * 4 + len(LABELS) * 4 + 5)
+
+    # 被淘汰的会话重新开始，类别数变化（切换模型版本）时同样重新开始
+    assert smoother.repeat("a", LABELS) == (None, 0.0, False)
+    two_classes = [smoother.update("b", np.array([0.1, 0.9], dtype=np.float32), ["x", "y"]) for _ in range(3)]
+    assert [word for word, _, _ in two_classes] == [None, None, "y"]
+
+    try:
+        TemporalSmoother(method="median")
+        assert False, "不支持的平滑方式应当被拒绝"
+    except ValueError:
+        pass
+
+class ProbsRecognizer:
+    """按预设序列返回概率的识别器"""
+
+    labels = LABELS
+
+    def __init__(self, sequence):
+        self.sequence = list(sequence)
+        self.calls = 0
+
+    def predict(self, image, session_id=None, return_probs=False):
+        index = self.sequence[self.calls % len(self.sequence)]
+        self.calls += 1
+        if index is None:
+            return (None, 0.0, None, None) if return_probs else (None, 0.0, None)
+        probs = _probs(index)
+        if return_probs:
+            return LABELS[index], float(probs[index]), None, probs
+        return LABELS[index], float(probs[index]), None
+
+    def get_model_info(self):
+        return {}
+
+def _jpeg_base64(seed):
+    frame = np.random.default_rng(seed).integers(0, 255, size=(120, 160, 3), dtype=np.uint8)
+    _, buffer = cv2.imencode(".jpg", frame)
+    return "data:image/jpeg;base64," + base64.b64encode(buffer).decode("ascii")
+
+def test_service_reports_stable_word_per_session():
+    """带会话ID的请求返回稳定词汇和 changed 标记，复用结果的帧同样推进平滑状态"""
+    recognizer = ProbsRecognizer([0])
+    service = TranslationService(recognizer, motion_gate=MotionGate(), smoother=TemporalSmoother(min_frames=2))
+
+    frame = _jpeg_base64(0)
+    results = [service.recognize_from_base64(frame, session_id="s1") for _ in range(6)]
+    assert recognizer.calls == 1 and all(result.reused for result in results[1:])
+    assert results[-1].stable_word == "hello"
+    assert [result.changed for result in results].count(True) == 1
+
+    response = get_service_response(results[-1])
+    assert response["stable_word"] == "hello" and response["changed"] is False
+
+    # 不带会话ID的请求不做平滑，响应格式不变
+    plain = service.recognize_from_base64(_jpeg_base64(1))
+    assert plain.changed is None and "stable_word" not in get_service_response(plain)
+
+    service.release_session("s1")
+    assert service.get_metrics()["smoothing"]["sessions"] == 0
+
+if __name__ == "__main__":
+    test_ema_ignores_flicker_and_switches_with_hysteresis()
+    test_vote_and_bounded_sessions()
+    test_service_reports_stable_word_per_session()
+    print("✅ Temporal smoothing works")
@@ -0,0 +1,114 @@
+import os
+import sys
+import time
+
+# Ensure we can import from backend app
+current_dir = os.path.dirname(os.path.abspath(__file__))
+backend_dir = os.path.dirname(current_dir)
+sys.path.append(backend_dir)
+
+from app.core.config import config
+
+def test_engine_warms_up_before_returning():
+    """create_engine 返回前完成预热，并记录各阶段耗时"""
+    from app.core.engine import create_engine
+
+    original = (config.RECOGNIZER_POOL_SIZE, config.INFERENCE_WARMUP_FRAMES)
+    config.RECOGNIZER_POOL_SIZE, config.INFERENCE_WARMUP_FRAMES = 2, 2
+    timings = {}
+    try:
+        pool = create_engine(backend="numpy", timings=timings)
+    finally:
+        config.RECOGNIZER_POOL_SIZE, config.INFERENCE_WARMUP_FRAMES = original
+
+    try:
+        print(f"Engine timings: {timings}")
+        assert pool is not None and pool.is_ready()
+        assert {"import_ms", "model_load_ms", "pool_ms", "warmup_ms"} <= set(timings)
+        assert all(ms >= 0 for ms in timings.values())
+    finally:
+        pool.close()
+
+def test_recognition_routes_wait_for_warm_up():
+    """识别器在后台加载，预热完成前识别接口返回503，其余接口照常响应"""
+    from sqlalchemy import create_engine
+    from sqlalchemy.pool import StaticPool
+    import app.main as main_module
+    from app.database import SessionLocal
+
+    # 使用内存数据库，避免测试写入 app/db.sqlite3。app.database 可能已被其他测试导入，
+    # 此时修改 config.DATABASE_URL 不起作用，需要直接替换启动时建表的引擎和会话工厂绑定的引擎
+    memory_engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    original = (main_module.engine, SessionLocal.kw["bind"], config.INFERENCE_BACKEND)
+    main_module.engine, config.INFERENCE_BACKEND = memory_engine, "numpy"
+    SessionLocal.configure(bind=memory_engine)
+    try:
+        _check_startup_gating(main_module.app)
+    finally:
+        main_module.engine, _, config.INFERENCE_BACKEND = original
+        SessionLocal.configure(bind=original[1])
+
+def _check_startup_gating(app):
+    from fastapi.testclient import TestClient
+    from app.utils.common_utils import service_manager
+
+    with TestClient(app) as client:
+        assert client.get("/").status_code == 200
+
+        response = client.get("/api/health")
+        if response.status_code == 503:
+            assert response.json()["status"] == "loading"
+            rejected = client.post("/recognize/realtime", json={"image": "data"})
+            assert rejected.status_code == 503
+
+        deadline = time.monotonic() + 120
+        while service_manager.is_loading() and time.monotonic() < deadline:
+            time.sleep(0.1)
+
+        response = client.get("/api/health")
+        body = response.json()
+        print(f"Health: {body}")
+        assert response.status_code == 200
+        assert body["status"] == "ready"
+        assert {"database_ms", "serving_ms", "recognizer_ms", "ready_ms"} <= set(body["startup_ms"])
+
+def test_model_load_does_not_hold_translator_lock():
+    """模型加载期间不持有 translator_lock，/api/predict 立即返回未就绪而不是等待加载完成"""
+    import threading
+    from fastapi.testclient import TestClient
+    import app.core.engine as engine_module
+    from app.api.routes import flask_compat
+    from app.main import app
+
+    loading, release = threading.Event(), threading.Event()
+
+    def slow_create_engine(timings=None):
+        loading.set()
+        release.wait(10)
+        return None
+
+    original = (engine_module.create_engine, flask_compat.translator)
+    engine_module.create_engine, flask_compat.translator = slow_create_engine, None
+    loader = threading.Thread(target=flask_compat.init_translator)
+    loader.start()
+    try:
+        assert loading.wait(5)
+        assert flask_compat.translator_lock.acquire(timeout=1), "加载期间不应持有 translator_lock"
+        flask_compat.translator_lock.release()
+
+        start = time.perf_counter()
+        response = TestClient(app).post("/api/predict", json={"image": "data:image/jpeg;base64,"})
+        assert response.status_code == 503
+        assert time.perf_counter() - start < 2
+    finally:
+        release.set()
+        loader.join()
+        engine_module.create_engine, flask_compat.translator = original
+
+if __name__ == "__main__":
+    test_engine_warms_up_before_returning()
+    print("✅ Engine warms up before returning")
+    test_recognition_routes_wait_for_warm_up()
+    print("✅ Recognition routes wait for warm-up")
+    test_model_load_does_not_hold_translator_lock()
+    print("✅ Model load does not hold the translator lock")
@@ -0,0 +1,51 @@
+import json
+import os
+import subprocess
+import sys
+
+# Ensure we can import from backend app
+current_dir = os.path.dirname(os.path.abspath(__file__))
+backend_dir = os.path.dirname(current_dir)
+sys.path.append(backend_dir)
+
+from app.core.threads import available_cpus, parse_cpu_list, worker_cpus
+
+def test_parse_cpu_list():
+    assert parse_cpu_list("0-3,8") == [0, 1, 2, 3, 8]
+    assert parse_cpu_list(" 2, 0-1 ,2,") == [0, 1, 2]
+    assert parse_cpu_list("") == []
+
+def test_worker_cpus_split_evenly():
+    """核平分给各工作进程且互不重叠，核数不足时轮流共用"""
+    cpus = list(range(8))
+    shares = [worker_cpus(i, 3, cpus) for i in range(3)]
+    assert shares == [[0, 1], [2, 3], [4, 5]]
+    assert [worker_cpus(i, 4, [0, 1]) for i in range(4)] == [[0], [1], [0], [1]]
+    assert worker_cpus(0, 1) == available_cpus()
+
+def test_apply_thread_budget_in_fresh_process():
+    """新进程中设置线程预算后 TensorFlow / OpenCV 的线程数和CPU亲和性生效"""
+    cpu = available_cpus()[0]
+    code = (
+        "import os, sys, json; sys.path.append(sys.argv[1])\n"
+        "from app.core.threads import apply_thread_budget\n"
+        f"applied = apply_thread_budget(threads=2, inter_op_threads=1, cpu_affinity=[{cpu}])\n"
+        "import cv2\n"
+        "applied['env'] = os.environ['TF_NUM_INTRAOP_THREADS']\n"
+        "applied['cv2'] = cv2.getNumThreads()\n"
+        "applied['affinity'] = sorted(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else None\n"
+        "print(json.dumps(applied))\n"
+    )
+    output = subprocess.run([sys.executable, "-c", code, backend_dir], capture_output=True, text=True, check=True)
+    applied = json.loads(output.stdout.strip().splitlines()[-1])
+    print(f"Thread budget: {applied}")
+    assert applied["tf_intra_op"] == 2 and applied["env"] == "2"
+    assert applied["cv2"] == 2
+    if applied["affinity"] is not None:
+        assert applied["affinity"] == [cpu]
+
+if __name__ == "__main__":
+    test_parse_cpu_list()
+    test_worker_cpus_split_evenly()
+    test_apply_thread_budget_in_fresh_process()
+    print("✅ Thread budget works")
@@ -0,0 +1,139 @@
+import json
+import os
+import struct
+import sys
+import numpy as np
+
+# Ensure we can import from backend app
+current_dir = os.path.dirname(os.path.abspath(__file__))
+backend_dir = os.path.dirname(current_dir)
+sys.path.append(backend_dir)
+
+from app.core.wire_format import (
+    INT16_SCALE, WIRE_VERSION, decode_landmark_frame, decode_result, encode_landmark_frame, encode_result
+)
+from app.models.schemas import RecognitionResult
+
+def _landmarks(seed, num_hands=2):
+    """MediaPipe范围内的关键点：x/y 在 [0, 1]，z 在 [-0.3, 0.3]"""
+    rng = np.random.default_rng(seed)
+    landmarks = rng.random((num_hands, 21, 3), dtype=np.float32)
+    landmarks[..., 2] = (landmarks[..., 2] - 0.5) * 0.6
+    return landmarks
+
+def test_landmark_frame_round_trip_precision():
+    """float16 误差不超过 2.5e-4，int16 不超过半个量化步长；手数、handedness 和序号原样还原"""
+    landmarks = _landmarks(0)
+    json_bytes = len(json.dumps({"landmarks": landmarks.tolist()}))
+
+    for encoding, tolerance in (("float16", 2.5e-4), ("int16", 0.5 / INT16_SCALE + 1e-7)):
+        data = encode_landmark_frame(landmarks, sequence=42, handedness=["Left", "Right"], encoding=encoding)
+        frame = decode_landmark_frame(data)
+        error = float(np.abs(frame.landmarks - landmarks).max())
+        print(f"{encoding}: {len(data)} bytes (JSON {json_bytes}), max error {error:.2e}")
+        assert len(data) == 264 and len(data) * 8 < json_bytes
+        assert frame.landmarks.shape == (2, 21, 3) and frame.landmarks.dtype == np.float32
+        assert error <= tolerance
+        assert frame.handedness == ["Left", "Right"] and frame.sequence == 42
+
+    # 单手、未知 handedness、无手；序号取低32位
+    frame = decode_landmark_frame(encode_landmark_frame(_landmarks(1, 1).tolist(), sequence=2 ** 32 + 7))
+    assert frame.landmarks.shape == (1, 21, 3) and frame.handedness == [None] and frame.sequence == 7
+    empty = decode_landmark_frame(encode_landmark_frame([]))
+    assert empty.landmarks.shape == (0, 21, 3) and empty.handedness == []
+
+def test_rejects_malformed_frames():
+    """魔数、版本、长度、手数和编码范围不符时报 ValueError"""
+    data = encode_landmark_frame(_landmarks(2))
+    bad_frames = [
+        b"",
+        b"XX" + data[2:],
+        data[:2] + bytes([WIRE_VERSION + 1]) + data[3:],
+        data[:-1],
+        data + b"\x00",
+        data[:8] + struct.pack("<BB", 0, 3) + data[10:],
+        encode_result(RecognitionResult(success=True, message="")),
+    ]
+    for bad in bad_frames:
+        try:
+            decode_landmark_frame(bad)
+            assert False, "格式错误的消息应当被拒绝"
+        except ValueError:
+            pass
+
+    for kwargs in ({"encoding": "int16", "landmarks": np.full((1, 21, 3), 4.0)},
+                   {"encoding": "float32", "landmarks": _landmarks(3)},
+                   {"handedness": ["Up"], "landmarks": _landmarks(3, 1)},
+                   {"landmarks": np.zeros((3, 21, 3))}):
+        try:
+            encode_landmark_frame(**kwargs)
+            assert False, f"应当拒绝: {list(kwargs)}"
+        except ValueError:
+            pass
+
+def test_result_round_trip():
+    """识别结果的字段与 get_service_response 一致，可附带关键点"""
+    from app.utils.common_utils import get_service_response
+
+    result = RecognitionResult(
+        success=True, detected=True, predicted_class="谢谢", confidence=0.875, message="识别成功",
+        hands_count=1, processing_time_ms=3.5, stable_word="谢谢", stable_confidence=0.75, changed=True
+    )
+    landmarks = _landmarks(4, 1)
+    decoded = decode_result(encode_result(result, sequence=9, landmarks=landmarks, handedness=["Right"]))
+    expected = get_service_response(result)
+    assert {key: decoded[key] for key in expected} == expected
+    assert decoded["sequence"] == 9 and decoded["handedness"] == ["Right"]
+    assert float(np.abs(decoded["landmarks"] - landmarks).max()) <= 2.5e-4
+
+    failed = RecognitionResult(success=False, confidence=None, message="关键点格式错误")
+    decoded = decode_result(encode_result(failed))
+    assert decoded["confidence"] is None and decoded["word"] is None and decoded["message"] == "关键点格式错误"
+    assert "stable_word" not in decoded and "sequence_word" not in decoded
+    assert decoded["landmarks"].shape == (0, 21, 3)
+
+def test_binary_routes():
+    """octet-stream 的 REST 请求和 WebSocket 二进制消息返回二进制结果，序号原样返回"""
+    from fastapi.testclient import TestClient
+    from app.core.config import config
+    from app.core.recognizer import SignLanguageRecognizer
+    from app.core.recognizer_pool import RecognizerPool
+    from app.main import app
+    from app.services.translator import TranslationService
+    from app.utils.common_utils import service_manager
+
+    previous = service_manager.get_service()
+    recognizer = SignLanguageRecognizer(config.get_model_path("numpy"), config.get_labels_path(), backend="numpy")
+    service = TranslationService(RecognizerPool(recognizer, size=1))
+    service_manager.set_service(service)
+    try:
+        client = TestClient(app)
+        frame = encode_landmark_frame(_landmarks(5), sequence=3, encoding="int16")
+        response = client.post("/recognize/landmarks?session_id=s1", content=frame,
+                               headers={"Content-Type": "application/octet-stream"})
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/octet-stream"
+        decoded = decode_result(response.content)
+        assert decoded["sequence"] == 3 and decoded["word"] in recognizer.labels
+
+        response = client.post("/recognize/landmarks", content=frame[:-2],
+                               headers={"Content-Type": "application/octet-stream"})
+        assert response.status_code == 400
+
+        with client.websocket_connect("/ws") as ws:
+            ws.send_bytes(encode_landmark_frame(_landmarks(5), sequence=4, encoding="int16"))
+            message = decode_result(ws.receive_bytes())
+            assert message["sequence"] == 4 and message["word"] == decoded["word"]
+
+            ws.send_bytes(b"not a frame")
+            assert json.loads(ws.receive_text())["type"] == "error"
+    finally:
+        service_manager.set_service(previous)
+        recognizer.close()
+
+if __name__ == "__main__":
+    test_landmark_frame_round_trip_precision()
+    test_rejects_malformed_frames()
+    test_result_round_trip()
+    test_binary_routes()
+    print("✅ Binary landmark wire format works")
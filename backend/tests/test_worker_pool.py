@@ -0,0 +1,148 @@
+import os
+import sys
+import numpy as np
+
+# Ensure we can import from backend app
+current_dir = os.path.dirname(os.path.abspath(__file__))
+backend_dir = os.path.dirname(current_dir)
+sys.path.append(backend_dir)
+
+from app.core.config import config
+from app.core.landmarks import array_to_landmarks, landmarks_to_array
+from app.core.worker_pool import ProcessRecognizerPool, SharedFrameRing
+
+def test_shared_frame_ring_round_trip():
+    """帧写入槽位后，通过名称连接的另一端读到相同内容"""
+    ring = SharedFrameRing(num_slots=2, slot_bytes=64 * 48 * 3)
+    try:
+        frame = np.random.default_rng(0).integers(0, 255, (48, 64, 3), dtype=np.uint8)
+        slot = ring.acquire(timeout=1)
+        shape, dtype = ring.write(slot, frame)
+
+        reader = SharedFrameRing(2, 64 * 48 * 3, name=ring.name)
+        assert np.array_equal(reader.view(slot, shape, dtype), frame)
+        reader.close()
+
+        too_large = np.zeros((100, 100, 3), dtype=np.uint8)
+        try:
+            ring.write(slot, too_large)
+            assert False, "超过槽位大小的帧应当被拒绝"
+        except ValueError:
+            pass
+        ring.release(slot)
+    finally:
+        ring.close()
+        ring.unlink()
+
+def test_landmark_array_round_trip():
+    """关键点数组还原为MediaPipe对象后坐标不变"""
+    array = np.random.default_rng(1).random((2, 21, 3), dtype=np.float32)
+    hand_landmarks_list = array_to_landmarks(array)
+    assert len(hand_landmarks_list) == 2
+    assert np.allclose(landmarks_to_array(hand_landmarks_list), array)
+    assert array_to_landmarks(None) is None
+
+def test_process_pool_predicts():
+    """工作进程通过共享内存接收帧并回传结果"""
+    pool = ProcessRecognizerPool(
+        config.get_model_path("numpy"),
+        config.get_labels_path(),
+        num_workers=2,
+        slot_bytes=240 * 320 * 3,
+        backend="numpy"
+    )
+    try:
+        assert pool.start(timeout=120)
+        blank = np.zeros((240, 320, 3), dtype=np.uint8)
+        for session_id in (None, "stream-1", "stream-1"):
+            assert pool.predict(blank, session_id=session_id) == (None, 0.0, None)
+        pool.release_session("stream-1")
+
+        # 上传的关键点：特征经任务队列交给工作进程分类
+        label, confidence, probabilities = pool.predict_features(
+            np.full(126, 0.5, dtype=np.float32), return_probs=True
+        )
+        assert label in pool.labels and confidence == float(probabilities.max())
+
+        stats = pool.get_stats()
+        print(f"Worker stats: {stats}")
+        assert stats["completed"] == 4
+        assert stats["in_flight"] == 0
+    finally:
+        pool.close()
+
+def _wait_for(condition, timeout=120):
+    import time
+
+    deadline = time.time() + timeout
+    while not condition() and time.time() < deadline:
+        time.sleep(0.1)
+    return condition()
+
+def test_dead_worker_is_restarted():
+    """
+    工作进程被杀死后池仍就绪，请求交给其余进程；分给它的任务失败而不是等到超时，
+    槽位归还，池重启该进程后恢复全部容量
+    """
+    import time
+    import zlib
+
+    pool = ProcessRecognizerPool(
+        config.get_model_path("numpy"),
+        config.get_labels_path(),
+        num_workers=2,
+        num_slots=4,
+        slot_bytes=240 * 320 * 3,
+        backend="numpy",
+        result_timeout=60.0
+    )
+    # 固定路由到 0 号进程的会话
+    session_id = next(f"stream-{i}" for i in range(100) if zlib.crc32(f"stream-{i}".encode("utf-8")) % 2 == 0)
+    try:
+        assert pool.start(timeout=120)
+        blank = np.zeros((240, 320, 3), dtype=np.uint8)
+
+        pool._processes[0].kill()
+        pool._processes[0].join(10)
+        # 一个进程退出不影响就绪状态，它的会话和轮询请求都交给仍在运行的进程
+        assert pool.is_ready()
+        stats = pool.get_stats()
+        assert stats["available"] == 1 and stats["degraded"]
+        for sid in (None, None, session_id):
+            assert pool.predict(blank, session_id=sid) == (None, 0.0, None)
+
+        assert _wait_for(lambda: pool.get_stats()["available"] == 2)
+        assert pool.get_stats()["restarts"] == 1 and not pool.get_stats()["degraded"]
+
+        # 任务已派发但进程在回传结果前退出：Future 很快失败，不等 result_timeout
+        future = pool.submit(blank, session_id=session_id)
+        pool._processes[0].kill()
+        start = time.perf_counter()
+        try:
+            future.result(timeout=30)
+        except RuntimeError:
+            pass
+        assert time.perf_counter() - start < 30
+
+        assert _wait_for(lambda: pool.get_stats()["available"] == 2)
+        assert pool.predict(blank, session_id=session_id) == (None, 0.0, None)
+
+        # 调用方超时：登记的任务被移除，槽位在工作进程回传结果后归还
+        pool.result_timeout = 0.0
+        assert pool.predict(blank) == (None, None, None)
+        pool.result_timeout = 60.0
+        assert pool.get_stats()["in_flight"] == 0
+        assert _wait_for(lambda: pool.ring._free.qsize() == pool.num_slots, timeout=30)
+
+        stats = pool.get_stats()
+        print(f"Worker stats after restart: {stats}")
+        assert stats["restarts"] == 2 and stats["in_flight"] == 0
+    finally:
+        pool.close()
+
+if __name__ == "__main__":
+    test_shared_frame_ring_round_trip()
+    test_landmark_array_round_trip()
+    test_process_pool_predicts()
+    test_dead_worker_is_restarted()
+    print("✅ Process recognizer pool works")